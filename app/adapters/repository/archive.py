@@ -0,0 +1,232 @@
+import bz2
+import gzip
+import lzma
+import shutil
+import tarfile
+import tempfile
+import threading
+import zipfile
+from abc import ABC, abstractmethod
+from pathlib import Path, PurePosixPath
+from typing import IO, Any, Callable, Dict, List, Optional, Tuple, cast
+
+import pyarrow as pa
+
+# Extensões da compressão individual dos arquivos do caso e os respectivos
+# descompressores, que leem os dados sob demanda, sem descompactar o
+# arquivo inteiro em disco ou em memória.
+FILE_COMPRESSIONS: Dict[str, Callable[[IO[bytes]], Any]] = {
+    ".gz": lambda f: gzip.GzipFile(fileobj=f),
+    ".bz2": lambda f: bz2.BZ2File(f),
+    ".xz": lambda f: lzma.LZMAFile(f),
+    ".zst": lambda f: pa.CompressedInputStream(f, "zstd"),
+}
+
+# Extensões dos arquivos .tar compactados e a compressão do arquivo inteiro
+TAR_COMPRESSIONS: Dict[str, str] = {
+    ".tar.gz": ".gz",
+    ".tgz": ".gz",
+    ".tar.bz2": ".bz2",
+    ".tar.xz": ".xz",
+    ".tar.zst": ".zst",
+    ".tzst": ".zst",
+}
+
+
+# Tamanho máximo, em bytes, do conteúdo descompactado de um .tar compactado
+# mantido em memória. Acima deste tamanho, o conteúdo é mantido em disco.
+TAR_SPOOL_MAX_SIZE = 64 * 1024 * 1024
+
+
+def _archive_suffix(path: Path) -> Optional[str]:
+    name = path.name.lower()
+    for suffix in [".zip", ".tar"] + list(TAR_COMPRESSIONS):
+        if name.endswith(suffix):
+            return suffix
+    return None
+
+
+class AbstractCaseArchive(ABC):
+    """
+    Acesso aos arquivos de um caso do DECOMP pelo nome de cada arquivo,
+    independente do diretório em que se encontram dentro do arquivo
+    compactado e da compressão individual de cada um deles.
+    """
+
+    @abstractmethod
+    def read(self, filename: str, size: int = -1) -> bytes:
+        """
+        Lê o conteúdo de um arquivo do caso, ou somente os seus `size`
+        primeiros bytes. Lança FileNotFoundError caso não exista.
+        """
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """
+        Libera os recursos mantidos pelo arquivo compactado aberto.
+        """
+        pass
+
+    @staticmethod
+    def _lookup(filename: str) -> List[Tuple[str, str]]:
+        # Nomes possíveis de um arquivo do caso, sem compressão ou com
+        # cada uma das compressões individuais suportadas
+        return [(filename, "")] + [
+            (filename + suffix, suffix) for suffix in FILE_COMPRESSIONS
+        ]
+
+    @staticmethod
+    def _read_stream(f: IO[bytes], suffix: str, size: int) -> bytes:
+        if suffix:
+            with FILE_COMPRESSIONS[suffix](f) as d:
+                content: bytes = d.read() if size < 0 else d.read(size)
+                return content
+        return f.read(size)
+
+
+class DirectoryArchive(AbstractCaseArchive):
+    """
+    Arquivos do caso em um diretório, compactados individualmente
+    (ex: relato.rv0.gz, dec_oper_usih.csv.zst) ou não.
+    """
+
+    def __init__(self, path: str) -> None:
+        self._path = Path(path)
+
+    def read(self, filename: str, size: int = -1) -> bytes:
+        for name, suffix in self._lookup(filename):
+            path = self._path.joinpath(name)
+            if path.is_file():
+                with open(path, "rb") as f:
+                    return self._read_stream(f, suffix, size)
+        raise FileNotFoundError(str(self._path.joinpath(filename)))
+
+
+class ZipArchive(AbstractCaseArchive):
+    """
+    Arquivos do caso em um arquivo .zip. Cada arquivo é descompactado
+    sob demanda, podendo ser lido por diversas threads.
+    """
+
+    def __init__(self, path: str) -> None:
+        self._path = path
+        self._zip = zipfile.ZipFile(path)
+        self._members: Dict[str, zipfile.ZipInfo] = {}
+        for info in self._zip.infolist():
+            if not info.is_dir():
+                name = PurePosixPath(info.filename).name
+                self._members.setdefault(name, info)
+
+    def read(self, filename: str, size: int = -1) -> bytes:
+        for name, suffix in self._lookup(filename):
+            if name in self._members:
+                with self._zip.open(self._members[name]) as f:
+                    return self._read_stream(f, suffix, size)
+        raise FileNotFoundError(f"{self._path}:{filename}")
+
+    def close(self) -> None:
+        self._zip.close()
+
+
+class TarArchive(AbstractCaseArchive):
+    """
+    Arquivos do caso em um arquivo .tar, compactado por inteiro
+    (ex: .tar.gz, .tar.zst) ou não. Os arquivos .tar sem compressão
+    são indexados na abertura e lidos diretamente. Os compactados não
+    permitem acesso direto e são descompactados uma única vez, na
+    primeira leitura, em um arquivo temporário mantido em memória até
+    `TAR_SPOOL_MAX_SIZE` bytes e em disco acima deste tamanho, que é
+    indexado e lido como um .tar sem compressão.
+    """
+
+    def __init__(self, path: str) -> None:
+        self._path = path
+        suffix = _archive_suffix(Path(path))
+        self._compression = TAR_COMPRESSIONS.get(suffix or "", "")
+        self._lock = threading.Lock()
+        self._tar: Optional[tarfile.TarFile] = None
+        self._spool: Optional[IO[bytes]] = None
+        self._members: Dict[str, tarfile.TarInfo] = {}
+        if not self._compression:
+            self.__index(tarfile.open(path, "r:"))
+
+    def __index(self, tar: tarfile.TarFile) -> None:
+        for info in tar.getmembers():
+            if info.isfile():
+                name = PurePosixPath(info.name).name
+                self._members.setdefault(name, info)
+        self._tar = tar
+
+    def __spool(self) -> None:
+        spool = tempfile.SpooledTemporaryFile(
+            max_size=TAR_SPOOL_MAX_SIZE, prefix="sintese_caso_"
+        )
+        with open(self._path, "rb") as raw:
+            with FILE_COMPRESSIONS[self._compression](raw) as stream:
+                shutil.copyfileobj(stream, spool)
+        spool.seek(0)
+        self._spool = cast(IO[bytes], spool)
+        self.__index(tarfile.open(fileobj=self._spool, mode="r:"))
+
+    def read(self, filename: str, size: int = -1) -> bytes:
+        with self._lock:
+            if self._tar is None:
+                self.__spool()
+            assert self._tar is not None
+            for name, suffix in self._lookup(filename):
+                if name in self._members:
+                    f = self._tar.extractfile(self._members[name])
+                    assert f is not None
+                    return self._read_stream(f, suffix, size)
+        raise FileNotFoundError(f"{self._path}:{filename}")
+
+    def close(self) -> None:
+        with self._lock:
+            if self._tar is not None:
+                self._tar.close()
+            if self._spool is not None:
+                self._spool.close()
+            self._tar = None
+            self._spool = None
+            self._members = {}
+
+
+def find_case_archive(directory: str, archive: str = "") -> str:
+    """
+    Obtém o caminho do arquivo compactado com os arquivos do caso: o
+    arquivo fornecido, relativo ao diretório do caso, ou o único arquivo
+    compactado existente no diretório. Na ausência de arquivos compactados,
+    é retornado o próprio diretório, cujos arquivos podem estar
+    compactados individualmente.
+    """
+    if archive:
+        return str(Path(directory).joinpath(archive))
+    candidates = sorted(
+        p
+        for p in Path(directory).iterdir()
+        if p.is_file() and _archive_suffix(p) is not None
+    )
+    if len(candidates) > 1:
+        raise ValueError(
+            "Mais de um arquivo compactado no diretório do caso: "
+            + ", ".join(p.name for p in candidates)
+        )
+    return str(candidates[0]) if candidates else directory
+
+
+def open_case_archive(path: str) -> AbstractCaseArchive:
+    """
+    Abre o arquivo compactado do caso de acordo com a sua extensão,
+    ou o diretório do caso com arquivos compactados individualmente.
+    """
+    p = Path(path)
+    if p.is_dir():
+        return DirectoryArchive(path)
+    if not p.is_file():
+        raise FileNotFoundError(path)
+    suffix = _archive_suffix(p)
+    if suffix == ".zip":
+        return ZipArchive(path)
+    if suffix is not None:
+        return TarArchive(path)
+    raise ValueError(f"Formato de arquivo compactado não suportado: {path}")
@@ -1,20 +1,39 @@
+import base64
+import json
 import logging
 import os
 import pathlib
+import shutil
+import sqlite3
 from abc import ABC, abstractmethod
-from typing import Dict, Type
+from contextlib import closing
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Type
 
+import numpy as np
 import pandas as pd
 import polars as pl
 import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.ipc as ipc
 import pyarrow.parquet as pq
 
+from app.internal.constants import SCENARIO_COL, STAGE_COL, VARIABLE_COL
+from app.model.settings import Settings
+from app.utils.manifest import OutputManifest, TableFingerprint
+from app.utils.schema import apply_schema
 from app.utils.tz import enforce_utc
 
 logger = logging.getLogger(__name__)
 
 
 class AbstractExportRepository(ABC):
+    @property
+    @abstractmethod
+    def path(self) -> pathlib.Path:
+        pass
+
     @abstractmethod
     def read_df(self, filename: str) -> pd.DataFrame | None:
         pass
@@ -23,14 +42,170 @@ class AbstractExportRepository(ABC):
     def synthetize_df(self, df: pd.DataFrame, filename: str) -> bool:
         pass
 
+    def size(self, filename: str) -> Optional[int]:
+        """
+        Obtém o tamanho (bytes) ocupado por uma síntese escrita, quando
+        pode ser determinado.
+        """
+        return None
+
     def synthetize_pl(self, df: pl.DataFrame, filename: str) -> bool:
         """Default implementation: convert to pandas and use existing path."""
         return self.synthetize_df(df.to_pandas(), filename)
 
+    def synthetize_df_iter(
+        self, dfs: Iterable[pd.DataFrame], filename: str
+    ) -> bool:
+        """Default implementation: concatenate chunks and write at once."""
+        chunks = list(dfs)
+        if len(chunks) == 0:
+            return False
+        self.synthetize_df(pd.concat(chunks, ignore_index=True), filename)
+        return True
+
+
+def encode_text_as_dictionary(table: pa.Table) -> pa.Table:
+    """
+    Codifica as colunas de texto de uma tabela como dicionário.
+    """
+    for i, field in enumerate(table.schema):
+        if pa.types.is_string(field.type) or pa.types.is_large_string(
+            field.type
+        ):
+            table = table.set_column(
+                i, field.name, pc.dictionary_encode(table.column(i))
+            )
+    return table
+
+
+def _file_size(path: pathlib.Path) -> Optional[int]:
+    return path.stat().st_size if path.is_file() else None
+
+
+PARQUET_COMPRESSIONS = ["zstd", "snappy", "lz4", "gzip", "brotli", "none"]
+
+# Escrita de um grupo de linhas para cada estágio
+STAGE_ROW_GROUPS = "estagio"
+
+# Manifesto dos conjuntos de dados particionados
+PARTITIONED_MANIFEST = "_manifesto.json"
+
+
+@dataclass
+class ParquetOptions:
+    """
+    Opções de escrita dos arquivos Parquet: compressão, codificação
+    das colunas de texto como dicionário, grupos de linhas e estatísticas
+    das colunas, que permitem aos leitores descartar grupos de linhas.
+    """
+
+    compression: str = "zstd"
+    compression_level: Optional[int] = None
+    dictionary: bool = True
+    row_groups: str = ""
+    statistics: bool = True
+    partitions: str = ""
+    flat_copy: bool = False
+
+    def __post_init__(self) -> None:
+        self.compression = self.compression.lower()
+        if self.compression not in PARQUET_COMPRESSIONS:
+            raise ValueError(
+                f"Compressão Parquet não suportada: {self.compression}"
+            )
+        if self.compression_level is not None and self.compression in [
+            "snappy",
+            "none",
+        ]:
+            raise ValueError(
+                f"Compressão Parquet {self.compression} não possui níveis"
+            )
+        self.row_groups = self.row_groups.lower()
+        if self.row_groups not in ["", STAGE_ROW_GROUPS] and not (
+            self.row_groups.isdigit() and int(self.row_groups) > 0
+        ):
+            raise ValueError(
+                f"Grupos de linhas Parquet não reconhecidos: {self.row_groups}"
+            )
+        self.partitions = self.partitions.lower().replace(" ", "")
+        if not all(c.isidentifier() for c in self.partition_columns):
+            raise ValueError(
+                f"Partições Parquet não reconhecidas: {self.partitions}"
+            )
+
+    @classmethod
+    def from_settings(cls) -> "ParquetOptions":
+        settings = Settings()
+        return cls(
+            compression=settings.parquet_compression,
+            compression_level=settings.parquet_compression_level,
+            dictionary=settings.parquet_dictionary,
+            row_groups=settings.parquet_row_groups,
+            statistics=settings.parquet_statistics,
+            partitions=settings.parquet_partitions,
+            flat_copy=settings.parquet_flat_copy,
+        )
+
+    @property
+    def partition_columns(self) -> List[str]:
+        return [c for c in self.partitions.split(",") if c]
+
+    @property
+    def writer_kwargs(self) -> Dict[str, Any]:
+        return {
+            "compression": self.compression,
+            "compression_level": self.compression_level,
+            "write_statistics": self.statistics,
+            "flavor": "spark",
+            "coerce_timestamps": "ms",
+            "allow_truncated_timestamps": True,
+        }
+
+    def prepare(self, table: pa.Table) -> pa.Table:
+        """
+        Codifica as colunas de texto como dicionário, caso habilitado.
+        """
+        return encode_text_as_dictionary(table) if self.dictionary else table
+
+    @property
+    def row_group_size(self) -> Optional[int]:
+        return int(self.row_groups) if self.row_groups.isdigit() else None
+
+    def write(
+        self,
+        writer: pq.ParquetWriter,
+        table: pa.Table,
+        row_group_size: Optional[int] = None,
+    ) -> None:
+        """
+        Escreve uma tabela em grupos de linhas. Com grupos por estágio,
+        as linhas são agrupadas por estágio, mantendo a ordem relativa
+        das linhas de cada estágio.
+        """
+        if self.row_groups != STAGE_ROW_GROUPS or (
+            STAGE_COL not in table.column_names
+        ):
+            writer.write_table(
+                table, row_group_size=self.row_group_size or row_group_size
+            )
+            return
+        stages = table.column(STAGE_COL).to_numpy(zero_copy_only=False)
+        order = np.argsort(stages, kind="stable")
+        table = table.take(order)
+        stages = stages[order]
+        starts = np.r_[0, np.flatnonzero(stages[1:] != stages[:-1]) + 1]
+        ends = np.r_[starts[1:], len(stages)]
+        for start, end in zip(starts, ends):
+            writer.write_table(
+                table.slice(start, end - start),
+                row_group_size=max(end - start, 1),
+            )
+
 
 class ParquetExportRepository(AbstractExportRepository):
-    def __init__(self, path: str):
+    def __init__(self, path: str, options: Optional[ParquetOptions] = None):
         self.__path = path
+        self.options = options or ParquetOptions.from_settings()
 
     @property
     def path(self) -> pathlib.Path:
@@ -40,19 +215,184 @@ class ParquetExportRepository(AbstractExportRepository):
         arq = self.path.joinpath(filename + ".parquet")
         if os.path.isfile(arq):
             return pd.read_parquet(arq)
+        manifest = self.path.joinpath(filename, PARTITIONED_MANIFEST)
+        if os.path.isfile(manifest):
+            return self._read_partitioned(manifest)
         return None
 
-    def synthetize_df(self, df: pd.DataFrame, filename: str) -> bool:
+    def _read_partitioned(self, manifest_path: pathlib.Path) -> pd.DataFrame:
+        """
+        Lê um conjunto de dados particionado, restaurando a ordem e
+        os tipos das colunas de partição a partir do esquema serializado
+        no manifesto.
+        """
+        manifest = json.loads(manifest_path.read_text())
+        schema = ipc.read_schema(
+            pa.py_buffer(base64.b64decode(manifest["esquema"]))
+        )
+        dictionaries = (
+            "infer"
+            if any(pa.types.is_dictionary(f.type) for f in schema)
+            else None
+        )
+        partitioning = ds.partitioning(
+            schema, flavor="hive", dictionaries=dictionaries
+        )
+        dataset = ds.dataset(
+            manifest_path.parent, format="parquet", partitioning=partitioning
+        )
+        return dataset.to_table().select(manifest["colunas"]).to_pandas()
+
+    def _write_partitioned(
+        self, table: pa.Table, filename: str, columns: List[str]
+    ) -> None:
+        """
+        Escreve uma tabela como um conjunto de dados particionado no estilo
+        Hive (`<coluna>=<valor>/parte-0.parquet`), com um manifesto das
+        partições e do número de linhas de cada arquivo.
+        """
+        root = self.path.joinpath(filename)
+        if root.is_dir():
+            shutil.rmtree(root)
+        # As colunas categóricas são ordenadas e comparadas pelos valores,
+        # pois os índices dos dicionários não podem ser ordenados
+        sort_keys = pa.table(
+            {
+                c: (
+                    pc.dictionary_decode(table.column(c))
+                    if pa.types.is_dictionary(table.schema.field(c).type)
+                    else table.column(c)
+                )
+                for c in columns
+            }
+        )
+        order = pc.sort_indices(sort_keys, [(c, "ascending") for c in columns])
+        table = table.take(order)
+        keys = [
+            sort_keys.column(c).take(order).to_numpy(zero_copy_only=False)
+            for c in columns
+        ]
+        changes = np.zeros(max(len(table) - 1, 0), dtype=bool)
+        for k in keys:
+            changes |= k[1:] != k[:-1]
+        starts = np.r_[0, np.flatnonzero(changes) + 1]
+        ends = np.r_[starts[1:], len(table)]
+        files: List[Dict[str, Any]] = []
+        for start, end in zip(starts, ends):
+            values = {
+                c: k[start].item()
+                if isinstance(k[start], np.generic)
+                else k[start]
+                for c, k in zip(columns, keys)
+            }
+            subdir = "/".join(f"{c}={v}" for c, v in values.items())
+            path = root.joinpath(subdir, "parte-0.parquet")
+            path.parent.mkdir(parents=True, exist_ok=True)
+            pq.write_table(
+                table.slice(start, end - start).drop_columns(columns),
+                path,
+                row_group_size=self.options.row_group_size,
+                **self.options.writer_kwargs,
+            )
+            files.append(
+                {
+                    "caminho": f"{subdir}/parte-0.parquet",
+                    "linhas": int(end - start),
+                    "particao": values,
+                }
+            )
+        manifest = {
+            "tabela": filename,
+            "colunas": table.column_names,
+            "particoes": [
+                {"coluna": c, "tipo": str(table.schema.field(c).type)}
+                for c in columns
+            ],
+            "esquema": base64.b64encode(
+                pa.schema([table.schema.field(c) for c in columns])
+                .serialize()
+                .to_pybytes()
+            ).decode("ascii"),
+            "linhas": len(table),
+            "arquivos": files,
+        }
+        root.joinpath(PARTITIONED_MANIFEST).write_text(
+            json.dumps(manifest, indent=2)
+        )
+
+    def _write_table(self, table: pa.Table, filename: str) -> None:
+        table = self.options.prepare(table)
+        path = self.path.joinpath(filename + ".parquet")
+        columns = [
+            c for c in self.options.partition_columns if c in table.column_names
+        ]
+        if len(columns) > 0 and len(table) > 0:
+            self._write_partitioned(table, filename, columns)
+            if not self.options.flat_copy:
+                path.unlink(missing_ok=True)
+                return
+        elif self.path.joinpath(filename, PARTITIONED_MANIFEST).is_file():
+            shutil.rmtree(self.path.joinpath(filename))
+        if self.options.row_groups == STAGE_ROW_GROUPS:
+            with pq.ParquetWriter(
+                path, table.schema, **self.options.writer_kwargs
+            ) as writer:
+                self.options.write(writer, table)
+            return
         pq.write_table(
-            pa.Table.from_pandas(enforce_utc(df)),
-            self.path.joinpath(filename + ".parquet"),
-            write_statistics=False,
-            flavor="spark",
-            coerce_timestamps="ms",
-            allow_truncated_timestamps=True,
+            table,
+            path,
+            row_group_size=self.options.row_group_size,
+            **self.options.writer_kwargs,
         )
+
+    def size(self, filename: str) -> Optional[int]:
+        paths = [self.path.joinpath(filename + ".parquet")]
+        root = self.path.joinpath(filename)
+        if root.is_dir():
+            paths += [p for p in root.rglob("*") if p.is_file()]
+        sizes = [p.stat().st_size for p in paths if p.is_file()]
+        return sum(sizes) if sizes else None
+
+    def synthetize_df(self, df: pd.DataFrame, filename: str) -> bool:
+        df = enforce_utc(apply_schema(df, self.options.dictionary))
+        self._write_table(pa.Table.from_pandas(df), filename)
+        OutputManifest().register(filename, TableFingerprint.of([df]))
         return True
 
+    def synthetize_df_iter(
+        self, dfs: Iterable[pd.DataFrame], filename: str
+    ) -> bool:
+        """Write each chunk as a row group of a single Parquet file."""
+        if self.options.partition_columns:
+            return super().synthetize_df_iter(dfs, filename)
+        writer: pq.ParquetWriter | None = None
+        fingerprint = TableFingerprint()
+        try:
+            for df in dfs:
+                df = enforce_utc(apply_schema(df, self.options.dictionary))
+                fingerprint.update(df)
+                table = self.options.prepare(
+                    pa.Table.from_pandas(df, preserve_index=False)
+                )
+                if writer is None:
+                    writer = pq.ParquetWriter(
+                        self.path.joinpath(filename + ".parquet"),
+                        table.schema,
+                        **self.options.writer_kwargs,
+                    )
+                else:
+                    table = table.cast(writer.schema)
+                self.options.write(
+                    writer, table, row_group_size=max(len(table), 1)
+                )
+        finally:
+            if writer is not None:
+                writer.close()
+        if writer is not None:
+            OutputManifest().register(filename, fingerprint)
+        return writer is not None
+
     def synthetize_pl(self, df: pl.DataFrame, filename: str) -> bool:
         """Write Parquet from Polars DataFrame via PyArrow with UTC enforcement."""
         for col_name in df.columns:
@@ -63,14 +403,7 @@ class ParquetExportRepository(AbstractExportRepository):
                 )
         try:
             arrow_table = pa.Table.from_pandas(df.to_arrow().to_pandas())
-            pq.write_table(
-                arrow_table,
-                self.path.joinpath(filename + ".parquet"),
-                write_statistics=False,
-                flavor="spark",
-                coerce_timestamps="ms",
-                allow_truncated_timestamps=True,
-            )
+            self._write_table(arrow_table, filename)
             return True
         except Exception:
             logger.warning(
@@ -81,6 +414,318 @@ class ParquetExportRepository(AbstractExportRepository):
             return self.synthetize_df(df.to_pandas(), filename)
 
 
+ARROW_COMPRESSIONS = ["none", "lz4", "zstd"]
+
+
+class ArrowExportRepository(AbstractExportRepository):
+    """
+    Escreve as sínteses no formato de arquivo do Arrow IPC (Feather v2).
+    Sem compressão, os arquivos podem ser mapeados em memória pelos
+    leitores sem cópia dos dados.
+    """
+
+    def __init__(self, path: str, compression: Optional[str] = None):
+        self.__path = path
+        self.compression = (compression or Settings().arrow_compression).lower()
+        if self.compression not in ARROW_COMPRESSIONS:
+            raise ValueError(
+                f"Compressão Arrow não suportada: {self.compression}"
+            )
+
+    @property
+    def path(self) -> pathlib.Path:
+        return pathlib.Path(self.__path)
+
+    @property
+    def _options(self) -> ipc.IpcWriteOptions:
+        return ipc.IpcWriteOptions(
+            compression=None if self.compression == "none" else self.compression
+        )
+
+    def read_df(self, filename: str) -> pd.DataFrame | None:
+        arq = self.path.joinpath(filename + ".arrow")
+        if os.path.isfile(arq):
+            with pa.memory_map(str(arq)) as source:
+                return ipc.open_file(source).read_all().to_pandas()
+        return None
+
+    def _write_table(self, table: pa.Table, filename: str) -> None:
+        table = encode_text_as_dictionary(table)
+        with ipc.new_file(
+            self.path.joinpath(filename + ".arrow"),
+            table.schema,
+            options=self._options,
+        ) as writer:
+            writer.write_table(table)
+
+    def size(self, filename: str) -> Optional[int]:
+        return _file_size(self.path.joinpath(filename + ".arrow"))
+
+    def synthetize_df(self, df: pd.DataFrame, filename: str) -> bool:
+        df = enforce_utc(apply_schema(df))
+        self._write_table(pa.Table.from_pandas(df), filename)
+        OutputManifest().register(filename, TableFingerprint.of([df]))
+        return True
+
+    def synthetize_df_iter(
+        self, dfs: Iterable[pd.DataFrame], filename: str
+    ) -> bool:
+        """
+        Write each chunk as record batches of a single IPC file. The text
+        columns are not dictionary encoded, since the IPC file format does
+        not allow replacing the dictionaries between batches.
+        """
+        writer: ipc.RecordBatchFileWriter | None = None
+        schema: pa.Schema | None = None
+        fingerprint = TableFingerprint()
+        try:
+            for df in dfs:
+                df = enforce_utc(apply_schema(df, categories=False))
+                fingerprint.update(df)
+                table = pa.Table.from_pandas(df, preserve_index=False)
+                if writer is None:
+                    schema = table.schema
+                    writer = ipc.new_file(
+                        self.path.joinpath(filename + ".arrow"),
+                        schema,
+                        options=self._options,
+                    )
+                else:
+                    table = table.cast(schema)
+                writer.write_table(table)
+        finally:
+            if writer is not None:
+                writer.close()
+        if writer is not None:
+            OutputManifest().register(filename, fingerprint)
+        return writer is not None
+
+    def synthetize_pl(self, df: pl.DataFrame, filename: str) -> bool:
+        for col_name in df.columns:
+            dtype = df[col_name].dtype
+            if isinstance(dtype, pl.Datetime) and dtype.time_zone is None:
+                df = df.with_columns(
+                    pl.col(col_name).dt.replace_time_zone("UTC")
+                )
+        self._write_table(df.to_arrow(), filename)
+        return True
+
+
+# Arquivo único com todas as sínteses
+SQLITE_STORE = "sintese.sqlite"
+
+# Tempo máximo (s) de espera pela escrita de outros processos
+SQLITE_TIMEOUT = 600.0
+
+# Tabelas de catálogo das sínteses e das suas colunas
+SQLITE_CATALOG = "_sinteses"
+SQLITE_COLUMNS = "_colunas"
+
+
+def _quote(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+class SQLiteExportRepository(AbstractExportRepository):
+    """
+    Escreve todas as sínteses em um único arquivo SQLite, com uma tabela
+    por síntese e índices nas colunas de estágio, cenário, variável e
+    códigos das entidades. Cada síntese é escrita em uma transação, e os
+    tipos das colunas são registrados em um catálogo para a leitura.
+    """
+
+    def __init__(self, path: str):
+        self.__path = path
+
+    @property
+    def path(self) -> pathlib.Path:
+        return pathlib.Path(self.__path)
+
+    @property
+    def store(self) -> pathlib.Path:
+        return self.path.joinpath(SQLITE_STORE)
+
+    def _connect(self) -> sqlite3.Connection:
+        con = sqlite3.connect(
+            self.store, timeout=SQLITE_TIMEOUT, isolation_level=None
+        )
+        con.execute(
+            f"CREATE TABLE IF NOT EXISTS {SQLITE_CATALOG}"
+            + " (tabela TEXT PRIMARY KEY, linhas INTEGER)"
+        )
+        con.execute(
+            f"CREATE TABLE IF NOT EXISTS {SQLITE_COLUMNS}"
+            + " (tabela TEXT, posicao INTEGER, coluna TEXT, tipo TEXT,"
+            + " PRIMARY KEY (tabela, posicao))"
+        )
+        return con
+
+    @staticmethod
+    def _sql_type(series: pd.Series) -> str:
+        if pd.api.types.is_bool_dtype(series) or (
+            pd.api.types.is_integer_dtype(series)
+        ):
+            return "INTEGER"
+        if pd.api.types.is_float_dtype(series):
+            return "REAL"
+        return "TEXT"
+
+    @staticmethod
+    def _indexed(column: str) -> bool:
+        return column in [STAGE_COL, SCENARIO_COL, VARIABLE_COL] or (
+            column.startswith("codigo_")
+        )
+
+    @staticmethod
+    def _rows(df: pd.DataFrame) -> Iterator[tuple[Any, ...]]:
+        columns: List[List[Any]] = []
+        for c in df.columns:
+            series = df[c]
+            if pd.api.types.is_datetime64_any_dtype(series):
+                values = series.dt.tz_convert("UTC").dt.tz_localize(None)
+                series = pd.Series(
+                    np.datetime_as_string(values.to_numpy(), unit="s"),
+                    index=series.index,
+                ).where(series.notna(), None)
+            if pd.api.types.is_float_dtype(series):
+                columns.append(series.tolist())
+            else:
+                series = series.astype(object)
+                columns.append(series.where(series.notna(), None).tolist())
+        return zip(*columns)
+
+    def read_df(self, filename: str) -> pd.DataFrame | None:
+        if not self.store.is_file():
+            return None
+        with closing(self._connect()) as con:
+            types = con.execute(
+                f"SELECT coluna, tipo FROM {SQLITE_COLUMNS}"
+                + " WHERE tabela = ? ORDER BY posicao",
+                (filename,),
+            ).fetchall()
+            if len(types) == 0:
+                return None
+            df = pd.read_sql_query(f"SELECT * FROM {_quote(filename)}", con)
+        for column, kind in types:
+            if kind.startswith("datetime64"):
+                df[column] = pd.to_datetime(df[column], utc=True).astype(kind)
+            elif kind in ["category", "object", "str", "string"]:
+                continue
+            else:
+                df[column] = df[column].astype(kind)
+        return df
+
+    def query(self, sql: str, *params: Any) -> pd.DataFrame:
+        """
+        Executa uma consulta sobre as sínteses e os metadados do arquivo.
+        """
+        with closing(self._connect()) as con:
+            return pd.read_sql_query(sql, con, params=params or None)
+
+    def _write(self, dfs: Iterable[pd.DataFrame], filename: str) -> bool:
+        table = _quote(filename)
+        con = self._connect()
+        written = False
+        try:
+            con.execute("BEGIN IMMEDIATE")
+            con.execute(f"DROP TABLE IF EXISTS {table}")
+            con.execute(
+                f"DELETE FROM {SQLITE_COLUMNS} WHERE tabela = ?", (filename,)
+            )
+            rows = 0
+            fingerprint = TableFingerprint()
+            for df in dfs:
+                if df.shape[1] == 0:
+                    continue
+                df = enforce_utc(apply_schema(df))
+                fingerprint.update(df)
+                if not written:
+                    con.execute(
+                        f"CREATE TABLE {table} ("
+                        + ", ".join(
+                            f"{_quote(str(c))} {self._sql_type(df[c])}"
+                            for c in df.columns
+                        )
+                        + ")"
+                    )
+                    con.executemany(
+                        f"INSERT INTO {SQLITE_COLUMNS} VALUES (?, ?, ?, ?)",
+                        [
+                            (filename, i, str(c), str(df[c].dtype))
+                            for i, c in enumerate(df.columns)
+                        ],
+                    )
+                    written = True
+                con.executemany(
+                    f"INSERT INTO {table} VALUES ("
+                    + ", ".join(["?"] * df.shape[1])
+                    + ")",
+                    self._rows(df),
+                )
+                rows += df.shape[0]
+            if written:
+                for c in self._indexed_columns(con, filename):
+                    con.execute(
+                        f"CREATE INDEX {_quote(f'{filename}__{c}')}"
+                        + f" ON {table} ({_quote(c)})"
+                    )
+                con.execute(
+                    f"INSERT OR REPLACE INTO {SQLITE_CATALOG} VALUES (?, ?)",
+                    (filename, rows),
+                )
+            else:
+                con.execute(
+                    f"DELETE FROM {SQLITE_CATALOG} WHERE tabela = ?",
+                    (filename,),
+                )
+            con.execute("COMMIT")
+        except BaseException:
+            if con.in_transaction:
+                con.execute("ROLLBACK")
+            raise
+        finally:
+            con.close()
+        if written:
+            OutputManifest().register(filename, fingerprint)
+        return written
+
+    def size(self, filename: str) -> Optional[int]:
+        """
+        Obtém as páginas ocupadas pela tabela e pelos seus índices,
+        caso o SQLite disponha da tabela virtual `dbstat`.
+        """
+        try:
+            with closing(self._connect()) as con:
+                (size,) = con.execute(
+                    "SELECT SUM(pgsize) FROM dbstat WHERE name IN"
+                    + " (SELECT name FROM sqlite_master WHERE tbl_name = ?)",
+                    (filename,),
+                ).fetchone()
+        except sqlite3.Error:
+            return None
+        return None if size is None else int(size)
+
+    def _indexed_columns(
+        self, con: sqlite3.Connection, filename: str
+    ) -> List[str]:
+        columns = con.execute(
+            f"SELECT coluna FROM {SQLITE_COLUMNS}"
+            + " WHERE tabela = ? ORDER BY posicao",
+            (filename,),
+        ).fetchall()
+        return [c for (c,) in columns if self._indexed(c)]
+
+    def synthetize_df(self, df: pd.DataFrame, filename: str) -> bool:
+        self._write([df], filename)
+        return True
+
+    def synthetize_df_iter(
+        self, dfs: Iterable[pd.DataFrame], filename: str
+    ) -> bool:
+        """Insert all chunks into the same table in a single transaction."""
+        return self._write(dfs, filename)
+
+
 class CSVExportRepository(AbstractExportRepository):
     def __init__(self, path: str):
         self.__path = path
@@ -95,12 +740,35 @@ class CSVExportRepository(AbstractExportRepository):
             return pd.read_csv(arq)
         return None
 
+    def size(self, filename: str) -> Optional[int]:
+        return _file_size(self.path.joinpath(filename + ".csv"))
+
     def synthetize_df(self, df: pd.DataFrame, filename: str) -> bool:
-        enforce_utc(df).to_csv(
-            self.path.joinpath(filename + ".csv"), index=False
-        )
+        df = enforce_utc(apply_schema(df))
+        df.to_csv(self.path.joinpath(filename + ".csv"), index=False)
+        OutputManifest().register(filename, TableFingerprint.of([df]))
         return True
 
+    def synthetize_df_iter(
+        self, dfs: Iterable[pd.DataFrame], filename: str
+    ) -> bool:
+        """Append each chunk to the same CSV file."""
+        written = False
+        fingerprint = TableFingerprint()
+        for df in dfs:
+            df = enforce_utc(apply_schema(df))
+            fingerprint.update(df)
+            df.to_csv(
+                self.path.joinpath(filename + ".csv"),
+                index=False,
+                mode="a" if written else "w",
+                header=not written,
+            )
+            written = True
+        if written:
+            OutputManifest().register(filename, fingerprint)
+        return written
+
 
 class TestExportRepository(AbstractExportRepository):
     def __init__(self, path: str):
@@ -117,13 +785,45 @@ class TestExportRepository(AbstractExportRepository):
         return True  # no-op for testing
 
 
+class MemoryExportRepository(AbstractExportRepository):
+    """
+    Mantém as sínteses em memória, indexadas pelo nome do arquivo,
+    sem escrita em disco.
+    """
+
+    def __init__(self, path: str):
+        self.__path = path
+        self.tables: Dict[str, pd.DataFrame] = {}
+
+    @property
+    def path(self) -> pathlib.Path:
+        return pathlib.Path(self.__path)
+
+    def read_df(self, filename: str) -> pd.DataFrame | None:
+        return self.tables.get(filename)
+
+    def size(self, filename: str) -> Optional[int]:
+        df = self.tables.get(filename)
+        return None if df is None else int(df.memory_usage(deep=True).sum())
+
+    def synthetize_df(self, df: pd.DataFrame, filename: str) -> bool:
+        self.tables[filename] = apply_schema(df)
+        OutputManifest().register(
+            filename, TableFingerprint.of([self.tables[filename]])
+        )
+        return True
+
+
 def factory(
     kind: str, *args: object, **kwargs: object
 ) -> AbstractExportRepository:
     mapping: Dict[str, Type[AbstractExportRepository]] = {
         "PARQUET": ParquetExportRepository,
         "CSV": CSVExportRepository,
+        "ARROW": ArrowExportRepository,
+        "SQLITE": SQLiteExportRepository,
         "TEST": TestExportRepository,
+        "MEMORIA": MemoryExportRepository,
     }
     kind_upper = kind.upper()
     if kind_upper not in mapping:
@@ -1,11 +1,27 @@
 import asyncio
+import copy
+import functools
 import logging
 import pathlib
 import platform
 from abc import ABC, abstractmethod
+from concurrent.futures import Future, ProcessPoolExecutor
 from os.path import join
-from typing import Any, Dict, Optional, Type, cast
-
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    cast,
+)
+
+import pandas as pd
 from idecomp.decomp.arquivos import Arquivos
 from idecomp.decomp.avl_turb_max import AvlTurbMax
 from idecomp.decomp.caso import Caso
@@ -22,17 +38,54 @@ from idecomp.decomp.dec_oper_usit import DecOperUsit
 from idecomp.decomp.decomptim import Decomptim
 from idecomp.decomp.hidr import Hidr
 from idecomp.decomp.inviabunic import InviabUnic
+from idecomp.decomp.modelos.arquivoscsv.arquivocsv import ArquivoCSV
 from idecomp.decomp.relato import Relato
 from idecomp.decomp.relgnl import Relgnl
 from idecomp.decomp.vazoes import Vazoes
 
+from app.adapters.repository.archive import (
+    AbstractCaseArchive,
+    find_case_archive,
+    open_case_archive,
+)
+from app.adapters.repository.nativecsv import (
+    HEADER_PROBE_SIZE,
+    parser_version,
+    read_csv_content,
+    sniff_version,
+)
+from app.adapters.repository.prefetch import NOT_READ, FilePrefetcher
 from app.model.settings import Settings
 from app.utils.encoding import converte_codificacao
 
+T = TypeVar("T", bound=ArquivoCSV)
+F = TypeVar("F", bound=Callable[..., Any])
+
 if platform.system() == "Windows":
     Dadger.ENCODING = "iso-8859-1"
 
 
+def _read_dec_fcf_cortes_table(
+    source: str | bytes,
+) -> Optional[pd.DataFrame]:
+    return DecFcfCortes.read(source).tabela
+
+
+def _prefetchable(getter: F) -> F:
+    """
+    Permite que o arquivo obtido pelo método seja entregue pela leitura
+    antecipada iniciada por `prefetch`, caso exista, no lugar de ser lido
+    novamente pelo repositório.
+    """
+    name = getter.__name__.removeprefix("get_")
+
+    @functools.wraps(getter)
+    def wrapper(self: "RawFilesRepository") -> Any:
+        return self._take_prefetched(name, lambda: getter(self))
+
+    return cast(F, wrapper)
+
+
 class AbstractFilesRepository(ABC):
     @property
     @abstractmethod
@@ -116,13 +169,51 @@ class AbstractFilesRepository(ABC):
     def get_dec_fcf_cortes(self, stage: int) -> Optional[DecFcfCortes]:
         pass
 
+    @abstractmethod
+    def get_dec_fcf_cortes_tables(
+        self, stages: List[int]
+    ) -> Iterator[Tuple[int, Optional[pd.DataFrame]]]:
+        pass
+
+    @abstractmethod
+    def get_file_version(self, filename: str) -> Optional[str]:
+        pass
+
+    def prefetch(self, files: List[str]) -> None:
+        """
+        Inicia a leitura antecipada dos arquivos fornecidos, identificados
+        pelos nomes dos métodos de leitura (ex: relato, dec_oper_usih).
+        """
+        pass
+
+    def stop_prefetch(self) -> None:
+        """
+        Interrompe a leitura antecipada dos arquivos.
+        """
+        pass
+
+    @classmethod
+    def release(cls, tmppath: str) -> None:
+        """
+        Libera os recursos compartilhados entre as instâncias do
+        repositório criadas para o diretório do caso, ao final de
+        um comando.
+        """
+        pass
+
 
 class RawFilesRepository(AbstractFilesRepository):
+    # Leituras antecipadas de cada diretório de caso, compartilhadas
+    # entre as instâncias do repositório criadas a cada bloco `with` da
+    # unidade de trabalho. Cada arquivo lido é entregue à primeira
+    # instância que o requisita, e não é mantido após a entrega.
+    PREFETCHERS: Dict[str, FilePrefetcher] = {}
+
     def __init__(self, tmppath: str, version: str = "latest"):
         self.__tmppath = tmppath
         self.__version = version
         try:
-            arq_caso = Caso.read(join(str(self.__tmppath), "caso.dat"))
+            arq_caso = Caso.read(self._source(Caso, "caso.dat"))
             extensao = arq_caso.arquivos
             if extensao is None:
                 raise FileNotFoundError()
@@ -132,6 +223,15 @@ class RawFilesRepository(AbstractFilesRepository):
             logger.error("Erro na leitura do arquivo arquivo caso.dat")
             raise e
         self.__arquivos: Optional[Arquivos] = None
+        self.__converted: Set[str] = set()
+        self._reset()
+
+    def _reset(self) -> None:
+        """
+        Descarta os arquivos do caso lidos pela instância, mantendo o
+        caso.dat e o arquivo de índice dos arquivos do caso.
+        """
+        self.__prefetched: Dict[str, Any] = {}
         self.__read_dadger = False
         self.__read_dadgnl = False
         self.__read_relato = False
@@ -151,6 +251,107 @@ class RawFilesRepository(AbstractFilesRepository):
         self.__read_avl_turb_max = False
         self.__read_dec_fcf_cortes: Dict[int, bool] = {}
         self.__dec_fcf_cortes: Dict[int, DecFcfCortes] = {}
+        self.__versions: Dict[str, Optional[str]] = {}
+
+    def _source(self, parser: Type[Any], filename: str) -> str | bytes:
+        """
+        Obtém o argumento para a leitura de um arquivo do caso pelo
+        idecomp: o caminho do arquivo no diretório do caso.
+        """
+        return join(self.__tmppath, filename)
+
+    def _read_bytes(self, filename: str, size: int = -1) -> bytes:
+        """
+        Lê o conteúdo de um arquivo do caso, ou somente os seus `size`
+        primeiros bytes.
+        """
+        with open(join(self.__tmppath, filename), "rb") as f:
+            return f.read(size)
+
+    def _convert_encoding(self, filename: str) -> None:
+        """
+        Converte a codificação de um arquivo do caso para UTF-8, no
+        próprio diretório do caso.
+        """
+        caminho = str(pathlib.Path(self.__tmppath).joinpath(filename))
+        installdir = Settings().installdir
+        assert installdir is not None
+        script = str(
+            pathlib.Path(installdir).joinpath(Settings().encoding_script)
+        )
+        asyncio.run(converte_codificacao(caminho, script))
+
+    def _convert_encoding_once(self, filename: str) -> None:
+        """
+        Converte a codificação de um arquivo do caso somente na primeira
+        leitura pela instância ou pelas leituras antecipadas iniciadas
+        por ela.
+        """
+        if filename not in self.__converted:
+            self._convert_encoding(filename)
+            self.__converted.add(filename)
+
+    def _fork(self) -> "RawFilesRepository":
+        """
+        Cria uma instância para a leitura de um arquivo do caso que
+        compartilha o caso.dat, o índice dos arquivos, as conversões de
+        codificação e o arquivo compactado desta instância, sem os
+        arquivos já lidos.
+        """
+        repository = copy.copy(self)
+        repository._reset()
+        return repository
+
+    def _take_prefetched(self, name: str, read: Callable[[], Any]) -> Any:
+        if name not in self.__prefetched:
+            prefetcher = self.PREFETCHERS.get(self.__tmppath)
+            obj = NOT_READ if prefetcher is None else prefetcher.take(name)
+            if obj is NOT_READ:
+                return read()
+            self.__prefetched[name] = obj
+        return self.__prefetched[name]
+
+    def prefetch(self, files: List[str]) -> None:
+        self.stop_prefetch()
+        workers = Settings().file_readers
+        kind, path = type(self), self.__tmppath
+        files = [
+            f
+            for f in files
+            if hasattr(getattr(kind, f"get_{f}", None), "__wrapped__")
+        ]
+        if workers < 1 or not files:
+            return
+        # O índice dos arquivos é lido e a conversão da codificação, que
+        # reescreve o arquivo no diretório do caso, é feita antes do início
+        # das leituras antecipadas, na thread principal
+        arq_dadger = self.arquivos.dadger
+        if "dadger" in files and arq_dadger is not None:
+            self._convert_encoding_once(arq_dadger)
+
+        def read(name: str) -> Any:
+            # Cada arquivo é lido por uma nova instância, descartada após
+            # a leitura, para que não seja mantido após a entrega
+            return getattr(kind, f"get_{name}").__wrapped__(self._fork())
+
+        self.PREFETCHERS[path] = FilePrefetcher(
+            read,
+            files,
+            workers,
+            Settings().memory_budget,
+            logging.getLogger("main"),
+        )
+
+    def stop_prefetch(self) -> None:
+        prefetcher = self.PREFETCHERS.pop(self.__tmppath, None)
+        if prefetcher is not None:
+            prefetcher.close()
+
+    @classmethod
+    def release(cls, tmppath: str) -> None:
+        prefetcher = cls.PREFETCHERS.pop(tmppath, None)
+        if prefetcher is not None:
+            prefetcher.close()
 
     @property
     def extensao(self) -> str:
@@ -162,13 +363,14 @@ class RawFilesRepository(AbstractFilesRepository):
             logger = logging.getLogger("main")
             try:
                 self.__arquivos = Arquivos.read(
-                    join(self.__tmppath, self.extensao)
+                    self._source(Arquivos, self.extensao)
                 )
             except FileNotFoundError as e:
                 logger.error(f"Não foi encontrado o arquivo {self.extensao}")
                 raise e
         return self.__arquivos
 
+    @_prefetchable
     def get_dadger(self) -> Dadger:
         if not self.__read_dadger:
             self.__read_dadger = True
@@ -176,20 +378,12 @@ class RawFilesRepository(AbstractFilesRepository):
                 arq_dadger = self.arquivos.dadger
                 if arq_dadger is None:
                     raise FileNotFoundError()
-                caminho = str(pathlib.Path(self.__tmppath).joinpath(arq_dadger))
-                installdir = Settings().installdir
-                assert installdir is not None
-                script = str(
-                    pathlib.Path(installdir).joinpath(
-                        Settings().encoding_script
-                    )
-                )
-                asyncio.run(converte_codificacao(caminho, script))
+                self._convert_encoding_once(arq_dadger)
 
                 logger = logging.getLogger("main")
                 logger.info(f"Lendo arquivo {arq_dadger}")
 
-                self.__dadger = Dadger.read(join(self.__tmppath, arq_dadger))
+                self.__dadger = Dadger.read(self._source(Dadger, arq_dadger))
             except Exception as e:
                 logging.getLogger("main").error(
                     f"Erro na leitura do dadger: {e}"
@@ -197,6 +391,7 @@ class RawFilesRepository(AbstractFilesRepository):
                 raise e
         return self.__dadger
 
+    @_prefetchable
     def get_dadgnl(self) -> Dadgnl:
         if not self.__read_dadgnl:
             self.__read_dadgnl = True
@@ -206,12 +401,13 @@ class RawFilesRepository(AbstractFilesRepository):
                 if arq_dadgnl is None:
                     raise FileNotFoundError()
                 logger.info(f"Lendo arquivo {arq_dadgnl}")
-                self.__dadgnl = Dadgnl.read(join(self.__tmppath, arq_dadgnl))
+                self.__dadgnl = Dadgnl.read(self._source(Dadgnl, arq_dadgnl))
             except Exception as e:
                 logger.info(f"Erro na leitura do dadgnl: {e}")
                 raise e
         return self.__dadgnl
 
+    @_prefetchable
     def get_relato(self) -> Relato:
         if not self.__read_relato:
             self.__read_relato = True
@@ -219,12 +415,13 @@ class RawFilesRepository(AbstractFilesRepository):
             try:
                 arq_relato = f"relato.{self.extensao}"
                 logger.info(f"Lendo arquivo {arq_relato}")
-                self.__relato = Relato.read(join(self.__tmppath, arq_relato))
+                self.__relato = Relato.read(self._source(Relato, arq_relato))
             except Exception as e:
                 logger.error(f"Erro na leitura do {arq_relato}: {e}")
                 raise e
         return self.__relato
 
+    @_prefetchable
     def get_relato2(self) -> Relato:
         if not self.__read_relato2:
             self.__read_relato2 = True
@@ -232,7 +429,7 @@ class RawFilesRepository(AbstractFilesRepository):
             try:
                 arq_relato2 = f"relato2.{self.extensao}"
                 logger.info(f"Lendo arquivo {arq_relato2}")
-                self.__relato2 = Relato.read(join(self.__tmppath, arq_relato2))
+                self.__relato2 = Relato.read(self._source(Relato, arq_relato2))
             except FileNotFoundError:
                 logger.info(f"Não encontrado arquivo {arq_relato2}")
                 raise RuntimeError()
@@ -241,6 +438,7 @@ class RawFilesRepository(AbstractFilesRepository):
                 raise e
         return self.__relato2
 
+    @_prefetchable
     def get_decomptim(self) -> Decomptim:
         if not self.__read_decomptim:
             self.__read_decomptim = True
@@ -248,13 +446,14 @@ class RawFilesRepository(AbstractFilesRepository):
             try:
                 logger.info("Lendo arquivo decomp.tim")
                 self.__decomptim = Decomptim.read(
-                    join(self.__tmppath, "decomp.tim")
+                    self._source(Decomptim, "decomp.tim")
                 )
             except Exception as e:
                 logger.error(f"Erro na leitura do decomp.tim: {e}")
                 raise e
         return self.__decomptim
 
+    @_prefetchable
     def get_inviabunic(self) -> InviabUnic:
         if not self.__read_inviabunic:
             self.__read_inviabunic = True
@@ -263,7 +462,7 @@ class RawFilesRepository(AbstractFilesRepository):
                 arq_inviabunic = f"inviab_unic.{self.extensao}"
                 logger.info(f"Lendo arquivo {arq_inviabunic}")
                 self.__inviabunic = InviabUnic.read(
-                    join(self.__tmppath, arq_inviabunic)
+                    self._source(InviabUnic, arq_inviabunic)
                 )
             except FileNotFoundError:
                 logger.info(f"Não encontrado arquivo {arq_inviabunic}")
@@ -273,6 +472,7 @@ class RawFilesRepository(AbstractFilesRepository):
                 raise e
         return self.__inviabunic
 
+    @_prefetchable
     def get_relgnl(self) -> Relgnl:
         if not self.__read_relgnl:
             self.__read_relgnl = True
@@ -280,7 +480,7 @@ class RawFilesRepository(AbstractFilesRepository):
             try:
                 arq_relgnl = f"relgnl.{self.extensao}"
                 logger.info(f"Lendo arquivo {arq_relgnl}")
-                self.__relgnl = Relgnl.read(join(self.__tmppath, arq_relgnl))
+                self.__relgnl = Relgnl.read(self._source(Relgnl, arq_relgnl))
             except FileNotFoundError:
                 logger.info(f"Não encontrado arquivo {arq_relgnl}")
                 raise RuntimeError()
@@ -289,6 +489,7 @@ class RawFilesRepository(AbstractFilesRepository):
                 raise e
         return self.__relgnl
 
+    @_prefetchable
     def get_hidr(self) -> Hidr:
         if not self.__read_hidr:
             self.__read_hidr = True
@@ -298,12 +499,13 @@ class RawFilesRepository(AbstractFilesRepository):
                 if arq_hidr is None:
                     raise FileNotFoundError()
                 logger.info(f"Lendo arquivo {arq_hidr}")
-                self.__hidr = Hidr.read(join(self.__tmppath, arq_hidr))
+                self.__hidr = Hidr.read(self._source(Hidr, arq_hidr))
             except Exception as e:
                 logger.error(f"Erro na leitura do {arq_hidr}: {e}")
                 raise e
         return self.__hidr
 
+    @_prefetchable
     def get_vazoes(self) -> Vazoes:
         if not self.__read_vazoes:
             self.__read_vazoes = True
@@ -313,166 +515,143 @@ class RawFilesRepository(AbstractFilesRepository):
                 if arq_vazoes is None:
                     raise FileNotFoundError()
                 logger.info(f"Lendo arquivo {arq_vazoes}")
-                self.__vazoes = Vazoes.read(join(self.__tmppath, arq_vazoes))
+                self.__vazoes = Vazoes.read(self._source(Vazoes, arq_vazoes))
             except Exception as e:
                 logger.error(f"Erro na leitura do {arq_vazoes}: {e}")
                 raise e
         return self.__vazoes
 
+    def get_file_version(self, filename: str) -> Optional[str]:
+        if filename not in self.__versions:
+            try:
+                self.__versions[filename] = sniff_version(
+                    self._read_bytes(filename, HEADER_PROBE_SIZE)
+                )
+            except FileNotFoundError:
+                self.__versions[filename] = None
+        return self.__versions[filename]
+
+    def __read_csv_file(self, file_class: Type[T], filename: str) -> T:
+        version = self.get_file_version(filename)
+        if version is None:
+            raise FileNotFoundError()
+        if Settings().csv_reader == "NATIVO":
+            arquivo = read_csv_content(
+                self._read_bytes(filename), file_class, version
+            )
+            if arquivo is not None:
+                return arquivo
+        return file_class.read(
+            self._source(file_class, filename),
+            version=parser_version(version),
+        )
+
+    @_prefetchable
     def get_dec_oper_usih(self) -> DecOperUsih:
         if not self.__read_dec_oper_usih:
             self.__read_dec_oper_usih = True
             logger = logging.getLogger("main")
             try:
                 logger.info("Lendo arquivo dec_oper_usih.csv")
-                self.__dec_oper_usih = DecOperUsih.read(
-                    join(self.__tmppath, "dec_oper_usih.csv")
+                self.__dec_oper_usih = self.__read_csv_file(
+                    DecOperUsih, "dec_oper_usih.csv"
                 )
-                version = self.__dec_oper_usih.versao
-                if version is None:
-                    raise FileNotFoundError()
-                if version <= "31.0.2":
-                    DecOperUsih.set_version("31.0.2")
-                    self.__dec_oper_usih = DecOperUsih.read(
-                        join(self.__tmppath, "dec_oper_usih.csv")
-                    )
             except Exception as e:
                 logger.error(f"Erro na leitura do dec_oper_usih.csv: {e}")
                 raise e
         return self.__dec_oper_usih
 
+    @_prefetchable
     def get_dec_oper_usit(self) -> DecOperUsit:
         if not self.__read_dec_oper_usit:
             self.__read_dec_oper_usit = True
             logger = logging.getLogger("main")
             try:
                 logger.info("Lendo arquivo dec_oper_usit.csv")
-                self.__dec_oper_usit = DecOperUsit.read(
-                    join(self.__tmppath, "dec_oper_usit.csv")
+                self.__dec_oper_usit = self.__read_csv_file(
+                    DecOperUsit, "dec_oper_usit.csv"
                 )
-                version = self.__dec_oper_usit.versao
-                if version is None:
-                    raise FileNotFoundError()
-                if version <= "31.0.2":
-                    DecOperUsit.set_version("31.0.2")
-                    self.__dec_oper_usit = DecOperUsit.read(
-                        join(self.__tmppath, "dec_oper_usit.csv")
-                    )
             except Exception as e:
                 logger.error(f"Erro na leitura do dec_oper_usit.csv: {e}")
                 raise e
         return self.__dec_oper_usit
 
+    @_prefetchable
     def get_dec_oper_gnl(self) -> DecOperGnl:
         if not self.__read_dec_oper_gnl:
             self.__read_dec_oper_gnl = True
             logger = logging.getLogger("main")
             try:
                 logger.info("Lendo arquivo dec_oper_gnl.csv")
-                self.__dec_oper_gnl = DecOperGnl.read(
-                    join(self.__tmppath, "dec_oper_gnl.csv")
+                self.__dec_oper_gnl = self.__read_csv_file(
+                    DecOperGnl, "dec_oper_gnl.csv"
                 )
-                version = self.__dec_oper_gnl.versao
-                if version is None:
-                    raise FileNotFoundError()
-                if version <= "31.0.2":
-                    DecOperGnl.set_version("31.0.2")
-                    self.__dec_oper_gnl = DecOperGnl.read(
-                        join(self.__tmppath, "dec_oper_gnl.csv")
-                    )
             except Exception as e:
                 logger.error(f"Erro na leitura do dec_oper_gnl.csv: {e}")
                 raise e
         return self.__dec_oper_gnl
 
+    @_prefetchable
     def get_dec_oper_ree(self) -> DecOperRee:
         if not self.__read_dec_oper_ree:
             self.__read_dec_oper_ree = True
             logger = logging.getLogger("main")
             try:
                 logger.info("Lendo arquivo dec_oper_ree.csv")
-                self.__dec_oper_ree = DecOperRee.read(
-                    join(self.__tmppath, "dec_oper_ree.csv")
+                self.__dec_oper_ree = self.__read_csv_file(
+                    DecOperRee, "dec_oper_ree.csv"
                 )
-                version = self.__dec_oper_ree.versao
-                if version is None:
-                    raise FileNotFoundError()
-                if version <= "31.0.2":
-                    DecOperRee.set_version("31.0.2")
-                    self.__dec_oper_ree = DecOperRee.read(
-                        join(self.__tmppath, "dec_oper_ree.csv")
-                    )
             except Exception as e:
                 logger.error(f"Erro na leitura do dec_oper_ree.csv: {e}")
                 raise e
         return self.__dec_oper_ree
 
+    @_prefetchable
     def get_dec_oper_sist(self) -> DecOperSist:
         if not self.__read_dec_oper_sist:
             self.__read_dec_oper_sist = True
             logger = logging.getLogger("main")
             try:
                 logger.info("Lendo arquivo dec_oper_sist.csv")
-                self.__dec_oper_sist = DecOperSist.read(
-                    join(self.__tmppath, "dec_oper_sist.csv")
+                self.__dec_oper_sist = self.__read_csv_file(
+                    DecOperSist, "dec_oper_sist.csv"
                 )
-                version = self.__dec_oper_sist.versao
-                if version is None:
-                    raise FileNotFoundError()
-                if version <= "31.0.2":
-                    DecOperSist.set_version("31.0.2")
-                    self.__dec_oper_sist = DecOperSist.read(
-                        join(self.__tmppath, "dec_oper_sist.csv")
-                    )
             except Exception as e:
                 logger.error(f"Erro na leitura do dec_oper_sist.csv: {e}")
                 raise e
         return self.__dec_oper_sist
 
+    @_prefetchable
     def get_dec_oper_interc(self) -> DecOperInterc:
         if not self.__read_dec_oper_interc:
             self.__read_dec_oper_interc = True
             logger = logging.getLogger("main")
             try:
                 logger.info("Lendo arquivo dec_oper_interc.csv")
-                self.__dec_oper_interc = DecOperInterc.read(
-                    join(self.__tmppath, "dec_oper_interc.csv")
+                self.__dec_oper_interc = self.__read_csv_file(
+                    DecOperInterc, "dec_oper_interc.csv"
                 )
-                version = self.__dec_oper_interc.versao
-                if version is None:
-                    raise FileNotFoundError()
-                if version <= "31.0.2":
-                    DecOperInterc.set_version("31.0.2")
-                    self.__dec_oper_interc = DecOperInterc.read(
-                        join(self.__tmppath, "dec_oper_interc.csv")
-                    )
             except Exception as e:
                 logger.error(f"Erro na leitura do dec_oper_interc.csv: {e}")
                 raise e
         return self.__dec_oper_interc
 
+    @_prefetchable
     def get_dec_eco_discr(self) -> DecEcoDiscr:
         if not self.__read_dec_eco_discr:
             self.__read_dec_eco_discr = True
             logger = logging.getLogger("main")
             try:
                 logger.info("Lendo arquivo dec_eco_discr.csv")
-                self.__dec_eco_discr = DecEcoDiscr.read(
-                    join(self.__tmppath, "dec_eco_discr.csv")
+                self.__dec_eco_discr = self.__read_csv_file(
+                    DecEcoDiscr, "dec_eco_discr.csv"
                 )
-                version = self.__dec_eco_discr.versao
-                if version is None:
-                    raise FileNotFoundError()
-                if version <= "31.0.2":
-                    DecEcoDiscr.set_version("31.0.2")
-                    self.__dec_eco_discr = DecEcoDiscr.read(
-                        join(self.__tmppath, "dec_eco_discr.csv")
-                    )
             except Exception as e:
                 logger.error(f"Erro na leitura do dec_eco_discr.csv: {e}")
                 raise e
         return self.__dec_eco_discr
 
+    @_prefetchable
     def get_avl_turb_max(self) -> AvlTurbMax:
         if not self.__read_avl_turb_max:
             self.__read_avl_turb_max = True
@@ -480,7 +659,7 @@ class RawFilesRepository(AbstractFilesRepository):
             try:
                 logger.info("Lendo arquivo avl_turb_max.csv")
                 self.__avl_turb_max = AvlTurbMax.read(
-                    join(self.__tmppath, "avl_turb_max.csv")
+                    self._source(AvlTurbMax, "avl_turb_max.csv")
                 )
             except Exception as e:
                 logger.error(f"Erro na leitura do avl_turb_max.csv: {e}")
@@ -495,16 +674,140 @@ class RawFilesRepository(AbstractFilesRepository):
             try:
                 logger.info(f"Lendo arquivo {file_name}")
                 self.__dec_fcf_cortes[stage] = DecFcfCortes.read(
-                    join(self.__tmppath, file_name)
+                    self._source(DecFcfCortes, file_name)
                 )
             except Exception as e:
                 logger.error(f"Erro na leitura do {file_name}: {e}")
                 raise e
         return self.__dec_fcf_cortes.get(stage)
 
+    def get_dec_fcf_cortes_tables(
+        self, stages: List[int]
+    ) -> Iterator[Tuple[int, Optional[pd.DataFrame]]]:
+        """
+        Lê as tabelas dos arquivos de cortes dos estágios fornecidos,
+        em paralelo quando há mais de um processador disponível,
+        retornando-as na ordem dos estágios e sem mantê-las em cache.
+        """
+        logger = logging.getLogger("main")
+        names = {
+            stage: f"dec_fcf_cortes_{str(stage).zfill(3)}.{self.extensao}"
+            for stage in stages
+        }
+        workers = min(int(Settings().processors), len(stages))
+        if Settings().memory_budget:
+            # Com memória máxima definida, os cortes são lidos em série
+            workers = 1
+        if workers <= 1:
+            for stage in stages:
+                logger.info(f"Lendo arquivo {names[stage]}")
+                yield (
+                    stage,
+                    _read_dec_fcf_cortes_table(
+                        self._source(DecFcfCortes, names[stage])
+                    ),
+                )
+            return
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending: Dict[int, Future[Optional[pd.DataFrame]]] = {}
+            remaining = list(stages)
+            for stage in stages:
+                while remaining and len(pending) < 2 * workers:
+                    next_stage = remaining.pop(0)
+                    logger.info(f"Lendo arquivo {names[next_stage]}")
+                    pending[next_stage] = executor.submit(
+                        _read_dec_fcf_cortes_table,
+                        self._source(DecFcfCortes, names[next_stage]),
+                    )
+                yield stage, pending.pop(stage).result()
 
-def factory(kind: str, *args: Any, **kwargs: Any) -> AbstractFilesRepository:
+
+def _decode_text(content: bytes, encoding: str | List[str]) -> str:
+    # Decodifica o conteúdo com as codificações do modelo do idecomp, na
+    # ordem em que são tentadas na leitura dos arquivos em disco, e
+    # normaliza as quebras de linha como na leitura em modo texto.
+    encodings = [encoding] if isinstance(encoding, str) else encoding
+    error: Optional[UnicodeDecodeError] = None
+    for e in encodings:
+        try:
+            text = content.decode(e)
+            return text.replace("\r\n", "\n").replace("\r", "\n")
+        except UnicodeDecodeError as err:
+            error = err
+    assert error is not None
+    raise error
+
+
+class ArchiveFilesRepository(RawFilesRepository):
+    """
+    Lê os arquivos do caso diretamente de um arquivo compactado (.zip,
+    .tar, .tar.gz, .tar.zst, ...) ou de um diretório com os arquivos
+    compactados individualmente (.gz, .zst, ...), sem extraí-los em
+    disco. O conteúdo de cada arquivo é descompactado em memória e
+    fornecido diretamente aos modelos do idecomp.
+    """
+
+    # Arquivos compactados abertos, pelo caminho absoluto, compartilhados
+    # entre as instâncias do repositório criadas a cada bloco `with` da
+    # unidade de trabalho, para que um .tar compactado seja descompactado
+    # uma única vez por comando. São fechados ao final do comando.
+    ARCHIVES: Dict[str, AbstractCaseArchive] = {}
+
+    def __init__(self, tmppath: str, version: str = "latest"):
+        path = self._archive_path(tmppath)
+        archive = self.ARCHIVES.get(path)
+        if archive is None:
+            logging.getLogger("main").debug(
+                f"Lendo arquivos do caso compactados em {path}"
+            )
+            archive = open_case_archive(path)
+            self.ARCHIVES[path] = archive
+        self._archive: AbstractCaseArchive = archive
+        super().__init__(tmppath, version)
+
+    @staticmethod
+    def _archive_path(tmppath: str) -> str:
+        path = find_case_archive(tmppath, Settings().case_archive)
+        return str(pathlib.Path(path).resolve())
+
+    @classmethod
+    def release(cls, tmppath: str) -> None:
+        super().release(tmppath)
+        if not pathlib.Path(tmppath).is_dir():
+            return
+        archive = cls.ARCHIVES.pop(cls._archive_path(tmppath), None)
+        if archive is not None:
+            archive.close()
+
+    def _source(self, parser: Type[Any], filename: str) -> str | bytes:
+        content = self._archive.read(filename)
+        if getattr(parser, "STORAGE", "TEXT") == "BINARY":
+            return content
+        return _decode_text(content, parser.ENCODING)
+
+    def _read_bytes(self, filename: str, size: int = -1) -> bytes:
+        return self._archive.read(filename, size)
+
+    def _convert_encoding(self, filename: str) -> None:
+        # A decodificação é feita em memória, na leitura do arquivo
+        pass
+
+
+def _kind(kind: str) -> Type[AbstractFilesRepository]:
     mapping: Dict[str, Type[AbstractFilesRepository]] = {
-        "FS": RawFilesRepository
+        "FS": RawFilesRepository,
+        "COMPACTADO": ArchiveFilesRepository,
     }
-    return mapping.get(kind, RawFilesRepository)(*args, **kwargs)
+    return mapping.get(kind, RawFilesRepository)
+
+
+def release(kind: str, tmppath: str) -> None:
+    """
+    Libera os recursos compartilhados pelos repositórios de arquivos do
+    tipo fornecido para o diretório do caso, ao final de um comando.
+    """
+    _kind(kind).release(tmppath)
+
+
+def factory(kind: str, *args: Any, **kwargs: Any) -> AbstractFilesRepository:
+    return _kind(kind)(*args, **kwargs)
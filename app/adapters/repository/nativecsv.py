@@ -0,0 +1,195 @@
+import io
+import re
+from typing import Dict, List, Optional, Tuple, Type, TypeVar
+
+import numpy as np
+import pandas as pd
+import polars as pl
+from cfinterface.components.block import Block
+from cfinterface.components.defaultblock import DefaultBlock
+from cfinterface.components.floatfield import FloatField
+from cfinterface.components.integerfield import IntegerField
+from cfinterface.data.blockdata import BlockData
+from idecomp.decomp.modelos.arquivoscsv.arquivocsv import ArquivoCSV
+from idecomp.decomp.modelos.blocos.tabelacsv import TabelaCSV
+from idecomp.decomp.modelos.blocos.versaomodelo import VersaoModelo
+
+T = TypeVar("T", bound=ArquivoCSV)
+
+# Versão a partir da qual os arquivos de saída do DECOMP passaram a
+# ter o formato atual, conforme os modelos do idecomp.
+LEGACY_VERSION = "31.0.2"
+
+# Última versão do modelo cujos arquivos de saída têm o formato conhecido
+# pelo leitor nativo. Os arquivos de versões posteriores, que podem ter
+# outras colunas, são lidos pelo idecomp.
+LATEST_KNOWN_VERSION = "31.21"
+
+# Tamanho máximo do cabeçalho onde é buscada a versão do modelo.
+HEADER_PROBE_SIZE = 4096
+
+_VERSION_PATTERNS = [
+    re.compile(rb"CEPEL: DECOMP[^\n]*?Versao([^\n]*)"),
+    re.compile(rb"Nome do Modelo: DECOMP Vers(?:\xe3|\xc3\xa3)o:([^\n]*)"),
+    re.compile(rb"CEPEL: DECOMP[^\n]*? v(\d[\d.]*)"),
+]
+_END_OF_TABLE_PATTERN = re.compile(rb"\n[^\n]?\n")
+
+
+def sniff_version(header: bytes) -> Optional[str]:
+    """
+    Obtém a versão do modelo a partir do cabeçalho de um arquivo
+    de saída .csv do DECOMP, como é feito pelo bloco `VersaoModelo`.
+    """
+    for pattern in _VERSION_PATTERNS:
+        match = pattern.search(header)
+        if match is not None:
+            version = match.group(1).decode("iso-8859-1")
+            return version.strip().split("-")[0].strip()
+    return None
+
+
+def probe_version(path: str) -> Optional[str]:
+    """
+    Obtém a versão do modelo lendo somente o início de um arquivo
+    de saída .csv do DECOMP, sem processar a tabela de dados.
+    """
+    with open(path, "rb") as f:
+        return sniff_version(f.read(HEADER_PROBE_SIZE))
+
+
+def _version_key(version: str) -> Optional[Tuple[int, ...]]:
+    try:
+        return tuple(int(v) for v in version.split("."))
+    except ValueError:
+        return None
+
+
+def parser_version(version: str) -> Optional[str]:
+    """
+    Obtém a versão dos modelos do idecomp que deve ser utilizada para
+    a leitura de um arquivo gerado pela versão fornecida do modelo.
+    """
+    key = _version_key(version)
+    legacy = _version_key(LEGACY_VERSION)
+    if key is not None and legacy is not None and key <= legacy:
+        return LEGACY_VERSION
+    return None
+
+
+def known_version(version: str) -> bool:
+    """
+    Verifica se os arquivos gerados pela versão fornecida do modelo têm
+    o formato conhecido pelo leitor nativo.
+    """
+    key = _version_key(version)
+    latest = _version_key(LATEST_KNOWN_VERSION)
+    return key is not None and latest is not None and key <= latest
+
+
+def _table_block(
+    file_class: Type[ArquivoCSV], version: str
+) -> Optional[Type[TabelaCSV]]:
+    blocks: List[Type[Block]] = file_class.BLOCKS
+    versions: Dict[str, List[Type[Block]]] = getattr(file_class, "VERSIONS", {})
+    legacy = parser_version(version)
+    if legacy is not None and legacy in versions:
+        blocks = versions[legacy]
+    for b in blocks:
+        if issubclass(b, TabelaCSV):
+            return b
+    return None
+
+
+def _table_bytes(content: bytes, begin_pattern: bytes) -> Optional[bytes]:
+    # O cabeçalho da tabela fica entre duas linhas de separadores e os
+    # dados vão até a primeira linha vazia, como no bloco `TabelaCSV`.
+    header_begin = content.find(begin_pattern)
+    if header_begin == -1:
+        return None
+    header_end = content.find(
+        begin_pattern, content.find(b"\n", header_begin) + 1
+    )
+    if header_end == -1:
+        return None
+    data_begin = content.find(b"\n", header_end) + 1
+    if data_begin == 0:
+        return b""
+    end = _END_OF_TABLE_PATTERN.search(content, data_begin - 1)
+    data_end = end.start() + 1 if end is not None else len(content)
+    return content[data_begin:data_end]
+
+
+def _parse_table(data: bytes, table: Type[TabelaCSV]) -> pd.DataFrame:
+    fields = table.LINE_MODEL.fields
+    names = table.COLUMN_NAMES
+    if len(data.strip()) == 0:
+        return pd.DataFrame(columns=names)
+    raw = pl.read_csv(
+        io.BytesIO(data.decode(ArquivoCSV.ENCODING).encode("utf-8")),
+        has_header=False,
+        separator=";",
+        quote_char=None,
+        infer_schema=False,
+        truncate_ragged_lines=True,
+    )
+    if raw.width < len(names):
+        raise ValueError(
+            f"Número de colunas ({raw.width}) inferior ao esperado"
+            + f" ({len(names)})"
+        )
+    columns: Dict[str, np.ndarray | pd.Series] = {}
+    for field, name, col in zip(fields, names, raw.columns):
+        series = raw.get_column(col).str.strip_chars()
+        if isinstance(field, IntegerField):
+            series = series.cast(pl.Int64, strict=False)
+            if series.null_count() > 0:
+                series = series.cast(pl.Float64)
+            columns[name] = series.to_numpy()
+        elif isinstance(field, FloatField):
+            columns[name] = series.cast(pl.Float64, strict=False).to_numpy()
+        else:
+            columns[name] = pd.Series(series.to_list())
+    return pd.DataFrame(columns)
+
+
+def read_csv_table(
+    path: str, file_class: Type[T], version: Optional[str] = None
+) -> Optional[T]:
+    """
+    Realiza a leitura de um arquivo de saída .csv do DECOMP com o
+    leitor de CSV do polars, aplicando o esquema de colunas da versão
+    do modelo informada no cabeçalho. Retorna None quando o formato
+    do arquivo não é reconhecido ou a versão do modelo é posterior à
+    `LATEST_KNOWN_VERSION`, para que seja lido pelo idecomp.
+    """
+    with open(path, "rb") as f:
+        content = f.read()
+    return read_csv_content(content, file_class, version)
+
+
+def read_csv_content(
+    content: bytes, file_class: Type[T], version: Optional[str] = None
+) -> Optional[T]:
+    """
+    Realiza a leitura do conteúdo de um arquivo de saída .csv do DECOMP,
+    como `read_csv_table`, para arquivos que não estão em disco.
+    """
+    if version is None:
+        version = sniff_version(content[:HEADER_PROBE_SIZE])
+    if version is None or not known_version(version):
+        return None
+    table = _table_block(file_class, version)
+    if table is None:
+        return None
+    data = _table_bytes(content, table.BEGIN_PATTERN.encode("ascii"))
+    if data is None:
+        return None
+    try:
+        df = _parse_table(data, table)
+    except (pl.exceptions.PolarsError, ValueError):
+        return None
+    block_data = BlockData(DefaultBlock())
+    block_data.append(VersaoModelo(data=version))
+    block_data.append(table(data=df))
+    return file_class(data=block_data)
@@ -0,0 +1,124 @@
+import logging
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+from app.utils.memory import current_rss_mb
+
+# Resultado das leituras antecipadas não realizadas, cujos arquivos
+# devem ser lidos sob demanda por quem os requisitar.
+NOT_READ = object()
+
+
+class FilePrefetcher:
+    """
+    Lê antecipadamente os arquivos do caso em threads separadas, na ordem
+    em que serão requisitados, enquanto as sínteses anteriores são
+    calculadas. Cada arquivo lido aguarda em memória até ser requisitado
+    com `take`, sendo mantidos no máximo `workers` arquivos em leitura ou
+    aguardando. A leitura antecipada é interrompida quando a memória
+    residente excede `memory_cap` (MB), e os arquivos restantes são
+    lidos sob demanda.
+    """
+
+    def __init__(
+        self,
+        read: Callable[[str], Any],
+        files: List[str],
+        workers: int = 1,
+        memory_cap: Optional[float] = None,
+        logger: Optional[logging.Logger] = None,
+    ) -> None:
+        if workers < 1:
+            raise ValueError(f"Número de leitores inválido: {workers}")
+        self.read = read
+        self.memory_cap = memory_cap
+        self.logger = logger
+        self._pending = list(files)
+        self._futures: Dict[str, Future[Any]] = {}
+        self._requested: Set[str] = set()
+        self._cancelled = False
+        self._lock = threading.Lock()
+        self._slots = threading.Semaphore(workers)
+        self._threads: List[threading.Thread] = [
+            threading.Thread(target=self._work, name=f"leitor-{i}", daemon=True)
+            for i in range(workers)
+        ]
+        for t in self._threads:
+            t.start()
+
+    def _log(self, msg: str) -> None:
+        if self.logger is not None:
+            self.logger.info(msg)
+
+    def _exceeds_memory_cap(self) -> bool:
+        if self.memory_cap is None:
+            return False
+        rss = current_rss_mb()
+        return not np.isnan(rss) and rss > self.memory_cap
+
+    def _next(self) -> Optional[Tuple[str, Future[Any]]]:
+        # Obtém o próximo arquivo a ser lido, ignorando os que já foram
+        # requisitados e estão sendo lidos sob demanda.
+        with self._lock:
+            while self._pending and not self._cancelled:
+                name = self._pending.pop(0)
+                if name not in self._requested:
+                    future: Future[Any] = Future()
+                    self._futures[name] = future
+                    return name, future
+            return None
+
+    def _work(self) -> None:
+        while True:
+            self._slots.acquire()
+            item = self._next()
+            if item is None:
+                self._slots.release()
+                return
+            name, future = item
+            if self._exceeds_memory_cap():
+                self._log(
+                    "Leitura antecipada interrompida: memória residente"
+                    + f" acima de {self.memory_cap:.0f} MB"
+                )
+                with self._lock:
+                    self._cancelled = True
+                future.set_result(NOT_READ)
+                continue
+            try:
+                future.set_result(self.read(name))
+            except Exception as e:
+                future.set_exception(e)
+
+    def take(self, name: str) -> Any:
+        """
+        Obtém um arquivo lido antecipadamente, aguardando o fim da
+        leitura caso esteja em andamento. Retorna NOT_READ caso a leitura
+        não tenha sido iniciada, para que o arquivo seja lido sob demanda.
+        """
+        with self._lock:
+            self._requested.add(name)
+            future = self._futures.pop(name, None)
+        if future is None:
+            return NOT_READ
+        self._slots.release()
+        return future.result()
+
+    def close(self) -> None:
+        """
+        Interrompe a leitura antecipada, aguardando as leituras em
+        andamento e descartando os arquivos não requisitados.
+        """
+        with self._lock:
+            self._cancelled = True
+            self._pending.clear()
+        for _ in self._threads:
+            self._slots.release()
+        for t in self._threads:
+            t.join()
+        self._threads = []
+        with self._lock:
+            self._futures.clear()
@@ -0,0 +1,94 @@
+"""
+Interface para uso do sintetizador-decomp a partir de outros programas
+em Python, que retorna as sínteses como DataFrames sem escrevê-las em
+disco.
+
+Além das tabelas das variáveis requisitadas, são retornadas as tabelas
+de metadados, de estatísticas e de desempenho produzidas pela síntese.
+Os dados de cada caso são mantidos em memória entre as chamadas e
+descartados quando algum arquivo de entrada é modificado.
+"""
+
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+import pandas as pd
+import pyarrow as pa
+
+from app.model.settings import Settings
+from app.services.session import SynthesisSession
+
+SynthesisTables = Union[Dict[str, pd.DataFrame], Dict[str, pa.Table]]
+
+_SESSION: Optional[SynthesisSession] = None
+
+
+def _session() -> SynthesisSession:
+    global _SESSION
+    if _SESSION is None:
+        settings = Settings()
+        if settings.installdir is None:
+            # Necessário para o script de conversão de codificação
+            settings.installdir = str(Path(__file__).resolve().parents[1])
+        _SESSION = SynthesisSession()
+    return _SESSION
+
+
+def sintetizar(
+    sintetizador: str,
+    caminho: str,
+    variaveis: Optional[List[str]] = None,
+    arrow: bool = False,
+) -> SynthesisTables:
+    """
+    Realiza a síntese das variáveis fornecidas (ou de todas as variáveis
+    suportadas, caso nenhuma seja fornecida) para o caso no diretório
+    `caminho`, retornando as tabelas produzidas indexadas pelo nome.
+
+    Com `arrow=True`, as tabelas são retornadas como `pyarrow.Table`.
+    """
+    tables = _session().synthetize(caminho, sintetizador, variaveis or [])
+    if not arrow:
+        return tables
+    return {
+        name: pa.Table.from_pandas(df, preserve_index=False)
+        for name, df in tables.items()
+    }
+
+
+def sintetizar_sistema(
+    caminho: str, variaveis: Optional[List[str]] = None, arrow: bool = False
+) -> SynthesisTables:
+    return sintetizar("sistema", caminho, variaveis, arrow)
+
+
+def sintetizar_execucao(
+    caminho: str, variaveis: Optional[List[str]] = None, arrow: bool = False
+) -> SynthesisTables:
+    return sintetizar("execucao", caminho, variaveis, arrow)
+
+
+def sintetizar_cenarios(
+    caminho: str, variaveis: Optional[List[str]] = None, arrow: bool = False
+) -> SynthesisTables:
+    return sintetizar("cenarios", caminho, variaveis, arrow)
+
+
+def sintetizar_operacao(
+    caminho: str, variaveis: Optional[List[str]] = None, arrow: bool = False
+) -> SynthesisTables:
+    return sintetizar("operacao", caminho, variaveis, arrow)
+
+
+def sintetizar_politica(
+    caminho: str, variaveis: Optional[List[str]] = None, arrow: bool = False
+) -> SynthesisTables:
+    return sintetizar("politica", caminho, variaveis, arrow)
+
+
+def limpar_cache() -> None:
+    """
+    Descarta os dados dos casos mantidos em memória.
+    """
+    if _SESSION is not None:
+        _SESSION.clear()
@@ -1,12 +1,18 @@
 import os
 import time
 from multiprocessing import Manager
-from typing import Any, Tuple
+from typing import Any, Optional, Tuple
 
 import click
 
 import app.domain.commands as commands
 import app.services.handlers as handlers
+from app.adapters.repository.export import (
+    ARROW_COMPRESSIONS,
+    PARQUET_COMPRESSIONS,
+    ParquetOptions,
+)
+from app.model.operation.filters import parse_int_ranges
 from app.services.unitofwork import factory
 from app.utils.log import Log
 
@@ -30,13 +36,165 @@ def _log_and_execute(title: str, q: Any, handler_fn: Any, command: Any) -> None:
     Log.terminate_logging_process()
 
 
+def _validate_filter(ctx: Any, param: Any, value: str) -> str:
+    try:
+        parse_int_ranges(value)
+    except ValueError as e:
+        raise click.BadParameter(str(e))
+    return value
+
+
+def _validate_row_groups(ctx: Any, param: Any, value: Optional[str]) -> str:
+    try:
+        ParquetOptions(row_groups=value or "")
+    except ValueError as e:
+        raise click.BadParameter(str(e))
+    return value or ""
+
+
+def _validate_partitions(ctx: Any, param: Any, value: Optional[str]) -> str:
+    try:
+        ParquetOptions(partitions=value or "")
+    except ValueError as e:
+        raise click.BadParameter(str(e))
+    return value or ""
+
+
 @click.group()
-def app() -> None:
+@click.option(
+    "--perfil",
+    type=click.Choice(["cpu", "memoria"], case_sensitive=False),
+    default=None,
+    help="gera perfis de CPU ou de memória de cada síntese",
+)
+@click.option(
+    "--memoria-maxima",
+    type=float,
+    default=None,
+    help="memória residente máxima (MB), acima da qual as caches são"
+    + " liberadas entre as sínteses",
+)
+@click.option(
+    "--compressao",
+    type=click.Choice(PARQUET_COMPRESSIONS, case_sensitive=False),
+    default=None,
+    help="compressão dos arquivos Parquet (padrão: zstd)",
+)
+@click.option(
+    "--nivel-compressao",
+    type=int,
+    default=None,
+    help="nível da compressão dos arquivos Parquet",
+)
+@click.option(
+    "--dicionario/--sem-dicionario",
+    default=None,
+    help="codifica as colunas de texto dos arquivos Parquet como dicionário",
+)
+@click.option(
+    "--grupos-linhas",
+    default=None,
+    callback=_validate_row_groups,
+    help="grupos de linhas dos arquivos Parquet: número de linhas ou"
+    + " 'estagio', para um grupo por estágio",
+)
+@click.option(
+    "--estatisticas-parquet/--sem-estatisticas-parquet",
+    default=None,
+    help="escreve as estatísticas das colunas nos arquivos Parquet",
+)
+@click.option(
+    "--compressao-arrow",
+    type=click.Choice(ARROW_COMPRESSIONS, case_sensitive=False),
+    default=None,
+    help="compressão dos arquivos Arrow IPC (padrão: none, que permite"
+    + " o mapeamento em memória)",
+)
+@click.option(
+    "--particoes",
+    default=None,
+    callback=_validate_partitions,
+    help="colunas de partição dos conjuntos de dados Parquet"
+    + " (ex: estagio,codigo_usina)",
+)
+@click.option(
+    "--arquivo-unico",
+    is_flag=True,
+    help="também escreve o arquivo único das sínteses particionadas",
+)
+@click.option(
+    "--valores-float32",
+    is_flag=True,
+    help="escreve as colunas de valores das sínteses em precisão simples",
+)
+@click.option(
+    "--arquivo-caso",
+    default=None,
+    help="lê os arquivos do caso de um arquivo compactado (.zip, .tar.gz,"
+    + " .tar.zst...) sem extraí-los ou, com '.', de arquivos compactados"
+    + " individualmente (.gz, .zst...) no diretório do caso",
+)
+@click.option(
+    "--historico-tempos",
+    default=None,
+    help="arquivo JSON onde são guardados os tempos de síntese de cada"
+    + " variável, usados na estimativa do tempo restante",
+)
+def app(
+    perfil: Optional[str],
+    memoria_maxima: Optional[float],
+    compressao: Optional[str],
+    nivel_compressao: Optional[int],
+    dicionario: Optional[bool],
+    grupos_linhas: str,
+    estatisticas_parquet: Optional[bool],
+    compressao_arrow: Optional[str],
+    particoes: str,
+    arquivo_unico: bool,
+    valores_float32: bool,
+    arquivo_caso: Optional[str],
+    historico_tempos: Optional[str],
+) -> None:
     """
     Aplicação para realizar a síntese de informações em
     um modelo unificado de dados para o DECOMP.
     """
-    pass
+    if perfil:
+        os.environ["PERFIL_SINTESE"] = perfil.upper()
+    if memoria_maxima:
+        os.environ["MEMORIA_MAXIMA"] = str(memoria_maxima)
+    if historico_tempos:
+        os.environ["HISTORICO_TEMPOS"] = historico_tempos
+    try:
+        ParquetOptions(
+            compression=compressao or ParquetOptions.compression,
+            compression_level=nivel_compressao,
+        )
+    except ValueError as e:
+        raise click.UsageError(str(e))
+    if compressao:
+        os.environ["COMPRESSAO_PARQUET"] = compressao.lower()
+    if nivel_compressao is not None:
+        os.environ["NIVEL_COMPRESSAO_PARQUET"] = str(nivel_compressao)
+    if dicionario is not None:
+        os.environ["DICIONARIO_PARQUET"] = "1" if dicionario else "0"
+    if grupos_linhas:
+        os.environ["GRUPOS_LINHAS_PARQUET"] = grupos_linhas
+    if estatisticas_parquet is not None:
+        os.environ["ESTATISTICAS_PARQUET"] = (
+            "1" if estatisticas_parquet else "0"
+        )
+    if compressao_arrow:
+        os.environ["COMPRESSAO_ARROW"] = compressao_arrow.lower()
+    if particoes:
+        os.environ["PARTICOES_PARQUET"] = particoes
+    if arquivo_unico:
+        os.environ["ARQUIVO_UNICO_PARQUET"] = "1"
+    if valores_float32:
+        os.environ["VALORES_FLOAT32"] = "1"
+    if arquivo_caso:
+        os.environ["REPOSITORIO_ARQUIVOS"] = "COMPACTADO"
+        os.environ["ARQUIVO_CASO"] = arquivo_caso
 
 
 @click.command("sistema")
@@ -112,12 +270,80 @@ def cenarios(variaveis: Tuple[str, ...], formato: str) -> None:
     default=1,
     help="numero de processadores para paralelizar",
 )
+@click.option(
+    "--estagios",
+    default="",
+    callback=_validate_filter,
+    help="estágios sintetizados (ex: 1-2,4)",
+)
+@click.option(
+    "--cenarios",
+    default="",
+    callback=_validate_filter,
+    help="cenários sintetizados (ex: 1-10)",
+)
+@click.option(
+    "--usinas",
+    default="",
+    callback=_validate_filter,
+    help=(
+        "códigos das usinas sintetizadas, comparados aos códigos das "
+        "hidrelétricas e das térmicas"
+    ),
+)
+@click.option(
+    "--submercados",
+    default="",
+    callback=_validate_filter,
+    help="códigos dos submercados sintetizados",
+)
+@click.option(
+    "--apenas-estatisticas",
+    is_flag=True,
+    help="escreve apenas as estatísticas, sem as sínteses por cenário",
+)
+@click.option(
+    "--escritores",
+    default=1,
+    type=click.IntRange(min=0),
+    help="threads de escrita das sínteses (0: escrita imediata)",
+)
+@click.option(
+    "--fila-exportacao",
+    default=2,
+    type=click.IntRange(min=1),
+    help="máximo de sínteses aguardando escrita",
+)
+@click.option(
+    "--leitores",
+    default=1,
+    type=click.IntRange(min=0),
+    help="threads de leitura antecipada dos arquivos (0: leitura sob demanda)",
+)
 def operacao(
-    variaveis: Tuple[str, ...], formato: str, processadores: int
+    variaveis: Tuple[str, ...],
+    formato: str,
+    processadores: int,
+    estagios: str,
+    cenarios: str,
+    usinas: str,
+    submercados: str,
+    apenas_estatisticas: bool,
+    escritores: int,
+    fila_exportacao: int,
+    leitores: int,
 ) -> None:
     """Realiza a síntese dos dados da operação do DECOMP."""
     os.environ["FORMATO_SINTESE"] = formato
     os.environ["PROCESSADORES"] = str(processadores)
+    os.environ["FILTRO_ESTAGIOS"] = estagios
+    os.environ["FILTRO_CENARIOS"] = cenarios
+    os.environ["FILTRO_USINAS"] = usinas
+    os.environ["FILTRO_SUBMERCADOS"] = submercados
+    os.environ["APENAS_ESTATISTICAS"] = "1" if apenas_estatisticas else ""
+    os.environ["ESCRITORES_EXPORTACAO"] = str(escritores)
+    os.environ["FILA_EXPORTACAO"] = str(fila_exportacao)
+    os.environ["LEITORES_ARQUIVOS"] = str(leitores)
     q = _setup_logging()
     _log_and_execute(
         "Realizando síntese da OPERACAO",
@@ -217,6 +443,34 @@ def completa(
     Log.terminate_logging_process()
 
 
+@click.command("servidor")
+@click.option("--host", default="127.0.0.1", help="endereço do servidor")
+@click.option("--porta", default=5080, help="porta do servidor")
+@click.option(
+    "--formato", default="PARQUET", help="formato para escrita da síntese"
+)
+@click.option(
+    "--casos",
+    default=4,
+    help="número de casos mantidos em memória simultaneamente",
+)
+def servidor(host: str, porta: int, formato: str, casos: int) -> None:
+    """
+    Executa um servidor HTTP local que realiza sínteses sob demanda,
+    mantendo em memória os dados já processados de cada caso.
+    """
+    from app.server import serve
+
+    os.environ["FORMATO_SINTESE"] = formato
+    q = _setup_logging()
+    Log.configure_main_logger(q)
+    try:
+        serve(host, porta, q, casos)
+    finally:
+        time.sleep(1.0)
+        Log.terminate_logging_process()
+
+
 app.add_command(completa)
 app.add_command(sistema)
 app.add_command(execucao)
@@ -224,3 +478,4 @@ app.add_command(cenarios)
 app.add_command(operacao)
 app.add_command(politica)
 app.add_command(limpeza)
+app.add_command(servidor)
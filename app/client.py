@@ -0,0 +1,79 @@
+import json
+from typing import Any, Dict, List, Optional, cast
+from urllib.error import HTTPError
+from urllib.parse import quote, urlencode
+from urllib.request import Request, urlopen
+
+import pandas as pd
+import pyarrow.ipc as ipc
+
+from app.server import DEFAULT_HOST, DEFAULT_PORT
+
+
+class SynthesisClient:
+    """
+    Cliente do servidor de sínteses (`sintetizador-decomp servidor`).
+    """
+
+    def __init__(
+        self,
+        host: str = DEFAULT_HOST,
+        port: int = DEFAULT_PORT,
+        timeout: Optional[float] = None,
+    ) -> None:
+        self.url = f"http://{host}:{port}"
+        self.timeout = timeout
+
+    def _request(
+        self, path: str, body: Optional[Dict[str, Any]] = None
+    ) -> bytes:
+        request = Request(
+            self.url + path,
+            data=None if body is None else json.dumps(body).encode(),
+            headers={"Content-Type": "application/json"},
+            method="GET" if body is None else "POST",
+        )
+        try:
+            with urlopen(request, timeout=self.timeout) as response:
+                return cast(bytes, response.read())
+        except HTTPError as e:
+            message = e.read().decode(errors="replace")
+            try:
+                message = json.loads(message)["erro"]
+            except (ValueError, KeyError, TypeError):
+                pass
+            raise RuntimeError(f"Erro {e.code} do servidor: {message}")
+
+    def status(self) -> Dict[str, Any]:
+        """
+        Obtém os casos mantidos em memória pelo servidor.
+        """
+        return cast(Dict[str, Any], json.loads(self._request("/saude")))
+
+    def synthetize(
+        self, case: str, synthesizer: str, variable: str
+    ) -> pd.DataFrame:
+        """
+        Obtém a síntese de uma variável de um caso.
+        """
+        path = f"/sintese/{quote(synthesizer)}/{quote(variable)}?" + urlencode(
+            {"caso": case}
+        )
+        return ipc.open_stream(self._request(path)).read_pandas()
+
+    def write(
+        self, case: str, synthesizer: str, variables: List[str]
+    ) -> List[str]:
+        """
+        Solicita a escrita das sínteses das variáveis fornecidas no
+        diretório de síntese do caso, retornando as tabelas escritas.
+        """
+        body = {
+            "caso": case,
+            "sintetizador": synthesizer,
+            "variaveis": variables,
+        }
+        response = cast(
+            Dict[str, Any], json.loads(self._request("/sintese", body))
+        )
+        return cast(List[str], response["arquivos"])
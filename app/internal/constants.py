@@ -116,11 +116,17 @@ SCENARIO_SYNTHESIS_COMMON_COLUMNS = [
 
 EXECUTION_SYNTHESIS_METADATA_OUTPUT = "METADADOS_EXECUCAO"
 OPERATION_SYNTHESIS_METADATA_OUTPUT = "METADADOS_OPERACAO"
+OPERATION_SYNTHESIS_FILES_METADATA_OUTPUT = "METADADOS_ARQUIVOS_OPERACAO"
+OPERATION_SYNTHESIS_FILTERS_METADATA_OUTPUT = "METADADOS_FILTROS_OPERACAO"
 OPERATION_SYNTHESIS_STATS_ROOT = "ESTATISTICAS_OPERACAO"
+OPERATION_SYNTHESIS_STATS_FRAGMENTS_DIR = "_fragmentos_estatisticas"
 SCENARIO_SYNTHESIS_METADATA_OUTPUT = "METADADOS_CENARIOS"
 SCENARIO_SYNTHESIS_STATS_ROOT = "ESTATISTICAS_CENARIOS"
 POLICY_SYNTHESIS_METADATA_OUTPUT = "METADADOS_POLITICA"
+POLICY_SYNTHESIS_CUT_STORE_OUTPUT = "CORTES_ARMAZENADOS.arrow"
 SYSTEM_SYNTHESIS_METADATA_OUTPUT = "METADADOS_SISTEMA"
+SYNTHESIS_PERFORMANCE_OUTPUT = "DESEMPENHO_SINTESE"
+SYNTHESIS_MANIFEST_OUTPUT = "MANIFESTO_SINTESE"
 EXECUTION_SYNTHESIS_SUBDIR = ""
 OPERATION_SYNTHESIS_SUBDIR = ""
 SCENARIO_SYNTHESIS_SUBDIR = ""
@@ -0,0 +1,78 @@
+from dataclasses import dataclass
+from typing import List, Optional
+
+import pandas as pd
+
+from app.model.settings import Settings
+
+
+def parse_int_ranges(text: Optional[str]) -> Optional[List[int]]:
+    """
+    Interpreta uma lista de inteiros e de intervalos separados por
+    vírgulas, como "1-3,5", retornando None para um texto vazio.
+    """
+    if not text or not text.strip():
+        return None
+    values: List[int] = []
+    for part in text.split(","):
+        part = part.strip()
+        try:
+            if "-" in part:
+                start, end = (int(v) for v in part.split("-", 1))
+                values += list(range(start, end + 1))
+            else:
+                values.append(int(part))
+        except ValueError:
+            raise ValueError(f"Filtro não reconhecido: {text}")
+    return sorted(set(values))
+
+
+@dataclass
+class OperationFilters:
+    """
+    Estágios, cenários, usinas e submercados aos quais a síntese
+    da operação é restrita. Um campo vazio não restringe a síntese.
+    """
+
+    stages: Optional[List[int]] = None
+    scenarios: Optional[List[int]] = None
+    plants: Optional[List[int]] = None
+    submarkets: Optional[List[int]] = None
+
+    @classmethod
+    def from_settings(cls) -> "OperationFilters":
+        settings = Settings()
+        return cls(
+            stages=parse_int_ranges(settings.stage_filter),
+            scenarios=parse_int_ranges(settings.scenario_filter),
+            plants=parse_int_ranges(settings.plant_filter),
+            submarkets=parse_int_ranges(settings.submarket_filter),
+        )
+
+    @property
+    def active(self) -> bool:
+        return any(
+            v is not None
+            for v in [self.stages, self.scenarios, self.plants, self.submarkets]
+        )
+
+    def to_df(self) -> pd.DataFrame:
+        """
+        Descreve os filtros aplicados, para exportação como metadados.
+        """
+        filters = {
+            "estagios": self.stages,
+            "cenarios": self.scenarios,
+            "usinas": self.plants,
+            "submercados": self.submarkets,
+        }
+        return pd.DataFrame(
+            {
+                "filtro": [k for k, v in filters.items() if v is not None],
+                "valores": [
+                    ",".join(str(i) for i in v)
+                    for v in filters.values()
+                    if v is not None
+                ],
+            }
+        )
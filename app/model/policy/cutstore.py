@@ -0,0 +1,260 @@
+import json
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.ipc as ipc
+
+from app.internal.constants import (
+    BLOCK_COL,
+    COEF_TYPE_COL,
+    COEF_VALUE_COL,
+    CUT_INDEX_COL,
+    ENTITY_INDEX_COL,
+    ITERATION_COL,
+    LAG_COL,
+    RHS_COEF_CODE,
+    STAGE_COL,
+    STATE_VALUE_COL,
+)
+
+# Colunas que identificam cada variável de estado dos cortes
+STATE_VARIABLE_COLUMNS = [COEF_TYPE_COL, ENTITY_INDEX_COL, LAG_COL, BLOCK_COL]
+
+# Chave dos metadados do esquema Arrow com as variáveis de cada estágio
+VARIABLES_METADATA_KEY = b"variaveis"
+
+
+def _concat(arrays: List[np.ndarray], dtype: type) -> np.ndarray:
+    if len(arrays) == 0:
+        return np.array([], dtype=dtype)
+    return np.concatenate(arrays).astype(dtype)
+
+
+@dataclass
+class StageCuts:
+    """
+    Cortes de Benders de um estágio em representação densa: um vetor
+    com o termo independente (RHS) de cada corte e uma matriz com os
+    coeficientes de cada corte para cada variável de estado. Cada corte
+    define a restrição: alpha >= rhs + coeficientes @ x.
+    """
+
+    stage: int
+    cut_index: np.ndarray
+    iteration: np.ndarray
+    rhs: np.ndarray
+    coefficients: np.ndarray
+    variables: np.ndarray
+
+    @classmethod
+    def from_df(cls, stage: int, df: pd.DataFrame) -> "StageCuts":
+        """
+        Constrói a representação densa a partir da tabela de coeficientes
+        dos cortes de um estágio.
+        """
+        cut_index, cut_pos = np.unique(
+            df[CUT_INDEX_COL].to_numpy(), return_inverse=True
+        )
+        iteration = np.zeros(len(cut_index), dtype=np.int32)
+        iteration[cut_pos] = df[ITERATION_COL].to_numpy()
+        is_rhs = df[COEF_TYPE_COL].to_numpy() == RHS_COEF_CODE
+        values = df[COEF_VALUE_COL].to_numpy(dtype=np.float64)
+        rhs = np.zeros(len(cut_index), dtype=np.float64)
+        rhs[cut_pos[is_rhs]] = values[is_rhs]
+        keys = df.loc[~is_rhs, STATE_VARIABLE_COLUMNS].to_numpy(dtype=np.int32)
+        variables, var_pos = np.unique(keys, axis=0, return_inverse=True)
+        coefficients = np.zeros(
+            (len(cut_index), len(variables)), dtype=np.float64
+        )
+        coefficients[cut_pos[~is_rhs], var_pos.ravel()] = values[~is_rhs]
+        return cls(
+            stage=stage,
+            cut_index=cut_index.astype(np.int32),
+            iteration=iteration,
+            rhs=rhs,
+            coefficients=coefficients,
+            variables=variables.reshape(-1, len(STATE_VARIABLE_COLUMNS)),
+        )
+
+    @property
+    def variables_df(self) -> pd.DataFrame:
+        """
+        As variáveis de estado, na ordem das colunas da matriz
+        de coeficientes.
+        """
+        return pd.DataFrame(self.variables, columns=STATE_VARIABLE_COLUMNS)
+
+    def state_matrix(
+        self, df: pd.DataFrame, state_col: str = "estado"
+    ) -> np.ndarray:
+        """
+        Constrói a matriz de estados, com um estado por linha e uma
+        variável de estado por coluna, a partir de uma tabela com as
+        colunas das variáveis de estado, `state_col` e `valor_estado`.
+        Variáveis não informadas assumem o valor nulo.
+        """
+        states, state_pos = np.unique(
+            df[state_col].to_numpy(), return_inverse=True
+        )
+        positions = {tuple(v): i for i, v in enumerate(self.variables.tolist())}
+        keys = df[STATE_VARIABLE_COLUMNS].to_numpy(dtype=np.int32).tolist()
+        var_pos = np.array([positions.get(tuple(k), -1) for k in keys])
+        valid = var_pos >= 0
+        matrix = np.zeros((len(states), len(self.variables)), np.float64)
+        matrix[state_pos[valid], var_pos[valid]] = df[STATE_VALUE_COL].to_numpy(
+            dtype=np.float64
+        )[valid]
+        return matrix
+
+    def _cut_values(self, states: np.ndarray) -> np.ndarray:
+        states = np.atleast_2d(np.asarray(states, dtype=np.float64))
+        if states.shape[1] != self.coefficients.shape[1]:
+            raise ValueError(
+                f"Número de variáveis de estado ({states.shape[1]})"
+                + f" diferente do esperado ({self.coefficients.shape[1]})"
+            )
+        return np.asarray(
+            states @ self.coefficients.T + self.rhs, dtype=np.float64
+        )
+
+    def evaluate(self, states: np.ndarray) -> np.ndarray:
+        """
+        Avalia a função de custo futuro, como o máximo entre os
+        cortes, para cada estado fornecido.
+        """
+        return np.asarray(self._cut_values(states).max(axis=1))
+
+    def binding_cuts(self, states: np.ndarray) -> np.ndarray:
+        """
+        Obtém o índice do corte ativo para cada estado fornecido.
+        """
+        return np.asarray(
+            self.cut_index[self._cut_values(states).argmax(axis=1)]
+        )
+
+
+class CutStore:
+    """
+    Armazenamento compacto dos cortes de Benders de todos os estágios,
+    que pode ser persistido e recuperado em formato Arrow IPC.
+    """
+
+    def __init__(self, stages: Dict[int, StageCuts]) -> None:
+        self.stages = stages
+
+    @classmethod
+    def from_stage_dfs(cls, dfs: Iterable[pd.DataFrame]) -> "CutStore":
+        """
+        Constrói o armazenamento a partir das tabelas de coeficientes
+        dos cortes de cada estágio.
+        """
+        store = cls({})
+        for df in dfs:
+            store.add(df)
+        return store
+
+    def add(self, df: pd.DataFrame) -> None:
+        """
+        Adiciona os cortes de um estágio a partir da sua tabela de
+        coeficientes.
+        """
+        if df.empty:
+            return
+        stage = int(df[STAGE_COL].iloc[0])
+        self.stages[stage] = StageCuts.from_df(stage, df)
+
+    def collect(self, dfs: Iterable[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+        """
+        Adiciona os cortes de cada tabela à medida que as tabelas são
+        consumidas, repassando-as sem alterações.
+        """
+        for df in dfs:
+            self.add(df)
+            yield df
+
+    def evaluate(self, stage: int, states: np.ndarray) -> np.ndarray:
+        """
+        Avalia a função de custo futuro de um estágio para cada
+        estado fornecido.
+        """
+        return self.stages[stage].evaluate(states)
+
+    def to_arrow(self) -> pa.Table:
+        """
+        Converte os cortes em uma tabela Arrow com um corte por linha.
+        As variáveis de estado de cada estágio são mantidas nos
+        metadados do esquema.
+        """
+        stages = list(self.stages.values())
+        row_sizes = np.concatenate(
+            [[0]] + [np.full(len(s.rhs), s.variables.shape[0]) for s in stages]
+        )
+        coefficients = pa.ListArray.from_arrays(
+            pa.array(np.cumsum(row_sizes), type=pa.int32()),
+            pa.array(
+                _concat([s.coefficients.ravel() for s in stages], np.float64)
+            ),
+        )
+        table = pa.table(
+            {
+                STAGE_COL: _concat(
+                    [np.full(len(s.rhs), s.stage) for s in stages], np.int32
+                ),
+                CUT_INDEX_COL: _concat([s.cut_index for s in stages], np.int32),
+                ITERATION_COL: _concat([s.iteration for s in stages], np.int32),
+                "rhs": _concat([s.rhs for s in stages], np.float64),
+                "coeficientes": coefficients,
+            }
+        )
+        variables = {str(s.stage): s.variables.tolist() for s in stages}
+        return table.replace_schema_metadata(
+            {VARIABLES_METADATA_KEY: json.dumps(variables).encode()}
+        )
+
+    @classmethod
+    def from_arrow(cls, table: pa.Table) -> "CutStore":
+        """
+        Recupera os cortes a partir de uma tabela gerada por `to_arrow`.
+        """
+        metadata = table.schema.metadata or {}
+        variables = json.loads(metadata.get(VARIABLES_METADATA_KEY, b"{}"))
+        stage_col = table.column(STAGE_COL).to_numpy()
+        stages: Dict[int, StageCuts] = {}
+        for stage_str, stage_variables in variables.items():
+            stage = int(stage_str)
+            rows = table.filter(pa.array(stage_col == stage))
+            num_variables = len(stage_variables)
+            coefficients = (
+                rows.column("coeficientes")
+                .combine_chunks()
+                .flatten()
+                .to_numpy()
+                .reshape(rows.num_rows, num_variables)
+            )
+            stages[stage] = StageCuts(
+                stage=stage,
+                cut_index=rows.column(CUT_INDEX_COL).to_numpy(),
+                iteration=rows.column(ITERATION_COL).to_numpy(),
+                rhs=rows.column("rhs").to_numpy(),
+                coefficients=coefficients,
+                variables=np.array(stage_variables, dtype=np.int32).reshape(
+                    num_variables, len(STATE_VARIABLE_COLUMNS)
+                ),
+            )
+        return cls(stages)
+
+    def save(self, path: str) -> None:
+        """Persiste os cortes em um arquivo Arrow IPC."""
+        table = self.to_arrow()
+        with pa.OSFile(path, "wb") as sink:
+            with ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+
+    @classmethod
+    def load(cls, path: str) -> "CutStore":
+        """Recupera os cortes de um arquivo Arrow IPC."""
+        with pa.memory_map(path, "r") as source:
+            return cls.from_arrow(ipc.open_file(source).read_all())
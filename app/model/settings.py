@@ -9,6 +9,48 @@ class Settings(metaclass=Singleton):
         self.basedir: str | None = getenv("APP_BASEDIR")
         self.encoding_script: str = "app/static/converte_utf8.sh"
         self.file_repository: str = getenv("REPOSITORIO_ARQUIVOS", "FS")
+        self.case_archive: str = getenv("ARQUIVO_CASO", "")
+        self.csv_reader: str = getenv("LEITOR_CSV", "IDECOMP")
         self.synthesis_format: str = getenv("FORMATO_SINTESE", "PARQUET")
         self.synthesis_dir: str = getenv("DIRETORIO_SINTESE", "sintese")
+        self.parquet_compression: str = getenv("COMPRESSAO_PARQUET", "zstd")
+        self.parquet_compression_level: int | None = (
+            int(getenv("NIVEL_COMPRESSAO_PARQUET", ""))
+            if getenv("NIVEL_COMPRESSAO_PARQUET")
+            else None
+        )
+        self.parquet_dictionary: bool = getenv(
+            "DICIONARIO_PARQUET", "1"
+        ) not in ("", "0")
+        self.parquet_row_groups: str = getenv("GRUPOS_LINHAS_PARQUET", "")
+        self.parquet_statistics: bool = getenv(
+            "ESTATISTICAS_PARQUET", "1"
+        ) not in ("", "0")
+        self.arrow_compression: str = getenv("COMPRESSAO_ARROW", "none")
+        self.parquet_partitions: str = getenv("PARTICOES_PARQUET", "")
+        self.parquet_flat_copy: bool = getenv(
+            "ARQUIVO_UNICO_PARQUET", ""
+        ) not in ("", "0")
+        self.float32_values: bool = getenv("VALORES_FLOAT32", "") not in (
+            "",
+            "0",
+        )
         self.processors: str | int = getenv("PROCESSADORES", 1)
+        self.export_writers: int = int(getenv("ESCRITORES_EXPORTACAO", 1))
+        self.export_queue: int = int(getenv("FILA_EXPORTACAO", 2))
+        self.file_readers: int = int(getenv("LEITORES_ARQUIVOS", 1))
+        self.stage_filter: str = getenv("FILTRO_ESTAGIOS", "")
+        self.scenario_filter: str = getenv("FILTRO_CENARIOS", "")
+        self.plant_filter: str = getenv("FILTRO_USINAS", "")
+        self.submarket_filter: str = getenv("FILTRO_SUBMERCADOS", "")
+        self.statistics_only: bool = getenv("APENAS_ESTATISTICAS", "") not in (
+            "",
+            "0",
+        )
+        self.profiling: str = getenv("PERFIL_SINTESE", "")
+        self.memory_budget: float | None = (
+            float(getenv("MEMORIA_MAXIMA", ""))
+            if getenv("MEMORIA_MAXIMA")
+            else None
+        )
+        self.timing_history: str = getenv("HISTORICO_TEMPOS", "")
@@ -0,0 +1,175 @@
+import json
+import logging
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, cast
+from urllib.parse import parse_qs, urlparse
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.ipc as ipc
+
+from app.adapters.repository.export import factory as export_factory
+from app.model.settings import Settings
+from app.services.session import DEFAULT_MAX_CASES, SynthesisSession
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 5080
+
+ARROW_STREAM_CONTENT_TYPE = "application/vnd.apache.arrow.stream"
+
+
+class SynthesisServer(SynthesisSession):
+    """
+    Sessão de sínteses do servidor, que também escreve as sínteses
+    requisitadas no diretório de síntese de cada caso.
+    """
+
+    def write(
+        self, directory: str, synthesizer: str, variables: List[str]
+    ) -> List[str]:
+        """
+        Realiza a síntese das variáveis fornecidas para um caso e
+        escreve as tabelas produzidas no diretório de síntese do caso.
+        """
+        tables = self.synthetize(directory, synthesizer, variables)
+        path = Path(directory).resolve().joinpath(Settings().synthesis_dir)
+        path.mkdir(parents=True, exist_ok=True)
+        exporter = export_factory(Settings().synthesis_format, str(path))
+        for name, df in tables.items():
+            exporter.synthetize_df(df, name)
+        return list(tables.keys())
+
+
+def to_arrow_ipc(df: pd.DataFrame) -> bytes:
+    """
+    Serializa uma tabela no formato de stream do Arrow IPC.
+    """
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    sink = pa.BufferOutputStream()
+    with ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return cast(bytes, sink.getvalue().to_pybytes())
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    """
+    Rotas do servidor:
+
+    - GET /saude: casos mantidos em memória.
+    - GET /sintese/<sintetizador>/<variavel>?caso=<diretorio>: tabela
+      da variável em Arrow IPC.
+    - POST /sintese, com corpo JSON {"caso", "sintetizador",
+      "variaveis"}: escreve as sínteses no diretório do caso.
+    """
+
+    server: "_HTTPServer"
+
+    def _send(self, status: int, body: bytes, content_type: str) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_json(self, status: int, data: Dict[str, Any]) -> None:
+        self._send(status, json.dumps(data).encode(), "application/json")
+
+    def _handle(self, action: Callable[[], None]) -> None:
+        try:
+            action()
+        except ValueError as e:
+            self._send_json(400, {"erro": str(e)})
+        except Exception as e:
+            self.server.synthesis.logger.exception(e)
+            self._send_json(500, {"erro": str(e)})
+
+    def do_GET(self) -> None:
+        url = urlparse(self.path)
+        parts = [p for p in url.path.split("/") if p]
+        if parts == ["saude"]:
+            self._send_json(200, self.server.synthesis.status())
+        elif len(parts) == 3 and parts[0] == "sintese":
+            case = parse_qs(url.query).get("caso", [""])[0]
+            self._handle(lambda: self._get_synthesis(case, *parts[1:]))
+        else:
+            self._send_json(404, {"erro": f"Rota não encontrada: {url.path}"})
+
+    def _get_synthesis(
+        self, case: str, synthesizer: str, variable: str
+    ) -> None:
+        tables = self.server.synthesis.synthetize(case, synthesizer, [variable])
+        df = tables.get(variable)
+        if df is None:
+            self._send_json(404, {"erro": f"Síntese não gerada: {variable}"})
+            return
+        self._send(200, to_arrow_ipc(df), ARROW_STREAM_CONTENT_TYPE)
+
+    def do_POST(self) -> None:
+        url = urlparse(self.path)
+        if url.path.strip("/") != "sintese":
+            self._send_json(404, {"erro": f"Rota não encontrada: {url.path}"})
+            return
+        length = int(self.headers.get("Content-Length", 0))
+        self._handle(lambda: self._post_synthesis(self.rfile.read(length)))
+
+    def _post_synthesis(self, body: bytes) -> None:
+        try:
+            request = json.loads(body or b"{}")
+        except json.JSONDecodeError:
+            raise ValueError("Corpo da requisição não é um JSON válido")
+        files = self.server.synthesis.write(
+            request.get("caso", ""),
+            request.get("sintetizador", ""),
+            list(request.get("variaveis", [])),
+        )
+        self._send_json(200, {"arquivos": files})
+
+    def log_message(self, format: str, *args: Any) -> None:
+        self.server.synthesis.logger.debug(format % args)
+
+
+class _HTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], synthesis: SynthesisServer):
+        super().__init__(address, _RequestHandler)
+        self.synthesis = synthesis
+
+
+def create_server(
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    q: Any = None,
+    max_cases: int = DEFAULT_MAX_CASES,
+) -> _HTTPServer:
+    """
+    Cria o servidor HTTP de sínteses. Com porta 0, uma porta livre
+    é escolhida e pode ser obtida em `server.server_address`.
+    """
+    return _HTTPServer((host, port), SynthesisServer(q, max_cases))
+
+
+def serve(
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    q: Any = None,
+    max_cases: int = DEFAULT_MAX_CASES,
+    ready: Optional[Callable[[_HTTPServer], None]] = None,
+) -> None:
+    """
+    Executa o servidor de sínteses até que seja interrompido.
+    """
+    server = create_server(host, port, q, max_cases)
+    logger = logging.getLogger("main")
+    logger.info(
+        f"Servidor de sínteses em http://{host}:{server.server_address[1]}"
+    )
+    if ready is not None:
+        ready(server)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from typing import Optional
+from typing import Iterator, List, Optional, Tuple
 
+import pandas as pd
 from idecomp.decomp import (  # type: ignore[attr-defined]
     Dadger,
     Decomptim,
@@ -113,9 +114,22 @@ def get_avl_turb_max(uow: AbstractUnitOfWork) -> AvlTurbMax:
         return avl
 
 
+def get_file_version(filename: str, uow: AbstractUnitOfWork) -> Optional[str]:
+    with uow:
+        version = uow.files.get_file_version(filename)
+        return version
+
+
 def get_dec_fcf_cortes(
     stage: int, uow: AbstractUnitOfWork
 ) -> Optional[DecFcfCortes]:
     with uow:
         dec = uow.files.get_dec_fcf_cortes(stage)
         return dec
+
+
+def get_dec_fcf_cortes_tables(
+    stages: List[int], uow: AbstractUnitOfWork
+) -> Iterator[Tuple[int, Optional[pd.DataFrame]]]:
+    with uow:
+        yield from uow.files.get_dec_fcf_cortes_tables(stages)
@@ -8,7 +8,7 @@ All functions accept (cache, uow) and use the cache dict owned by Deck.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Dict
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 import numpy as np
 import pandas as pd
@@ -35,6 +35,25 @@ from app.utils.operations import fast_group_df
 if TYPE_CHECKING:
     from app.services.unitofwork import AbstractUnitOfWork
 
+# Colunas dos arquivos dec_oper_* utilizadas no cálculo dos limites
+DEC_OPER_BOUNDS_COLUMNS: Dict[str, List[str]] = {
+    "dec_oper_ree": ["earm_maximo_MWmes"],
+    "dec_oper_usih": ["volume_util_maximo_hm3", "volume_minimo_hm3"],
+    "dec_oper_usit": ["geracao_minima_MW", "geracao_maxima_MW"],
+    "dec_oper_interc": ["capacidade_MW"],
+}
+
+# Os limites por estágio são obtidos do primeiro cenário de todos os
+# estágios. Quando a síntese é filtrada, somente estes dados são
+# processados, sem os filtros de estágios e cenários do Deck.
+DEC_OPER_BOUNDS_FILTERS: Dict[str, List[int]] = {SCENARIO_COL: [1]}
+
+
+def _bounds_filters() -> Optional[Dict[str, List[int]]]:
+    from app.services.deck.deck import Deck
+
+    return DEC_OPER_BOUNDS_FILTERS if Deck.DECK_DATA_FILTERS else None
+
 
 # ---------------------------------------------------------------------------
 # Stored energy bounds
@@ -48,7 +67,9 @@ def stored_energy_upper_bounds_eer(
     if name not in cache:
         from app.services.deck.deck import Deck
 
-        df = Deck.dec_oper_ree(uow)
+        df = Deck.dec_oper_ree(
+            uow, DEC_OPER_BOUNDS_COLUMNS["dec_oper_ree"], _bounds_filters()
+        )
         df = df.loc[
             df[SCENARIO_COL] == 1,
             [STAGE_COL, EER_CODE_COL, "earm_maximo_MWmes"],
@@ -163,7 +184,9 @@ def stored_volume_upper_bounds(
     if name not in cache:
         from app.services.deck.deck import Deck
 
-        df = Deck.dec_oper_usih(uow)
+        df = Deck.dec_oper_usih(
+            uow, DEC_OPER_BOUNDS_COLUMNS["dec_oper_usih"], _bounds_filters()
+        )
         df = df.loc[
             (df[SCENARIO_COL] == 1) & (df[BLOCK_COL] == 0),
             [STAGE_COL, HYDRO_CODE_COL, "volume_util_maximo_hm3"],
@@ -195,7 +218,9 @@ def stored_volume_lower_bounds(
     if name not in cache:
         from app.services.deck.deck import Deck
 
-        df = Deck.dec_oper_usih(uow)
+        df = Deck.dec_oper_usih(
+            uow, DEC_OPER_BOUNDS_COLUMNS["dec_oper_usih"], _bounds_filters()
+        )
         df = df.loc[
             (df[SCENARIO_COL] == 1) & (df[BLOCK_COL] == 0),
             [STAGE_COL, HYDRO_CODE_COL, "volume_minimo_hm3"],
@@ -537,7 +562,9 @@ def thermal_generation_bounds(
     if obj is None:
         from app.services.deck.deck import Deck
 
-        df = Deck.dec_oper_usit(uow)
+        df = Deck.dec_oper_usit(
+            uow, DEC_OPER_BOUNDS_COLUMNS["dec_oper_usit"], _bounds_filters()
+        )
         df.rename(
             {
                 "geracao_minima_MW": LOWER_BOUND_COL,
@@ -582,7 +609,9 @@ def exchange_bounds(
     if obj is None:
         from app.services.deck.deck import Deck
 
-        df = Deck.dec_oper_interc(uow)
+        df = Deck.dec_oper_interc(
+            uow, DEC_OPER_BOUNDS_COLUMNS["dec_oper_interc"]
+        )
         df.rename(
             {"capacidade_MW": UPPER_BOUND_COL},
             axis=1,
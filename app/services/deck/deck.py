@@ -15,7 +15,7 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Type, TypeVar
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Type, TypeVar
 
 import pandas as pd
 from idecomp.decomp import (  # type: ignore[attr-defined]
@@ -36,6 +36,8 @@ from idecomp.decomp.dec_oper_sist import DecOperSist
 from idecomp.decomp.dec_oper_usih import DecOperUsih
 from idecomp.decomp.dec_oper_usit import DecOperUsit
 
+from app.internal.constants import SCENARIO_COL, STAGE_COL
+from app.model.policy.cutstore import CutStore
 from app.services.deck import (
     accessors,
     entities,
@@ -60,11 +62,48 @@ class Deck:
     T = TypeVar("T")
     logger: Optional[logging.Logger] = None
     DECK_DATA_CACHING: Dict[str, Any] = {}
+    DECK_DATA_PROJECTION: Dict[str, List[str]] = {}
+    DECK_DATA_FILTERS: Dict[str, List[int]] = {}
 
     @classmethod
     def _c(cls) -> Dict[str, Any]:
         return cls.DECK_DATA_CACHING
 
+    @classmethod
+    def set_projection(cls, projection: Dict[str, List[str]]) -> None:
+        """
+        Define as colunas dos arquivos dec_oper_* que serão necessárias
+        em uma síntese, para que cada arquivo seja processado uma única vez
+        somente com as colunas necessárias.
+        """
+        cls.DECK_DATA_PROJECTION = {k: list(v) for k, v in projection.items()}
+
+    @classmethod
+    def set_filters(cls, stages: Optional[List[int]] = None, scenarios: Optional[List[int]] = None) -> None:
+        """
+        Define os estágios e os cenários que serão sintetizados, para que
+        os arquivos dec_oper_* sejam filtrados antes da expansão dos
+        cenários nos estágios determinísticos.
+        """
+        filters: Dict[str, List[int]] = {}
+        if stages is not None:
+            filters[STAGE_COL] = sorted(stages)
+        if scenarios is not None:
+            filters[SCENARIO_COL] = sorted(scenarios)
+        cls.DECK_DATA_FILTERS = filters
+
+    @classmethod
+    def _filters(cls, filters: Optional[Dict[str, List[int]]]) -> Optional[Dict[str, List[int]]]:
+        if filters is not None:
+            return filters or None
+        return dict(cls.DECK_DATA_FILTERS) or None
+
+    @classmethod
+    def _projection(cls, name: str, columns: Optional[List[str]]) -> Optional[List[str]]:
+        if columns is None:
+            return None
+        return sorted(set(columns) | set(cls.DECK_DATA_PROJECTION.get(name, [])))
+
     @classmethod
     def _log(cls, msg: str, level: int = logging.INFO) -> None:
         if cls.logger is not None:
@@ -144,6 +183,14 @@ class Deck:
     def _get_dec_fcf_cortes(cls, stage: int, uow: AbstractUnitOfWork) -> Optional[DecFcfCortes]:
         return accessors.get_dec_fcf_cortes(stage, uow)
 
+    @classmethod
+    def _get_dec_fcf_cortes_tables(cls, stages: List[int], uow: AbstractUnitOfWork) -> Iterator[Tuple[int, Optional[pd.DataFrame]]]:
+        return accessors.get_dec_fcf_cortes_tables(stages, uow)
+
+    @classmethod
+    def _get_file_version(cls, filename: str, uow: AbstractUnitOfWork) -> Optional[str]:
+        return accessors.get_file_version(filename, uow)
+
     # --- Cached primary file objects (infrastructure) ---
 
     @classmethod
@@ -184,6 +231,10 @@ class Deck:
     def runtimes(cls, uow: AbstractUnitOfWork) -> pd.DataFrame:
         return _infra.runtimes(cls._c(), uow)
 
+    @classmethod
+    def file_versions(cls, uow: AbstractUnitOfWork) -> pd.DataFrame:
+        return _infra.file_versions(cls._c(), uow)
+
     @classmethod
     def probabilities(cls, uow: AbstractUnitOfWork) -> pd.DataFrame:
         return _infra.probabilities(cls._c(), uow)
@@ -307,32 +358,32 @@ class Deck:
     # --- Operations data (dec_oper_*) ---
 
     @classmethod
-    def dec_oper_sist(cls, uow: AbstractUnitOfWork) -> pd.DataFrame:
-        return operations.dec_oper_sist(cls._c(), uow)
+    def dec_oper_sist(cls, uow: AbstractUnitOfWork, columns: Optional[List[str]] = None, filters: Optional[Dict[str, List[int]]] = None) -> pd.DataFrame:
+        return operations.dec_oper_sist(cls._c(), uow, cls._projection("dec_oper_sist", columns), cls._filters(filters))
 
     @classmethod
-    def dec_oper_ree(cls, uow: AbstractUnitOfWork) -> pd.DataFrame:
-        return operations.dec_oper_ree(cls._c(), uow)
+    def dec_oper_ree(cls, uow: AbstractUnitOfWork, columns: Optional[List[str]] = None, filters: Optional[Dict[str, List[int]]] = None) -> pd.DataFrame:
+        return operations.dec_oper_ree(cls._c(), uow, cls._projection("dec_oper_ree", columns), cls._filters(filters))
 
     @classmethod
-    def dec_oper_usih(cls, uow: AbstractUnitOfWork) -> pd.DataFrame:
-        return operations.dec_oper_usih(cls._c(), uow)
+    def dec_oper_usih(cls, uow: AbstractUnitOfWork, columns: Optional[List[str]] = None, filters: Optional[Dict[str, List[int]]] = None) -> pd.DataFrame:
+        return operations.dec_oper_usih(cls._c(), uow, cls._projection("dec_oper_usih", columns), cls._filters(filters))
 
     @classmethod
-    def dec_oper_usit(cls, uow: AbstractUnitOfWork) -> pd.DataFrame:
-        return operations.dec_oper_usit(cls._c(), uow)
+    def dec_oper_usit(cls, uow: AbstractUnitOfWork, columns: Optional[List[str]] = None, filters: Optional[Dict[str, List[int]]] = None) -> pd.DataFrame:
+        return operations.dec_oper_usit(cls._c(), uow, cls._projection("dec_oper_usit", columns), cls._filters(filters))
 
     @classmethod
     def dec_oper_gnl(cls, uow: AbstractUnitOfWork) -> pd.DataFrame:
         return operations.dec_oper_gnl(cls._c(), uow)
 
     @classmethod
-    def dec_oper_interc(cls, uow: AbstractUnitOfWork) -> pd.DataFrame:
-        return operations.dec_oper_interc(cls._c(), uow)
+    def dec_oper_interc(cls, uow: AbstractUnitOfWork, columns: Optional[List[str]] = None, filters: Optional[Dict[str, List[int]]] = None) -> pd.DataFrame:
+        return operations.dec_oper_interc(cls._c(), uow, cls._projection("dec_oper_interc", columns), cls._filters(filters))
 
     @classmethod
-    def dec_oper_interc_net(cls, uow: AbstractUnitOfWork) -> pd.DataFrame:
-        return operations.dec_oper_interc_net(cls._c(), uow)
+    def dec_oper_interc_net(cls, uow: AbstractUnitOfWork, columns: Optional[List[str]] = None, filters: Optional[Dict[str, List[int]]] = None) -> pd.DataFrame:
+        return operations.dec_oper_interc_net(cls._c(), uow, cls._projection("dec_oper_interc_net", columns), cls._filters(filters))
 
     @classmethod
     def avl_turb_max(cls, uow: AbstractUnitOfWork) -> pd.DataFrame:
@@ -350,6 +401,14 @@ class Deck:
     def cortes(cls, uow: AbstractUnitOfWork) -> pd.DataFrame:
         return operations.cortes(cls._c(), uow)
 
+    @classmethod
+    def cortes_per_stage(cls, uow: AbstractUnitOfWork) -> Iterator[pd.DataFrame]:
+        return operations.cortes_per_stage(cls._c(), uow)
+
+    @classmethod
+    def cut_store(cls, uow: AbstractUnitOfWork) -> CutStore:
+        return operations.cut_store(cls._c(), uow)
+
     @classmethod
     def variaveis_cortes(cls, uow: AbstractUnitOfWork) -> pd.DataFrame:
         return operations.variaveis_cortes(cls._c(), uow)
@@ -2,7 +2,8 @@
 Infrastructure helpers for DECOMP synthesis.
 
 Cached accessors for primary file objects (dadger, relato, relato2) and
-execution metadata: costs, convergence, infeasibilities, runtimes, probabilities.
+execution metadata: costs, convergence, infeasibilities, runtimes, output
+file versions, probabilities.
 """
 
 from __future__ import annotations
@@ -24,6 +25,18 @@ from app.internal.constants import (
     VALUE_COL,
 )
 
+# Arquivos de saída cuja versão do modelo é identificada pelo cabeçalho
+VERSIONED_FILES = [
+    "dec_oper_usih.csv",
+    "dec_oper_usit.csv",
+    "dec_oper_gnl.csv",
+    "dec_oper_ree.csv",
+    "dec_oper_sist.csv",
+    "dec_oper_interc.csv",
+    "dec_eco_discr.csv",
+    "avl_turb_max.csv",
+]
+
 if TYPE_CHECKING:
     from idecomp.decomp import Dadger, Relato  # type: ignore[attr-defined]
 
@@ -330,6 +343,23 @@ def runtimes(cache: Dict[str, Any], uow: "AbstractUnitOfWork") -> pd.DataFrame:
     return obj
 
 
+def file_versions(
+    cache: Dict[str, Any], uow: "AbstractUnitOfWork"
+) -> pd.DataFrame:
+    name = "file_versions"
+    obj = cache.get(name)
+    if obj is None:
+        from app.services.deck.deck import Deck
+
+        versions = [Deck._get_file_version(f, uow) for f in VERSIONED_FILES]
+        obj = pd.DataFrame(
+            data={"arquivo": VERSIONED_FILES, "versao": versions}
+        )
+        obj = obj.loc[obj["versao"].notna()].reset_index(drop=True)
+        cache[name] = obj
+    return obj
+
+
 def probabilities(
     cache: Dict[str, Any], uow: "AbstractUnitOfWork"
 ) -> pd.DataFrame:
@@ -1,6 +1,15 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Dict, Optional
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 
 import numpy as np
 import pandas as pd
@@ -19,9 +28,11 @@ from app.internal.constants import (
     EXCHANGE_TARGET_CODE_COL,
     GTER_COEF_CODE,
     HYDRO_CODE_COL,
+    IDENTIFICATION_COLUMNS,
     ITERATION_COL,
     IV_SUBMARKET_CODE,
     LAG_COL,
+    NODE_COL,
     QDEF_COEF_CODE,
     RHS_COEF_CODE,
     SCENARIO_COL,
@@ -31,13 +42,186 @@ from app.internal.constants import (
     THERMAL_CODE_COL,
     VARM_COEF_CODE,
 )
+from app.model.policy.cutstore import CutStore
 from app.model.policy.unit import Unit
 from app.services.deck import processing
 from app.utils.operations import cast_ac_fields_to_stage
+from app.utils.schema import apply_schema
 
 if TYPE_CHECKING:
     from app.services.unitofwork import AbstractUnitOfWork
 
+# Colunas dos arquivos dec_oper_* que identificam cada linha e são
+# sempre mantidas quando é feita a projeção das colunas de valores.
+DEC_OPER_KEY_COLUMNS = IDENTIFICATION_COLUMNS + [
+    NODE_COL,
+    "duracao",
+    "nome_submercado",
+    "nome_ree",
+    "nome_usina",
+    "nome_submercado_de",
+    "nome_submercado_para",
+]
+
+# Colunas calculadas a partir de outras colunas dos arquivos dec_oper_*
+DEC_OPER_DERIVED_COLUMNS: Dict[str, List[str]] = {
+    "geracao_termica_total_MW": [
+        "geracao_termica_MW",
+        "geracao_termica_antecipada_MW",
+    ],
+    "geracao_hidro_com_itaipu_MW": ["geracao_hidroeletrica_MW", "itaipu_60MW"],
+    "demanda_liquida_MW": ["demanda_MW", "geracao_pequenas_usinas_MW"],
+    "geracao_nao_simuladas_MW": [
+        "geracao_pequenas_usinas_MW",
+        "geracao_eolica_MW",
+    ],
+    "volume_minimo_hm3": ["volume_util_maximo_hm3"],
+    "geracao_percentual_maxima": ["geracao_MW", "geracao_maxima_MW"],
+    "geracao_percentual_flexivel": [
+        "geracao_MW",
+        "geracao_minima_MW",
+        "geracao_maxima_MW",
+    ],
+}
+
+
+def _projection_key(name: str) -> str:
+    return f"{name}_colunas"
+
+
+def _cache_name(name: str, filters: Optional[Dict[str, List[int]]]) -> str:
+    """
+    Obtém o nome de um arquivo dec_oper_* na cache. Os dados processados
+    com filtros de estágios e cenários são armazenados separadamente
+    dos dados completos.
+    """
+    if not filters:
+        return name
+    return name + "".join(
+        f"_{col}_" + "-".join(str(v) for v in values)
+        for col, values in sorted(filters.items())
+    )
+
+
+def _has_column(columns: Optional[Set[str]], col: str) -> bool:
+    return columns is None or col in columns
+
+
+def _source_columns(
+    columns: Optional[Set[str]], required: Optional[List[str]] = None
+) -> Optional[Set[str]]:
+    """
+    Obtém as colunas que devem ser lidas do arquivo para que as colunas
+    fornecidas, incluindo as derivadas, possam ser calculadas.
+    """
+    if columns is None:
+        return None
+    source = set(columns) | set(required or [])
+    for col in columns:
+        source |= set(DEC_OPER_DERIVED_COLUMNS.get(col, []))
+    return source
+
+
+def _project_df(df: pd.DataFrame, columns: Optional[Set[str]]) -> pd.DataFrame:
+    """
+    Mantém no df somente as colunas de identificação e as colunas
+    de valores fornecidas. Caso não sejam fornecidas colunas, o df
+    é mantido inalterado.
+    """
+    if columns is None:
+        return df
+    return df.drop(
+        columns=[
+            c
+            for c in df.columns
+            if c not in DEC_OPER_KEY_COLUMNS and c not in columns
+        ]
+    )
+
+
+def _cached_projection(
+    cache: Dict[str, Any], key: str, columns: Optional[List[str]]
+) -> Optional[pd.DataFrame]:
+    df = cache.get(key)
+    if df is None:
+        return None
+    cached_columns: Optional[Set[str]] = cache.get(_projection_key(key))
+    if cached_columns is None:
+        return _project_df(df, None if columns is None else set(columns))
+    if columns is not None and set(columns) <= cached_columns:
+        return _project_df(df, set(columns))
+    return None
+
+
+def _cached_dec_oper(
+    cache: Dict[str, Any],
+    name: str,
+    columns: Optional[List[str]],
+    filters: Optional[Dict[str, List[int]]] = None,
+) -> Optional[pd.DataFrame]:
+    """
+    Obtém os dados processados de um arquivo dec_oper_* da cache,
+    caso contenham todas as colunas requisitadas. Os dados completos
+    também atendem às requisições com filtros, que são novamente
+    aplicados nas sínteses.
+    """
+    for key in dict.fromkeys([_cache_name(name, filters), name]):
+        df = _cached_projection(cache, key, columns)
+        if df is not None:
+            return df
+    return None
+
+
+def _columns_to_process(
+    cache: Dict[str, Any],
+    name: str,
+    columns: Optional[List[str]],
+    filters: Optional[Dict[str, List[int]]] = None,
+) -> Optional[Set[str]]:
+    """
+    Obtém as colunas que devem ser processadas para um arquivo dec_oper_*,
+    unindo as colunas requisitadas com as já existentes na cache.
+    """
+    if columns is None:
+        return None
+    cached_columns: Optional[Set[str]] = cache.get(
+        _projection_key(_cache_name(name, filters))
+    )
+    return set(columns) | (cached_columns or set())
+
+
+def _store_dec_oper(
+    cache: Dict[str, Any],
+    name: str,
+    df: pd.DataFrame,
+    columns: Optional[Set[str]],
+    filters: Optional[Dict[str, List[int]]] = None,
+) -> pd.DataFrame:
+    """
+    Armazena os dados processados de um arquivo dec_oper_* na cache,
+    com as colunas de códigos e índices nos tipos inteiros compactos.
+    """
+    df = apply_schema(df, categories=False, float32=False)
+    key = _cache_name(name, filters)
+    cache[key] = df
+    if columns is None:
+        cache.pop(_projection_key(key), None)
+    else:
+        cache[_projection_key(key)] = columns
+    return df
+
+
+def _table_and_version(arq: Any, name: str) -> Tuple[pd.DataFrame, str]:
+    """
+    Obtém a tabela e a versão do modelo de um arquivo dec_oper_*,
+    a partir de uma única leitura do arquivo.
+    """
+    from app.services.deck.deck import Deck
+
+    df = Deck._validate_data(arq.tabela, pd.DataFrame, name)
+    version = Deck._validate_data(arq.versao, str, name)
+    return df, version
+
 
 def _stub_nodes_scenarios_v31_0_2(df: pd.DataFrame) -> pd.DataFrame:
     stages = df[STAGE_COL].unique().tolist()
@@ -92,48 +276,51 @@ def _eval_net_exchange(
         if df.loc[reverse_filter].empty:
             continue
         for col in ["intercambio_origem_MW", "intercambio_destino_MW"]:
+            if col not in df.columns:
+                continue
             df.loc[direct_filter, col] -= df.loc[reverse_filter, col].to_numpy()
         df = df.drop(index=df.loc[reverse_filter].index)
     return df
 
 
 def dec_oper_sist(
-    cache: Dict[str, Any], uow: "AbstractUnitOfWork"
+    cache: Dict[str, Any],
+    uow: "AbstractUnitOfWork",
+    columns: Optional[List[str]] = None,
+    filters: Optional[Dict[str, List[int]]] = None,
 ) -> pd.DataFrame:
     name = "dec_oper_sist"
-    df = cache.get(name)
+    df = _cached_dec_oper(cache, name, columns, filters)
     if df is None:
         from app.services.deck.deck import Deck
 
-        df = Deck._validate_data(
-            Deck._get_dec_oper_sist(uow).tabela,
-            pd.DataFrame,
-            name,
-        )
-        version = Deck._validate_data(
-            Deck._get_dec_oper_sist(uow).versao,
-            str,
-            name,
-        )
+        value_columns = _columns_to_process(cache, name, columns, filters)
+        df, version = _table_and_version(Deck._get_dec_oper_sist(uow), name)
+        df = _project_df(df, _source_columns(value_columns))
         if version <= "31.0.2":
             df = _stub_nodes_scenarios_v31_0_2(df)
         df = processing.add_dates_to_df(df, uow)
         df = df.rename(columns={"duracao": BLOCK_DURATION_COL})
         df = processing.fill_average_block_in_df(df, uow)
-        df["geracao_termica_total_MW"] = (
-            df["geracao_termica_MW"] + df["geracao_termica_antecipada_MW"]
-        )
-        df["itaipu_60MW"] = df["itaipu_60MW"].fillna(0.0)
-        df["geracao_hidro_com_itaipu_MW"] = (
-            df["geracao_hidroeletrica_MW"] + df["itaipu_60MW"]
-        )
-        df["demanda_liquida_MW"] = (
-            df["demanda_MW"] - df["geracao_pequenas_usinas_MW"]
-        )
-        df["geracao_nao_simuladas_MW"] = (
-            df["geracao_pequenas_usinas_MW"] + df["geracao_eolica_MW"]
-        )
-        df = processing.expand_scenarios_in_df(df)
+        if _has_column(value_columns, "geracao_termica_total_MW"):
+            df["geracao_termica_total_MW"] = (
+                df["geracao_termica_MW"] + df["geracao_termica_antecipada_MW"]
+            )
+        if "itaipu_60MW" in df.columns:
+            df["itaipu_60MW"] = df["itaipu_60MW"].fillna(0.0)
+        if _has_column(value_columns, "geracao_hidro_com_itaipu_MW"):
+            df["geracao_hidro_com_itaipu_MW"] = (
+                df["geracao_hidroeletrica_MW"] + df["itaipu_60MW"]
+            )
+        if _has_column(value_columns, "demanda_liquida_MW"):
+            df["demanda_liquida_MW"] = (
+                df["demanda_MW"] - df["geracao_pequenas_usinas_MW"]
+            )
+        if _has_column(value_columns, "geracao_nao_simuladas_MW"):
+            df["geracao_nao_simuladas_MW"] = (
+                df["geracao_pequenas_usinas_MW"] + df["geracao_eolica_MW"]
+            )
+        df = processing.expand_scenarios_in_df(df, filters)
         df = df.sort_values(
             [
                 SUBMARKET_CODE_COL,
@@ -142,33 +329,30 @@ def dec_oper_sist(
                 BLOCK_COL,
             ]
         ).reset_index(drop=True)
-        cache[name] = df
+        df = _store_dec_oper(cache, name, df, value_columns, filters)
+        df = _project_df(df, None if columns is None else set(columns))
     return df.copy()
 
 
 def dec_oper_ree(
-    cache: Dict[str, Any], uow: "AbstractUnitOfWork"
+    cache: Dict[str, Any],
+    uow: "AbstractUnitOfWork",
+    columns: Optional[List[str]] = None,
+    filters: Optional[Dict[str, List[int]]] = None,
 ) -> pd.DataFrame:
     name = "dec_oper_ree"
-    df = cache.get(name)
+    df = _cached_dec_oper(cache, name, columns, filters)
     if df is None:
         from app.services.deck.deck import Deck
 
-        df = Deck._validate_data(
-            Deck._get_dec_oper_ree(uow).tabela,
-            pd.DataFrame,
-            name,
-        )
-        version = Deck._validate_data(
-            Deck._get_dec_oper_ree(uow).versao,
-            str,
-            name,
-        )
+        value_columns = _columns_to_process(cache, name, columns, filters)
+        df, version = _table_and_version(Deck._get_dec_oper_ree(uow), name)
+        df = _project_df(df, _source_columns(value_columns))
         if version <= "31.0.2":
             df = _stub_nodes_scenarios_v31_0_2(df)
         df = processing.add_dates_to_df(df, uow)
         df = processing.add_stages_durations_to_df(df, uow)
-        df = processing.expand_scenarios_in_df(df)
+        df = processing.expand_scenarios_in_df(df, filters)
         df = df.sort_values(
             [
                 EER_CODE_COL,
@@ -177,12 +361,16 @@ def dec_oper_ree(
                 BLOCK_COL,
             ]
         ).reset_index(drop=True)
-        cache[name] = df
+        df = _store_dec_oper(cache, name, df, value_columns, filters)
+        df = _project_df(df, None if columns is None else set(columns))
     return df.copy()
 
 
 def dec_oper_usih(
-    cache: Dict[str, Any], uow: "AbstractUnitOfWork"
+    cache: Dict[str, Any],
+    uow: "AbstractUnitOfWork",
+    columns: Optional[List[str]] = None,
+    filters: Optional[Dict[str, List[int]]] = None,
 ) -> pd.DataFrame:
     def _cast_volumes_to_absolute(
         df: pd.DataFrame, uow: "AbstractUnitOfWork"
@@ -196,9 +384,13 @@ def dec_oper_usih(
         )
         codes = df[HYDRO_CODE_COL].unique()
         volume_columns = [
-            "volume_util_maximo_hm3",
-            "volume_util_inicial_hm3",
-            "volume_util_final_hm3",
+            c
+            for c in [
+                "volume_util_maximo_hm3",
+                "volume_util_inicial_hm3",
+                "volume_util_final_hm3",
+            ]
+            if c in df.columns
         ]
         df["volume_minimo_hm3"] = 0.0
         dadger = Deck.dadger(uow)
@@ -244,28 +436,23 @@ def dec_oper_usih(
         return df
 
     name = "dec_oper_usih"
-    df = cache.get(name)
+    df = _cached_dec_oper(cache, name, columns, filters)
     if df is None:
         from app.services.deck.deck import Deck
 
-        df = Deck._validate_data(
-            Deck._get_dec_oper_usih(uow).tabela,
-            pd.DataFrame,
-            name,
+        value_columns = _columns_to_process(cache, name, columns, filters)
+        df, version = _table_and_version(Deck._get_dec_oper_usih(uow), name)
+        df = _project_df(
+            df, _source_columns(value_columns, ["volume_util_maximo_hm3"])
         )
         df = _cast_volumes_to_absolute(df, uow)
-        version = Deck._validate_data(
-            Deck._get_dec_oper_usih(uow).versao,
-            str,
-            name,
-        )
         if version <= "31.0.2":
             df = _stub_nodes_scenarios_v31_0_2(df)
         df = processing.add_dates_to_df_merge(df, uow)
         df = _add_eer_sbm_to_df(df, uow)
         df = df.rename(columns={"duracao": BLOCK_DURATION_COL})
         df = processing.fill_average_block_in_df(df, uow)
-        df = processing.expand_scenarios_in_df(df)
+        df = processing.expand_scenarios_in_df(df, filters)
         df = df.sort_values(
             [
                 HYDRO_CODE_COL,
@@ -274,53 +461,52 @@ def dec_oper_usih(
                 BLOCK_COL,
             ]
         ).reset_index(drop=True)
-        cache[name] = df
+        df = _store_dec_oper(cache, name, df, value_columns, filters)
+        df = _project_df(df, None if columns is None else set(columns))
     return df.copy()
 
 
 def dec_oper_usit(
-    cache: Dict[str, Any], uow: "AbstractUnitOfWork"
+    cache: Dict[str, Any],
+    uow: "AbstractUnitOfWork",
+    columns: Optional[List[str]] = None,
+    filters: Optional[Dict[str, List[int]]] = None,
 ) -> pd.DataFrame:
     name = "dec_oper_usit"
-    df = cache.get(name)
+    df = _cached_dec_oper(cache, name, columns, filters)
     if df is None:
         from app.services.deck.deck import Deck
 
-        df = Deck._validate_data(
-            Deck._get_dec_oper_usit(uow).tabela,
-            pd.DataFrame,
-            name,
-        )
-        version = Deck._validate_data(
-            Deck._get_dec_oper_usit(uow).versao,
-            str,
-            name,
-        )
+        value_columns = _columns_to_process(cache, name, columns, filters)
+        df, version = _table_and_version(Deck._get_dec_oper_usit(uow), name)
+        df = _project_df(df, _source_columns(value_columns))
         if version <= "31.0.2":
             df = _stub_nodes_scenarios_v31_0_2(df)
         df = processing.add_dates_to_df_merge(df, uow)
-        df["geracao_percentual_maxima"] = (
-            100 * df["geracao_MW"] / df["geracao_maxima_MW"]
-        )
-        filtro = df["geracao_maxima_MW"] != df["geracao_minima_MW"]
-        df.loc[
-            filtro,
-            "geracao_percentual_flexivel",
-        ] = (
-            100
-            * (
-                df.loc[filtro, "geracao_MW"]
-                - df.loc[filtro, "geracao_minima_MW"]
+        if _has_column(value_columns, "geracao_percentual_maxima"):
+            df["geracao_percentual_maxima"] = (
+                100 * df["geracao_MW"] / df["geracao_maxima_MW"]
             )
-            / (
-                df.loc[filtro, "geracao_maxima_MW"]
-                - df.loc[filtro, "geracao_minima_MW"]
+        if _has_column(value_columns, "geracao_percentual_flexivel"):
+            filtro = df["geracao_maxima_MW"] != df["geracao_minima_MW"]
+            df.loc[
+                filtro,
+                "geracao_percentual_flexivel",
+            ] = (
+                100
+                * (
+                    df.loc[filtro, "geracao_MW"]
+                    - df.loc[filtro, "geracao_minima_MW"]
+                )
+                / (
+                    df.loc[filtro, "geracao_maxima_MW"]
+                    - df.loc[filtro, "geracao_minima_MW"]
+                )
             )
-        )
-        df.loc[~filtro, "geracao_percentual_flexivel"] = 100.0
+            df.loc[~filtro, "geracao_percentual_flexivel"] = 100.0
         df = df.rename(columns={"duracao": BLOCK_DURATION_COL})
         df = processing.fill_average_block_in_df(df, uow)
-        df = processing.expand_scenarios_in_df(df)
+        df = processing.expand_scenarios_in_df(df, filters)
         df = df.sort_values(
             [
                 THERMAL_CODE_COL,
@@ -329,7 +515,8 @@ def dec_oper_usit(
                 BLOCK_COL,
             ]
         ).reset_index(drop=True)
-        cache[name] = df
+        df = _store_dec_oper(cache, name, df, value_columns, filters)
+        df = _project_df(df, None if columns is None else set(columns))
     return df.copy()
 
 
@@ -341,16 +528,7 @@ def dec_oper_gnl(
     if df is None:
         from app.services.deck.deck import Deck
 
-        df = Deck._validate_data(
-            Deck._get_dec_oper_gnl(uow).tabela,
-            pd.DataFrame,
-            name,
-        )
-        version = Deck._validate_data(
-            Deck._get_dec_oper_gnl(uow).versao,
-            str,
-            name,
-        )
+        df, version = _table_and_version(Deck._get_dec_oper_gnl(uow), name)
         if version <= "31.0.2":
             df = _stub_nodes_scenarios_v31_0_2(df)
         df = processing.add_dates_to_df(df, uow)
@@ -359,30 +537,26 @@ def dec_oper_gnl(
 
 
 def dec_oper_interc(
-    cache: Dict[str, Any], uow: "AbstractUnitOfWork"
+    cache: Dict[str, Any],
+    uow: "AbstractUnitOfWork",
+    columns: Optional[List[str]] = None,
+    filters: Optional[Dict[str, List[int]]] = None,
 ) -> pd.DataFrame:
     name = "dec_oper_interc"
-    df = cache.get(name)
+    df = _cached_dec_oper(cache, name, columns, filters)
     if df is None:
         from app.services.deck.deck import Deck
 
-        df = Deck._validate_data(
-            Deck._get_dec_oper_interc(uow).tabela,
-            pd.DataFrame,
-            name,
-        )
-        version = Deck._validate_data(
-            Deck._get_dec_oper_interc(uow).versao,
-            str,
-            name,
-        )
+        value_columns = _columns_to_process(cache, name, columns, filters)
+        df, version = _table_and_version(Deck._get_dec_oper_interc(uow), name)
+        df = _project_df(df, _source_columns(value_columns))
         if version <= "31.0.2":
             df = _stub_nodes_scenarios_v31_0_2(df)
         df = _add_iv_submarket_code(df)
         df = processing.add_dates_to_df(df, uow)
         df = processing.add_block_durations_to_df(df, uow)
         df = processing.fill_average_block_in_df(df, uow)
-        df = processing.expand_scenarios_in_df(df)
+        df = processing.expand_scenarios_in_df(df, filters)
         df = df.sort_values(
             [
                 EXCHANGE_SOURCE_CODE_COL,
@@ -392,19 +566,28 @@ def dec_oper_interc(
                 BLOCK_COL,
             ]
         ).reset_index(drop=True)
-        cache[name] = df
+        df = _store_dec_oper(cache, name, df, value_columns, filters)
+        df = _project_df(df, None if columns is None else set(columns))
     return df.copy()
 
 
 def dec_oper_interc_net(
-    cache: Dict[str, Any], uow: "AbstractUnitOfWork"
+    cache: Dict[str, Any],
+    uow: "AbstractUnitOfWork",
+    columns: Optional[List[str]] = None,
+    filters: Optional[Dict[str, List[int]]] = None,
 ) -> pd.DataFrame:
     name = "dec_oper_interc_net"
-    df = cache.get(name)
+    df = _cached_dec_oper(cache, name, columns, filters)
     if df is None:
         from app.services.deck.deck import Deck
 
-        df = Deck.dec_oper_interc(uow)
+        value_columns = _columns_to_process(cache, name, columns, filters)
+        df = Deck.dec_oper_interc(
+            uow,
+            None if value_columns is None else sorted(value_columns),
+            filters or {},
+        )
         df = _eval_net_exchange(df, uow)
         df = df.sort_values(
             [
@@ -415,7 +598,8 @@ def dec_oper_interc_net(
                 BLOCK_COL,
             ]
         ).reset_index(drop=True)
-        cache[name] = df
+        df = _store_dec_oper(cache, name, df, value_columns, filters)
+        df = _project_df(df, None if columns is None else set(columns))
     return df.copy()
 
 
@@ -443,6 +627,64 @@ def avl_turb_max(
     return df.copy()
 
 
+# Colunas da tabela de coeficientes dos cortes exportada na síntese
+CUTS_COLUMNS = [
+    STAGE_COL,
+    CUT_INDEX_COL,
+    ITERATION_COL,
+    SCENARIO_COL,
+    COEF_TYPE_COL,
+    ENTITY_INDEX_COL,
+    LAG_COL,
+    BLOCK_COL,
+    COEF_VALUE_COL,
+    STATE_VALUE_COL,
+]
+
+
+def _cut_stages(uow: "AbstractUnitOfWork") -> List[int]:
+    from app.services.deck.deck import Deck
+
+    # TODO melhorar logica para pegar dados de nos que geram cortes
+    # a partir do mapcut. A logica atual funciona apenas para casos
+    # com moldes de PMO
+    return list(range(1, Deck.num_stages(uow)))
+
+
+def _process_dec_fcf_cortes(df: pd.DataFrame, stage: int) -> pd.DataFrame:
+    df = df.rename(
+        {
+            "indice_iteracao": ITERATION_COL,
+            "indice_lag": LAG_COL,
+            "indice_patamar": BLOCK_COL,
+            "indice_entidade": ENTITY_INDEX_COL,
+            "valor_coeficiente": COEF_VALUE_COL,
+            "ponto_consultado": STATE_VALUE_COL,
+        },
+        axis=1,
+    )
+    MAP_COEF_CODE = {
+        "VARM": str(VARM_COEF_CODE),
+        "-": str(VARM_COEF_CODE),
+        "RHS": str(RHS_COEF_CODE),
+        "GTERF": str(GTER_COEF_CODE),
+        "QDEFP": str(QDEF_COEF_CODE),
+    }
+    df[COEF_TYPE_COL] = df["tipo_coeficiente"].replace(MAP_COEF_CODE)
+    df[COEF_TYPE_COL] = df[COEF_TYPE_COL].astype(int)
+    df[STAGE_COL] = df.shape[0] * [stage]
+    df[SCENARIO_COL] = df.shape[0] * [np.nan]
+    df.drop(columns=["tipo_entidade", "nome_entidade"], inplace=True)
+    num_iterations = df[ITERATION_COL].max()
+    num_elements = len(
+        df.loc[df[ITERATION_COL] == num_iterations, ITERATION_COL].tolist()
+    )
+    df[CUT_INDEX_COL] = np.repeat(
+        list(range(num_iterations, 0, -1)), num_elements
+    )
+    return df
+
+
 def _dec_fcf_cortes_per_stage(
     cache: Dict[str, Any], stage: int, uow: "AbstractUnitOfWork"
 ) -> pd.DataFrame:
@@ -458,38 +700,7 @@ def _dec_fcf_cortes_per_stage(
                 pd.DataFrame,
                 name,
             )
-            df = df.rename(
-                {
-                    "indice_iteracao": ITERATION_COL,
-                    "indice_lag": LAG_COL,
-                    "indice_patamar": BLOCK_COL,
-                    "indice_entidade": ENTITY_INDEX_COL,
-                    "valor_coeficiente": COEF_VALUE_COL,
-                    "ponto_consultado": STATE_VALUE_COL,
-                },
-                axis=1,
-            )
-            MAP_COEF_CODE = {
-                "VARM": str(VARM_COEF_CODE),
-                "-": str(VARM_COEF_CODE),
-                "RHS": str(RHS_COEF_CODE),
-                "GTERF": str(GTER_COEF_CODE),
-                "QDEFP": str(QDEF_COEF_CODE),
-            }
-            df[COEF_TYPE_COL] = df["tipo_coeficiente"].replace(MAP_COEF_CODE)
-            df[COEF_TYPE_COL] = df[COEF_TYPE_COL].astype(int)
-            df[STAGE_COL] = df.shape[0] * [stage]
-            df[SCENARIO_COL] = df.shape[0] * [np.nan]
-            df.drop(columns=["tipo_entidade", "nome_entidade"], inplace=True)
-            num_iterations = df[ITERATION_COL].max()
-            num_elements = len(
-                df.loc[
-                    df[ITERATION_COL] == num_iterations, ITERATION_COL
-                ].tolist()
-            )
-            df[CUT_INDEX_COL] = np.repeat(
-                list(range(num_iterations, 0, -1)), num_elements
-            )
+            df = _process_dec_fcf_cortes(df, stage)
             cache[name] = df
             return df.copy()
         else:
@@ -497,23 +708,43 @@ def _dec_fcf_cortes_per_stage(
     return df.copy()
 
 
+def _iter_dec_fcf_cortes(
+    cache: Dict[str, Any], uow: "AbstractUnitOfWork"
+) -> Iterator[pd.DataFrame]:
+    """
+    Itera sobre as tabelas de cortes de cada estágio, lendo os arquivos
+    em paralelo, sem construir a tabela completa dos cortes.
+    """
+    df: Optional[pd.DataFrame] = cache.get("dec_fcf_cortes")
+    if df is not None:
+        for _, df_stage in df.groupby(STAGE_COL, sort=True):
+            yield df_stage.reset_index(drop=True)
+        return
+
+    from app.services.deck.deck import Deck
+
+    stages = _cut_stages(uow)
+    for stage, table in Deck._get_dec_fcf_cortes_tables(stages, uow):
+        if table is None:
+            continue
+        name = f"dec_fcf_cortes_{str(stage).zfill(3)}"
+        yield _process_dec_fcf_cortes(
+            Deck._validate_data(table, pd.DataFrame, name), stage
+        )
+
+
 def dec_fcf_cortes(
     cache: Dict[str, Any], uow: "AbstractUnitOfWork"
 ) -> pd.DataFrame:
     name = "dec_fcf_cortes"
     df = cache.get(name)
     if df is None:
-        from app.services.deck.deck import Deck
-
-        df = pd.DataFrame()
-        # TODO melhorar logica para pegar dados de nos que geram cortes
-        # a partir do mapcut. A logica atual funciona apenas para casos
-        # com moldes de PMO
-        cut_stages = list(range(1, Deck.num_stages(uow)))
-        for stage in cut_stages:
-            df_stage = _dec_fcf_cortes_per_stage(cache, stage, uow)
-            df = pd.concat([df, df_stage], ignore_index=True)
-        df = df.reset_index(drop=True)
+        dfs = list(_iter_dec_fcf_cortes(cache, uow))
+        df = (
+            pd.concat(dfs, ignore_index=True)
+            if len(dfs) > 0
+            else pd.DataFrame()
+        )
         cache[name] = df
     return df.copy()
 
@@ -523,25 +754,52 @@ def cortes(cache: Dict[str, Any], uow: "AbstractUnitOfWork") -> pd.DataFrame:
     df = cache.get(name)
     if df is None:
         df = dec_fcf_cortes(cache, uow)
-        df = df[
-            [
-                STAGE_COL,
-                CUT_INDEX_COL,
-                ITERATION_COL,
-                SCENARIO_COL,
-                COEF_TYPE_COL,
-                ENTITY_INDEX_COL,
-                LAG_COL,
-                BLOCK_COL,
-                COEF_VALUE_COL,
-                STATE_VALUE_COL,
-            ]
-        ]
+        df = df[CUTS_COLUMNS]
         df = df.reset_index(drop=True)
         cache[name] = df
     return df.copy()
 
 
+def cortes_per_stage(
+    cache: Dict[str, Any], uow: "AbstractUnitOfWork"
+) -> Iterator[pd.DataFrame]:
+    """
+    Itera sobre os coeficientes dos cortes de cada estágio, para que
+    possam ser exportados sem que a tabela completa seja mantida em
+    memória. Os tipos de coeficientes encontrados são mantidos em cache.
+    """
+    coef_types: Dict[int, None] = {}
+    for df in _iter_dec_fcf_cortes(cache, uow):
+        coef_types.update(dict.fromkeys(df[COEF_TYPE_COL].tolist()))
+        yield df[CUTS_COLUMNS].reset_index(drop=True)
+    cache["tipos_coeficientes_cortes"] = list(coef_types)
+
+
+def cut_store(cache: Dict[str, Any], uow: "AbstractUnitOfWork") -> CutStore:
+    name = "cut_store"
+    store: Optional[CutStore] = cache.get(name)
+    if store is None:
+        store = CutStore.from_stage_dfs(
+            df[CUTS_COLUMNS] for df in _iter_dec_fcf_cortes(cache, uow)
+        )
+        cache[name] = store
+    return store
+
+
+def _cut_coefficient_types(
+    cache: Dict[str, Any], uow: "AbstractUnitOfWork"
+) -> List[int]:
+    name = "tipos_coeficientes_cortes"
+    coef_types: Optional[List[int]] = cache.get(name)
+    if coef_types is None:
+        types: Dict[int, None] = {}
+        for df in _iter_dec_fcf_cortes(cache, uow):
+            types.update(dict.fromkeys(df[COEF_TYPE_COL].tolist()))
+        coef_types = list(types)
+        cache[name] = coef_types
+    return coef_types
+
+
 def variaveis_cortes(
     cache: Dict[str, Any], uow: "AbstractUnitOfWork"
 ) -> pd.DataFrame:
@@ -572,8 +830,13 @@ def variaveis_cortes(
         QDEF_COEF_CODE: Unit.hm3.value,
     }
     if df is None:
-        cuts_df = dec_fcf_cortes(cache, uow)
-        df = cuts_df[[COEF_TYPE_COL]].drop_duplicates()
+        df = pd.DataFrame(
+            data={
+                COEF_TYPE_COL: np.array(
+                    _cut_coefficient_types(cache, uow), dtype=np.int64
+                )
+            }
+        )
         df["nome_curto_coeficiente"] = df[COEF_TYPE_COL].replace(
             MAP_COEF_TYPE_SHORT_NAME
         )
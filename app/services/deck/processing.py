@@ -128,20 +128,51 @@ def fill_average_block_in_df(
 
 
 def expand_scenarios_in_df_single_stochastic_stage(
-    df: pd.DataFrame, stage: int, num_scenarios: int
+    df: pd.DataFrame,
+    stage: int,
+    num_scenarios: int,
+    scenarios: list[int] | None = None,
 ) -> pd.DataFrame:
+    scenario_values = (
+        np.arange(1, num_scenarios + 1)
+        if scenarios is None
+        else np.array(scenarios, dtype=np.int64)
+    )
     deterministic_stages_df = df.loc[df[STAGE_COL] != stage].copy()
     stochastic_stage_df = df.loc[df[STAGE_COL] == stage].copy()
+    if scenarios is not None:
+        stochastic_stage_df = stochastic_stage_df.loc[
+            stochastic_stage_df[SCENARIO_COL].isin(scenarios)
+        ]
+    if len(scenario_values) == 0:
+        return df.iloc[0:0].copy()
     expanded_df = pd.concat(
-        [deterministic_stages_df] * num_scenarios, ignore_index=True
+        [deterministic_stages_df] * len(scenario_values), ignore_index=True
     )
     expanded_df[SCENARIO_COL] = np.repeat(
-        np.arange(1, num_scenarios + 1), deterministic_stages_df.shape[0]
+        scenario_values, deterministic_stages_df.shape[0]
     )
     return pd.concat([expanded_df, stochastic_stage_df], ignore_index=True)
 
 
-def expand_scenarios_in_df(df: pd.DataFrame) -> pd.DataFrame:
+def _filter_stages_scenarios(
+    df: pd.DataFrame, filters: dict[str, list[int]]
+) -> pd.DataFrame:
+    for col, values in filters.items():
+        df = df.loc[df[col].isin(values)]
+    return df
+
+
+def expand_scenarios_in_df(
+    df: pd.DataFrame, filters: dict[str, list[int]] | None = None
+) -> pd.DataFrame:
+    """
+    Replica os estágios determinísticos para cada cenário do estágio
+    estocástico. Com filtros de estágios e de cenários (colunas `estagio`
+    e `cenario`), somente os estágios e os cenários filtrados são
+    expandidos, sem a materialização dos demais.
+    """
+    filters = filters or {}
     unique_scenarios_df = df[[STAGE_COL, SCENARIO_COL]].drop_duplicates()
     num_scenarios_df = unique_scenarios_df.groupby(
         STAGE_COL, as_index=False
@@ -158,9 +189,25 @@ def expand_scenarios_in_df(df: pd.DataFrame) -> pd.DataFrame:
             num_scenarios_df[STAGE_COL] == stage,
             SCENARIO_COL,
         ].values[0]
-        return expand_scenarios_in_df_single_stochastic_stage(
-            df, stage, num_scenarios
+        if not filters:
+            return expand_scenarios_in_df_single_stochastic_stage(
+                df, stage, num_scenarios
+            )
+        # A estrutura dos cenários é obtida antes dos filtros, para que
+        # os estágios determinísticos sejam expandidos mesmo quando o
+        # estágio estocástico não é sintetizado
+        scenarios = sorted(
+            unique_scenarios_df.loc[
+                unique_scenarios_df[STAGE_COL] == stage, SCENARIO_COL
+            ].tolist()
         )
+        if SCENARIO_COL in filters:
+            scenarios = [s for s in scenarios if s in filters[SCENARIO_COL]]
+        if STAGE_COL in filters:
+            df = df.loc[df[STAGE_COL].isin(filters[STAGE_COL])]
+        return expand_scenarios_in_df_single_stochastic_stage(
+            df, stage, num_scenarios, scenarios
+        ).reset_index(drop=True)
     if len(stochastic_stages) == 0 or len(deterministic_stages) == 0:
-        return df
+        return _filter_stages_scenarios(df, filters).reset_index(drop=True)
     raise RuntimeError("Formato dos cenários não reconhecido")
@@ -184,7 +184,7 @@ def version(cache: Dict[str, Any], uow: "AbstractUnitOfWork") -> str:
         from app.services.deck.deck import Deck
 
         v = Deck._validate_data(
-            Deck._get_dec_oper_sist(uow).versao,
+            Deck._get_file_version("dec_oper_sist.csv", uow),
             str,
             name,
         )
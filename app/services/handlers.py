@@ -1,7 +1,15 @@
 import pathlib
 import shutil
+from types import TracebackType
+from typing import Optional, Type
+
+import pandas as pd
 
 import app.domain.commands as commands
+from app.internal.constants import (
+    SYNTHESIS_MANIFEST_OUTPUT,
+    SYNTHESIS_PERFORMANCE_OUTPUT,
+)
 from app.model.settings import Settings
 from app.services.synthesis.execution import ExecutionSynthetizer
 from app.services.synthesis.operation import OperationSynthetizer
@@ -9,36 +17,129 @@ from app.services.synthesis.policy import PolicySynthetizer
 from app.services.synthesis.scenarios import ScenarioSynthetizer
 from app.services.synthesis.system import SystemSynthetizer
 from app.services.unitofwork import AbstractUnitOfWork
+from app.utils.manifest import MANIFEST_COLUMNS, OutputManifest
+from app.utils.profiling import Profiler
+from app.utils.timing import PerformanceTelemetry
+
+
+def export_performance(uow: AbstractUnitOfWork) -> None:
+    """
+    Exporta os tempos coletados durante a execução de um comando
+    e reinicia o coletor para o próximo comando.
+    """
+    telemetry = PerformanceTelemetry()
+    df = telemetry.to_df()
+    telemetry.clear()
+    if df.empty:
+        return
+    with uow:
+        uow.export.synthetize_df(df, SYNTHESIS_PERFORMANCE_OUTPUT)
+
+
+def export_manifest(uow: AbstractUnitOfWork) -> None:
+    """
+    Exporta o manifesto das sínteses, com o esquema, o número de linhas,
+    o tamanho, os estágios e o hash do conteúdo de cada tabela. As
+    tabelas escritas pelo comando substituem as suas entradas no
+    manifesto existente, que mantém as escritas por outros comandos.
+    """
+    manifest = OutputManifest()
+    with uow:
+        df = manifest.to_df(uow.export.size)
+        manifest.clear()
+        if df.empty:
+            return
+        previous = uow.export.read_df(SYNTHESIS_MANIFEST_OUTPUT)
+        if previous is not None and set(MANIFEST_COLUMNS) <= set(
+            previous.columns
+        ):
+            previous = previous.loc[
+                ~previous["arquivo"].astype(str).isin(df["arquivo"]),
+                MANIFEST_COLUMNS,
+            ]
+            df = pd.concat(
+                [previous.astype(df.dtypes.to_dict()), df], ignore_index=True
+            )
+            df = df.sort_values("arquivo").reset_index(drop=True)
+        uow.export.synthetize_df(df, SYNTHESIS_MANIFEST_OUTPUT)
+
+
+def export_profiles(uow: AbstractUnitOfWork) -> None:
+    """
+    Escreve os perfis coletados durante a execução de um comando,
+    quando habilitados, no diretório da síntese.
+    """
+    profiler = Profiler()
+    if profiler.enabled:
+        with uow:
+            profiler.write(uow.export.path)
+    profiler.configure(None)
+
+
+class synthesis_command:
+    """
+    Executa um comando de síntese: reinicia os coletores de desempenho,
+    do manifesto e de perfis no início e, ao final, exporta os dados
+    coletados e libera os recursos mantidos pela unidade de trabalho.
+    """
+
+    def __init__(self, uow: AbstractUnitOfWork) -> None:
+        self.uow = uow
+
+    def __enter__(self) -> "synthesis_command":
+        PerformanceTelemetry().clear()
+        OutputManifest().clear()
+        Profiler().configure(Settings().profiling)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        try:
+            if exc_type is None:
+                export_performance(self.uow)
+                export_manifest(self.uow)
+                export_profiles(self.uow)
+        finally:
+            self.uow.close()
 
 
 def synthetize_system(
     command: commands.SynthetizeSystem, uow: AbstractUnitOfWork
 ) -> None:
-    SystemSynthetizer.synthetize(command.variables, uow)
+    with synthesis_command(uow):
+        SystemSynthetizer.synthetize(command.variables, uow)
 
 
 def synthetize_execution(
     command: commands.SynthetizeExecution, uow: AbstractUnitOfWork
 ) -> None:
-    ExecutionSynthetizer.synthetize(command.variables, uow)
+    with synthesis_command(uow):
+        ExecutionSynthetizer.synthetize(command.variables, uow)
 
 
 def synthetize_scenario(
     command: commands.SynthetizeScenario, uow: AbstractUnitOfWork
 ) -> None:
-    ScenarioSynthetizer.synthetize(command.variables, uow)
+    with synthesis_command(uow):
+        ScenarioSynthetizer.synthetize(command.variables, uow)
 
 
 def synthetize_operation(
     command: commands.SynthetizeOperation, uow: AbstractUnitOfWork
 ) -> None:
-    OperationSynthetizer.synthetize(command.variables, uow)
+    with synthesis_command(uow):
+        OperationSynthetizer.synthetize(command.variables, uow)
 
 
 def synthetize_policy(
     command: commands.SynthetizePolicy, uow: AbstractUnitOfWork
 ) -> None:
-    PolicySynthetizer.synthetize(command.variables, uow)
+    with synthesis_command(uow):
+        PolicySynthetizer.synthetize(command.variables, uow)
 
 
 def clean() -> None:
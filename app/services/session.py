@@ -0,0 +1,174 @@
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+import app.domain.commands as commands
+import app.services.handlers as handlers
+from app.model.operation.filters import OperationFilters
+from app.services.deck.deck import Deck
+from app.services.synthesis.operation import OperationSynthetizer
+from app.services.unitofwork import MemoryUnitOfWork
+
+# Número de casos mantidos em memória simultaneamente
+DEFAULT_MAX_CASES = 4
+
+SYNTHESIS_HANDLERS: Dict[
+    str, Tuple[Callable[..., None], Callable[..., Any]]
+] = {
+    "sistema": (handlers.synthetize_system, commands.SynthetizeSystem),
+    "execucao": (handlers.synthetize_execution, commands.SynthetizeExecution),
+    "cenarios": (handlers.synthetize_scenario, commands.SynthetizeScenario),
+    "operacao": (handlers.synthetize_operation, commands.SynthetizeOperation),
+    "politica": (handlers.synthetize_policy, commands.SynthetizePolicy),
+}
+
+
+def case_fingerprint(directory: str) -> Dict[str, Tuple[int, int]]:
+    """
+    Identifica o estado dos arquivos de entrada de um caso pelo tamanho
+    e pela data de modificação de cada arquivo do diretório.
+    """
+    fingerprint: Dict[str, Tuple[int, int]] = {}
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_file():
+                stat = entry.stat()
+                fingerprint[entry.name] = (stat.st_size, stat.st_mtime_ns)
+    return fingerprint
+
+
+@dataclass
+class CaseState:
+    """
+    Dados de um caso mantidos em memória entre as requisições: as
+    tabelas do Deck e as sínteses de operação em cache, inclusive as
+    movidas para o disco no diretório temporário do caso.
+    """
+
+    directory: str
+    fingerprint: Dict[str, Tuple[int, int]]
+    deck_cache: Dict[str, Any] = field(default_factory=dict)
+    synthesis_cache: Dict[Any, Any] = field(default_factory=dict)
+    ordered_entities: Dict[Any, Any] = field(default_factory=dict)
+    spill_dir: Optional[tempfile.TemporaryDirectory[str]] = None
+    requests: int = 0
+
+    def operation_state(self) -> Dict[str, Any]:
+        """
+        Valores dos atributos de classe do sintetizador da operação
+        durante uma síntese do caso. Os que só existem durante uma
+        síntese (estatísticas, filtros e escrita) partem vazios.
+        """
+        return {
+            "CACHED_SYNTHESIS": self.synthesis_cache,
+            "ORDERED_SYNTHESIS_ENTITIES": self.ordered_entities,
+            "SPILL_DIR": self.spill_dir,
+            "SYNTHESIS_STATS": {},
+            "STATS_DIR": None,
+            "FILTERS": OperationFilters(),
+            "WRITER": None,
+        }
+
+    def release(self) -> None:
+        """
+        Remove as sínteses do caso movidas para o disco.
+        """
+        if self.spill_dir is not None:
+            self.spill_dir.cleanup()
+            self.spill_dir = None
+
+
+class SynthesisSession:
+    """
+    Realiza sínteses em memória mantendo os dados de cada caso entre
+    as chamadas, que são descartados quando algum arquivo de entrada muda.
+
+    As caches do Deck e do sintetizador da operação são atributos de
+    classe, então as sínteses são executadas uma por vez, com as caches
+    do caso requisitado.
+    """
+
+    def __init__(self, q: Any = None, max_cases: int = DEFAULT_MAX_CASES):
+        self.q = q
+        self.max_cases = max_cases
+        self.cases: OrderedDict[str, CaseState] = OrderedDict()
+        self.logger = logging.getLogger("main")
+        self._lock = threading.Lock()
+
+    def _case(self, directory: str) -> CaseState:
+        fingerprint = case_fingerprint(directory)
+        case = self.cases.get(directory)
+        if case is not None and case.fingerprint != fingerprint:
+            self.logger.info(f"Arquivos de {directory} alterados")
+            case.release()
+            case = None
+        if case is None:
+            case = CaseState(directory, fingerprint)
+        self.cases[directory] = case
+        self.cases.move_to_end(directory)
+        while len(self.cases) > self.max_cases:
+            self.cases.popitem(last=False)[1].release()
+        return case
+
+    def synthetize(
+        self, directory: str, synthesizer: str, variables: List[str]
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Realiza a síntese das variáveis fornecidas para um caso,
+        retornando as tabelas produzidas, indexadas pelo nome.
+        """
+        if synthesizer not in SYNTHESIS_HANDLERS:
+            raise ValueError(f"Sintetizador não reconhecido: {synthesizer}")
+        path = Path(directory).resolve()
+        if not path.is_dir():
+            raise ValueError(f"Diretório do caso não encontrado: {directory}")
+        handler, command = SYNTHESIS_HANDLERS[synthesizer]
+        with self._lock:
+            case = self._case(str(path))
+            case.requests += 1
+            previous_deck = Deck.DECK_DATA_CACHING
+            state = case.operation_state()
+            previous = {a: getattr(OperationSynthetizer, a) for a in state}
+            Deck.DECK_DATA_CACHING = case.deck_cache
+            for attribute, value in state.items():
+                setattr(OperationSynthetizer, attribute, value)
+            try:
+                uow = MemoryUnitOfWork(str(path), self.q)
+                handler(command(list(variables)), uow)
+                return dict(uow.tables)
+            finally:
+                # O diretório das sínteses movidas para o disco pode ter
+                # sido criado durante a síntese, e pertence ao caso
+                case.spill_dir = OperationSynthetizer.SPILL_DIR
+                Deck.DECK_DATA_CACHING = previous_deck
+                for attribute, value in previous.items():
+                    setattr(OperationSynthetizer, attribute, value)
+
+    def clear(self) -> None:
+        """
+        Descarta os dados de todos os casos mantidos em memória.
+        """
+        with self._lock:
+            for case in self.cases.values():
+                case.release()
+            self.cases.clear()
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "casos": [
+                {
+                    "diretorio": c.directory,
+                    "requisicoes": c.requests,
+                    "tabelas_deck": len(c.deck_cache),
+                    "sinteses_cache": len(c.synthesis_cache),
+                }
+                for c in self.cases.values()
+            ]
+        }
@@ -190,6 +190,7 @@ class ExecutionSynthetizer:
         with time_and_log(
             message_root=f"Tempo para sintese de {filename}",
             logger=cls.logger,
+            variable=filename,
         ):
             try:
                 cls._log(f"Realizando síntese de {filename}")
@@ -210,7 +211,9 @@ class ExecutionSynthetizer:
         uow.subdir = EXECUTION_SYNTHESIS_SUBDIR
 
         with time_and_log(
-            message_root="Tempo para sintese da execucao", logger=cls.logger
+            message_root="Tempo para sintese da execucao",
+            logger=cls.logger,
+            synthesizer="execucao",
         ):
             synthesis_variables = cls._preprocess_synthesis_variables(
                 variables, uow
@@ -1,4 +1,5 @@
 from logging import DEBUG, ERROR
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 import pandas as pd
@@ -23,6 +24,9 @@ def get_from_cache(
     if res is None:
         cls._log(f"Erro na leitura do cache - {str(s)}", ERROR)
         raise RuntimeError()
+    if isinstance(res, Path):
+        # Síntese movida para o disco por exceder a memória máxima
+        return pd.read_parquet(res)
     return res.copy()
 
 
@@ -43,5 +47,6 @@ def store_in_cache_if_needed(
         with time_and_log(
             message_root="Tempo para armazenamento na cache",
             logger=cls.logger,
+            phase="cache",
         ):
             cls.CACHED_SYNTHESIS[s] = df.copy()
@@ -1,10 +1,15 @@
+import shutil
 from typing import TYPE_CHECKING
 
 import pandas as pd
 import polars as pl
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 from app.internal.constants import (
+    OPERATION_SYNTHESIS_FILES_METADATA_OUTPUT,
     OPERATION_SYNTHESIS_METADATA_OUTPUT,
+    OPERATION_SYNTHESIS_STATS_FRAGMENTS_DIR,
     OPERATION_SYNTHESIS_STATS_ROOT,
     STRING_DF_TYPE,
     VARIABLE_COL,
@@ -14,11 +19,13 @@ from app.model.operation.operationsynthesis import (
     UNITS,
     OperationSynthesis,
 )
+from app.model.settings import Settings
 from app.services.deck.bounds import OperationVariableBounds
 from app.services.deck.deck import Deck
 from app.services.synthesis.operation.cache import store_in_cache_if_needed
+from app.services.synthesis.operation.filters import filter_cached_synthesis
 from app.services.unitofwork import AbstractUnitOfWork
-from app.utils.operations import calc_statistics
+from app.utils.operations import calc_statistics, calc_statistics_collapsed
 from app.utils.timing import time_and_log
 
 if TYPE_CHECKING:
@@ -59,19 +66,37 @@ def export_metadata(
         uow.export.synthetize_df(
             metadata_df, OPERATION_SYNTHESIS_METADATA_OUTPUT
         )
+        uow.export.synthetize_df(
+            Deck.file_versions(uow), OPERATION_SYNTHESIS_FILES_METADATA_OUTPUT
+        )
 
 
 def add_synthesis_stats(
     cls: "type[OperationSynthetizer]",
     s: OperationSynthesis,
     df: pd.DataFrame,
+    uow: AbstractUnitOfWork,
 ) -> None:
+    """
+    Escreve as estatísticas de uma síntese, ordenadas, em um fragmento
+    em disco no diretório da síntese, que é lido somente na exportação
+    das estatísticas da sua resolução espacial. Os fragmentos são
+    mantidos até a exportação, mesmo que a síntese seja interrompida.
+    """
+    res = s.spatial_resolution
     df[VARIABLE_COL] = s.variable.value
-
-    if s.spatial_resolution not in cls.SYNTHESIS_STATS:
-        cls.SYNTHESIS_STATS[s.spatial_resolution] = [df]
-    else:
-        cls.SYNTHESIS_STATS[s.spatial_resolution].append(df)
+    df = df[[VARIABLE_COL] + res.all_synthesis_df_columns]
+    df = df.astype({VARIABLE_COL: STRING_DF_TYPE})
+    df = df.sort_values(res.sorting_synthesis_df_columns).reset_index(drop=True)
+    if cls.STATS_DIR is None:
+        with uow:
+            cls.STATS_DIR = uow.export.path.joinpath(
+                OPERATION_SYNTHESIS_STATS_FRAGMENTS_DIR
+            )
+        cls.STATS_DIR.mkdir(parents=True, exist_ok=True)
+    path = cls.STATS_DIR.joinpath(f"{s}.parquet")
+    df.to_parquet(path)
+    cls.SYNTHESIS_STATS.setdefault(res, {})[s.variable.value] = path
 
 
 def export_scenario_synthesis(
@@ -81,40 +106,65 @@ def export_scenario_synthesis(
     uow: AbstractUnitOfWork,
 ) -> None:
     filename = str(s)
+    statistics_only = Settings().statistics_only
     with time_and_log(
         message_root="Tempo para preparacao para exportacao",
         logger=cls.logger,
-    ):
+        phase="stats",
+    ) as timer:
+        timer.rows(rows_in=df.shape[0])
         df = df.sort_values(
             s.spatial_resolution.sorting_synthesis_df_columns
         ).reset_index(drop=True)
+        store_in_cache_if_needed(cls, s, df)
+        df = filter_cached_synthesis(cls, s, df)
         probs_df = Deck.expanded_probabilities(uow)
         df_pl = pl.from_pandas(df)
         probs_pl = pl.from_pandas(probs_df)
-        stats_pl = calc_statistics(df_pl, probs_pl)
+        if statistics_only:
+            stats_pl = calc_statistics_collapsed(df_pl, probs_pl)
+        else:
+            stats_pl = calc_statistics(df_pl, probs_pl)
         stats_df = stats_pl.to_pandas()
-        add_synthesis_stats(cls, s, stats_df)
-        store_in_cache_if_needed(cls, s, df)
+        timer.rows(rows_out=stats_df.shape[0])
+        add_synthesis_stats(cls, s, stats_df, uow)
+    if statistics_only:
+        return
     with time_and_log(
-        message_root="Tempo para exportacao dos dados", logger=cls.logger
-    ):
-        with uow:
-            df = df[s.spatial_resolution.all_synthesis_df_columns]
-            uow.export.synthetize_df(df, filename)
+        message_root="Tempo para exportacao dos dados",
+        logger=cls.logger,
+        phase="export",
+    ) as timer:
+        df = df[s.spatial_resolution.all_synthesis_df_columns]
+        timer.rows(rows_in=df.shape[0], rows_out=df.shape[0])
+        if cls.WRITER is not None:
+            cls.WRITER.submit(df, filename)
+        else:
+            with uow:
+                uow.export.synthetize_df(df, filename)
 
 
 def export_stats(
     cls: "type[OperationSynthetizer]",
     uow: AbstractUnitOfWork,
 ) -> None:
-    for res, dfs in cls.SYNTHESIS_STATS.items():
+    """
+    Exporta as estatísticas de cada resolução espacial a partir dos
+    fragmentos de cada variável. Como os fragmentos já estão ordenados,
+    a tabela é escrita fragmento a fragmento, na ordem das variáveis,
+    com os tipos das colunas compatíveis com todos os fragmentos.
+    """
+    for res, fragments in cls.SYNTHESIS_STATS.items():
+        paths = [fragments[v] for v in sorted(fragments)]
+        schema = pa.unify_schemas(
+            [pq.read_schema(p) for p in paths], promote_options="permissive"
+        )
         with uow:
-            df = pd.concat(dfs, ignore_index=True)
-            df = df[[VARIABLE_COL] + res.all_synthesis_df_columns]
-            df = df.astype({VARIABLE_COL: STRING_DF_TYPE})
-            df = df.sort_values(
-                [VARIABLE_COL] + res.sorting_synthesis_df_columns
-            ).reset_index(drop=True)
-            uow.export.synthetize_df(
-                df, f"{OPERATION_SYNTHESIS_STATS_ROOT}_{res.value}"
+            uow.export.synthetize_df_iter(
+                (pq.read_table(p).cast(schema).to_pandas() for p in paths),
+                f"{OPERATION_SYNTHESIS_STATS_ROOT}_{res.value}",
             )
+    cls.SYNTHESIS_STATS.clear()
+    if cls.STATS_DIR is not None:
+        shutil.rmtree(cls.STATS_DIR, ignore_errors=True)
+        cls.STATS_DIR = None
@@ -0,0 +1,109 @@
+from typing import TYPE_CHECKING
+
+import pandas as pd
+
+from app.internal.constants import (
+    EXCHANGE_SOURCE_CODE_COL,
+    EXCHANGE_TARGET_CODE_COL,
+    HYDRO_CODE_COL,
+    OPERATION_SYNTHESIS_FILTERS_METADATA_OUTPUT,
+    SCENARIO_COL,
+    STAGE_COL,
+    SUBMARKET_CODE_COL,
+    THERMAL_CODE_COL,
+)
+from app.model.operation.filters import OperationFilters
+from app.model.operation.operationsynthesis import OperationSynthesis
+from app.services.unitofwork import AbstractUnitOfWork
+
+if TYPE_CHECKING:
+    from app.services.synthesis.operation.orchestrator import (
+        OperationSynthetizer,
+    )
+
+
+def _filter_columns(
+    df: pd.DataFrame, columns: list[str], values: list[int] | None
+) -> pd.DataFrame:
+    columns = [c for c in dict.fromkeys(columns) if c in df.columns]
+    if values is None or len(columns) == 0:
+        return df
+    mask = df[columns[0]].isin(values)
+    for c in columns[1:]:
+        mask |= df[c].isin(values)
+    return df.loc[mask].reset_index(drop=True)
+
+
+def apply_temporal_filters(
+    filters: OperationFilters, df: pd.DataFrame
+) -> pd.DataFrame:
+    """
+    Restringe os dados aos estágios e cenários dos filtros. Como as
+    agregações espaciais são feitas por estágio e cenário, estes filtros
+    podem ser aplicados a todas as sínteses, inclusive às dependências.
+    """
+    df = _filter_columns(df, [STAGE_COL], filters.stages)
+    return _filter_columns(df, [SCENARIO_COL], filters.scenarios)
+
+
+def apply_entity_filters(
+    filters: OperationFilters, df: pd.DataFrame
+) -> pd.DataFrame:
+    """
+    Restringe os dados às usinas e aos submercados dos filtros. Os
+    intercâmbios são mantidos quando um dos submercados é filtrado.
+    """
+    df = _filter_columns(df, [HYDRO_CODE_COL, THERMAL_CODE_COL], filters.plants)
+    return _filter_columns(
+        df,
+        [
+            SUBMARKET_CODE_COL,
+            EXCHANGE_SOURCE_CODE_COL,
+            EXCHANGE_TARGET_CODE_COL,
+        ],
+        filters.submarkets,
+    )
+
+
+def filter_resolved_synthesis(
+    cls: "type[OperationSynthetizer]",
+    s: OperationSynthesis,
+    df: pd.DataFrame,
+) -> pd.DataFrame:
+    """
+    Aplica os filtros logo após a obtenção dos dados de uma síntese,
+    antes do cálculo dos limites, das estatísticas e da exportação.
+    As sínteses que são dependências de outras são mantidas com todas
+    as entidades, para que as agregações não sejam afetadas.
+    """
+    if df is None or not cls.FILTERS.active:
+        return df
+    df = apply_temporal_filters(cls.FILTERS, df)
+    if s not in cls.SYNTHESIS_TO_CACHE:
+        df = apply_entity_filters(cls.FILTERS, df)
+    return df
+
+
+def filter_cached_synthesis(
+    cls: "type[OperationSynthetizer]",
+    s: OperationSynthesis,
+    df: pd.DataFrame,
+) -> pd.DataFrame:
+    """
+    Aplica os filtros de entidades às sínteses que são dependências de
+    outras, depois de armazenadas em cache com todas as entidades.
+    """
+    if not cls.FILTERS.active or s not in cls.SYNTHESIS_TO_CACHE:
+        return df
+    return apply_entity_filters(cls.FILTERS, df)
+
+
+def export_filters_metadata(
+    cls: "type[OperationSynthetizer]", uow: AbstractUnitOfWork
+) -> None:
+    if not cls.FILTERS.active:
+        return
+    with uow:
+        uow.export.synthetize_df(
+            cls.FILTERS.to_df(), OPERATION_SYNTHESIS_FILTERS_METADATA_OUTPUT
+        )
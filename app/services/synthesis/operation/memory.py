@@ -0,0 +1,178 @@
+import tempfile
+from logging import INFO, WARNING
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+
+import numpy as np
+import pandas as pd
+
+from app.model.operation.operationsynthesis import (
+    SYNTHESIS_DEPENDENCIES,
+    OperationSynthesis,
+)
+from app.model.settings import Settings
+from app.services.deck.deck import Deck
+from app.utils.memory import cache_sizes, current_rss_mb, largest_entries
+
+if TYPE_CHECKING:
+    from app.services.synthesis.operation.orchestrator import (
+        OperationSynthetizer,
+    )
+
+# Tamanho mínimo (MB) das tabelas do Deck descartadas quando a memória
+# máxima é excedida. As menores, como as tabelas de metadados, são
+# mantidas, pois a sua leitura custa mais do que a memória liberada.
+DECK_EVICTION_MIN_MB = 1.0
+
+
+class MemoryPeak:
+    """
+    Maior memória residente observada entre as sínteses de variáveis,
+    com a composição das caches naquele momento.
+    """
+
+    def __init__(self) -> None:
+        self.rss_mb = 0.0
+        self.variable = ""
+        self.entries: list[tuple[str, float]] = []
+
+    def update(self, cls: "type[OperationSynthetizer]", variable: str) -> None:
+        rss = current_rss_mb()
+        if np.isnan(rss) or rss <= self.rss_mb:
+            return
+        self.rss_mb = rss
+        self.variable = variable
+        self.entries = largest_entries(
+            {
+                "Deck": Deck.DECK_DATA_CACHING,
+                "Sintese": {str(k): v for k, v in cls.CACHED_SYNTHESIS.items()},
+            }
+        )
+
+
+def memory_budget() -> Optional[float]:
+    """
+    Obtém a memória máxima (MB) definida para a síntese, caso exista.
+    """
+    budget = Settings().memory_budget
+    return budget if budget and budget > 0 else None
+
+
+def check_memory_budget(cls: "type[OperationSynthetizer]") -> None:
+    """
+    Avisa quando a memória máxima foi definida, mas a memória residente
+    não pode ser medida no sistema atual (fora do Linux), caso em que a
+    memória máxima não é aplicada.
+    """
+    budget = memory_budget()
+    if budget is not None and np.isnan(current_rss_mb()):
+        cls._log(
+            "Nao foi possivel medir a memoria residente neste sistema:"
+            + f" a memoria maxima de {budget:.1f} MB nao sera aplicada",
+            WARNING,
+        )
+
+
+def release_unneeded_cache(
+    cls: "type[OperationSynthetizer]",
+    remaining: list[OperationSynthesis],
+) -> int:
+    """
+    Descarta as sínteses em cache que não são dependências de nenhuma
+    das sínteses restantes, retornando o número de sínteses descartadas.
+    """
+    needed = {d for s in remaining for d in SYNTHESIS_DEPENDENCIES.get(s, [])}
+    released = [s for s in cls.CACHED_SYNTHESIS if s not in needed]
+    for s in released:
+        cls.CACHED_SYNTHESIS.pop(s)
+    return len(released)
+
+
+def spill_cache(cls: "type[OperationSynthetizer]") -> int:
+    """
+    Move as sínteses em cache para arquivos temporários em disco, que
+    são lidos novamente quando a síntese for requisitada.
+    """
+    if cls.SPILL_DIR is None:
+        cls.SPILL_DIR = tempfile.TemporaryDirectory(prefix="sintese_cache_")
+    spilled = 0
+    for s, df in list(cls.CACHED_SYNTHESIS.items()):
+        if not isinstance(df, pd.DataFrame):
+            continue
+        path = Path(cls.SPILL_DIR.name).joinpath(f"{s}.parquet")
+        df.to_parquet(path)
+        cls.CACHED_SYNTHESIS[s] = path
+        spilled += 1
+    return spilled
+
+
+def evict_deck_cache(excess_mb: float) -> tuple[int, float]:
+    """
+    Descarta as maiores tabelas em cache do Deck até que a memória
+    estimada das tabelas descartadas alcance o excesso fornecido,
+    mantendo as tabelas menores que `DECK_EVICTION_MIN_MB`. Retorna
+    o número de tabelas descartadas e a memória estimada liberada.
+    """
+    evicted, released = 0, 0.0
+    for key, size in cache_sizes(Deck.DECK_DATA_CACHING):
+        if released >= excess_mb or size < DECK_EVICTION_MIN_MB:
+            break
+        Deck.DECK_DATA_CACHING.pop(key, None)
+        evicted += 1
+        released += size
+    return evicted, released
+
+
+def enforce_memory_budget(
+    cls: "type[OperationSynthetizer]",
+    remaining: list[OperationSynthesis],
+) -> None:
+    """
+    Caso a memória residente exceda a memória máxima definida, libera
+    as caches antes da próxima síntese: descarta as sínteses que não
+    serão mais usadas, move as demais para o disco e descarta as maiores
+    tabelas da cache do Deck, que são lidas novamente quando necessário.
+    Como a memória residente nem sempre diminui após a liberação, as
+    tabelas do Deck só são descartadas novamente depois que alguma
+    tabela for lida.
+    """
+    budget = memory_budget()
+    if budget is None:
+        return
+    rss = current_rss_mb()
+    if np.isnan(rss) or rss <= budget:
+        return
+    released = release_unneeded_cache(cls, remaining)
+    spilled = spill_cache(cls)
+    evicted, evicted_mb = 0, 0.0
+    if cls.DECK_CACHE_AFTER_EVICTION is None or not (
+        Deck.DECK_DATA_CACHING.keys() <= cls.DECK_CACHE_AFTER_EVICTION
+    ):
+        evicted, evicted_mb = evict_deck_cache(rss - budget)
+        cls.DECK_CACHE_AFTER_EVICTION = set(Deck.DECK_DATA_CACHING)
+    if released + spilled + evicted == 0:
+        return
+    cls._log(
+        f"Memoria residente de {rss:.1f} MB excede o maximo de"
+        + f" {budget:.1f} MB: {released} sinteses descartadas,"
+        + f" {spilled} sinteses movidas para o disco e"
+        + f" {evicted} tabelas do Deck liberadas ({evicted_mb:.1f} MB)",
+        WARNING,
+    )
+
+
+def log_memory_report(
+    cls: "type[OperationSynthetizer]", peak: MemoryPeak
+) -> None:
+    """
+    Informa a maior memória residente observada e os objetos em cache
+    que ocupavam mais memória naquele momento.
+    """
+    if peak.rss_mb <= 0:
+        return
+    lines = [
+        f"Pico de memoria residente de {peak.rss_mb:.1f} MB"
+        + f" apos a sintese de {peak.variable}. Maiores objetos em cache:"
+    ]
+    lines += [f"  {name}: {size:.1f} MB" for name, size in peak.entries]
+    cls._log("\n".join(lines), INFO)
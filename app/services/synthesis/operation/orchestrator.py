@@ -1,5 +1,9 @@
 import logging
+import shutil
+import tempfile
+import time
 from logging import ERROR, INFO, WARNING
+from pathlib import Path
 from traceback import print_exc
 from typing import Any, Callable, TypeVar
 
@@ -9,6 +13,7 @@ import polars as pl
 from app.internal.constants import (
     OPERATION_SYNTHESIS_SUBDIR,
 )
+from app.model.operation.filters import OperationFilters
 from app.model.operation.operationsynthesis import (
     SUPPORTED_SYNTHESIS,
     SYNTHESIS_DEPENDENCIES,
@@ -16,6 +21,7 @@ from app.model.operation.operationsynthesis import (
 )
 from app.model.operation.spatialresolution import SpatialResolution
 from app.services.deck.bounds import OperationVariableBounds
+from app.services.deck.bounds_data import DEC_OPER_BOUNDS_COLUMNS
 from app.services.deck.deck import Deck
 from app.services.synthesis.operation import resolution as _resolution_mod
 from app.services.synthesis.operation.cache import (
@@ -29,6 +35,16 @@ from app.services.synthesis.operation.export import (
     export_scenario_synthesis,
     export_stats,
 )
+from app.services.synthesis.operation.filters import (
+    export_filters_metadata,
+    filter_resolved_synthesis,
+)
+from app.services.synthesis.operation.memory import (
+    MemoryPeak,
+    check_memory_budget,
+    enforce_memory_budget,
+    log_memory_report,
+)
 from app.services.synthesis.operation.pipeline import (
     get_ordered_entities,
     get_unique_column_values_in_order,
@@ -36,6 +52,14 @@ from app.services.synthesis.operation.pipeline import (
     post_resolve_file,
     set_ordered_entities,
 )
+from app.services.synthesis.operation.prefetch import (
+    finish_prefetch,
+    start_prefetch,
+)
+from app.services.synthesis.operation.progress import (
+    save_progress_history,
+    start_progress,
+)
 from app.services.synthesis.operation.spatial import (
     group_hydro_df,
     group_submarket_df,
@@ -46,6 +70,11 @@ from app.services.synthesis.operation.stubs import (
     stub_thermal_submarkets_dec_oper_sist,
     stub_valid_values_dec_oper_sist,
 )
+from app.services.synthesis.operation.writer import (
+    AsyncExportWriter,
+    finish_writer,
+    start_writer,
+)
 from app.services.unitofwork import AbstractUnitOfWork
 from app.utils.regex import match_variables_with_wildcards
 from app.utils.timing import time_and_log
@@ -64,13 +93,28 @@ class OperationSynthetizer:
     )
 
     # Estratégias de cache para reduzir tempo total de síntese
-    CACHED_SYNTHESIS: dict[OperationSynthesis, pd.DataFrame] = {}
+    CACHED_SYNTHESIS: dict[OperationSynthesis, pd.DataFrame | Path] = {}
     ORDERED_SYNTHESIS_ENTITIES: dict[
         OperationSynthesis, dict[str, list[Any]]
     ] = {}
 
-    # Estatísticas das sínteses são armazenadas separadamente
-    SYNTHESIS_STATS: dict[SpatialResolution, list[pd.DataFrame]] = {}
+    # Estatísticas das sínteses são armazenadas separadamente, em
+    # fragmentos no diretório da síntese por resolução espacial e variável
+    SYNTHESIS_STATS: dict[SpatialResolution, dict[str, Path]] = {}
+    STATS_DIR: Path | None = None
+
+    # Filtros de estágios, cenários e entidades da síntese
+    FILTERS: OperationFilters = OperationFilters()
+
+    # Diretório das sínteses em cache movidas para o disco
+    SPILL_DIR: tempfile.TemporaryDirectory[str] | None = None
+
+    # Tabelas em cache do Deck após a última liberação pela memória
+    # máxima, que só é repetida quando outra tabela for lida
+    DECK_CACHE_AFTER_EVICTION: set[str] | None = None
+
+    # Escrita das sínteses de cenários em segundo plano
+    WRITER: AsyncExportWriter | None = None
 
     @classmethod
     def clear_cache(cls) -> None:
@@ -80,6 +124,13 @@ class OperationSynthetizer:
         cls.CACHED_SYNTHESIS.clear()
         cls.ORDERED_SYNTHESIS_ENTITIES.clear()
         cls.SYNTHESIS_STATS.clear()
+        if cls.STATS_DIR is not None:
+            shutil.rmtree(cls.STATS_DIR, ignore_errors=True)
+            cls.STATS_DIR = None
+        if cls.SPILL_DIR is not None:
+            cls.SPILL_DIR.cleanup()
+            cls.SPILL_DIR = None
+        cls.DECK_CACHE_AFTER_EVICTION = None
 
     @classmethod
     def _log(cls, msg: str, level: int = INFO) -> None:
@@ -237,6 +288,7 @@ class OperationSynthetizer:
         else:
             df, is_stub = pd.DataFrame(), False
         if is_stub:
+            df = filter_resolved_synthesis(cls, s, df)
             df = cls._post_resolve(df, s, uow)
             df = cls._resolve_bounds(s, df, uow)
         return df, is_stub
@@ -258,7 +310,9 @@ class OperationSynthetizer:
         with time_and_log(
             message_root="Tempo para calculo dos limites",
             logger=cls.logger,
-        ):
+            phase="bounds",
+        ) as timer:
+            timer.rows(rows_in=df.shape[0])
             df_pl = pl.from_pandas(df)
             df_pl = OperationVariableBounds.resolve_bounds(
                 s,
@@ -266,6 +320,7 @@ class OperationSynthetizer:
                 cls._get_ordered_entities(s),
                 uow,
             )
+            timer.rows(rows_out=df_pl.height)
             return df_pl.to_pandas()
 
     @classmethod
@@ -291,6 +346,7 @@ class OperationSynthetizer:
             (s.variable, s.spatial_resolution), cls.logger
         )(uow)
         if df is not None:
+            df = filter_resolved_synthesis(cls, s, df)
             df = cls._post_resolve(df, s, uow)
             df = cls._resolve_bounds(s, df, uow)
         return df
@@ -305,9 +361,9 @@ class OperationSynthetizer:
 
     @classmethod
     def _add_synthesis_stats(
-        cls, s: OperationSynthesis, df: pd.DataFrame
+        cls, s: OperationSynthesis, df: pd.DataFrame, uow: AbstractUnitOfWork
     ) -> None:
-        add_synthesis_stats(cls, s, df)
+        add_synthesis_stats(cls, s, df, uow)
 
     @classmethod
     def _export_scenario_synthesis(
@@ -340,6 +396,26 @@ class OperationSynthetizer:
             cls._log("Erro no pré-processamento das variáveis", ERROR)
             return []
 
+    @classmethod
+    def _plan_dec_oper_projection(
+        cls, synthesis_variables: list[OperationSynthesis]
+    ) -> dict[str, list[str]]:
+        """
+        Reúne as colunas de cada arquivo dec_oper_* lidas pelas sínteses
+        solicitadas e pelo cálculo dos limites das variáveis.
+        """
+        plan: dict[str, set[str]] = {
+            name: set(columns)
+            for name, columns in DEC_OPER_BOUNDS_COLUMNS.items()
+        }
+        for s in synthesis_variables:
+            columns = _resolution_mod.resolve_columns(
+                (s.variable, s.spatial_resolution)
+            )
+            for name, cols in columns.items():
+                plan.setdefault(name, set()).update(cols)
+        return {name: sorted(cols) for name, cols in plan.items()}
+
     @classmethod
     def _synthetize_single_variable(
         cls, s: OperationSynthesis, uow: AbstractUnitOfWork
@@ -348,6 +424,7 @@ class OperationSynthetizer:
         with time_and_log(
             message_root=f"Tempo para sintese de {filename}",
             logger=cls.logger,
+            variable=filename,
         ):
             try:
                 cls._log(f"Realizando sintese de {filename}")
@@ -380,18 +457,50 @@ class OperationSynthetizer:
         Deck.logger = cls.logger
         OperationVariableBounds.logger = cls.logger
         uow.subdir = OPERATION_SYNTHESIS_SUBDIR
+        cls.FILTERS = OperationFilters.from_settings()
         with time_and_log(
             message_root="Tempo para sintese da operacao",
             logger=cls.logger,
+            synthesizer="operacao",
         ):
             synthesis_with_dependencies = cls._preprocess_synthesis_variables(
                 variables, uow
             )
+            Deck.set_projection(
+                cls._plan_dec_oper_projection(synthesis_with_dependencies)
+            )
+            Deck.set_filters(cls.FILTERS.stages, cls.FILTERS.scenarios)
+            progress = start_progress(cls, synthesis_with_dependencies, uow)
+            check_memory_budget(cls)
+            cls.DECK_CACHE_AFTER_EVICTION = None
+            peak = MemoryPeak()
             success_synthesis: list[OperationSynthesis] = []
-            for s in synthesis_with_dependencies:
-                r = cls._synthetize_single_variable(s, uow)
-                if r:
-                    success_synthesis.append(r)
+            start_writer(cls, uow)
+            start_prefetch(cls, synthesis_with_dependencies, uow)
+            try:
+                for i, s in enumerate(synthesis_with_dependencies):
+                    enforce_memory_budget(cls, synthesis_with_dependencies[i:])
+                    start = time.perf_counter()
+                    r = cls._synthetize_single_variable(s, uow)
+                    progress.finish(
+                        str(s), time.perf_counter() - start, r is not None
+                    )
+                    peak.update(cls, str(s))
+                    if r:
+                        success_synthesis.append(r)
+            except Exception:
+                # As estatísticas das variáveis já sintetizadas são
+                # exportadas antes da propagação do erro
+                cls._export_stats(uow)
+                raise
+            finally:
+                finish_prefetch(cls, uow)
+                Deck.set_projection({})
+                Deck.set_filters()
+                success_synthesis = finish_writer(cls, success_synthesis)
+            log_memory_report(cls, peak)
+            save_progress_history(cls, progress, uow)
 
             cls._export_stats(uow)
             cls._export_metadata(success_synthesis, uow)
+            export_filters_metadata(cls, uow)
@@ -71,8 +71,11 @@ def post_resolve(
         late_hooks = []
 
     with time_and_log(
-        message_root="Tempo para compactacao dos dados", logger=cls.logger
-    ):
+        message_root="Tempo para compactacao dos dados",
+        logger=cls.logger,
+        phase="post_resolve",
+    ) as timer:
+        timer.rows(rows_in=df.shape[0])
         spatial_resolution = s.spatial_resolution
 
         for hook in early_hooks:
@@ -96,4 +99,5 @@ def post_resolve(
 
         for hook in late_hooks:
             df = hook(s, df, uow)
+        timer.rows(rows_out=df.shape[0])
     return df
@@ -0,0 +1,52 @@
+from typing import TYPE_CHECKING
+
+from app.model.operation.operationsynthesis import OperationSynthesis
+from app.services.deck.deck import Deck
+from app.services.synthesis.operation.resolution import resolve_files
+from app.services.unitofwork import AbstractUnitOfWork
+
+if TYPE_CHECKING:
+    from app.services.synthesis.operation.orchestrator import (
+        OperationSynthetizer,
+    )
+
+
+def plan_prefetch(synthesis_variables: list[OperationSynthesis]) -> list[str]:
+    """
+    Obtém os arquivos do caso lidos pelas sínteses solicitadas, na ordem
+    em que serão requisitados, exceto os que já foram processados e estão
+    em cache no Deck.
+    """
+    files: list[str] = []
+    for s in synthesis_variables:
+        for f in resolve_files((s.variable, s.spatial_resolution)):
+            if f not in files and f not in Deck.DECK_DATA_CACHING:
+                files.append(f)
+    return files
+
+
+def start_prefetch(
+    cls: "type[OperationSynthetizer]",
+    synthesis_variables: list[OperationSynthesis],
+    uow: AbstractUnitOfWork,
+) -> None:
+    """
+    Inicia a leitura antecipada dos arquivos do caso necessários para
+    as sínteses de cenários.
+    """
+    files = plan_prefetch(synthesis_variables)
+    if files:
+        cls._log(f"Leitura antecipada dos arquivos: {', '.join(files)}")
+    with uow:
+        uow.files.prefetch(files)
+
+
+def finish_prefetch(
+    cls: "type[OperationSynthetizer]", uow: AbstractUnitOfWork
+) -> None:
+    """
+    Interrompe a leitura antecipada dos arquivos do caso, descartando
+    os arquivos lidos e não requisitados pelas sínteses.
+    """
+    with uow:
+        uow.files.stop_prefetch()
@@ -0,0 +1,56 @@
+from logging import DEBUG
+from typing import TYPE_CHECKING
+
+from app.internal.constants import SCENARIO_COL, STAGE_COL
+from app.model.operation.operationsynthesis import OperationSynthesis
+from app.model.settings import Settings
+from app.services.deck.deck import Deck
+from app.services.unitofwork import AbstractUnitOfWork
+from app.utils.progress import ProgressReporter, TimingHistory
+
+if TYPE_CHECKING:
+    from app.services.synthesis.operation.orchestrator import (
+        OperationSynthetizer,
+    )
+
+
+def deck_size_key(uow: AbstractUnitOfWork) -> str:
+    """
+    Identifica o porte do deck pelo número de estágios e de cenários,
+    para agrupar os tempos históricos de síntese.
+    """
+    try:
+        df = Deck.expanded_probabilities(uow)
+        return (
+            f"estagios{df[STAGE_COL].nunique()}"
+            + f"_cenarios{df[SCENARIO_COL].nunique()}"
+        )
+    except Exception:
+        return "desconhecido"
+
+
+def start_progress(
+    cls: "type[OperationSynthetizer]",
+    synthesis: list[OperationSynthesis],
+    uow: AbstractUnitOfWork,
+) -> ProgressReporter:
+    history = TimingHistory(Settings().timing_history)
+    return ProgressReporter(
+        [str(s) for s in synthesis],
+        cls.logger,
+        history.get(deck_size_key(uow)),
+    )
+
+
+def save_progress_history(
+    cls: "type[OperationSynthetizer]",
+    progress: ProgressReporter,
+    uow: AbstractUnitOfWork,
+) -> None:
+    timings = progress.successful_timings
+    if len(timings) == 0:
+        return
+    history = TimingHistory(Settings().timing_history)
+    history.update(deck_size_key(uow), timings)
+    if history.save():
+        cls._log(f"Tempos de sintese salvos em {history.path}", DEBUG)
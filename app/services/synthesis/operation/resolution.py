@@ -1,5 +1,5 @@
 import logging
-from typing import Callable
+from typing import Callable, NamedTuple
 
 import pandas as pd
 
@@ -21,8 +21,9 @@ def resolve_dec_oper_sist(
     with time_and_log(
         message_root="Tempo para obtenção dos dados do dec_oper_sist",
         logger=logger,
+        phase="resolve",
     ):
-        df = Deck.dec_oper_sist(uow)
+        df = Deck.dec_oper_sist(uow, [col])
         return post_resolve_file(None, df, col, logger)
 
 
@@ -36,8 +37,9 @@ def resolve_dec_oper_ree(
     with time_and_log(
         message_root="Tempo para obtenção dos dados do dec_oper_ree",
         logger=logger,
+        phase="resolve",
     ):
-        df = Deck.dec_oper_ree(uow)
+        df = Deck.dec_oper_ree(uow, [col])
         return post_resolve_file(None, df, col, logger)
 
 
@@ -48,6 +50,7 @@ def resolve_ena_coupling_eer(
     with time_and_log(
         message_root="Tempo para obtenção dos dados de ENA do relato",
         logger=logger,
+        phase="resolve",
     ):
         return Deck.eer_afluent_energy(uow)
 
@@ -59,6 +62,7 @@ def resolve_ena_coupling_sbm(
     with time_and_log(
         message_root="Tempo para obtenção dos dados de ENA do relato",
         logger=logger,
+        phase="resolve",
     ):
         return Deck.sbm_afluent_energy(uow)
 
@@ -74,8 +78,9 @@ def resolve_dec_oper_usih(
     with time_and_log(
         message_root="Tempo para obtenção dos dados do dec_oper_usih",
         logger=logger,
+        phase="resolve",
     ):
-        df = Deck.dec_oper_usih(uow)
+        df = Deck.dec_oper_usih(uow, [col])
         df = post_resolve_file(None, df, col, logger)
         if blocks:
             df = df.loc[df[BLOCK_COL].isin(blocks)].copy()
@@ -92,8 +97,9 @@ def resolve_dec_oper_usit(
     with time_and_log(
         message_root="Tempo para obtenção dos dados do dec_oper_usit",
         logger=logger,
+        phase="resolve",
     ):
-        df = Deck.dec_oper_usit(uow)
+        df = Deck.dec_oper_usit(uow, [col])
         return post_resolve_file(None, df, col, logger)
 
 
@@ -107,8 +113,9 @@ def resolve_dec_oper_interc(
     with time_and_log(
         message_root="Tempo para obtenção dos dados do dec_oper_interc",
         logger=logger,
+        phase="resolve",
     ):
-        df = Deck.dec_oper_interc(uow)
+        df = Deck.dec_oper_interc(uow, [col])
         return post_resolve_file(None, df, col, logger)
 
 
@@ -122,8 +129,9 @@ def resolve_dec_oper_interc_net(
     with time_and_log(
         message_root="Tempo para obtenção dos dados do dec_oper_interc",
         logger=logger,
+        phase="resolve",
     ):
-        df = Deck.dec_oper_interc_net(uow)
+        df = Deck.dec_oper_interc_net(uow, [col])
         return post_resolve_file(None, df, col, logger)
 
 
@@ -135,6 +143,7 @@ def resolve_hydro_operation_report_block(
     with time_and_log(
         message_root="Tempo para obtenção dos dados dos relato e relato2",
         logger=logger,
+        phase="resolve",
     ):
         return Deck.hydro_operation_report_data(col, uow)
 
@@ -146,6 +155,7 @@ def resolve_hydro_generation_report_block(
     with time_and_log(
         message_root="Tempo para obtenção dos dados dos relato e relato2",
         logger=logger,
+        phase="resolve",
     ):
         return Deck.energy_balance_report_data("geracao_hidraulica", uow)
 
@@ -158,50 +168,137 @@ def resolve_operation_report_block(
     with time_and_log(
         message_root="Tempo para obtenção dos dados dos relato e relato2",
         logger=logger,
+        phase="resolve",
     ):
         return Deck.operation_report_data(col, uow)
 
 
+class DispatchRule(NamedTuple):
+    """
+    Regra de resolução de uma síntese, contendo a função de resolução,
+    as colunas lidas de cada arquivo dec_oper_* por ela e os arquivos
+    do caso lidos, identificados como no repositório de arquivos.
+    """
+
+    resolve: Callable[[AbstractUnitOfWork], pd.DataFrame]
+    columns: dict[str, list[str]]
+    files: tuple[str, ...] = ()
+
+
 def resolve_dispatch(
     synthesis: tuple[Variable, SpatialResolution],
     logger: logging.Logger | None = None,
 ) -> Callable[[AbstractUnitOfWork], pd.DataFrame]:
     """Retorna a função de resolução correspondente à síntese fornecida."""
+    return _dispatch_rules(logger)[synthesis].resolve
+
+
+def resolve_columns(
+    synthesis: tuple[Variable, SpatialResolution],
+) -> dict[str, list[str]]:
+    """
+    Retorna as colunas de cada arquivo dec_oper_* que são lidas para
+    a resolução da síntese fornecida.
+    """
+    rule = _dispatch_rules().get(synthesis)
+    return rule.columns if rule is not None else {}
+
+
+def resolve_files(
+    synthesis: tuple[Variable, SpatialResolution],
+) -> list[str]:
+    """
+    Retorna os arquivos do caso que são lidos para a resolução da
+    síntese fornecida.
+    """
+    rule = _dispatch_rules().get(synthesis)
+    return list(rule.files) if rule is not None else []
+
+
+def _dispatch_rules(
+    logger: logging.Logger | None = None,
+) -> dict[tuple[Variable, SpatialResolution], DispatchRule]:
     V = Variable
     SR = SpatialResolution
 
-    def sist(col: str) -> Callable[[AbstractUnitOfWork], pd.DataFrame]:
-        return lambda uow: resolve_dec_oper_sist(uow, col, logger)
+    def sist(col: str) -> DispatchRule:
+        return DispatchRule(
+            lambda uow: resolve_dec_oper_sist(uow, col, logger),
+            {"dec_oper_sist": [col]},
+            ("dec_oper_sist",),
+        )
+
+    def sist_valid(col: str, blocks: list[int] | None = None) -> DispatchRule:
+        return DispatchRule(
+            lambda uow: _stub_valid_values_sist(uow, col, blocks, logger),
+            {"dec_oper_sist": [col]},
+            ("dec_oper_sist",),
+        )
+
+    def sist_thermal(col: str) -> DispatchRule:
+        return DispatchRule(
+            lambda uow: _stub_thermal_submarkets_sist(uow, col, logger),
+            {"dec_oper_sist": [col]},
+            ("dec_oper_sist",),
+        )
 
-    def ree(col: str) -> Callable[[AbstractUnitOfWork], pd.DataFrame]:
-        return lambda uow: resolve_dec_oper_ree(uow, col, logger)
+    def ree(col: str) -> DispatchRule:
+        return DispatchRule(
+            lambda uow: resolve_dec_oper_ree(uow, col, logger),
+            {"dec_oper_ree": [col]},
+            ("dec_oper_ree",),
+        )
 
-    def usih(
-        col: str, blocks: list[int] | None = None
-    ) -> Callable[[AbstractUnitOfWork], pd.DataFrame]:
-        return lambda uow: resolve_dec_oper_usih(uow, col, blocks, logger)
+    def usih(col: str, blocks: list[int] | None = None) -> DispatchRule:
+        return DispatchRule(
+            lambda uow: resolve_dec_oper_usih(uow, col, blocks, logger),
+            {"dec_oper_usih": [col]},
+            ("dec_oper_usih",),
+        )
 
-    def usit(col: str) -> Callable[[AbstractUnitOfWork], pd.DataFrame]:
-        return lambda uow: resolve_dec_oper_usit(uow, col, logger)
+    def usih_volume(col: str) -> DispatchRule:
+        return DispatchRule(
+            lambda uow: _stub_stored_volume_usih(uow, col, logger),
+            {"dec_oper_usih": [col]},
+            ("dec_oper_usih",),
+        )
 
-    def interc(col: str) -> Callable[[AbstractUnitOfWork], pd.DataFrame]:
-        return lambda uow: resolve_dec_oper_interc(uow, col, logger)
+    def usit(col: str) -> DispatchRule:
+        return DispatchRule(
+            lambda uow: resolve_dec_oper_usit(uow, col, logger),
+            {"dec_oper_usit": [col]},
+            ("dec_oper_usit",),
+        )
 
-    def interc_net(col: str) -> Callable[[AbstractUnitOfWork], pd.DataFrame]:
-        return lambda uow: resolve_dec_oper_interc_net(uow, col, logger)
+    def interc(col: str) -> DispatchRule:
+        return DispatchRule(
+            lambda uow: resolve_dec_oper_interc(uow, col, logger),
+            {"dec_oper_interc": [col]},
+            ("dec_oper_interc",),
+        )
 
-    def hydro_op(col: str) -> Callable[[AbstractUnitOfWork], pd.DataFrame]:
-        return lambda uow: resolve_hydro_operation_report_block(
-            uow, col, logger
+    def interc_net(col: str) -> DispatchRule:
+        return DispatchRule(
+            lambda uow: resolve_dec_oper_interc_net(uow, col, logger),
+            {"dec_oper_interc": [col], "dec_oper_interc_net": [col]},
+            ("dec_oper_interc",),
         )
 
-    def op_report(col: str) -> Callable[[AbstractUnitOfWork], pd.DataFrame]:
-        return lambda uow: resolve_operation_report_block(uow, col, logger)
+    def hydro_op(col: str) -> DispatchRule:
+        return DispatchRule(
+            lambda uow: resolve_hydro_operation_report_block(uow, col, logger),
+            {},
+            ("relato", "relato2"),
+        )
 
-    _rules: dict[
-        tuple[Variable, SpatialResolution],
-        Callable[[AbstractUnitOfWork], pd.DataFrame],
-    ] = {
+    def op_report(col: str) -> DispatchRule:
+        return DispatchRule(
+            lambda uow: resolve_operation_report_block(uow, col, logger),
+            {},
+            ("relato", "relato2"),
+        )
+
+    _rules: dict[tuple[Variable, SpatialResolution], DispatchRule] = {
         (V.CUSTO_MARGINAL_OPERACAO, SR.SUBMERCADO): sist("cmo"),
         (V.CUSTO_GERACAO_TERMICA, SR.SISTEMA_INTERLIGADO): op_report(
             "geracao_termica"
@@ -216,11 +313,11 @@ def resolve_dispatch(
             V.ENERGIA_ARMAZENADA_PERCENTUAL_INICIAL,
             SR.RESERVATORIO_EQUIVALENTE,
         ): ree("earm_inicial_percentual"),
-        (V.ENERGIA_ARMAZENADA_ABSOLUTA_INICIAL, SR.SUBMERCADO): lambda uow: (
-            _stub_valid_values_sist(uow, "earm_inicial_MWmes", [0], logger)
+        (V.ENERGIA_ARMAZENADA_ABSOLUTA_INICIAL, SR.SUBMERCADO): sist_valid(
+            "earm_inicial_MWmes", [0]
         ),
-        (V.ENERGIA_ARMAZENADA_PERCENTUAL_INICIAL, SR.SUBMERCADO): lambda uow: (
-            _stub_valid_values_sist(uow, "earm_inicial_percentual", [0], logger)
+        (V.ENERGIA_ARMAZENADA_PERCENTUAL_INICIAL, SR.SUBMERCADO): sist_valid(
+            "earm_inicial_percentual", [0]
         ),
         (
             V.ENERGIA_ARMAZENADA_ABSOLUTA_FINAL,
@@ -230,19 +327,19 @@ def resolve_dispatch(
             V.ENERGIA_ARMAZENADA_PERCENTUAL_FINAL,
             SR.RESERVATORIO_EQUIVALENTE,
         ): ree("earm_final_percentual"),
-        (V.ENERGIA_ARMAZENADA_ABSOLUTA_FINAL, SR.SUBMERCADO): lambda uow: (
-            _stub_valid_values_sist(uow, "earm_final_MWmes", [0], logger)
+        (V.ENERGIA_ARMAZENADA_ABSOLUTA_FINAL, SR.SUBMERCADO): sist_valid(
+            "earm_final_MWmes", [0]
         ),
-        (V.ENERGIA_ARMAZENADA_PERCENTUAL_FINAL, SR.SUBMERCADO): lambda uow: (
-            _stub_valid_values_sist(uow, "earm_final_percentual", [0], logger)
+        (V.ENERGIA_ARMAZENADA_PERCENTUAL_FINAL, SR.SUBMERCADO): sist_valid(
+            "earm_final_percentual", [0]
         ),
-        (V.GERACAO_TERMICA, SR.SUBMERCADO): lambda uow: (
-            _stub_thermal_submarkets_sist(
-                uow, "geracao_termica_total_MW", logger
-            )
+        (V.GERACAO_TERMICA, SR.SUBMERCADO): sist_thermal(
+            "geracao_termica_total_MW"
         ),
-        (V.GERACAO_HIDRAULICA, SR.SUBMERCADO): lambda uow: (
-            resolve_hydro_generation_report_block(uow, logger)
+        (V.GERACAO_HIDRAULICA, SR.SUBMERCADO): DispatchRule(
+            lambda uow: resolve_hydro_generation_report_block(uow, logger),
+            {},
+            ("relato", "relato2"),
         ),
         (V.GERACAO_USINAS_NAO_SIMULADAS, SR.SUBMERCADO): sist(
             "geracao_nao_simuladas_MW"
@@ -250,9 +347,11 @@ def resolve_dispatch(
         (
             V.ENERGIA_NATURAL_AFLUENTE_ACOPLAMENTO,
             SR.RESERVATORIO_EQUIVALENTE,
-        ): lambda uow: resolve_ena_coupling_eer(uow, logger),
-        (V.ENERGIA_NATURAL_AFLUENTE_ACOPLAMENTO, SR.SUBMERCADO): lambda uow: (
-            resolve_ena_coupling_sbm(uow, logger)
+        ): DispatchRule(
+            lambda uow: resolve_ena_coupling_eer(uow, logger), {}, ("relato",)
+        ),
+        (V.ENERGIA_NATURAL_AFLUENTE_ACOPLAMENTO, SR.SUBMERCADO): DispatchRule(
+            lambda uow: resolve_ena_coupling_sbm(uow, logger), {}, ("relato",)
         ),
         (
             V.ENERGIA_NATURAL_AFLUENTE_ABSOLUTA,
@@ -265,27 +364,19 @@ def resolve_dispatch(
         (
             V.VOLUME_ARMAZENADO_PERCENTUAL_INICIAL,
             SR.USINA_HIDROELETRICA,
-        ): lambda uow: _stub_stored_volume_usih(
-            uow, "volume_util_inicial_percentual", logger
-        ),
+        ): usih_volume("volume_util_inicial_percentual"),
         (
             V.VOLUME_ARMAZENADO_PERCENTUAL_FINAL,
             SR.USINA_HIDROELETRICA,
-        ): lambda uow: _stub_stored_volume_usih(
-            uow, "volume_util_final_percentual", logger
-        ),
+        ): usih_volume("volume_util_final_percentual"),
         (
             V.VOLUME_ARMAZENADO_ABSOLUTO_INICIAL,
             SR.USINA_HIDROELETRICA,
-        ): lambda uow: _stub_stored_volume_usih(
-            uow, "volume_util_inicial_hm3", logger
-        ),
+        ): usih_volume("volume_util_inicial_hm3"),
         (
             V.VOLUME_ARMAZENADO_ABSOLUTO_FINAL,
             SR.USINA_HIDROELETRICA,
-        ): lambda uow: _stub_stored_volume_usih(
-            uow, "volume_util_final_hm3", logger
-        ),
+        ): usih_volume("volume_util_final_hm3"),
         (V.VAZAO_INCREMENTAL, SR.USINA_HIDROELETRICA): usih(
             "vazao_incremental_m3s", [0]
         ),
@@ -318,7 +409,7 @@ def resolve_dispatch(
             "intercambio_origem_MW"
         ),
     }
-    return _rules[synthesis]
+    return _rules
 
 
 # ---------------------------------------------------------------------------
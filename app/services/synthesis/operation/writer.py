@@ -0,0 +1,146 @@
+import logging
+import queue
+import threading
+from logging import ERROR
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from app.adapters.repository.export import AbstractExportRepository
+from app.model.operation.operationsynthesis import OperationSynthesis
+from app.model.settings import Settings
+from app.services.unitofwork import AbstractUnitOfWork
+from app.utils.timing import PerformanceTelemetry, time_and_log
+
+if TYPE_CHECKING:
+    from app.services.synthesis.operation.orchestrator import (
+        OperationSynthetizer,
+    )
+
+
+_WriteTask = Tuple[pd.DataFrame, str, Optional[time_and_log]]
+
+
+class AsyncExportWriter:
+    """
+    Escreve as sínteses em threads separadas, de modo que o cálculo da
+    próxima variável ocorra enquanto a anterior é escrita. A fila de
+    escrita é limitada: quando está cheia, `submit` aguarda a escrita
+    de alguma síntese, limitando a memória ocupada pelas tabelas
+    pendentes. Sem threads de escrita, as sínteses são escritas
+    imediatamente.
+    """
+
+    def __init__(
+        self,
+        exporter: AbstractExportRepository,
+        writers: int = 1,
+        queue_size: int = 2,
+        logger: Optional[logging.Logger] = None,
+    ) -> None:
+        if writers < 0:
+            raise ValueError(f"Número de escritores inválido: {writers}")
+        if queue_size < 1:
+            raise ValueError(f"Tamanho de fila inválido: {queue_size}")
+        self.exporter = exporter
+        self.logger = logger
+        self.errors: Dict[str, Exception] = {}
+        self._lock = threading.Lock()
+        self._queue: "queue.Queue[Optional[_WriteTask]]" = queue.Queue(
+            maxsize=queue_size
+        )
+        self._threads: List[threading.Thread] = [
+            threading.Thread(
+                target=self._work, name=f"escritor-{i}", daemon=True
+            )
+            for i in range(writers)
+        ]
+        for t in self._threads:
+            t.start()
+
+    def _write(
+        self,
+        df: pd.DataFrame,
+        filename: str,
+        parent: Optional[time_and_log] = None,
+    ) -> None:
+        try:
+            with time_and_log(
+                message_root=f"Tempo para escrita de {filename}",
+                logger=self.logger,
+                variable=filename,
+                phase="escrita",
+                profiled=False,
+                parent=parent,
+            ) as timer:
+                timer.rows(rows_in=df.shape[0], rows_out=df.shape[0])
+                self.exporter.synthetize_df(df, filename)
+        except Exception as e:
+            with self._lock:
+                self.errors[filename] = e
+
+    def _work(self) -> None:
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                self._write(*item)
+            finally:
+                self._queue.task_done()
+
+    def submit(self, df: pd.DataFrame, filename: str) -> None:
+        """
+        Adiciona uma síntese à fila de escrita, aguardando caso a fila
+        esteja cheia.
+        """
+        if not self._threads:
+            self._write(df, filename)
+        else:
+            parent = PerformanceTelemetry().current()
+            self._queue.put((df, filename, parent))
+
+    def wait(self) -> Dict[str, Exception]:
+        """
+        Aguarda a escrita de todas as sínteses e encerra as threads,
+        retornando os erros ocorridos na escrita de cada arquivo.
+        """
+        for _ in self._threads:
+            self._queue.put(None)
+        for t in self._threads:
+            t.join()
+        self._threads = []
+        return dict(self.errors)
+
+
+def start_writer(
+    cls: "type[OperationSynthetizer]", uow: AbstractUnitOfWork
+) -> None:
+    """
+    Inicia as threads de escrita das sínteses de cenários.
+    """
+    with uow:
+        exporter = uow.export
+    cls.WRITER = AsyncExportWriter(
+        exporter,
+        Settings().export_writers,
+        Settings().export_queue,
+        cls.logger,
+    )
+
+
+def finish_writer(
+    cls: "type[OperationSynthetizer]",
+    success_synthesis: list[OperationSynthesis],
+) -> list[OperationSynthesis]:
+    """
+    Aguarda a escrita das sínteses de cenários, informando os erros
+    ocorridos, e retorna as sínteses escritas com sucesso.
+    """
+    if cls.WRITER is None:
+        return success_synthesis
+    errors = cls.WRITER.wait()
+    cls.WRITER = None
+    for filename, e in errors.items():
+        cls._log(f"Erro na escrita da sintese de {filename}: {e}", ERROR)
+    return [s for s in success_synthesis if str(s) not in errors]
@@ -1,14 +1,18 @@
 import logging
+import pathlib
 from logging import ERROR, INFO
 from traceback import print_exc
-from typing import Callable, Optional
+from typing import Callable, Iterator, Optional
 
+import numpy as np
 import pandas as pd
 
 from app.internal.constants import (
+    POLICY_SYNTHESIS_CUT_STORE_OUTPUT,
     POLICY_SYNTHESIS_METADATA_OUTPUT,
     POLICY_SYNTHESIS_SUBDIR,
 )
+from app.model.policy.cutstore import CutStore
 from app.model.policy.policysynthesis import (
     SUPPORTED_SYNTHESIS,
     PolicySynthesis,
@@ -84,6 +88,20 @@ class PolicySynthetizer:
         }
         return RULES[synthesis.variable](uow)
 
+    @classmethod
+    def _resolve_streaming(
+        cls, synthesis: PolicySynthesis, uow: AbstractUnitOfWork
+    ) -> Optional[Iterator[pd.DataFrame]]:
+        """
+        Obtém os dados da síntese em partes, para as sínteses que são
+        exportadas sem construir a tabela completa em memória.
+        """
+        RULES: dict[Variable, Callable[..., Iterator[pd.DataFrame]]] = {
+            Variable.CORTES_COEFICIENTES: Deck.cortes_per_stage,
+        }
+        rule = RULES.get(synthesis.variable)
+        return rule(uow) if rule is not None else None
+
     @classmethod
     def _resolve_cortes_coeficientes(
         cls, uow: AbstractUnitOfWork
@@ -103,6 +121,45 @@ class PolicySynthetizer:
             raise RuntimeError()
         return df
 
+    @classmethod
+    def _cut_store_path(cls, uow: AbstractUnitOfWork) -> pathlib.Path:
+        uow.subdir = POLICY_SYNTHESIS_SUBDIR
+        with uow:
+            return uow.export.path.joinpath(POLICY_SYNTHESIS_CUT_STORE_OUTPUT)
+
+    @classmethod
+    def cut_store(cls, uow: AbstractUnitOfWork) -> CutStore:
+        """
+        Obtém os cortes de Benders de todos os estágios em representação
+        compacta, com uma matriz densa de coeficientes por estágio. Os
+        cortes armazenados na síntese de CORTES_COEFICIENTES são lidos
+        quando existem, sem que os arquivos dec_fcf_cortes sejam
+        processados novamente.
+        """
+        path = cls._cut_store_path(uow)
+        if path.is_file():
+            return CutStore.load(str(path))
+        return Deck.cut_store(uow)
+
+    @classmethod
+    def evaluate_future_cost(
+        cls,
+        stage: int,
+        states: np.ndarray | pd.DataFrame,
+        uow: AbstractUnitOfWork,
+    ) -> np.ndarray:
+        """
+        Avalia a função de custo futuro de um estágio para vários estados
+        de uma só vez. Os estados podem ser fornecidos como uma matriz,
+        com as variáveis na ordem de `StageCuts.variables`, ou como uma
+        tabela com as colunas das variáveis de estado, `estado` e
+        `valor_estado`.
+        """
+        stage_cuts = cls.cut_store(uow).stages[stage]
+        if isinstance(states, pd.DataFrame):
+            states = stage_cuts.state_matrix(states)
+        return stage_cuts.evaluate(states)
+
     @classmethod
     def _export_metadata(
         cls,
@@ -139,9 +196,23 @@ class PolicySynthetizer:
         with time_and_log(
             message_root=f"Tempo para sintese de {filename}",
             logger=cls.logger,
+            variable=filename,
         ):
             try:
                 cls._log(f"Realizando síntese de {filename}")
+                chunks = cls._resolve_streaming(s, uow)
+                if chunks is not None:
+                    store: Optional[CutStore] = None
+                    if s.variable == Variable.CORTES_COEFICIENTES:
+                        store = CutStore({})
+                        chunks = store.collect(chunks)
+                    with uow:
+                        if uow.export.synthetize_df_iter(chunks, filename):
+                            if store is not None:
+                                store.save(str(cls._cut_store_path(uow)))
+                            return s
+                    cls._log("Dados dos cortes não encontrados", ERROR)
+                    return None
                 df = cls._resolve(s, uow)
                 if df is not None:
                     with uow:
@@ -159,7 +230,9 @@ class PolicySynthetizer:
         uow.subdir = POLICY_SYNTHESIS_SUBDIR
 
         with time_and_log(
-            message_root="Tempo para sintese da politica", logger=cls.logger
+            message_root="Tempo para sintese da politica",
+            logger=cls.logger,
+            synthesizer="politica",
         ):
             synthesis_variables = cls._preprocess_synthesis_variables(
                 variables, uow
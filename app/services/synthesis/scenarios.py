@@ -127,6 +127,7 @@ class ScenarioSynthetizer:
         with time_and_log(
             message_root=f"Tempo para sintese de {filename}",
             logger=cls.logger,
+            variable=filename,
         ):
             try:
                 cls._log(f"Realizando síntese de {filename}")
@@ -147,7 +148,9 @@ class ScenarioSynthetizer:
         uow.subdir = SCENARIO_SYNTHESIS_SUBDIR
 
         with time_and_log(
-            message_root="Tempo para sintese dos cenarios", logger=cls.logger
+            message_root="Tempo para sintese dos cenarios",
+            logger=cls.logger,
+            synthesizer="cenarios",
         ):
             synthesis_variables = cls._preprocess_synthesis_variables(
                 variables, uow
@@ -147,8 +147,9 @@ class SystemSynthetizer:
         with time_and_log(
             message_root="Tempo para obtenção dos dados do dec_oper_usit",
             logger=cls.logger,
+            phase="resolve",
         ):
-            df = Deck.dec_oper_usit(uow)
+            df = Deck.dec_oper_usit(uow, ["custo_incremental"])
             df = cls._post_resolve_file(df, "custo_incremental")
 
             if df is None:
@@ -231,6 +232,7 @@ class SystemSynthetizer:
         with time_and_log(
             message_root=f"Tempo para sintese de {filename}",
             logger=cls.logger,
+            variable=filename,
         ):
             try:
                 cls._log(f"Realizando síntese de {filename}")
@@ -251,7 +253,9 @@ class SystemSynthetizer:
         uow.subdir = SYSTEM_SYNTHESIS_SUBDIR
 
         with time_and_log(
-            message_root="Tempo para sintese do sistema", logger=cls.logger
+            message_root="Tempo para sintese do sistema",
+            logger=cls.logger,
+            synthesizer="sistema",
         ):
             synthesis_variables = cls._preprocess_synthesis_variables(
                 variables, uow
@@ -1,9 +1,12 @@
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Dict, Optional, Type
+
+import pandas as pd
 
 from app.adapters.repository.export import (
     AbstractExportRepository,
+    MemoryExportRepository,
 )
 from app.adapters.repository.export import (
     factory as export_factory,
@@ -14,6 +17,9 @@ from app.adapters.repository.files import (
 from app.adapters.repository.files import (
     factory as files_factory,
 )
+from app.adapters.repository.files import (
+    release as files_release,
+)
 from app.model.settings import Settings
 
 
@@ -33,6 +39,13 @@ class AbstractUnitOfWork(ABC):
     def rollback(self) -> None:
         raise NotImplementedError
 
+    def close(self) -> None:
+        """
+        Libera os recursos mantidos entre os blocos `with` ao final
+        de um comando.
+        """
+        pass
+
     @property
     @abstractmethod
     def files(self) -> AbstractFilesRepository:
@@ -78,15 +91,18 @@ class FSUnitOfWork(AbstractUnitOfWork):
                 Settings().file_repository, str(self._path), self._version
             )
         if self._exporter is None:
-            synthesis_outdir = (
-                Path(self._path)
-                .joinpath(Settings().synthesis_dir)
-                .joinpath(self._subdir)
-            )
-            synthesis_outdir.mkdir(parents=True, exist_ok=True)
-            self._exporter = export_factory(
-                Settings().synthesis_format, str(synthesis_outdir)
-            )
+            self._exporter = self._create_exporter()
+
+    def _create_exporter(self) -> AbstractExportRepository:
+        synthesis_outdir = (
+            Path(self._path)
+            .joinpath(Settings().synthesis_dir)
+            .joinpath(self._subdir)
+        )
+        synthesis_outdir.mkdir(parents=True, exist_ok=True)
+        return export_factory(
+            Settings().synthesis_format, str(synthesis_outdir)
+        )
 
     def __enter__(self) -> "AbstractUnitOfWork":
         if self._depth == 0:
@@ -116,6 +132,33 @@ class FSUnitOfWork(AbstractUnitOfWork):
     def rollback(self) -> None:
         pass
 
+    def close(self) -> None:
+        files_release(Settings().file_repository, self._path)
+
+
+class MemoryUnitOfWork(FSUnitOfWork):
+    """
+    Lê os arquivos do diretório do caso e mantém as sínteses em memória,
+    acumuladas entre os blocos `with`, no lugar de escrevê-las em disco.
+    """
+
+    def __init__(self, directory: str, q: Any) -> None:
+        super().__init__(directory, q)
+        self._memory = MemoryExportRepository(
+            str(Path(self._path).joinpath(Settings().synthesis_dir))
+        )
+
+    def _create_exporter(self) -> AbstractExportRepository:
+        return self._memory
+
+    @property
+    def tables(self) -> Dict[str, pd.DataFrame]:
+        return self._memory.tables
+
 
 def factory(kind: str, *args: Any, **kwargs: Any) -> AbstractUnitOfWork:
-    return {"FS": FSUnitOfWork}.get(kind, FSUnitOfWork)(*args, **kwargs)
+    mapping: Dict[str, Type[AbstractUnitOfWork]] = {
+        "FS": FSUnitOfWork,
+        "MEMORIA": MemoryUnitOfWork,
+    }
+    return mapping.get(kind, FSUnitOfWork)(*args, **kwargs)
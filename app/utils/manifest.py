@@ -0,0 +1,121 @@
+import hashlib
+import json
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import pandas as pd
+
+from app.internal.constants import STAGE_COL
+from app.utils.singleton import Singleton
+
+MANIFEST_COLUMNS = [
+    "arquivo",
+    "esquema",
+    "linhas",
+    "bytes",
+    "estagio_min",
+    "estagio_max",
+    "hash",
+]
+
+
+class TableFingerprint:
+    """
+    Impressão digital de uma tabela exportada: esquema, número de linhas,
+    estágios mínimo e máximo e um hash do conteúdo. O hash é calculado
+    linha a linha, sendo o mesmo para a tabela escrita de uma única vez
+    ou em partes.
+    """
+
+    def __init__(self) -> None:
+        self.schema: Dict[str, str] = {}
+        self.rows = 0
+        self.stage_min: Optional[int] = None
+        self.stage_max: Optional[int] = None
+        self._hash = hashlib.blake2b(digest_size=16)
+
+    def update(self, df: pd.DataFrame) -> "TableFingerprint":
+        if not self.schema:
+            self.schema = {str(c): str(t) for c, t in df.dtypes.items()}
+        self.rows += df.shape[0]
+        if df.shape[0] > 0:
+            self._hash.update(
+                pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes()
+            )
+        if STAGE_COL in df.columns and df[STAGE_COL].notna().any():
+            low, high = int(df[STAGE_COL].min()), int(df[STAGE_COL].max())
+            self.stage_min = (
+                low if self.stage_min is None else min(self.stage_min, low)
+            )
+            self.stage_max = (
+                high if self.stage_max is None else max(self.stage_max, high)
+            )
+        return self
+
+    @classmethod
+    def of(cls, dfs: Iterable[pd.DataFrame]) -> "TableFingerprint":
+        fingerprint = cls()
+        for df in dfs:
+            fingerprint.update(df)
+        return fingerprint
+
+    @property
+    def schema_json(self) -> str:
+        return json.dumps(self.schema, ensure_ascii=False)
+
+    @property
+    def digest(self) -> str:
+        h = self._hash.copy()
+        h.update(self.schema_json.encode())
+        return h.hexdigest()
+
+
+class OutputManifest(metaclass=Singleton):
+    """
+    Coletor das impressões digitais das tabelas escritas pelos
+    repositórios de exportação, para a escrita do manifesto das
+    sínteses ao final de cada comando.
+    """
+
+    def __init__(self) -> None:
+        self.fingerprints: Dict[str, TableFingerprint] = {}
+        self._lock = threading.Lock()
+
+    def register(self, filename: str, fingerprint: TableFingerprint) -> None:
+        with self._lock:
+            self.fingerprints[filename] = fingerprint
+
+    def clear(self) -> None:
+        with self._lock:
+            self.fingerprints.clear()
+
+    def to_df(
+        self, size: Callable[[str], Optional[int]] = lambda _: None
+    ) -> pd.DataFrame:
+        """
+        Obtém o manifesto das tabelas escritas, com o tamanho em bytes
+        de cada uma fornecido pela função `size`.
+        """
+        with self._lock:
+            items = sorted(self.fingerprints.items())
+        rows: List[List[Any]] = [
+            [
+                filename,
+                f.schema_json,
+                f.rows,
+                size(filename),
+                f.stage_min,
+                f.stage_max,
+                f.digest,
+            ]
+            for filename, f in items
+        ]
+        df = pd.DataFrame(rows, columns=MANIFEST_COLUMNS)
+        return df.astype(
+            {
+                "linhas": "int64",
+                "bytes": "Int64",
+                "estagio_min": "Int64",
+                "estagio_max": "Int64",
+            }
+        )
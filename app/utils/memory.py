@@ -0,0 +1,123 @@
+import os
+import sys
+import threading
+from types import TracebackType
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+import numpy as np
+import pandas as pd
+import polars as pl
+
+# Intervalo (s) entre as amostras da memória residente do processo
+MEMORY_SAMPLE_INTERVAL = 0.05
+
+# Número de objetos em cache listados no relatório de memória
+MEMORY_REPORT_ENTRIES = 10
+
+try:
+    _PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
+except (AttributeError, ValueError, OSError):  # pragma: no cover
+    _PAGE_SIZE = 4096
+
+
+def current_rss_mb() -> float:
+    """
+    Obtém a memória residente atual do processo, em MB. Diferente
+    do `ru_maxrss`, este valor diminui quando a memória é liberada.
+    """
+    try:
+        with open("/proc/self/statm", "r") as f:
+            resident_pages = int(f.read().split()[1])
+    except (OSError, ValueError, IndexError):
+        return float("nan")
+    return resident_pages * _PAGE_SIZE / 1024**2
+
+
+def object_size_mb(obj: Any) -> float:
+    """
+    Estima a memória ocupada pelos DataFrames e arrays contidos em
+    um objeto, percorrendo dicionários, listas e tuplas.
+    """
+    if isinstance(obj, pd.DataFrame):
+        return float(obj.memory_usage(deep=True).sum()) / 1024**2
+    if isinstance(obj, pl.DataFrame):
+        return obj.estimated_size("mb")
+    if isinstance(obj, np.ndarray):
+        return obj.nbytes / 1024**2
+    if isinstance(obj, dict):
+        return sum(object_size_mb(v) for v in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return sum(object_size_mb(v) for v in obj)
+    if hasattr(obj, "__dict__") and not isinstance(obj, type):
+        return sum(
+            object_size_mb(v)
+            for v in vars(obj).values()
+            if isinstance(v, (pd.DataFrame, pl.DataFrame, np.ndarray, dict))
+        )
+    return sys.getsizeof(obj) / 1024**2
+
+
+def cache_sizes(cache: Dict[Any, Any]) -> List[Tuple[Any, float]]:
+    """
+    Lista as chaves de uma cache com a memória ocupada pelo objeto
+    de cada uma delas, do maior para o menor objeto.
+    """
+    sizes = [(key, object_size_mb(value)) for key, value in list(cache.items())]
+    sizes.sort(key=lambda e: e[1], reverse=True)
+    return sizes
+
+
+def largest_entries(
+    caches: Dict[str, Dict[Any, Any]],
+    entries: int = MEMORY_REPORT_ENTRIES,
+) -> List[Tuple[str, float]]:
+    """
+    Lista os objetos em cache que ocupam mais memória, identificados
+    pelo nome da cache e pela chave de cada objeto.
+    """
+    sizes = [
+        (f"{name}[{key}]", size)
+        for name, cache in caches.items()
+        for key, size in cache_sizes(cache)
+    ]
+    sizes.sort(key=lambda e: e[1], reverse=True)
+    return sizes[:entries]
+
+
+class MemoryMonitor:
+    """
+    Amostra, em uma thread auxiliar, a memória residente do processo
+    enquanto um bloco é executado, para obter o pico do bloco.
+    """
+
+    def __init__(self, interval: float = MEMORY_SAMPLE_INTERVAL) -> None:
+        self.interval = interval
+        self.peak_mb = float("nan")
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _sample(self) -> None:
+        rss = current_rss_mb()
+        if not np.isnan(rss) and not (self.peak_mb >= rss):
+            self.peak_mb = rss
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def __enter__(self) -> "MemoryMonitor":
+        self._sample()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self._sample()
@@ -142,6 +142,62 @@ def calc_statistics(df: pl.DataFrame, probs: pl.DataFrame) -> pl.DataFrame:
     return pl.concat([df_q, df_m])
 
 
+def calc_statistics_collapsed(
+    df: pl.DataFrame, probs: pl.DataFrame
+) -> pl.DataFrame:
+    """
+    Calcula as estatísticas como `calc_statistics`, mas obtém diretamente
+    as estatísticas dos grupos cujo valor é o mesmo em todos os cenários,
+    como os estágios determinísticos replicados na expansão dos cenários,
+    sem os cálculos de quantis e médias ponderadas sobre as réplicas.
+
+    O df fornecido ainda contém os cenários expandidos, pois as agregações
+    espaciais, os limites e as variáveis de estágios anteriores são obtidos
+    por cenário a partir dos dados expandidos pelo Deck.
+    """
+    value_columns = [SCENARIO_COL, VALUE_COL]
+    grouping_columns = [c for c in df.columns if c not in value_columns]
+    if df.is_empty() or len(grouping_columns) == 0:
+        return calc_statistics(df, probs)
+    value = pl.col(VALUE_COL)
+    constant = (
+        (value.min() == value.max())
+        & (value.null_count() == 0)
+        & ~value.cast(pl.Float64).is_nan().any()
+    ).over(grouping_columns)
+    flagged = df.with_columns(constant.fill_null(False).alias("_constante"))
+    varying_df = flagged.filter(~pl.col("_constante")).drop("_constante")
+    constant_df = (
+        flagged.filter(pl.col("_constante"))
+        .group_by(grouping_columns)
+        .agg(value.first().cast(pl.Float64), value.count().alias("_n"))
+    )
+    if constant_df.is_empty():
+        return calc_statistics(varying_df, probs)
+    labels = [quantile_scenario_labels(q) for q in QUANTILES_FOR_STATISTICS]
+    results = [
+        constant_df.select(
+            grouping_columns + [value, pl.lit(label).alias(SCENARIO_COL)]
+        )
+        for label in labels + ["mean"]
+    ]
+    results.append(
+        constant_df.select(
+            grouping_columns
+            + [
+                pl.when(pl.col("_n") > 1)
+                .then(pl.lit(0.0))
+                .otherwise(pl.lit(float("nan")))
+                .alias(VALUE_COL),
+                pl.lit("std").alias(SCENARIO_COL),
+            ]
+        )
+    )
+    if not varying_df.is_empty():
+        results.insert(0, calc_statistics(varying_df, probs))
+    return pl.concat(results)
+
+
 __MONTH_STR_INT_MAP = {
     "JAN": 1,
     "FEV": 2,
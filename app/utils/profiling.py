@@ -0,0 +1,182 @@
+import cProfile
+import io
+import pstats
+import threading
+import tracemalloc
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from app.utils.singleton import Singleton
+
+PROFILE_CPU = "CPU"
+PROFILE_MEMORY = "MEMORIA"
+
+# Subdiretório da síntese onde são escritos os perfis
+PROFILE_SUBDIR = "perfil"
+
+# Número de funções ou de locais de alocação nos relatórios em texto
+PROFILE_REPORT_LINES = 40
+
+
+@dataclass
+class _ProfileScope:
+    name: str
+    profile: Optional[cProfile.Profile] = None
+    children: List[pstats.Stats] = field(default_factory=list)
+    snapshot: Optional[tracemalloc.Snapshot] = None
+    peak: int = 0
+
+
+class Profiler(metaclass=Singleton):
+    """
+    Perfilador opcional das sínteses, que mede cada sintetizador e cada
+    variável sintetizada com o cProfile (CPU) ou com o tracemalloc
+    (memória), seguindo os mesmos limites dos blocos `time_and_log`.
+    A hierarquia dos escopos é mantida separadamente para cada thread.
+    """
+
+    def __init__(self) -> None:
+        self.kind: Optional[str] = None
+        self.reports: Dict[str, pstats.Stats | str] = {}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    @property
+    def _stack(self) -> List[_ProfileScope]:
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        stack: List[_ProfileScope] = self._local.stack
+        return stack
+
+    def configure(self, kind: Optional[str]) -> None:
+        """
+        Define o tipo de perfil coletado, descartando os perfis
+        anteriores. Um tipo vazio desabilita o perfilador.
+        """
+        self.clear()
+        kind = kind.upper() if kind else None
+        if kind not in [None, PROFILE_CPU, PROFILE_MEMORY]:
+            raise ValueError(f"Tipo de perfil não reconhecido: {kind}")
+        self.kind = kind
+
+    def clear(self) -> None:
+        for scope in self._stack:
+            if scope.profile is not None:
+                scope.profile.disable()
+        # Os escopos abertos em outras threads também são descartados
+        self._local = threading.local()
+        with self._lock:
+            self.reports.clear()
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    @property
+    def enabled(self) -> bool:
+        return self.kind is not None
+
+    def enter(self, name: str) -> None:
+        if self.kind == PROFILE_CPU:
+            self._enter_cpu(name)
+        elif self.kind == PROFILE_MEMORY:
+            self._enter_memory(name)
+
+    def exit(self) -> None:
+        if len(self._stack) == 0:
+            return
+        if self.kind == PROFILE_CPU:
+            self._exit_cpu()
+        elif self.kind == PROFILE_MEMORY:
+            self._exit_memory()
+
+    def _enter_cpu(self, name: str) -> None:
+        # Só pode haver um cProfile ativo por vez, então o perfil do
+        # escopo externo é pausado e recebe os do interno ao final.
+        if self._stack and self._stack[-1].profile is not None:
+            self._stack[-1].profile.disable()
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            # A partir do Python 3.12, um perfil ativo em outra thread
+            # impede a habilitação de outro, e o escopo não é medido.
+            self._stack.append(_ProfileScope(name))
+            return
+        self._stack.append(_ProfileScope(name, profile=profile))
+
+    def _exit_cpu(self) -> None:
+        scope = self._stack.pop()
+        stats: Optional[pstats.Stats] = None
+        if scope.profile is not None:
+            scope.profile.disable()
+            stats = pstats.Stats(scope.profile)
+            for child in scope.children:
+                stats.add(child)
+            with self._lock:
+                self.reports[scope.name] = stats
+        if self._stack:
+            parent = self._stack[-1]
+            if stats is not None:
+                parent.children.append(stats)
+            if parent.profile is not None:
+                parent.profile.enable()
+
+    def _enter_memory(self, name: str) -> None:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+        if self._stack:
+            parent = self._stack[-1]
+            parent.peak = max(parent.peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.reset_peak()
+        self._stack.append(
+            _ProfileScope(name, snapshot=tracemalloc.take_snapshot())
+        )
+
+    def _exit_memory(self) -> None:
+        scope = self._stack.pop()
+        peak = max(scope.peak, tracemalloc.get_traced_memory()[1])
+        if self._stack:
+            parent = self._stack[-1]
+            parent.peak = max(parent.peak, peak)
+        if scope.snapshot is None:
+            return
+        snapshot = tracemalloc.take_snapshot().filter_traces(
+            [tracemalloc.Filter(False, tracemalloc.__file__)]
+        )
+        differences = snapshot.compare_to(scope.snapshot, "lineno")
+        lines = [
+            f"Perfil de memória: {scope.name}",
+            f"Pico de memória alocada: {peak / 1024**2:.2f} MB",
+            "",
+            f"Principais locais de alocação (top {PROFILE_REPORT_LINES}):",
+        ]
+        lines += [str(d) for d in differences[:PROFILE_REPORT_LINES]]
+        with self._lock:
+            self.reports[scope.name] = "\n".join(lines) + "\n"
+
+    def write(self, directory: str | Path) -> List[Path]:
+        """
+        Escreve os perfis coletados, um por sintetizador e um por
+        variável sintetizada, no diretório fornecido.
+        """
+        path = Path(directory).joinpath(PROFILE_SUBDIR)
+        written: List[Path] = []
+        if len(self.reports) > 0:
+            path.mkdir(parents=True, exist_ok=True)
+        for name, report in self.reports.items():
+            if isinstance(report, pstats.Stats):
+                stats_path = path.joinpath(f"{name}.pstats")
+                report.dump_stats(str(stats_path))
+                written.append(stats_path)
+                text = io.StringIO()
+                report.stream = text  # type: ignore[attr-defined]
+                report.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(
+                    PROFILE_REPORT_LINES
+                )
+                report_text = text.getvalue()
+            else:
+                report_text = report
+            text_path = path.joinpath(f"{name}.txt")
+            text_path.write_text(report_text, encoding="utf-8")
+            written.append(text_path)
+        return written
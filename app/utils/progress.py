@@ -0,0 +1,140 @@
+import json
+import time
+from logging import INFO, Logger
+from pathlib import Path
+from threading import Lock
+from typing import Dict, List, Optional
+
+# Peso da execução mais recente na média dos tempos históricos
+HISTORY_WEIGHT = 0.5
+
+
+def _format_duration(seconds: float) -> str:
+    seconds = int(round(seconds))
+    return (
+        f"{seconds // 3600:02d}:{(seconds % 3600) // 60:02d}:{seconds % 60:02d}"
+    )
+
+
+class TimingHistory:
+    """
+    Tempos históricos de síntese de cada variável, agrupados pelo
+    porte do deck, persistidos em um arquivo JSON.
+    """
+
+    def __init__(self, path: Optional[str]) -> None:
+        self.path = Path(path) if path else None
+        self.data: Dict[str, Dict[str, float]] = {}
+        if self.path is not None and self.path.is_file():
+            try:
+                self.data = json.loads(self.path.read_text())
+            except (OSError, ValueError):
+                self.data = {}
+
+    def get(self, key: str) -> Dict[str, float]:
+        return dict(self.data.get(key, {}))
+
+    def update(self, key: str, timings: Dict[str, float]) -> None:
+        """
+        Atualiza os tempos de um porte de deck com uma média
+        ponderada entre o histórico e a execução atual.
+        """
+        history = self.data.setdefault(key, {})
+        for name, elapsed in timings.items():
+            previous = history.get(name)
+            history[name] = (
+                elapsed
+                if previous is None
+                else HISTORY_WEIGHT * elapsed + (1 - HISTORY_WEIGHT) * previous
+            )
+
+    def save(self) -> bool:
+        if self.path is None:
+            return False
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text(json.dumps(self.data, indent=2))
+        except OSError:
+            return False
+        return True
+
+
+class ProgressReporter:
+    """
+    Acompanha o progresso da síntese de uma lista de itens, informando
+    o número de itens concluídos, o tempo de cada item e uma estimativa
+    do tempo restante. Os itens podem ser concluídos em qualquer ordem,
+    inclusive por execuções paralelas.
+    """
+
+    def __init__(
+        self,
+        items: List[str],
+        logger: Optional[Logger] = None,
+        history: Optional[Dict[str, float]] = None,
+    ) -> None:
+        self.items = list(items)
+        self.logger = logger
+        self.history = history or {}
+        self.timings: Dict[str, float] = {}
+        self.failures: List[str] = []
+        self.start_time = time.perf_counter()
+        self._lock = Lock()
+
+    @property
+    def done(self) -> int:
+        return len(self.timings)
+
+    @property
+    def total(self) -> int:
+        return len(self.items)
+
+    @property
+    def successful_timings(self) -> Dict[str, float]:
+        return {k: v for k, v in self.timings.items() if k not in self.failures}
+
+    def eta(self) -> Optional[float]:
+        """
+        Estima o tempo restante. Os tempos históricos dos itens restantes
+        são corrigidos pela razão entre os tempos atuais e os históricos
+        dos itens concluídos. Sem histórico, usa o tempo médio atual.
+        """
+        remaining = [i for i in self.items if i not in self.timings]
+        if len(remaining) == 0:
+            return 0.0
+        if self.done == 0:
+            if all(i in self.history for i in remaining):
+                return sum(self.history[i] for i in remaining)
+            return None
+        mean = sum(self.timings.values()) / self.done
+        known = [i for i in self.timings if i in self.history]
+        historical = sum(self.history[i] for i in known)
+        if len(known) == 0 or historical <= 0:
+            return mean * len(remaining)
+        ratio = sum(self.timings[i] for i in known) / historical
+        return sum(
+            ratio * self.history[i] if i in self.history else mean
+            for i in remaining
+        )
+
+    def finish(self, item: str, elapsed: float, success: bool = True) -> None:
+        """
+        Registra a conclusão de um item e informa o progresso.
+        """
+        with self._lock:
+            self.timings[item] = elapsed
+            if not success:
+                self.failures.append(item)
+            eta = self.eta()
+            total_elapsed = time.perf_counter() - self.start_time
+            status = "concluida" if success else "sem sucesso"
+            message = (
+                f"Progresso: {self.done}/{self.total}"
+                + f" ({100 * self.done / max(self.total, 1):.0f}%)"
+                + f" - {item} {status} em {elapsed:.2f} s"
+                + f" - decorrido {_format_duration(total_elapsed)}"
+            )
+            if eta is not None:
+                message += f" - restante estimado {_format_duration(eta)}"
+            if self.logger is not None:
+                self.logger.log(INFO, message)
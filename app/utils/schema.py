@@ -0,0 +1,127 @@
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_integer_dtype, is_string_dtype
+
+from app.internal.constants import (
+    BLOCK_COL,
+    CONFIG_COL,
+    CUT_INDEX_COL,
+    EEP_COL,
+    EER_CODE_COL,
+    EER_NAME_COL,
+    ENTITY_INDEX_COL,
+    EXCHANGE_SOURCE_CODE_COL,
+    EXCHANGE_SOURCE_NAME_COL,
+    EXCHANGE_TARGET_CODE_COL,
+    EXCHANGE_TARGET_NAME_COL,
+    HYDRO_CODE_COL,
+    HYDRO_NAME_COL,
+    ITERATION_COL,
+    LAG_COL,
+    LOWER_BOUND_COL,
+    LOWER_BOUND_UNIT_COL,
+    LTA_VALUE_COL,
+    MONTH_COL,
+    NODE_COL,
+    SCENARIO_COL,
+    SPAN_COL,
+    STAGE_COL,
+    STATS_OR_SCENARIO_COL,
+    SUBMARKET_CODE_COL,
+    SUBMARKET_NAME_COL,
+    UNIT_COL,
+    UPPER_BOUND_COL,
+    UPPER_BOUND_UNIT_COL,
+    VALUE_COL,
+    VARIABLE_COL,
+)
+from app.model.settings import Settings
+
+# Menor tipo inteiro de cada coluna de códigos e índices. Caso os
+# valores não caibam no tipo, é utilizado o próximo tipo mais largo.
+INTEGER_COLUMNS: Dict[str, str] = {
+    STAGE_COL: "int16",
+    BLOCK_COL: "int8",
+    SCENARIO_COL: "int32",
+    HYDRO_CODE_COL: "int16",
+    EER_CODE_COL: "int16",
+    SUBMARKET_CODE_COL: "int16",
+    EXCHANGE_SOURCE_CODE_COL: "int16",
+    EXCHANGE_TARGET_CODE_COL: "int16",
+    NODE_COL: "int32",
+    LAG_COL: "int16",
+    MONTH_COL: "int8",
+    ITERATION_COL: "int32",
+    SPAN_COL: "int32",
+    CONFIG_COL: "int16",
+    CUT_INDEX_COL: "int32",
+    ENTITY_INDEX_COL: "int32",
+}
+
+# Colunas de nomes, com poucos valores distintos, armazenadas
+# como categorias (dicionários nos arquivos de saída)
+CATEGORY_COLUMNS: List[str] = [
+    VARIABLE_COL,
+    SCENARIO_COL,
+    STATS_OR_SCENARIO_COL,
+    HYDRO_NAME_COL,
+    EER_NAME_COL,
+    EEP_COL,
+    SUBMARKET_NAME_COL,
+    EXCHANGE_SOURCE_NAME_COL,
+    EXCHANGE_TARGET_NAME_COL,
+    UNIT_COL,
+    LOWER_BOUND_UNIT_COL,
+    UPPER_BOUND_UNIT_COL,
+]
+
+# Colunas de valores, que podem ser escritas em precisão simples
+VALUE_COLUMNS: List[str] = [
+    VALUE_COL,
+    LOWER_BOUND_COL,
+    UPPER_BOUND_COL,
+    LTA_VALUE_COL,
+]
+
+_INTEGER_WIDTHS = ["int8", "int16", "int32", "int64"]
+
+
+def _compact_integer(series: pd.Series, dtype: str) -> pd.Series:
+    if series.empty:
+        return series.astype(dtype)
+    low, high = series.min(), series.max()
+    for width in _INTEGER_WIDTHS[_INTEGER_WIDTHS.index(dtype) :]:
+        info = np.iinfo(width)
+        if info.min <= low and high <= info.max:
+            return series.astype(width)
+    return series
+
+
+def apply_schema(
+    df: pd.DataFrame,
+    categories: bool = True,
+    float32: Optional[bool] = None,
+) -> pd.DataFrame:
+    """
+    Obtém uma cópia de um DataFrame com as colunas conhecidas convertidas
+    para os tipos compactos do registro: inteiros com a menor largura
+    que comporta os valores, categorias para as colunas de nomes e,
+    opcionalmente, precisão simples para as colunas de valores. Caso
+    `float32` não seja fornecido, é utilizada a opção ``VALORES_FLOAT32``.
+    """
+    if float32 is None:
+        float32 = Settings().float32_values
+    df = df.copy(deep=False)
+    for col in df.columns:
+        series = df[col]
+        dtype = series.dtype
+        if col in INTEGER_COLUMNS and is_integer_dtype(dtype):
+            if isinstance(dtype, np.dtype):
+                df[col] = _compact_integer(series, INTEGER_COLUMNS[col])
+        elif categories and col in CATEGORY_COLUMNS and is_string_dtype(series):
+            df[col] = series.astype("category")
+        elif float32 and col in VALUE_COLUMNS and dtype == np.float64:
+            df[col] = series.astype(np.float32)
+    return df
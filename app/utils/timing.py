@@ -1,7 +1,136 @@
+import threading
 import time
+from dataclasses import asdict, dataclass
 from logging import INFO, Logger
 from types import TracebackType
-from typing import Optional, Type
+from typing import List, Optional, Type
+
+import pandas as pd
+
+from app.utils.memory import MemoryMonitor
+from app.utils.profiling import Profiler
+from app.utils.singleton import Singleton
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - indisponível no Windows
+    resource = None  # type: ignore[assignment]
+
+
+def _peak_memory_mb() -> float:
+    # No Linux, ru_maxrss é dado em kB. Como é o pico do processo,
+    # só é possível medir o quanto cada etapa aumentou este pico.
+    if resource is None:
+        return float("nan")
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0
+
+
+@dataclass
+class TimingRecord:
+    """
+    Registro de desempenho de uma etapa da síntese.
+    """
+
+    id: int
+    id_pai: int
+    nivel: int
+    sintetizador: str
+    variavel: str
+    fase: str
+    descricao: str
+    tempo_real_s: float
+    tempo_cpu_s: float
+    linhas_entrada: Optional[int]
+    linhas_saida: Optional[int]
+    delta_memoria_pico_mb: float
+    pico_rss_mb: float
+
+
+class PerformanceTelemetry(metaclass=Singleton):
+    """
+    Coletor hierárquico dos tempos medidos pelos blocos `time_and_log`
+    (sintetizador -> variável -> fase), para exportação ao final
+    de cada comando. A hierarquia dos blocos é mantida separadamente
+    para cada thread.
+    """
+
+    def __init__(self) -> None:
+        self.records: List[TimingRecord] = []
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._next_id = 0
+
+    @property
+    def _stack(self) -> List["time_and_log"]:
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        stack: List["time_and_log"] = self._local.stack
+        return stack
+
+    def clear(self) -> None:
+        with self._lock:
+            self.records.clear()
+            self._stack.clear()
+            self._next_id = 0
+
+    def current(self) -> Optional["time_and_log"]:
+        """
+        Obtém o bloco mais interno em execução na thread atual.
+        """
+        return self._stack[-1] if self._stack else None
+
+    def _push(self, timer: "time_and_log") -> None:
+        parent = self._stack[-1] if self._stack else timer.parent
+        with self._lock:
+            timer.record_id = self._next_id
+            self._next_id += 1
+        timer.parent_id = parent.record_id if parent else -1
+        timer.depth = parent.depth + 1 if parent else 0
+        if parent is not None:
+            timer.synthesizer = timer.synthesizer or parent.synthesizer
+            timer.variable = timer.variable or parent.variable
+        self._stack.append(timer)
+
+    def _pop(
+        self,
+        timer: "time_and_log",
+        wall_time: float,
+        cpu_time: float,
+        memory_delta: float,
+        peak_rss: float = float("nan"),
+    ) -> None:
+        if timer in self._stack:
+            while self._stack.pop() is not timer:
+                pass
+        record = TimingRecord(
+            id=timer.record_id,
+            id_pai=timer.parent_id,
+            nivel=timer.depth,
+            sintetizador=timer.synthesizer or "",
+            variavel=timer.variable or "",
+            fase=timer.phase or "",
+            descricao=timer.message_root or "",
+            tempo_real_s=wall_time,
+            tempo_cpu_s=cpu_time,
+            linhas_entrada=timer.rows_in,
+            linhas_saida=timer.rows_out,
+            delta_memoria_pico_mb=memory_delta,
+            pico_rss_mb=peak_rss,
+        )
+        with self._lock:
+            self.records.append(record)
+
+    def to_df(self) -> pd.DataFrame:
+        """
+        Obtém os registros coletados, ordenados pela ordem de início
+        de cada etapa.
+        """
+        columns = list(TimingRecord.__dataclass_fields__.keys())
+        if len(self.records) == 0:
+            return pd.DataFrame(columns=columns)
+        df = pd.DataFrame([asdict(r) for r in self.records], columns=columns)
+        df = df.astype({"linhas_entrada": "Int64", "linhas_saida": "Int64"})
+        return df.sort_values("id").reset_index(drop=True)
 
 
 class time_and_log:
@@ -10,12 +139,60 @@ class time_and_log:
         message_root: Optional[str] = None,
         logger: Optional[Logger] = None,
         level: int = INFO,
+        synthesizer: Optional[str] = None,
+        variable: Optional[str] = None,
+        phase: Optional[str] = None,
+        profiled: bool = True,
+        parent: Optional["time_and_log"] = None,
     ) -> None:
         self.message_root = message_root
+        self.parent = parent
         self.logger = logger
         self.level = level
+        self.synthesizer = synthesizer
+        self.variable = variable
+        self.phase = phase
+        self.rows_in: Optional[int] = None
+        self.rows_out: Optional[int] = None
+        self.record_id = -1
+        self.parent_id = -1
+        self.depth = 0
+        self.profiled = profiled and (
+            synthesizer is not None or variable is not None
+        )
+        self.monitor: Optional[MemoryMonitor] = None
+
+    def rows(
+        self, rows_in: Optional[int] = None, rows_out: Optional[int] = None
+    ) -> None:
+        """
+        Informa o número de linhas de entrada e de saída da etapa.
+        """
+        if rows_in is not None:
+            self.rows_in = rows_in
+        if rows_out is not None:
+            self.rows_out = rows_out
+
+    @property
+    def scope_name(self) -> str:
+        """
+        Nome do escopo de perfilamento: o sintetizador, seguido
+        da variável, quando existir.
+        """
+        return "_".join(n for n in [self.synthesizer, self.variable] if n)
 
     def __enter__(self) -> "time_and_log":
+        PerformanceTelemetry()._push(self)
+        if self.profiled:
+            Profiler().enter(self.scope_name)
+            # O pico de memória residente é amostrado somente nos
+            # escopos de sintetizador e de variável
+            self.monitor = MemoryMonitor().__enter__()
+        self.start_memory = _peak_memory_mb()
+        # O tempo de CPU é o da thread que executa a etapa, para que as
+        # threads auxiliares (escrita, leitura antecipada e amostragem da
+        # memória) não sejam contabilizadas na etapa em andamento
+        self.start_cpu_time = time.thread_time()
         self.start_time = time.perf_counter()
         return self
 
@@ -27,6 +204,19 @@ class time_and_log:
     ) -> None:
         end_time = time.perf_counter()
         run_time = end_time - self.start_time
+        peak_rss = float("nan")
+        if self.monitor is not None:
+            self.monitor.__exit__(exc_type, exc_value, exc_tb)
+            peak_rss = self.monitor.peak_mb
+        if self.profiled:
+            Profiler().exit()
+        PerformanceTelemetry()._pop(
+            self,
+            run_time,
+            time.thread_time() - self.start_cpu_time,
+            _peak_memory_mb() - self.start_memory,
+            peak_rss,
+        )
         if self.logger:
             message_with_root = (
                 f"{self.message_root}: {run_time:.2f} s"
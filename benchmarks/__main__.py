@@ -0,0 +1,209 @@
+import itertools
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import click
+
+from benchmarks.compare import (
+    CALIBRATION_KEY,
+    CASE_KEYS,
+    DEFAULT_MIN_TIME,
+    DEFAULT_TOLERANCE,
+    benchmark_cases,
+    compare,
+    format_regressions,
+    machine_scale,
+)
+from benchmarks.runner import BENCHMARKS, run_suite
+
+# Linha de base versionada junto do repositório
+DEFAULT_BASELINE = str(Path(__file__).resolve().parent / "linha_base.json")
+
+
+def _run(
+    cases: List[Dict[str, Any]],
+    targets: List[str],
+    repeat: int,
+    directory: Optional[str],
+) -> Dict[str, Any]:
+    os.environ.setdefault("APP_INSTALLDIR", os.getcwd())
+    os.environ.setdefault("APP_BASEDIR", os.getcwd())
+    with tempfile.TemporaryDirectory(dir=directory) as workdir:
+        results = run_suite(cases, targets, workdir, repeat)
+    for r in results["resultados"]:
+        click.echo(
+            f"{r['caso']:<25} {r['alvo']:<25} {r['tempo_s']:>8.2f} s"
+            + f" {r['pico_rss_mb']:>8.1f} MB"
+        )
+    return results
+
+
+def _write(results: Dict[str, Any], path: str) -> None:
+    with open(path, "w") as f:
+        json.dump(results, f, indent=2)
+
+
+@click.group()
+def benchmarks() -> None:
+    """
+    Medidas de desempenho do sintetizador-decomp em decks sintéticos,
+    escalados em número de usinas hidroelétricas, de estágios, de
+    cenários e de iterações.
+    """
+    pass
+
+
+@click.command("executar")
+@click.option(
+    "--usinas",
+    multiple=True,
+    type=int,
+    help="número de usinas hidroelétricas dos decks gerados"
+    + " (padrão: as do deck de testes)",
+)
+@click.option(
+    "--estagios",
+    multiple=True,
+    type=int,
+    help="número de estágios dos decks gerados"
+    + " (padrão: os do deck de testes)",
+)
+@click.option(
+    "--cenarios",
+    multiple=True,
+    type=int,
+    default=(2, 20),
+    help="número de cenários do último estágio dos decks gerados",
+)
+@click.option(
+    "--iteracoes",
+    multiple=True,
+    type=int,
+    default=(1, 5),
+    help="fator de replicação das iterações (cortes e violações)",
+)
+@click.option(
+    "--alvo",
+    multiple=True,
+    type=click.Choice(list(BENCHMARKS.keys())),
+    help="carregador do Deck ou sintetizador a ser medido",
+)
+@click.option("--repeticoes", default=1, help="repetições de cada medida")
+@click.option(
+    "--diretorio",
+    default=None,
+    help="diretório onde são gerados os decks sintéticos",
+)
+@click.option(
+    "--saida",
+    default="benchmark.json",
+    help="arquivo JSON com os resultados",
+)
+def executar(
+    usinas: Tuple[int, ...],
+    estagios: Tuple[int, ...],
+    cenarios: Tuple[int, ...],
+    iteracoes: Tuple[int, ...],
+    alvo: Tuple[str, ...],
+    repeticoes: int,
+    diretorio: Optional[str],
+    saida: str,
+) -> None:
+    """
+    Mede o desempenho dos carregadores do Deck e dos sintetizadores
+    em decks sintéticos de tamanhos parametrizados.
+    """
+    dimensions = [usinas or (None,), estagios or (None,), cenarios, iteracoes]
+    cases = [
+        {k: v for k, v in zip(CASE_KEYS, values) if v is not None}
+        for values in itertools.product(*dimensions)
+    ]
+    targets = list(alvo) if alvo else list(BENCHMARKS.keys())
+    _write(_run(cases, targets, repeticoes, diretorio), saida)
+
+
+@click.command("comparar")
+@click.option(
+    "--linha-base",
+    default=DEFAULT_BASELINE,
+    help="arquivo JSON com os resultados de referência",
+)
+@click.option(
+    "--alvo",
+    multiple=True,
+    type=click.Choice(list(BENCHMARKS.keys())),
+    help="restringe a comparação aos alvos fornecidos",
+)
+@click.option(
+    "--tolerancia",
+    default=DEFAULT_TOLERANCE,
+    help="aumento relativo máximo tolerado em cada métrica",
+)
+@click.option(
+    "--tempo-minimo",
+    default=DEFAULT_MIN_TIME,
+    help="tempo (s) abaixo do qual as métricas não são comparadas",
+)
+@click.option("--repeticoes", default=3, help="repetições de cada medida")
+@click.option(
+    "--diretorio",
+    default=None,
+    help="diretório onde são gerados os decks sintéticos",
+)
+@click.option(
+    "--saida",
+    default=None,
+    help="arquivo JSON onde também são escritos os resultados atuais",
+)
+def comparar(
+    linha_base: str,
+    alvo: Tuple[str, ...],
+    tolerancia: float,
+    tempo_minimo: float,
+    repeticoes: int,
+    diretorio: Optional[str],
+    saida: Optional[str],
+) -> None:
+    """
+    Repete os benchmarks da linha de base e falha caso o tempo total,
+    o tempo de alguma fase ou o pico de memória piorem além da
+    tolerância.
+    """
+    with open(linha_base, "r") as f:
+        baseline = json.load(f)
+    cases, targets = benchmark_cases(baseline)
+    if alvo:
+        targets = [t for t in targets if t in alvo]
+    results = _run(cases, targets, repeticoes, diretorio)
+    if saida:
+        _write(results, saida)
+    if CALIBRATION_KEY not in baseline:
+        click.echo(
+            f"\n{linha_base} não possui a medida da carga de referência:"
+            + " os tempos são comparados sem normalização e só são"
+            + " válidos na máquina em que a linha de base foi gerada."
+        )
+    else:
+        click.echo(
+            "\nTempos da linha de base normalizados pela velocidade"
+            + f" relativa da máquina: {machine_scale(results, baseline):.2f}"
+        )
+    regressions = compare(results, baseline, tolerancia, tempo_minimo)
+    if len(regressions) > 0:
+        click.echo(
+            f"\n{len(regressions)} regressões de desempenho acima de"
+            + f" {tolerancia:.0%} em relação a {linha_base}:\n"
+        )
+        click.echo(format_regressions(regressions))
+        raise SystemExit(1)
+    click.echo("\nNenhuma regressão de desempenho encontrada.")
+
+
+benchmarks.add_command(executar)
+benchmarks.add_command(comparar)
+
+if __name__ == "__main__":
+    benchmarks()
@@ -0,0 +1,142 @@
+from dataclasses import dataclass
+from typing import Any, Dict, List, Tuple
+
+# Aumento relativo máximo tolerado em cada métrica
+DEFAULT_TOLERANCE = 0.25
+
+# Tempos abaixo deste valor (s) são dominados por ruído e não são comparados
+DEFAULT_MIN_TIME = 0.05
+
+TIME_METRIC = "tempo_s"
+MEMORY_METRIC = "pico_rss_mb"
+PHASE_METRIC_PREFIX = "fase:"
+CALIBRATION_KEY = "calibracao_s"
+
+# Dimensões dos decks sintéticos que definem cada caso, na ordem em que
+# compõem o nome do caso
+CASE_KEYS = ["usinas", "estagios", "cenarios", "iteracoes"]
+
+BenchmarkKey = Tuple[str, str]
+
+
+@dataclass
+class Regression:
+    """
+    Métrica de um benchmark que piorou além da tolerância em relação
+    à linha de base.
+    """
+
+    case: str
+    target: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def variation(self) -> float:
+        return self.current / self.baseline - 1.0
+
+
+def index_results(
+    results: Dict[str, Any],
+) -> Dict[BenchmarkKey, Dict[str, float]]:
+    """
+    Indexa as métricas de cada benchmark por caso e alvo, usando o
+    menor valor entre as repetições, que é o menos afetado por ruído.
+    """
+    index: Dict[BenchmarkKey, Dict[str, float]] = {}
+    for r in results["resultados"]:
+        metrics = {
+            TIME_METRIC: r[TIME_METRIC],
+            MEMORY_METRIC: r[MEMORY_METRIC],
+            **{
+                f"{PHASE_METRIC_PREFIX}{phase}": t
+                for phase, t in r.get("fases", {}).items()
+            },
+        }
+        current = index.setdefault((r["caso"], r["alvo"]), {})
+        for metric, value in metrics.items():
+            current[metric] = min(value, current.get(metric, value))
+    return index
+
+
+def benchmark_cases(
+    results: Dict[str, Any],
+) -> Tuple[List[Dict[str, Any]], List[str]]:
+    """
+    Obtém os casos e os alvos avaliados em um conjunto de resultados,
+    para que sejam repetidos na comparação.
+    """
+    cases: List[Dict[str, Any]] = []
+    targets: List[str] = []
+    for r in results["resultados"]:
+        case = {k: r[k] for k in CASE_KEYS if r.get(k) is not None}
+        if case not in cases:
+            cases.append(case)
+        if r["alvo"] not in targets:
+            targets.append(r["alvo"])
+    return cases, targets
+
+
+def machine_scale(current: Dict[str, Any], baseline: Dict[str, Any]) -> float:
+    """
+    Obtém a razão entre os tempos da carga de referência na máquina atual
+    e na máquina da linha de base, pela qual os tempos da linha de base
+    são multiplicados na comparação. Sem a medida em algum dos resultados,
+    os tempos são comparados diretamente.
+    """
+    current_time = current.get(CALIBRATION_KEY)
+    baseline_time = baseline.get(CALIBRATION_KEY)
+    if not current_time or not baseline_time:
+        return 1.0
+    return float(current_time) / float(baseline_time)
+
+
+def compare(
+    current: Dict[str, Any],
+    baseline: Dict[str, Any],
+    tolerance: float = DEFAULT_TOLERANCE,
+    min_time: float = DEFAULT_MIN_TIME,
+) -> List[Regression]:
+    """
+    Compara os tempos totais, os tempos por fase e o pico de memória
+    de cada benchmark com a linha de base. Os tempos da linha de base
+    são normalizados pela velocidade relativa das máquinas, medida com
+    a carga de referência (`machine_scale`).
+    """
+    regressions: List[Regression] = []
+    scale = machine_scale(current, baseline)
+    current_index = index_results(current)
+    for key, baseline_metrics in index_results(baseline).items():
+        current_metrics = current_index.get(key)
+        if current_metrics is None:
+            continue
+        for metric, base in baseline_metrics.items():
+            value = current_metrics.get(metric)
+            if value is None or base <= 0:
+                continue
+            if metric != MEMORY_METRIC:
+                base *= scale
+            if metric != MEMORY_METRIC and max(base, value) < min_time:
+                continue
+            if value > base * (1.0 + tolerance):
+                regressions.append(Regression(*key, metric, base, value))
+    return regressions
+
+
+def format_regressions(regressions: List[Regression]) -> str:
+    """
+    Formata as regressões encontradas como uma tabela em texto.
+    """
+    header = (
+        f"{'caso':<25} {'alvo':<25} {'metrica':<20}"
+        + f" {'base':>10} {'atual':>10} {'variacao':>9}"
+    )
+    lines = [header, "-" * len(header)]
+    for r in regressions:
+        lines.append(
+            f"{r.case:<25} {r.target:<25} {r.metric:<20}"
+            + f" {r.baseline:>10.3f} {r.current:>10.3f}"
+            + f" {r.variation:>+9.1%}"
+        )
+    return "\n".join(lines)
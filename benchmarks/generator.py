@@ -0,0 +1,808 @@
+import itertools
+import re
+import shutil
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+from idecomp.config import MAX_ESTAGIOS, MAX_UHES
+from idecomp.decomp import Vazoes
+from idecomp.decomp.modelos.vazoes import SecaoVazoesPostos
+
+# Deck utilizado como modelo para a geração dos decks sintéticos
+TEMPLATE_DECK_DIR = (
+    Path(__file__).resolve().parent.parent / "tests" / "mocks" / "arquivos"
+)
+
+# Arquivos do modelo que não fazem parte do deck
+IGNORED_FILES = ["__init__.py", "__pycache__", "sintese"]
+
+DEC_OPER_FILES = [
+    "dec_oper_sist.csv",
+    "dec_oper_ree.csv",
+    "dec_oper_usih.csv",
+    "dec_oper_usit.csv",
+    "dec_oper_gnl.csv",
+    "dec_oper_interc.csv",
+]
+
+# Tamanho de cada registro do hidr e número máximo de registros
+HIDR_RECORD_SIZE = 792
+HIDR_MAX_RECORDS = 600
+HIDR_NAME_SIZE = 12
+
+_TABLE_SEPARATOR_PATTERN = re.compile(r"^-----;")
+_AVL_SEPARATOR_PATTERN = re.compile(r"^-{12};")
+_INVIAB_SEPARATOR_PATTERN = re.compile(r"^\s*X-+X")
+_LEADING_INTEGER_PATTERN = re.compile(r"^(\s*)(\d+)")
+_PLANT_LINE_PATTERN = re.compile(r"^\s*(\d+)\s+")
+_STAGE_HEADER_PATTERN = re.compile(r"(ESTAGIO)(\s+)(\d+)(?=\s*/\s*CENARIO)")
+_SCENARIO_HEADER_PATTERN = re.compile(
+    r"(CENARIO)(\s+)(\d+)(\s*-\s*PROB ACUMUL:\s*)([\d.]+)"
+    + r"(\s*PROB SUBPROB:\s*)([\d.]+)"
+)
+_OPERATION_REPORT_TITLE = "RELATORIO  DA  OPERACAO"
+_TOTAL_STAGES_PATTERN = re.compile(r"(Total de estagios\s+--->)(\s*\d+)")
+_STAGE_STATES_PATTERN = re.compile(
+    r"(Numero de estados por estagio\s+--->)((?:\s+\d+)+)"
+)
+_CUTS_NODE_PATTERN = re.compile(r"(Cortes da FCF do n\S+:\s*)(\d+)")
+_INVIAB_STAGE_PATTERN = re.compile(r"^(\s*\d+\s+\d+)(\s+\d+)")
+_INVIAB_FINAL_STAGE_PATTERN = re.compile(r"^(\s*\d+)")
+_HYDRO_ENTITIES = ["USIH", "USIHTV"]
+
+
+def _replace_field(field: str, value: int) -> str:
+    # Mantém a largura fixa dos campos dos arquivos do DECOMP,
+    # alinhando o novo valor à direita como no original e preservando
+    # os zeros à esquerda dos campos que os possuem.
+    stripped = field.rstrip()
+    trailing = len(field) - len(stripped)
+    digits = stripped.strip()
+    text = str(value)
+    if len(digits) > 1 and digits.startswith("0"):
+        text = text.zfill(len(digits))
+    return text.rjust(len(stripped)) + " " * trailing
+
+
+def _plant_name(name: str, code: int) -> str:
+    # O nome da usina criada tem o mesmo tamanho do nome da usina de
+    # origem, para que as colunas de largura fixa sejam mantidas.
+    suffix = str(code)
+    return name[: max(0, len(name) - len(suffix))] + suffix
+
+
+def _replace_name(field: str, code: int) -> str:
+    name = field.strip()
+    return field.replace(name, _plant_name(name, code), 1)
+
+
+def _split_table(
+    lines: List[str], is_separator: Callable[[str], bool], separators: int
+) -> tuple[List[str], List[str], List[str]]:
+    """
+    Separa as linhas de um arquivo em cabeçalho, dados e rodapé, sendo
+    os dados as linhas após o separador de índice `separators` até a
+    primeira linha vazia ou o próximo separador.
+    """
+    count = 0
+    begin = len(lines)
+    for i, line in enumerate(lines):
+        if is_separator(line):
+            count += 1
+            if count == separators:
+                begin = i + 1
+                break
+    end = begin
+    while (
+        end < len(lines)
+        and len(lines[end].strip()) > 0
+        and not is_separator(lines[end])
+    ):
+        end += 1
+    return lines[:begin], lines[begin:end], lines[end:]
+
+
+def _read_lines(path: Path) -> List[str]:
+    return path.read_text(encoding="iso-8859-1").splitlines(keepends=True)
+
+
+def _write_lines(path: Path, lines: List[str]) -> None:
+    path.write_text("".join(lines), encoding="iso-8859-1")
+
+
+def _split_csv_table(
+    path: Path, pattern: re.Pattern[str] = _TABLE_SEPARATOR_PATTERN
+) -> tuple[List[str], List[str], List[str]]:
+    return _split_table(
+        _read_lines(path),
+        lambda line: pattern.match(line) is not None,
+        2,
+    )
+
+
+def _table_rows(path: Path) -> int:
+    return len(_split_csv_table(path)[1])
+
+
+def _replicate_plants(
+    fields: List[List[str]],
+    plants: Dict[int, int],
+    code: int,
+    name: int,
+    group: Callable[[List[str]], Any],
+) -> List[List[str]]:
+    """
+    Replica as linhas das usinas de origem de cada grupo de linhas
+    consecutivas (estágio, cenário, iteração, ...) para as usinas
+    criadas, que são adicionadas ao final do grupo. Os grupos com chave
+    `None` não possuem usinas hidroelétricas.
+    """
+    scaled: List[List[str]] = []
+    for key, rows in itertools.groupby(fields, key=group):
+        grouped = list(rows)
+        scaled += grouped
+        if key is None:
+            continue
+        by_code: Dict[int, List[List[str]]] = {}
+        for f in grouped:
+            by_code.setdefault(int(f[code]), []).append(f)
+        for new_code, source in plants.items():
+            for f in by_code.get(source, []):
+                new = list(f)
+                new[code] = _replace_field(f[code], new_code)
+                new[name] = _replace_name(f[name], new_code)
+                scaled.append(new)
+    return scaled
+
+
+def _scale_table_plants(
+    path: Path,
+    plants: Dict[int, int],
+    code: int,
+    name: int,
+    group: Callable[[List[str]], Any],
+    pattern: re.Pattern[str] = _TABLE_SEPARATOR_PATTERN,
+) -> None:
+    header, data, footer = _split_csv_table(path, pattern)
+    fields = [line.split(";") for line in data]
+    scaled = _replicate_plants(fields, plants, code, name, group)
+    _write_lines(path, header + [";".join(f) for f in scaled] + footer)
+
+
+def _scale_hidr(path: Path, plants: Dict[int, int]) -> None:
+    """
+    Adiciona ao hidr os registros das usinas criadas, copiando os dados
+    cadastrais das usinas de origem, e completa o arquivo até o número
+    máximo de registros com registros vazios.
+    """
+    content = path.read_bytes()
+    records = [
+        content[i : i + HIDR_RECORD_SIZE]
+        for i in range(0, len(content), HIDR_RECORD_SIZE)
+    ]
+    blank = records[-1]
+    records += [blank] * (HIDR_MAX_RECORDS - len(records))
+    for new_code, source in plants.items():
+        record = records[source - 1]
+        name = record[:HIDR_NAME_SIZE].decode("iso-8859-1").strip()
+        new_name = _plant_name(name, new_code).ljust(HIDR_NAME_SIZE)
+        records[new_code - 1] = (
+            new_name.encode("iso-8859-1") + record[HIDR_NAME_SIZE:]
+        )
+    path.write_bytes(b"".join(records))
+
+
+def _hidr_names(path: Path) -> Dict[int, str]:
+    content = path.read_bytes()
+    return {
+        i // HIDR_RECORD_SIZE + 1: content[i : i + HIDR_NAME_SIZE]
+        .decode("iso-8859-1")
+        .strip()
+        for i in range(0, len(content), HIDR_RECORD_SIZE)
+    }
+
+
+def _scale_relato_plants(
+    path: Path, plants: Dict[int, int], names: Dict[int, str]
+) -> None:
+    """
+    Replica, logo após a linha original, as linhas do relato que
+    começam com o código e o nome de uma usina de origem, como as do
+    mapeamento entre usinas, REEs e submercados e as dos relatórios da
+    operação de cada estágio.
+    """
+    sources: Dict[int, List[int]] = {}
+    for new_code, source in plants.items():
+        sources.setdefault(source, []).append(new_code)
+    scaled: List[str] = []
+    for line in _read_lines(path):
+        scaled.append(line)
+        match = _PLANT_LINE_PATTERN.match(line)
+        if match is None:
+            continue
+        source = int(match.group(1))
+        name = names.get(source, "")
+        if source not in sources or len(name) == 0:
+            continue
+        if not line[match.end() :].startswith(name + " "):
+            continue
+        name_end = match.end() + len(name)
+        for new_code in sources[source]:
+            code_field = line[: match.end(1)]
+            scaled.append(
+                _replace_field(code_field, new_code)
+                + line[match.end(1) : match.end()]
+                + _plant_name(name, new_code)
+                + line[name_end:]
+            )
+    _write_lines(path, scaled)
+
+
+def _scale_plants(path: Path, plants: int) -> None:
+    """
+    Cria usinas hidroelétricas até o número de usinas desejado, com
+    códigos posteriores aos do hidr, copiando ciclicamente as usinas do
+    deck modelo nos arquivos lidos pelo sintetizador: hidr, dec_oper_usih,
+    avl_turb_max, dec_fcf_cortes, relato e relato2.
+    """
+    codes = sorted(
+        {
+            int(line.split(";")[5])
+            for line in _split_csv_table(path / "dec_oper_usih.csv")[1]
+        }
+    )
+    if plants < len(codes) or plants > MAX_UHES:
+        raise ValueError(
+            f"Número de usinas {plants} fora do intervalo suportado:"
+            + f" [{len(codes)}, {MAX_UHES}]"
+        )
+    names = _hidr_names(path / "hidr.dat")
+    first_code = len(names) + 1
+    created = range(first_code, first_code + plants - len(codes))
+    if len(created) > 0 and created[-1] > HIDR_MAX_RECORDS:
+        raise ValueError(
+            f"Número de usinas {plants} excede o número de registros"
+            + f" do hidr: {HIDR_MAX_RECORDS}"
+        )
+    new_plants = {c: codes[i % len(codes)] for i, c in enumerate(created)}
+    if len(new_plants) == 0:
+        return
+    _scale_hidr(path / "hidr.dat", new_plants)
+    _scale_table_plants(
+        path / "dec_oper_usih.csv",
+        new_plants,
+        5,
+        6,
+        lambda f: tuple(f[:3]),
+    )
+    _scale_table_plants(
+        path / "avl_turb_max.csv",
+        new_plants,
+        2,
+        3,
+        lambda f: f[0],
+        _AVL_SEPARATOR_PATTERN,
+    )
+    for f in sorted(path.glob("dec_fcf_cortes_*")):
+        _scale_table_plants(
+            f,
+            new_plants,
+            2,
+            3,
+            lambda f: (f[0], f[1]) if f[1].strip() in _HYDRO_ENTITIES else None,
+        )
+    for name in ["relato.rv0", "relato2.rv0"]:
+        if (path / name).is_file():
+            _scale_relato_plants(path / name, new_plants, names)
+
+
+def _scale_table_stages(
+    path: Path,
+    source: int,
+    added: int,
+    node: Optional[int] = None,
+    pattern: re.Pattern[str] = _TABLE_SEPARATOR_PATTERN,
+) -> None:
+    """
+    Insere cópias das linhas do estágio de origem logo após o estágio,
+    renumerando os estágios (e nós) das cópias e dos estágios seguintes.
+    """
+    header, data, footer = _split_csv_table(path, pattern)
+    scaled: List[List[str]] = []
+
+    def shifted(f: List[str], offset: int) -> List[str]:
+        new = list(f)
+        new[0] = _replace_field(f[0], int(f[0]) + offset)
+        if node is not None:
+            new[node] = _replace_field(f[node], int(f[node]) + offset)
+        return new
+
+    for stage, rows in itertools.groupby(
+        [line.split(";") for line in data], key=lambda f: int(f[0])
+    ):
+        grouped = list(rows)
+        if stage < source:
+            scaled += grouped
+        elif stage == source:
+            for offset in range(added + 1):
+                scaled += [shifted(f, offset) for f in grouped]
+        else:
+            scaled += [shifted(f, added) for f in grouped]
+    _write_lines(path, header + [";".join(f) for f in scaled] + footer)
+
+
+def _scale_vazoes_stages(path: Path, source: int, added: int) -> None:
+    """
+    Insere estágios determinísticos após o estágio de origem na árvore
+    de cenários, replicando as previsões semanais do estágio.
+    """
+    vazoes = Vazoes.read(str(path))
+    data = vazoes.data.get_sections_of_type(SecaoVazoesPostos)
+    probabilities = list(data.probabilidades_nos)
+    general = list(data.data["dados_gerais"])
+    stages = data.numero_estagios
+    data.data["dados_gerais"] = (
+        general[: 2 + source] + [1] * added + general[2 + source :]
+    )[: len(general)]
+    data.numero_estagios = stages + added
+    data.probabilidades_nos = (
+        probabilities[:source] + [1.0] * added + probabilities[source:]
+    )
+    weeks = data.numero_semanas_completas
+    if source <= weeks:
+        size = SecaoVazoesPostos.TAMANHO_REGISTRO
+        for key in ["previsoes", "previsoes_com_postos_artificiais"]:
+            values = data.data[key]
+            record = values[(source - 1) * size : source * size]
+            data.data[key] = (
+                values[: source * size]
+                + record * added
+                + values[source * size :]
+            )
+        data.data["dados_caso"][0] = weeks + added
+    vazoes.write(str(path))
+
+
+def _renumber_header(
+    pattern: re.Pattern[str], line: str, renumber: Callable[[int], int]
+) -> str:
+    # Renumera o estágio (ou cenário) do cabeçalho de um relatório,
+    # mantendo a largura do campo.
+    def replace(match: re.Match[str]) -> str:
+        width = len(match.group(2)) + len(match.group(3))
+        value = str(renumber(int(match.group(3)))).rjust(width)
+        return (
+            match.group(1)
+            + value
+            + match.group(0)[match.end(3) - match.start() :]
+        )
+
+    return pattern.sub(replace, line)
+
+
+def _renumber_stage_headers(
+    lines: List[str], source: int, offset: int
+) -> List[str]:
+    # Renumera os estágios posteriores ao de origem nos cabeçalhos
+    # "ESTAGIO  k /  CENARIO" dos relatórios de cada estágio.
+    return [
+        _renumber_header(
+            _STAGE_HEADER_PATTERN,
+            line,
+            lambda s: s + offset if s > source else s,
+        )
+        for line in lines
+    ]
+
+
+def _report_begin(
+    lines: List[str], pattern: re.Pattern[str], value: int
+) -> Optional[int]:
+    # Primeira linha do título do primeiro relatório da operação
+    # do estágio (ou cenário) fornecido.
+    for i, line in enumerate(lines):
+        match = pattern.search(line)
+        if match is not None and int(match.group(3)) == value:
+            for j in range(i, max(-1, i - 3), -1):
+                if lines[j].strip() == _OPERATION_REPORT_TITLE:
+                    return j
+            return i
+    return None
+
+
+def _stage_report_begin(lines: List[str], stage: int) -> int:
+    begin = _report_begin(lines, _STAGE_HEADER_PATTERN, stage)
+    if begin is None:
+        raise ValueError(f"Relatórios do estágio {stage} não encontrados")
+    return begin
+
+
+def _replace_stage_states(
+    lines: List[str], transform: Callable[[List[str]], List[str]]
+) -> List[str]:
+    # Altera a lista do número de estados por estágio dos dados gerais
+    # do relato, mantendo a largura de cada valor.
+    def states(match: re.Match[str]) -> str:
+        fields: List[str] = re.findall(r"\s+\d+", match.group(2))
+        width = len(fields[-1])
+        values = transform([f.strip() for f in fields])
+        return (
+            match.group(1)
+            + values[0].rjust(len(fields[0]))
+            + "".join(v.rjust(width) for v in values[1:])
+        )
+
+    return [_STAGE_STATES_PATTERN.sub(states, line) for line in lines]
+
+
+def _scale_relato_stages(path: Path, source: int, added: int) -> None:
+    """
+    Replica os relatórios do estágio de origem no relato, renumerando
+    os estágios das cópias e dos estágios seguintes, e atualiza o número
+    de estágios e de estados por estágio dos dados gerais. As tabelas
+    com uma coluna por estágio não são alteradas.
+    """
+    lines = _renumber_stage_headers(_read_lines(path), source, added)
+    begin = _stage_report_begin(lines, source)
+    end = _stage_report_begin(lines, source + added + 1)
+    region = lines[begin:end]
+    copies: List[str] = []
+    for stage in range(source + 1, source + added + 1):
+        copies += [
+            _renumber_header(_STAGE_HEADER_PATTERN, line, lambda _: stage)
+            for line in region
+        ]
+    lines = lines[:end] + copies + lines[end:]
+    lines = [
+        _TOTAL_STAGES_PATTERN.sub(
+            lambda m: (
+                m.group(1) + str(int(m.group(2)) + added).rjust(len(m.group(2)))
+            ),
+            line,
+        )
+        for line in lines
+    ]
+    lines = _replace_stage_states(
+        lines, lambda v: v[:source] + ["1"] * added + v[source:]
+    )
+    _write_lines(path, lines)
+
+
+def _scale_dec_fcf_cortes_stages(
+    directory: Path, source: int, added: int
+) -> None:
+    """
+    Renumera os arquivos dec_fcf_cortes dos estágios posteriores ao de
+    origem e cria os arquivos dos novos estágios como cópias dos cortes
+    do estágio de origem.
+    """
+
+    def stage_file(f: Path, stage: int) -> Path:
+        prefix, number = f.stem.rsplit("_", 1)
+        return f.with_name(f"{prefix}_{str(stage).zfill(len(number))}")
+
+    def write_node(f: Path, offset: int) -> None:
+        lines = _read_lines(f)
+        lines = [
+            _CUTS_NODE_PATTERN.sub(
+                lambda m: (
+                    m.group(1)
+                    + str(int(m.group(2)) + offset).zfill(len(m.group(2)))
+                ),
+                line,
+            )
+            for line in lines
+        ]
+        _write_lines(f, lines)
+
+    files = sorted(directory.glob("dec_fcf_cortes_*"))
+    for f in reversed(files):
+        stage = int(f.stem.rsplit("_", 1)[1])
+        if stage > source:
+            new = stage_file(f, stage + added).with_suffix(f.suffix)
+            f.rename(new)
+            write_node(new, added)
+        elif stage == source:
+            for offset in range(1, added + 1):
+                new = stage_file(f, stage + offset).with_suffix(f.suffix)
+                shutil.copy(f, new)
+                write_node(new, offset)
+
+
+def _scale_inviab_unic_stages(path: Path, source: int, added: int) -> None:
+    # Renumera os estágios posteriores ao de origem das violações por
+    # iteração e da simulação final.
+    lines = _read_lines(path)
+
+    def renumber(match: re.Match[str]) -> str:
+        stage = int(match.group(match.lastindex or 0))
+        if stage > source:
+            stage += added
+        field = match.group(match.lastindex or 0)
+        prefix = match.group(0)[: len(match.group(0)) - len(field)]
+        return prefix + str(stage).rjust(len(field))
+
+    for separators, pattern in [
+        (2, _INVIAB_STAGE_PATTERN),
+        (4, _INVIAB_FINAL_STAGE_PATTERN),
+    ]:
+        header, data, footer = _split_table(
+            lines,
+            lambda line: _INVIAB_SEPARATOR_PATTERN.match(line) is not None,
+            separators,
+        )
+        data = [pattern.sub(renumber, line, count=1) for line in data]
+        lines = header + data + footer
+    _write_lines(path, lines)
+
+
+def _scale_stages(path: Path, stages: int) -> None:
+    """
+    Insere estágios determinísticos semanais no deck, replicando o
+    penúltimo estágio determinístico do deck modelo, até o número de
+    estágios desejado.
+    """
+    fields = [
+        line.split(";")
+        for line in _split_csv_table(path / "dec_eco_discr.csv")[1]
+    ]
+    base_stages = max(int(f[0]) for f in fields)
+    if stages < base_stages or stages > MAX_ESTAGIOS:
+        raise ValueError(
+            f"Número de estágios {stages} fora do intervalo suportado:"
+            + f" [{base_stages}, {MAX_ESTAGIOS}]"
+        )
+    added = stages - base_stages
+    if added == 0:
+        return
+    source = base_stages - 2
+    _scale_table_stages(path / "dec_eco_discr.csv", source, added)
+    for name in DEC_OPER_FILES:
+        _scale_table_stages(path / name, source, added, node=1)
+    _scale_table_stages(
+        path / "avl_turb_max.csv",
+        source,
+        added,
+        pattern=_AVL_SEPARATOR_PATTERN,
+    )
+    _scale_vazoes_stages(path / "vazoes.rv0", source, added)
+    _scale_dec_fcf_cortes_stages(path, source, added)
+    inviab = next(iter(sorted(path.glob("inviab_unic.*"))), None)
+    if inviab is not None:
+        _scale_inviab_unic_stages(inviab, source, added)
+    _scale_relato_stages(path / "relato.rv0", source, added)
+    relato2 = path / "relato2.rv0"
+    if relato2.is_file():
+        _write_lines(
+            relato2,
+            _renumber_stage_headers(_read_lines(relato2), source, added),
+        )
+
+
+def _scale_dec_oper(path: Path, scenarios: int) -> None:
+    """
+    Replica as linhas dos cenários do último estágio de um arquivo
+    dec_oper_* até o número de cenários desejado, renumerando os nós
+    e os cenários.
+    """
+    header, data, footer = _split_csv_table(path)
+    fields = [line.split(";") for line in data]
+    stages = [int(f[0]) for f in fields]
+    last_stage = max(stages)
+    stochastic = [f for f, s in zip(fields, stages) if s == last_stage]
+    deterministic = [f for f, s in zip(fields, stages) if s != last_stage]
+    base_scenarios = max(int(f[2]) for f in stochastic)
+    first_node = min(int(f[1]) for f in stochastic)
+    by_scenario: Dict[int, List[List[str]]] = {}
+    for f in stochastic:
+        by_scenario.setdefault(int(f[2]), []).append(f)
+    scaled = list(deterministic)
+    for scenario in range(1, scenarios + 1):
+        source = by_scenario[(scenario - 1) % base_scenarios + 1]
+        for f in source:
+            new = list(f)
+            new[1] = _replace_field(f[1], first_node + scenario - 1)
+            new[2] = _replace_field(f[2], scenario)
+            scaled.append(new)
+    _write_lines(path, header + [";".join(f) for f in scaled] + footer)
+
+
+def _scale_vazoes(path: Path, scenarios: int) -> None:
+    """
+    Altera o número de aberturas do último estágio da árvore de cenários,
+    com probabilidades iguais, replicando os cenários gerados.
+    """
+    vazoes = Vazoes.read(str(path))
+    data = vazoes.data.get_sections_of_type(SecaoVazoesPostos)
+    openings = [int(a) for a in data.numero_aberturas_estagios]
+    base_scenarios = openings[-1]
+    deterministic_nodes = len(openings) - 1
+    openings[-1] = scenarios
+    data.numero_aberturas_estagios = openings
+    data.probabilidades_nos = [1.0] * deterministic_nodes + [
+        1.0 / scenarios
+    ] * scenarios
+    for key in [
+        "cenarios_gerados",
+        "cenarios_calculados_com_postos_artificiais",
+    ]:
+        values = data.data[key]
+        block = len(values) // base_scenarios
+        data.data[key] = [
+            v
+            for s in range(scenarios)
+            for v in values[
+                (s % base_scenarios) * block : (s % base_scenarios + 1) * block
+            ]
+        ]
+    vazoes.write(str(path))
+
+
+def _scale_relato_scenarios(path: Path, scenarios: int) -> None:
+    """
+    Replica os relatórios de cada cenário do último estágio no relato2,
+    renumerando os cenários, com probabilidades iguais, e atualiza o
+    número de estados do último estágio nos dados gerais do relato.
+    """
+    relato = path / "relato.rv0"
+    _write_lines(
+        relato,
+        _replace_stage_states(
+            _read_lines(relato), lambda v: v[:-1] + [str(scenarios)]
+        ),
+    )
+    relato2 = path / "relato2.rv0"
+    if not relato2.is_file():
+        return
+    lines = _read_lines(relato2)
+    begins: List[int] = []
+    while True:
+        begin = _report_begin(lines, _SCENARIO_HEADER_PATTERN, len(begins) + 1)
+        if begin is None:
+            break
+        begins.append(begin)
+    if len(begins) == 0:
+        return
+    regions = [lines[b:e] for b, e in zip(begins, begins[1:] + [len(lines)])]
+    probability = f"{1.0 / scenarios:.6f}"
+
+    def header(match: re.Match[str], scenario: int) -> str:
+        width = len(match.group(2)) + len(match.group(3))
+        return (
+            match.group(1)
+            + str(scenario).rjust(width)
+            + match.group(4)
+            + probability.rjust(len(match.group(5)))
+            + match.group(6)
+            + probability.rjust(len(match.group(7)))
+        )
+
+    scaled = lines[: begins[0]]
+    for scenario in range(1, scenarios + 1):
+        region = regions[(scenario - 1) % len(regions)]
+        scaled += [
+            _SCENARIO_HEADER_PATTERN.sub(lambda m: header(m, scenario), line)
+            for line in region
+        ]
+    _write_lines(relato2, scaled)
+
+
+def _scale_dec_eco_discr(path: Path, scenarios: int) -> None:
+    # A última coluna da linha de média do último estágio contém
+    # o número de aberturas do estágio.
+    header, data, footer = _split_table(
+        _read_lines(path),
+        lambda line: _TABLE_SEPARATOR_PATTERN.match(line) is not None,
+        2,
+    )
+    fields = [line.split(";") for line in data]
+    last_stage = max(int(f[0]) for f in fields)
+    for f in fields:
+        if int(f[0]) == last_stage and f[1].strip() == "-":
+            f[4] = _replace_field(f[4], scenarios)
+    _write_lines(path, header + [";".join(f) for f in fields] + footer)
+
+
+def _replicate_iterations(
+    rows: List[str], iterations: int, offset: int
+) -> List[str]:
+    scaled = list(rows)
+    for r in range(1, iterations):
+        for line in rows:
+            match = _LEADING_INTEGER_PATTERN.match(line)
+            if match is None:
+                continue
+            field = match.group(0)
+            value = int(match.group(2)) + r * offset
+            scaled.append(str(value).rjust(len(field)) + line[len(field) :])
+    return scaled
+
+
+def _scale_dec_fcf_cortes(path: Path, iterations: int) -> int:
+    """
+    Replica os cortes de um arquivo dec_fcf_cortes, renumerando as
+    iterações. Retorna o número de linhas de dados do arquivo.
+    """
+    header, data, footer = _split_table(
+        _read_lines(path),
+        lambda line: _TABLE_SEPARATOR_PATTERN.match(line) is not None,
+        2,
+    )
+    if len(data) == 0:
+        return 0
+    offset = max(int(line.split(";")[0]) for line in data)
+    scaled = _replicate_iterations(data, iterations, offset)
+    _write_lines(path, header + scaled + footer)
+    return len(scaled)
+
+
+def _scale_inviab_unic(path: Path, iterations: int) -> int:
+    """
+    Replica as violações por iteração do inviab_unic, renumerando
+    as iterações. Retorna o número de linhas de violações.
+    """
+    header, data, footer = _split_table(
+        _read_lines(path),
+        lambda line: _INVIAB_SEPARATOR_PATTERN.match(line) is not None,
+        2,
+    )
+    if len(data) == 0:
+        return 0
+    offset = max(int(line.split()[0]) for line in data)
+    scaled = _replicate_iterations(data, iterations, offset)
+    _write_lines(path, header + scaled + footer)
+    return len(scaled)
+
+
+def generate_deck(
+    directory: str,
+    scenarios: Optional[int] = None,
+    iterations: int = 1,
+    plants: Optional[int] = None,
+    stages: Optional[int] = None,
+    template: Path = TEMPLATE_DECK_DIR,
+) -> Dict[str, int]:
+    """
+    Gera um deck sintético do DECOMP a partir do deck modelo, com o
+    número de usinas hidroelétricas, o número de estágios, o número de
+    cenários do último estágio e o número de vezes em que as iterações
+    (cortes e violações) são replicadas parametrizados. Retorna o número
+    de linhas de dados de cada arquivo escalado.
+
+    As usinas criadas copiam as usinas do deck modelo e os estágios
+    criados copiam o penúltimo estágio determinístico, de modo que os
+    arquivos lidos pelo sintetizador (dec_oper_*, dec_eco_discr,
+    avl_turb_max, hidr, vazoes, dec_fcf_cortes, inviab_unic, relato e
+    relato2) permaneçam consistentes entre si. O dadger, as usinas
+    térmicas e as tabelas do relato com uma coluna por estágio são os
+    do deck modelo.
+    """
+    path = Path(directory)
+    path.mkdir(parents=True, exist_ok=True)
+    for f in template.iterdir():
+        if f.name in IGNORED_FILES:
+            continue
+        if f.is_file():
+            shutil.copy(f, path / f.name)
+    sizes: Dict[str, int] = {}
+    if plants is not None:
+        _scale_plants(path, plants)
+    if stages is not None:
+        _scale_stages(path, stages)
+    if scenarios is not None:
+        _scale_vazoes(path / "vazoes.rv0", scenarios)
+        _scale_dec_eco_discr(path / "dec_eco_discr.csv", scenarios)
+        for name in DEC_OPER_FILES:
+            _scale_dec_oper(path / name, scenarios)
+        _scale_relato_scenarios(path, scenarios)
+    if any(d is not None for d in [plants, stages, scenarios]):
+        for name in DEC_OPER_FILES:
+            sizes[name] = _table_rows(path / name)
+    for f in sorted(path.glob("dec_fcf_cortes_*")):
+        sizes[f.name] = _scale_dec_fcf_cortes(f, iterations)
+    inviab = next(iter(sorted(path.glob("inviab_unic.*"))), None)
+    if inviab is not None:
+        sizes[inviab.name] = _scale_inviab_unic(inviab, iterations)
+    sizes["linhas_totais"] = int(np.sum(list(sizes.values())))
+    return sizes
@@ -0,0 +1,215 @@
+import logging
+import os
+import platform
+import subprocess
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+import app
+from app.services.deck.deck import Deck
+from app.services.synthesis.execution import ExecutionSynthetizer
+from app.services.synthesis.operation import OperationSynthetizer
+from app.services.synthesis.policy import PolicySynthetizer
+from app.services.synthesis.scenarios import ScenarioSynthetizer
+from app.services.synthesis.system import SystemSynthetizer
+from app.services.unitofwork import AbstractUnitOfWork, factory
+from app.utils.timing import PerformanceTelemetry, _peak_memory_mb
+
+
+def _rows(df: Optional[pd.DataFrame]) -> int:
+    return 0 if df is None else int(df.shape[0])
+
+
+def _synthetize(synthetizer: Any) -> Callable[[AbstractUnitOfWork], int]:
+    def run(uow: AbstractUnitOfWork) -> int:
+        synthetizer.synthetize([], uow)
+        return 0
+
+    return run
+
+
+# Carregadores do Deck com maior custo de leitura e processamento
+LOADERS: Dict[str, Callable[[AbstractUnitOfWork], int]] = {
+    "Deck.dec_oper_sist": lambda uow: _rows(Deck.dec_oper_sist(uow)),
+    "Deck.dec_oper_ree": lambda uow: _rows(Deck.dec_oper_ree(uow)),
+    "Deck.dec_oper_usih": lambda uow: _rows(Deck.dec_oper_usih(uow)),
+    "Deck.dec_oper_usit": lambda uow: _rows(Deck.dec_oper_usit(uow)),
+    "Deck.dec_oper_interc": lambda uow: _rows(Deck.dec_oper_interc(uow)),
+    "Deck.dec_eco_discr": lambda uow: _rows(Deck.dec_eco_discr(uow)),
+    "Deck.infeasibilities": lambda uow: _rows(Deck.infeasibilities(uow)),
+    "Deck.cortes": lambda uow: _rows(Deck.cortes(uow)),
+    "Deck.cut_store": lambda uow: sum(
+        len(s.rhs) for s in Deck.cut_store(uow).stages.values()
+    ),
+}
+
+SYNTHETIZERS: Dict[str, Callable[[AbstractUnitOfWork], int]] = {
+    "SystemSynthetizer": _synthetize(SystemSynthetizer),
+    "ExecutionSynthetizer": _synthetize(ExecutionSynthetizer),
+    "ScenarioSynthetizer": _synthetize(ScenarioSynthetizer),
+    "OperationSynthetizer": _synthetize(OperationSynthetizer),
+    "PolicySynthetizer": _synthetize(PolicySynthetizer),
+}
+
+BENCHMARKS: Dict[str, Callable[[AbstractUnitOfWork], int]] = {
+    **LOADERS,
+    **SYNTHETIZERS,
+}
+
+
+def run_benchmark(target: str, directory: str) -> Dict[str, Any]:
+    """
+    Executa um benchmark no processo atual, partindo do cache do Deck
+    vazio, e retorna o tempo de execução, o número de linhas produzidas
+    e o pico de memória residente do processo.
+    """
+    logger = logging.getLogger("main")
+    logger.propagate = False
+    if not logger.handlers:
+        logger.addHandler(logging.NullHandler())
+    Deck.DECK_DATA_CACHING = {}
+    OperationSynthetizer.clear_cache()
+    uow = factory("FS", directory, None)
+    telemetry = PerformanceTelemetry()
+    telemetry.clear()
+    start = time.perf_counter()
+    rows = BENCHMARKS[target](uow)
+    elapsed = time.perf_counter() - start
+    return {
+        "alvo": target,
+        "tempo_s": elapsed,
+        "linhas": rows,
+        "pico_rss_mb": _peak_memory_mb(),
+        "fases": _phase_times(telemetry.to_df()),
+    }
+
+
+def _phase_times(df: pd.DataFrame) -> Dict[str, float]:
+    """
+    Soma o tempo de cada fase (resolve, post_resolve, bounds, stats,
+    export, ...) medida pelos blocos `time_and_log` da síntese.
+    """
+    df = df.loc[df["fase"] != ""]
+    if df.empty:
+        return {}
+    return {
+        str(k): float(v)
+        for k, v in df.groupby("fase")["tempo_real_s"].sum().items()
+    }
+
+
+def run_isolated(target: str, directory: str) -> Dict[str, Any]:
+    """
+    Executa um benchmark em um novo processo, para que o pico de
+    memória e o cache do Deck não sejam afetados por outras medidas.
+    """
+    with ProcessPoolExecutor(
+        max_workers=1, mp_context=get_context("spawn")
+    ) as executor:
+        return executor.submit(run_benchmark, target, directory).result()
+
+
+def _calibration_workload() -> None:
+    # Carga de referência com as operações predominantes nas sínteses:
+    # agrupamentos e junções do pandas, operações vetoriais do numpy e
+    # laços em Python.
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        {
+            "estagio": rng.integers(1, 7, 200_000),
+            "cenario": rng.integers(1, 50, 200_000),
+            "codigo": rng.integers(1, 170, 200_000),
+            "valor": rng.random(200_000),
+        }
+    )
+    stats = df.groupby(["estagio", "codigo"])["valor"].agg(
+        ["mean", "std", "min", "max"]
+    )
+    df.merge(stats.reset_index(), on=["estagio", "codigo"])
+    np.sort(rng.random(1_000_000))
+    sum(i * i for i in range(500_000))
+
+
+def calibrate(repeat: int = 5) -> float:
+    """
+    Mede o tempo (s) da carga de referência na máquina atual, usado para
+    normalizar os tempos dos benchmarks na comparação entre máquinas.
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        _calibration_workload()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def _commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).resolve().parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_suite(
+    cases: List[Dict[str, Any]],
+    targets: List[str],
+    workdir: str,
+    repeat: int = 1,
+) -> Dict[str, Any]:
+    """
+    Gera um deck sintético para cada caso e executa os benchmarks
+    solicitados, retornando os resultados em formato serializável
+    para JSON.
+    """
+    from benchmarks.generator import generate_deck
+
+    results: List[Dict[str, Any]] = []
+    for case in cases:
+        name = "_".join(f"{k}{v}" for k, v in case.items())
+        directory = os.path.join(workdir, name)
+        sizes = generate_deck(
+            directory,
+            scenarios=case.get("cenarios"),
+            iterations=case.get("iteracoes", 1),
+            plants=case.get("usinas"),
+            stages=case.get("estagios"),
+        )
+        for target in targets:
+            for r in range(repeat):
+                result = run_isolated(target, directory)
+                rows = result["linhas"] or sizes["linhas_totais"]
+                result.update(
+                    {
+                        "caso": name,
+                        **case,
+                        "repeticao": r + 1,
+                        "linhas_entrada": sizes["linhas_totais"],
+                        "linhas_por_s": rows / result["tempo_s"]
+                        if result["tempo_s"] > 0
+                        else None,
+                    }
+                )
+                results.append(result)
+    return {
+        "versao": app.__version__,
+        "commit": _commit(),
+        "data": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "processadores": os.cpu_count(),
+        "calibracao_s": calibrate(),
+        "resultados": results,
+    }
@@ -3,6 +3,7 @@ import pandas as pd
 import polars as pl
 from unittest.mock import patch
 
+from app.utils.schema import apply_schema
 from tests.conftest import DECK_TEST_DIR
 
 
@@ -30,3 +31,338 @@ def test_test_export_repository_synthetize_df_returns_true():
     repo = TestExportRepository(str(DECK_TEST_DIR))
     result = repo.synthetize_df(pd.DataFrame(), "any_file")
     assert result is True
+
+
+def test_parquet_synthetize_df_iter_row_group_por_parte(tmp_path):
+    import pyarrow.parquet as pq
+
+    repo = factory("PARQUET", str(tmp_path))
+    partes = [
+        pd.DataFrame({"estagio": [1, 1], "valor": [1.0, 2.0]}),
+        pd.DataFrame({"estagio": [2], "valor": [3.0]}),
+    ]
+    assert repo.synthetize_df_iter(iter(partes), "test_output") is True
+    arquivo = pq.ParquetFile(tmp_path / "test_output.parquet")
+    assert arquivo.num_row_groups == 2
+    df = repo.read_df("test_output")
+    assert df is not None
+    assert df["valor"].tolist() == [1.0, 2.0, 3.0]
+
+
+def test_csv_synthetize_df_iter_concatena_partes(tmp_path):
+    repo = factory("CSV", str(tmp_path))
+    partes = [
+        pd.DataFrame({"estagio": [1], "valor": [1.0]}),
+        pd.DataFrame({"estagio": [2], "valor": [2.0]}),
+    ]
+    assert repo.synthetize_df_iter(iter(partes), "test_output") is True
+    df = repo.read_df("test_output")
+    assert df is not None
+    assert df["estagio"].tolist() == [1, 2]
+    assert repo.synthetize_df_iter(iter([]), "vazio") is False
+
+
+def test_parquet_opcoes_compressao_estatisticas_dicionario(tmp_path):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    from app.adapters.repository.export import ParquetOptions
+
+    opcoes = ParquetOptions(compression="lz4", compression_level=3)
+    repo = factory("PARQUET", str(tmp_path), opcoes)
+    df = pd.DataFrame(
+        {
+            "variavel": ["GHID", "GHID", "VARPF"],
+            "estagio": [1, 2, 1],
+            "valor": [1.0, 2.0, 3.0],
+        }
+    )
+    repo.synthetize_df(df, "test_output")
+    arquivo = pq.ParquetFile(tmp_path / "test_output.parquet")
+    coluna = arquivo.metadata.row_group(0).column(1)
+    assert coluna.compression == "LZ4"
+    assert coluna.statistics is not None
+    assert pa.types.is_dictionary(arquivo.schema_arrow.field("variavel").type)
+    df_lido = repo.read_df("test_output")
+    assert df_lido is not None
+    assert df_lido["variavel"].tolist() == ["GHID", "GHID", "VARPF"]
+
+
+def test_parquet_grupos_linhas_por_estagio(tmp_path):
+    import pyarrow.parquet as pq
+
+    from app.adapters.repository.export import ParquetOptions
+
+    repo = factory(
+        "PARQUET", str(tmp_path), ParquetOptions(row_groups="estagio")
+    )
+    df = pd.DataFrame(
+        {
+            "codigo_usina": [1, 1, 2, 2],
+            "estagio": [1, 2, 1, 2],
+            "valor": [1.0, 2.0, 3.0, 4.0],
+        }
+    )
+    repo.synthetize_df(df, "test_output")
+    arquivo = pq.ParquetFile(tmp_path / "test_output.parquet")
+    assert arquivo.num_row_groups == 2
+    for i in range(2):
+        estatisticas = arquivo.metadata.row_group(i).column(1).statistics
+        assert estatisticas.min == estatisticas.max == i + 1
+    tabela = pq.read_table(
+        tmp_path / "test_output.parquet", filters=[("estagio", "=", 2)]
+    )
+    assert tabela.column("valor").to_pylist() == [2.0, 4.0]
+
+
+def test_parquet_opcoes_invalidas():
+    import pytest
+
+    from app.adapters.repository.export import ParquetOptions
+
+    with pytest.raises(ValueError):
+        ParquetOptions(compression="xz")
+    with pytest.raises(ValueError):
+        ParquetOptions(compression="snappy", compression_level=1)
+    with pytest.raises(ValueError):
+        ParquetOptions(row_groups="0")
+
+
+def test_parquet_particionado_por_estagio_e_entidade(tmp_path):
+    import base64
+    import json
+
+    import pyarrow as pa
+    import pyarrow.ipc as ipc
+
+    from app.adapters.repository.export import ParquetOptions
+
+    opcoes = ParquetOptions(partitions="estagio,codigo_usina")
+    repo = factory("PARQUET", str(tmp_path), opcoes)
+    df = pd.DataFrame(
+        {
+            "codigo_usina": [1, 1, 2, 2],
+            "estagio": [1, 2, 1, 2],
+            "cenario": [1, 1, 1, 1],
+            "valor": [1.0, 2.0, 3.0, 4.0],
+        }
+    )
+    repo.synthetize_df(df.copy(), "GHID_UHE")
+    repo.synthetize_df(pd.DataFrame({"chave": ["GHID_UHE"]}), "METADADOS")
+    assert not (tmp_path / "GHID_UHE.parquet").exists()
+    assert (
+        tmp_path
+        / "GHID_UHE"
+        / "estagio=2"
+        / "codigo_usina=1"
+        / "parte-0.parquet"
+    ).is_file()
+    assert (tmp_path / "METADADOS.parquet").is_file()
+    manifesto = json.loads(
+        (tmp_path / "GHID_UHE" / "_manifesto.json").read_text()
+    )
+    assert manifesto["linhas"] == 4
+    assert len(manifesto["arquivos"]) == 4
+    esquema = ipc.read_schema(
+        pa.py_buffer(base64.b64decode(manifesto["esquema"]))
+    )
+    assert esquema.names == ["estagio", "codigo_usina"]
+    assert [str(t) for t in esquema.types] == [
+        p["tipo"] for p in manifesto["particoes"]
+    ]
+    df_lido = repo.read_df("GHID_UHE")
+    assert df_lido is not None
+    pd.testing.assert_frame_equal(
+        df_lido.sort_values(["codigo_usina", "estagio"]).reset_index(drop=True),
+        apply_schema(df),
+    )
+
+
+def test_parquet_particionado_por_coluna_categorica(tmp_path):
+    from app.adapters.repository.export import ParquetOptions
+
+    repo = factory(
+        "PARQUET",
+        str(tmp_path),
+        ParquetOptions(partitions="estagio,cenario,nome_usina"),
+    )
+    df = pd.DataFrame(
+        {
+            "nome_usina": ["FURNAS", "CAMARGOS", "FURNAS", "CAMARGOS"],
+            "estagio": [1, 1, 2, 2],
+            "cenario": ["mean", "p10", "p10", "mean"],
+            "valor": [1.0, 2.0, 3.0, 4.0],
+        }
+    )
+    df["nome_usina"] = df["nome_usina"].astype("category")
+    repo.synthetize_df(df.copy(), "ESTATISTICAS_OPERACAO_UHE")
+    assert (
+        tmp_path
+        / "ESTATISTICAS_OPERACAO_UHE"
+        / "estagio=1"
+        / "cenario=p10"
+        / "nome_usina=CAMARGOS"
+        / "parte-0.parquet"
+    ).is_file()
+    df_lido = repo.read_df("ESTATISTICAS_OPERACAO_UHE")
+    assert df_lido is not None
+    colunas = ["estagio", "cenario", "nome_usina"]
+    pd.testing.assert_frame_equal(
+        df_lido.astype({c: str for c in colunas[1:]})
+        .sort_values(colunas)
+        .reset_index(drop=True),
+        apply_schema(df)
+        .astype({c: str for c in colunas[1:]})
+        .sort_values(colunas)
+        .reset_index(drop=True),
+    )
+    assert isinstance(df_lido["nome_usina"].dtype, pd.CategoricalDtype)
+
+
+def test_parquet_particionado_com_arquivo_unico(tmp_path):
+    from app.adapters.repository.export import ParquetOptions
+
+    df = pd.DataFrame({"estagio": [1, 2], "valor": [1.0, 2.0]})
+    repo = factory(
+        "PARQUET",
+        str(tmp_path),
+        ParquetOptions(partitions="estagio", flat_copy=True),
+    )
+    repo.synthetize_df(df.copy(), "CMO_SBM")
+    assert (tmp_path / "CMO_SBM.parquet").is_file()
+    assert (tmp_path / "CMO_SBM" / "_manifesto.json").is_file()
+    repo = factory("PARQUET", str(tmp_path), ParquetOptions())
+    repo.synthetize_df(df.copy(), "CMO_SBM")
+    assert not (tmp_path / "CMO_SBM").exists()
+
+
+def test_arrow_escrita_e_leitura(tmp_path):
+    import pyarrow as pa
+    import pyarrow.ipc as ipc
+
+    df = pd.DataFrame(
+        {
+            "variavel": ["GHID", "VARPF"],
+            "estagio": [1, 2],
+            "valor": [1.0, 2.0],
+        }
+    )
+    for compressao in ["none", "lz4"]:
+        repo = factory("ARROW", str(tmp_path), compressao)
+        assert repo.synthetize_df(df.copy(), "test_output") is True
+        df_lido = repo.read_df("test_output")
+        assert df_lido is not None
+        assert df_lido["variavel"].tolist() == ["GHID", "VARPF"]
+        assert df_lido["valor"].tolist() == [1.0, 2.0]
+    with pa.memory_map(str(tmp_path / "test_output.arrow")) as fonte:
+        assert ipc.open_file(fonte).read_all().num_rows == 2
+    partes = [df.iloc[:1], df.iloc[1:]]
+    assert repo.synthetize_df_iter(iter(partes), "partes") is True
+    df_partes = repo.read_df("partes")
+    assert df_partes is not None
+    assert df_partes["estagio"].tolist() == [1, 2]
+    assert repo.read_df("inexistente") is None
+
+
+def test_sqlite_escrita_leitura_e_consulta(tmp_path):
+    repo = factory("SQLITE", str(tmp_path))
+    df = pd.DataFrame(
+        {
+            "codigo_usina": [1, 1, 2],
+            "estagio": [1, 2, 1],
+            "data_inicio": pd.to_datetime(
+                ["2024-01-01", "2024-01-08", "2024-01-01"]
+            ).tz_localize("UTC"),
+            "valor": [1.0, float("inf"), float("nan")],
+        }
+    )
+    repo.synthetize_df(df.copy(), "GHID_UHE")
+    repo.synthetize_df(
+        pd.DataFrame({"chave": ["GHID_UHE"], "unidade": ["MWmed"]}),
+        "METADADOS_OPERACAO",
+    )
+    assert [p.name for p in tmp_path.iterdir()] == ["sintese.sqlite"]
+    pd.testing.assert_frame_equal(repo.read_df("GHID_UHE"), apply_schema(df))
+    assert repo.read_df("inexistente") is None
+    indices = repo.query(
+        "SELECT name FROM sqlite_master WHERE type = 'index'"
+        + " AND tbl_name = ?",
+        "GHID_UHE",
+    )["name"].tolist()
+    assert sorted(indices) == ["GHID_UHE__codigo_usina", "GHID_UHE__estagio"]
+    consulta = repo.query(
+        'SELECT m.unidade, sum(d.valor) AS valor FROM "GHID_UHE" d'
+        + ' JOIN "METADADOS_OPERACAO" m ON m.chave = ?'
+        + " WHERE d.codigo_usina = 1",
+        "GHID_UHE",
+    )
+    assert consulta["unidade"].tolist() == ["MWmed"]
+
+
+def test_sqlite_escrita_transacional(tmp_path):
+    import sqlite3
+
+    import pytest
+
+    repo = factory("SQLITE", str(tmp_path))
+    df = pd.DataFrame({"estagio": [1, 2], "valor": [1.0, 2.0]})
+    repo.synthetize_df(df.copy(), "CMO_SBM")
+
+    def partes():
+        yield df.iloc[:1]
+        raise RuntimeError("falha na escrita")
+
+    with pytest.raises(RuntimeError):
+        repo.synthetize_df_iter(partes(), "CMO_SBM")
+    pd.testing.assert_frame_equal(repo.read_df("CMO_SBM"), apply_schema(df))
+
+    # A falha ao iniciar a transação é propagada sem a tentativa de
+    # desfazer uma transação inexistente
+    bloqueio = sqlite3.connect(repo.store, isolation_level=None)
+    bloqueio.execute("BEGIN IMMEDIATE")
+    with (
+        patch("app.adapters.repository.export.SQLITE_TIMEOUT", 0.01),
+        pytest.raises(sqlite3.OperationalError, match="locked"),
+    ):
+        repo.synthetize_df(df.copy(), "CMO_SBM")
+    bloqueio.execute("ROLLBACK")
+    bloqueio.close()
+
+
+def test_esquema_compacto_dos_arquivos(tmp_path):
+    import pyarrow as pa
+    import pyarrow.ipc as ipc
+    import pyarrow.parquet as pq
+
+    from app.model.settings import Settings
+
+    df = pd.DataFrame(
+        {
+            "variavel": ["GHID", "VARPF"],
+            "codigo_usina": [1, 2],
+            "estagio": [1, 2],
+            "cenario": [1, 2],
+            "patamar": [0, 1],
+            "valor": [1.0, 2.0],
+        }
+    )
+    esperado = {
+        "codigo_usina": pa.int16(),
+        "estagio": pa.int16(),
+        "cenario": pa.int32(),
+        "patamar": pa.int8(),
+    }
+    factory("PARQUET", str(tmp_path)).synthetize_df(df, "parquet")
+    factory("ARROW", str(tmp_path)).synthetize_df(df, "arrow")
+    with patch.object(Settings(), "float32_values", True):
+        factory("PARQUET", str(tmp_path)).synthetize_df(df, "float32")
+    esquema_parquet = pq.read_schema(tmp_path / "parquet.parquet")
+    esquema_arrow = ipc.open_file(tmp_path / "arrow.arrow").schema
+    for esquema in [esquema_parquet, esquema_arrow]:
+        for coluna, tipo in esperado.items():
+            assert esquema.field(coluna).type == tipo
+        assert pa.types.is_dictionary(esquema.field("variavel").type)
+        assert esquema.field("valor").type == pa.float64()
+    esquema = pq.read_schema(tmp_path / "float32.parquet")
+    assert esquema.field("valor").type == pa.float32()
+    assert df["estagio"].dtype == "int64"
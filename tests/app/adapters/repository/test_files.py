@@ -1,8 +1,34 @@
-from app.adapters.repository.files import factory
-
+import gzip
+import shutil
+import tarfile
+import time
+import zipfile
+from os import listdir
+from os.path import isfile, join
+from unittest.mock import MagicMock, patch
 
 import pandas as pd
-
+import pyarrow as pa
+import pytest
+from idecomp.decomp import (
+    DecEcoDiscr,
+    DecOperGnl,
+    DecOperInterc,
+    DecOperRee,
+    DecOperSist,
+    DecOperUsih,
+    DecOperUsit,
+)
+
+from app.adapters.repository.files import factory, release
+from app.adapters.repository.nativecsv import (
+    known_version,
+    parser_version,
+    probe_version,
+    read_csv_table,
+    sniff_version,
+)
+from app.model.settings import Settings
 from tests.conftest import DECK_TEST_DIR
 
 
@@ -103,3 +129,273 @@ def test_get_dec_eco_discr(test_settings):
     repo = factory("FS", DECK_TEST_DIR)
     oper = repo.get_dec_eco_discr()
     assert isinstance(oper.tabela, pd.DataFrame)
+
+
+@pytest.mark.parametrize(
+    "file_class,filename",
+    [
+        (DecOperUsih, "dec_oper_usih.csv"),
+        (DecOperUsit, "dec_oper_usit.csv"),
+        (DecOperGnl, "dec_oper_gnl.csv"),
+        (DecOperRee, "dec_oper_ree.csv"),
+        (DecOperSist, "dec_oper_sist.csv"),
+        (DecOperInterc, "dec_oper_interc.csv"),
+        (DecEcoDiscr, "dec_eco_discr.csv"),
+        # Arquivos no formato anterior à versão 31.0.2 do DECOMP
+        (DecOperUsih, join("legado", "dec_oper_usih.csv")),
+        (DecOperSist, join("legado", "dec_oper_sist.csv")),
+    ],
+)
+def test_leitor_csv_nativo_equivalente_idecomp(
+    test_settings, file_class, filename
+):
+    caminho = join(DECK_TEST_DIR, filename)
+    nativo = read_csv_table(caminho, file_class)
+    assert nativo is not None
+    idecomp = file_class.read(caminho, version=parser_version(nativo.versao))
+    assert nativo.versao == idecomp.versao
+    pd.testing.assert_frame_equal(nativo.tabela, idecomp.tabela)
+
+
+def test_leitor_csv_nativo_versao_desconhecida(test_settings):
+    assert sniff_version(b"Arquivo sem cabecalho de versao") is None
+    caminho = join(DECK_TEST_DIR, "caso.dat")
+    assert read_csv_table(caminho, DecOperSist) is None
+    assert (
+        sniff_version(b"*  CEPEL: DECOMP     - Versao 31.21 - Dez/2023(L)   *")
+        == "31.21"
+    )
+
+
+def test_leitor_csv_nativo_versao_posterior_lida_pelo_idecomp(
+    test_settings, tmp_path
+):
+    for arquivo in ["caso.dat", "dec_oper_sist.csv"]:
+        shutil.copy(join(DECK_TEST_DIR, arquivo), tmp_path / arquivo)
+    caminho = tmp_path / "dec_oper_sist.csv"
+    caminho.write_bytes(
+        caminho.read_bytes().replace(b"Versao 31.21", b"Versao 32.1")
+    )
+    assert known_version("31.21")
+    assert known_version("31.0.2")
+    assert not known_version("32.1")
+    assert not known_version("31.21.1")
+    assert read_csv_table(str(caminho), DecOperSist) is None
+    leitura = MagicMock(wraps=DecOperSist.read)
+    with (
+        patch.object(Settings(), "csv_reader", "NATIVO"),
+        patch.object(DecOperSist, "read", leitura),
+    ):
+        dec = factory("FS", str(tmp_path)).get_dec_oper_sist()
+    leitura.assert_called_once()
+    assert dec.versao == "32.1"
+    assert not dec.tabela.empty
+
+
+def test_sonda_versao_arquivos(test_settings):
+    assert probe_version(join(DECK_TEST_DIR, "dec_oper_usih.csv")) == "31.21"
+    assert probe_version(join(DECK_TEST_DIR, "avl_turb_max.csv")) == "31.21"
+    assert (
+        probe_version(join(DECK_TEST_DIR, "legado", "dec_oper_sist.csv"))
+        == "31.0.2"
+    )
+    repo = factory("FS", DECK_TEST_DIR)
+    assert repo.get_file_version("dec_eco_discr.csv") == "31.21"
+    assert repo.get_file_version("arquivo_inexistente.csv") is None
+
+
+def test_get_dec_fcf_cortes_tables_paralelo(test_settings):
+    from app.model.settings import Settings
+
+    repo = factory("FS", DECK_TEST_DIR)
+    sequencial = list(repo.get_dec_fcf_cortes_tables([1, 2, 3]))
+    with patch.object(Settings(), "processors", 2):
+        paralelo = list(repo.get_dec_fcf_cortes_tables([1, 2, 3]))
+    assert [s for s, _ in sequencial] == [1, 2, 3]
+    assert [s for s, _ in paralelo] == [1, 2, 3]
+    for (_, df_seq), (_, df_par) in zip(sequencial, paralelo):
+        pd.testing.assert_frame_equal(df_seq, df_par)
+
+
+def _compacta_caso(destino, formato: str) -> str:
+    arquivos = [
+        a
+        for a in listdir(DECK_TEST_DIR)
+        if isfile(join(DECK_TEST_DIR, a)) and not a.endswith(".py")
+    ]
+    if formato == "zip":
+        with zipfile.ZipFile(destino / "caso.zip", "w") as z:
+            for a in arquivos:
+                z.write(join(DECK_TEST_DIR, a), f"caso/{a}")
+        return "caso.zip"
+    if formato in ["tar", "tar.zst"]:
+        with pa.output_stream(
+            str(destino / f"caso.{formato}"),
+            compression="zstd" if formato == "tar.zst" else None,
+        ) as saida:
+            with tarfile.open(fileobj=saida, mode="w|") as t:
+                for a in arquivos:
+                    t.add(join(DECK_TEST_DIR, a), f"caso/{a}")
+        return f"caso.{formato}"
+    # Compressão individual, alternando entre gzip e zstd
+    for i, a in enumerate(sorted(arquivos)):
+        with open(join(DECK_TEST_DIR, a), "rb") as f:
+            conteudo = f.read()
+        if i % 2 == 0:
+            with gzip.open(destino / f"{a}.gz", "wb") as g:
+                g.write(conteudo)
+        else:
+            with pa.output_stream(
+                str(destino / f"{a}.zst"), compression="zstd"
+            ) as z:
+                z.write(conteudo)
+    return "."
+
+
+@pytest.mark.parametrize("formato", ["zip", "tar", "tar.zst", "arquivos"])
+def test_leitura_caso_compactado(test_settings, tmp_path, formato):
+    from app.model.settings import Settings
+
+    arquivo = _compacta_caso(tmp_path, formato)
+    conteudo = sorted(listdir(tmp_path))
+    fs = factory("FS", DECK_TEST_DIR)
+    with patch.object(Settings(), "case_archive", arquivo):
+        repo = factory("COMPACTADO", str(tmp_path))
+    assert repo.extensao == fs.extensao
+    assert repo.get_dadger().te.titulo == fs.get_dadger().te.titulo
+    pd.testing.assert_frame_equal(
+        repo.get_relato().balanco_energetico,
+        fs.get_relato().balanco_energetico,
+    )
+    pd.testing.assert_frame_equal(
+        repo.get_hidr().cadastro, fs.get_hidr().cadastro
+    )
+    pd.testing.assert_frame_equal(
+        repo.get_dec_oper_usih().tabela, fs.get_dec_oper_usih().tabela
+    )
+    assert repo.get_file_version("dec_oper_sist.csv") == "31.21"
+    assert repo.get_file_version("arquivo_inexistente.csv") is None
+    for (s_fs, df_fs), (s, df) in zip(
+        fs.get_dec_fcf_cortes_tables([1, 2]),
+        repo.get_dec_fcf_cortes_tables([1, 2]),
+    ):
+        assert s_fs == s
+        pd.testing.assert_frame_equal(df_fs, df)
+    # Nenhum arquivo é extraído no diretório do caso
+    assert sorted(listdir(tmp_path)) == conteudo
+    with patch.object(Settings(), "case_archive", arquivo):
+        release("COMPACTADO", str(tmp_path))
+
+
+def test_tar_compactado_descompactado_uma_vez(test_settings, tmp_path):
+    from app.adapters.repository import archive
+
+    arquivo = _compacta_caso(tmp_path, "tar.zst")
+    descompressor = archive.FILE_COMPRESSIONS[".zst"]
+    leituras = []
+
+    def conta_leituras(f):
+        leituras.append(f)
+        return descompressor(f)
+
+    with patch.dict(archive.FILE_COMPRESSIONS, {".zst": conta_leituras}):
+        caso = archive.open_case_archive(str(tmp_path / arquivo))
+        with open(join(DECK_TEST_DIR, "caso.dat"), "rb") as f:
+            assert caso.read("caso.dat") == f.read()
+        for a in ["dadger.rv0", "hidr.dat", "dec_oper_usih.csv"]:
+            assert len(caso.read(a)) > 0
+        assert len(caso.read("relato.rv0", 10)) == 10
+        with pytest.raises(FileNotFoundError):
+            caso.read("arquivo_inexistente")
+    assert len(leituras) == 1
+
+
+def test_busca_caso_compactado(test_settings, tmp_path):
+    from app.adapters.repository.archive import find_case_archive
+
+    assert find_case_archive(str(tmp_path)) == str(tmp_path)
+    shutil.copy(join(DECK_TEST_DIR, "caso.dat"), tmp_path / "caso.dat")
+    with zipfile.ZipFile(tmp_path / "caso.zip", "w") as z:
+        z.write(join(DECK_TEST_DIR, "caso.dat"), "caso.dat")
+    assert find_case_archive(str(tmp_path)) == str(tmp_path / "caso.zip")
+    (tmp_path / "outro.tar.zst").touch()
+    with pytest.raises(ValueError):
+        find_case_archive(str(tmp_path))
+    assert find_case_archive(str(tmp_path), "outro.tar.zst") == str(
+        tmp_path / "outro.tar.zst"
+    )
+
+
+def test_leitura_antecipada_arquivos(test_settings):
+    from app.adapters.repository.files import RawFilesRepository
+
+    repo = factory("FS", DECK_TEST_DIR)
+    repo.prefetch(["dec_oper_sist", "arquivo_inexistente"])
+    prefetcher = RawFilesRepository.PREFETCHERS[DECK_TEST_DIR]
+    while "dec_oper_sist" not in prefetcher._futures:
+        time.sleep(0.01)
+    prefetcher._futures["dec_oper_sist"].result()
+    # O arquivo lido antecipadamente é entregue à primeira instância
+    # do repositório que o requisita, e não é lido novamente
+    with patch.object(RawFilesRepository, "_read_bytes") as leitura:
+        outro = factory("FS", DECK_TEST_DIR)
+        dec = outro.get_dec_oper_sist()
+        assert outro.get_dec_oper_sist() is dec
+        leitura.assert_not_called()
+    assert isinstance(dec, DecOperSist)
+    assert factory("FS", DECK_TEST_DIR).get_dec_oper_sist() is not dec
+    repo.stop_prefetch()
+    assert DECK_TEST_DIR not in RawFilesRepository.PREFETCHERS
+    assert prefetcher._threads == []
+    with patch.object(Settings(), "file_readers", 0):
+        repo.prefetch(["dec_oper_sist"])
+    assert DECK_TEST_DIR not in RawFilesRepository.PREFETCHERS
+
+
+def test_leitura_antecipada_compartilha_o_caso(test_settings, tmp_path):
+    import threading
+
+    from app.adapters.repository import archive
+    from app.adapters.repository.files import (
+        ArchiveFilesRepository,
+        RawFilesRepository,
+    )
+    from app.model.settings import Settings
+
+    arquivo = _compacta_caso(tmp_path, "tar.zst")
+    with patch.object(Settings(), "case_archive", arquivo):
+        repo = factory("COMPACTADO", str(tmp_path))
+    conversoes = []
+    descompressor = archive.FILE_COMPRESSIONS[".zst"]
+    leituras = []
+
+    def conta_leituras(f):
+        leituras.append(f)
+        return descompressor(f)
+
+    with (
+        patch.object(
+            ArchiveFilesRepository,
+            "_convert_encoding",
+            lambda self, nome: conversoes.append(
+                (nome, threading.current_thread().name)
+            ),
+        ),
+        patch.dict(archive.FILE_COMPRESSIONS, {".zst": conta_leituras}),
+        patch("app.adapters.repository.files.Caso.read") as leitura_caso,
+    ):
+        # A conversão da codificação é feita na thread principal, e as
+        # leituras antecipadas compartilham o caso.dat e o arquivo do caso,
+        # já descompactado na leitura do caso.dat
+        repo.prefetch(["dadger", "hidr", "dec_oper_sist"])
+        prefetcher = RawFilesRepository.PREFETCHERS[str(tmp_path)]
+        for nome in ["dadger", "hidr", "dec_oper_sist"]:
+            while nome not in prefetcher._futures:
+                time.sleep(0.01)
+            assert prefetcher.take(nome) is not None
+        repo.stop_prefetch()
+        leitura_caso.assert_not_called()
+    assert conversoes == [("dadger.rv0", threading.main_thread().name)]
+    assert leituras == []
+    ArchiveFilesRepository.release(str(tmp_path))
+    assert str(tmp_path / arquivo) not in ArchiveFilesRepository.ARCHIVES
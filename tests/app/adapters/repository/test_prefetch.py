@@ -0,0 +1,72 @@
+import time
+
+import pytest
+
+from app.adapters.repository.prefetch import NOT_READ, FilePrefetcher
+
+
+def _aguarda_leitura(p: FilePrefetcher, nome: str):
+    while nome not in p._futures:
+        time.sleep(0.01)
+    return p.take(nome)
+
+
+def test_leitura_antecipada_na_ordem():
+    lidos = []
+
+    def le(nome):
+        lidos.append(nome)
+        return nome.upper()
+
+    p = FilePrefetcher(le, ["a", "b", "c"], workers=1)
+    assert _aguarda_leitura(p, "a") == "A"
+    assert _aguarda_leitura(p, "b") == "B"
+    assert _aguarda_leitura(p, "c") == "C"
+    p.close()
+    assert lidos == ["a", "b", "c"]
+
+
+def test_leitura_antecipada_janela_por_leitor():
+    lidos = []
+
+    def le(nome):
+        lidos.append(nome)
+        return nome
+
+    p = FilePrefetcher(le, ["a", "b", "c"], workers=1)
+    # Somente um arquivo é mantido aguardando para cada leitor, e os
+    # arquivos requisitados antes da leitura são lidos sob demanda
+    time.sleep(0.2)
+    assert lidos == ["a"]
+    assert p.take("b") is NOT_READ
+    assert p.take("a") == "a"
+    assert _aguarda_leitura(p, "c") == "c"
+    p.close()
+    assert lidos == ["a", "c"]
+
+
+def test_leitura_antecipada_excecao():
+    def le(nome):
+        raise FileNotFoundError(nome)
+
+    p = FilePrefetcher(le, ["a"], workers=2)
+    with pytest.raises(FileNotFoundError):
+        _aguarda_leitura(p, "a")
+    p.close()
+
+
+def test_leitura_antecipada_limite_memoria():
+    lidos = []
+    p = FilePrefetcher(lidos.append, ["a", "b"], workers=1, memory_cap=0.0)
+    assert p.take("a") is NOT_READ
+    assert p.take("b") is NOT_READ
+    p.close()
+    assert lidos == []
+
+
+def test_leitura_antecipada_interrompida():
+    p = FilePrefetcher(lambda nome: nome, ["a", "b", "c"], workers=2)
+    p.close()
+    assert p.take("c") is NOT_READ
+    with pytest.raises(ValueError):
+        FilePrefetcher(lambda nome: nome, [], workers=0)
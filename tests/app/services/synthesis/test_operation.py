@@ -14,14 +14,21 @@ from idecomp.decomp import (
 
 from app.internal.constants import (
     LOWER_BOUND_COL,
+    OPERATION_SYNTHESIS_FILES_METADATA_OUTPUT,
     OPERATION_SYNTHESIS_METADATA_OUTPUT,
+    OPERATION_SYNTHESIS_STATS_FRAGMENTS_DIR,
+    SYNTHESIS_PERFORMANCE_OUTPUT,
     UPPER_BOUND_COL,
     VALUE_COL,
 )
+from app.domain.commands import SynthetizeOperation
 from app.model.operation.operationsynthesis import UNITS, OperationSynthesis
+from app.model.operation.spatialresolution import SpatialResolution
 from app.services.deck.bounds import OperationVariableBounds
 from app.services.deck.deck import Deck
+from app.services.handlers import synthetize_operation
 from app.services.synthesis.operation import OperationSynthetizer
+from app.services.synthesis.operation.export import export_stats
 from app.services.unitofwork import factory
 from tests.conftest import DECK_TEST_DIR, q
 
@@ -1438,3 +1445,556 @@ def test_sintese_int_sbp(test_settings):
     )
     __valida_limites(df)
     __valida_metadata(synthesis_str, df_meta, False)
+
+
+def test_projecao_colunas_dec_oper_sist(test_settings):
+    with patch.object(Deck, "DECK_DATA_CACHING", {}):
+        df_completo = Deck.dec_oper_sist(uow)
+    with patch.object(Deck, "DECK_DATA_CACHING", {}):
+        df_projetado = Deck.dec_oper_sist(uow, ["cmo"])
+    assert "cmo" in df_projetado.columns
+    assert "demanda_MW" not in df_projetado.columns
+    assert "geracao_termica_total_MW" not in df_projetado.columns
+    assert df_projetado.shape[0] == df_completo.shape[0]
+    assert np.allclose(
+        df_projetado["cmo"].to_numpy(),
+        df_completo["cmo"].to_numpy(),
+        equal_nan=True,
+    )
+
+
+def test_projecao_colunas_dec_oper_sist_cache(test_settings):
+    with patch.object(Deck, "DECK_DATA_CACHING", {}):
+        df_cmo = Deck.dec_oper_sist(uow, ["cmo"])
+        df_gter = Deck.dec_oper_sist(uow, ["geracao_termica_total_MW"])
+        df_cmo_cache = Deck.dec_oper_sist(uow, ["cmo"])
+    assert "geracao_termica_total_MW" not in df_cmo.columns
+    assert "geracao_termica_total_MW" in df_gter.columns
+    assert "cmo" not in df_gter.columns
+    assert df_cmo_cache.equals(df_cmo)
+
+
+def test_projecao_colunas_planejada(test_settings):
+    synthesis = [
+        OperationSynthesis.factory("CMO_SBM"),
+        OperationSynthesis.factory("GTER_UTE"),
+    ]
+    plan = OperationSynthetizer._plan_dec_oper_projection(synthesis)
+    assert plan["dec_oper_sist"] == ["cmo"]
+    assert "geracao_MW" in plan["dec_oper_usit"]
+    assert "geracao_maxima_MW" in plan["dec_oper_usit"]
+
+
+def test_metadados_versoes_arquivos(test_settings):
+    m = MagicMock(lambda df, filename: df)
+    with patch(
+        "app.adapters.repository.export.TestExportRepository.synthetize_df",
+        new=m,
+    ):
+        OperationSynthetizer.synthetize(["CMO_SBM"], uow)
+        OperationSynthetizer.clear_cache()
+    df = __obtem_dados_sintese_mock(
+        OPERATION_SYNTHESIS_FILES_METADATA_OUTPUT, m
+    )
+    assert df is not None
+    assert "dec_oper_sist.csv" in df["arquivo"].tolist()
+    assert (df["versao"] == "31.21").all()
+
+
+def test_desempenho_sintese(test_settings):
+    m = MagicMock(lambda df, filename: df)
+    with patch(
+        "app.adapters.repository.export.TestExportRepository.synthetize_df",
+        new=m,
+    ):
+        synthetize_operation(SynthetizeOperation(["EARMF_SIN"]), uow)
+        OperationSynthetizer.clear_cache()
+    df = __obtem_dados_sintese_mock(SYNTHESIS_PERFORMANCE_OUTPUT, m)
+    assert df is not None
+    raiz = df.loc[df["nivel"] == 0]
+    assert raiz["sintetizador"].tolist() == ["operacao"]
+    assert (df["sintetizador"] == "operacao").all()
+    variaveis = df.loc[df["nivel"] == 1, "variavel"].tolist()
+    assert "EARMF_SIN" in variaveis
+    fases = df.loc[df["variavel"] == "EARMF_SIN", "fase"].tolist()
+    assert {"post_resolve", "bounds", "stats", "export"} <= set(fases)
+    assert (df["tempo_real_s"] >= 0).all()
+    assert set(df.loc[df["nivel"] > 0, "id_pai"]) <= set(df["id"])
+    exportacao = df.loc[
+        (df["variavel"] == "EARMF_SIN") & (df["fase"] == "export")
+    ]
+    assert exportacao["linhas_saida"].iloc[0] > 0
+    variavel = df.loc[(df["nivel"] == 1) & (df["variavel"] == "EARMF_SIN")]
+    assert variavel["pico_rss_mb"].iloc[0] > 0
+
+
+def test_memoria_maxima_libera_caches(test_settings):
+    from app.model.settings import Settings
+
+    m = MagicMock(lambda df, filename: df)
+    with (
+        patch(
+            "app.adapters.repository.export.TestExportRepository.synthetize_df",
+            new=m,
+        ),
+        patch.object(Deck, "DECK_DATA_CACHING", {}),
+        patch.object(Settings(), "memory_budget", 1.0),
+    ):
+        synthetize_operation(SynthetizeOperation(["EARMF_SIN"]), uow)
+        # Dependências em cache são movidas para o disco e lidas novamente
+        assert len(OperationSynthetizer.CACHED_SYNTHESIS) > 0
+        assert all(
+            not isinstance(v, pd.DataFrame)
+            for v in OperationSynthetizer.CACHED_SYNTHESIS.values()
+        )
+        OperationSynthetizer.clear_cache()
+    df = __obtem_dados_sintese_mock("EARMF_SIN", m)
+    assert df is not None
+    assert not df.empty
+
+
+def test_memoria_maxima_nao_le_arquivos_a_cada_variavel(test_settings):
+    from app.model.settings import Settings
+
+    leituras = {
+        f"_get_{a}": MagicMock(wraps=getattr(Deck, f"_get_{a}"))
+        for a in ["dec_oper_sist", "dec_oper_usih", "dec_oper_usit"]
+    }
+    m = MagicMock(lambda df, filename: df)
+    with (
+        patch(
+            "app.adapters.repository.export.TestExportRepository.synthetize_df",
+            new=m,
+        ),
+        patch.object(Deck, "DECK_DATA_CACHING", {}),
+        patch.object(Settings(), "memory_budget", 1.0),
+        patch.multiple(Deck, **leituras),
+    ):
+        synthetize_operation(
+            SynthetizeOperation(
+                ["CMO_SBM", "GHID_UHE", "VTUR_UHE", "GTER_UTE", "GTER_SBM"]
+            ),
+            uow,
+        )
+        OperationSynthetizer.clear_cache()
+    # A memória residente permanece acima da máxima, mas as tabelas do
+    # Deck não são descartadas e lidas novamente a cada variável
+    for nome, leitura in leituras.items():
+        assert leitura.call_count == 1, nome
+
+
+def test_memoria_maxima_descarta_maiores_tabelas_do_deck(test_settings):
+    from app.model.settings import Settings
+    from app.services.synthesis.operation.memory import enforce_memory_budget
+
+    grande = pd.DataFrame({"a": np.zeros(4 * 1024**2 // 8)})
+    media = pd.DataFrame({"a": np.zeros(2 * 1024**2 // 8)})
+    metadados = pd.DataFrame({"a": np.zeros(10)})
+    cache = {"grande": grande, "media": media, "metadados": metadados}
+    with (
+        patch.object(Deck, "DECK_DATA_CACHING", cache),
+        patch.object(Settings(), "memory_budget", 100.0),
+        patch(
+            "app.services.synthesis.operation.memory.current_rss_mb",
+            return_value=103.0,
+        ),
+    ):
+        OperationSynthetizer.clear_cache()
+        # Somente as maiores tabelas são descartadas, até o excesso
+        enforce_memory_budget(OperationSynthetizer, [])
+        assert list(cache) == ["media", "metadados"]
+        # Sem novas leituras, as tabelas não são descartadas novamente
+        enforce_memory_budget(OperationSynthetizer, [])
+        assert list(cache) == ["media", "metadados"]
+        # As tabelas pequenas são mantidas mesmo além do excesso
+        cache["grande"] = grande
+        with patch(
+            "app.services.synthesis.operation.memory.current_rss_mb",
+            return_value=200.0,
+        ):
+            enforce_memory_budget(OperationSynthetizer, [])
+        assert list(cache) == ["metadados"]
+        OperationSynthetizer.clear_cache()
+
+
+def test_caso_compactado_descompactado_uma_vez_por_comando(
+    test_settings, tmp_path
+):
+    from app.adapters.repository import archive
+    from app.adapters.repository.files import ArchiveFilesRepository
+    from app.model.settings import Settings
+    from tests.app.adapters.repository.test_files import _compacta_caso
+
+    arquivo = _compacta_caso(tmp_path, "tar.zst")
+    descompressor = archive.FILE_COMPRESSIONS[".zst"]
+    leituras = []
+
+    def conta_leituras(f):
+        leituras.append(f)
+        return descompressor(f)
+
+    m = MagicMock(lambda df, filename: df)
+    with (
+        patch(
+            "app.adapters.repository.export.TestExportRepository.synthetize_df",
+            new=m,
+        ),
+        patch.object(Deck, "DECK_DATA_CACHING", {}),
+        patch.object(Settings(), "file_repository", "COMPACTADO"),
+        patch.object(Settings(), "case_archive", arquivo),
+        patch.dict(archive.FILE_COMPRESSIONS, {".zst": conta_leituras}),
+    ):
+        uow_compactado = factory("FS", str(tmp_path), q)
+        synthetize_operation(
+            SynthetizeOperation(["CMO_SBM", "GTER_UTE"]), uow_compactado
+        )
+        OperationSynthetizer.clear_cache()
+        # O arquivo do caso é fechado ao final do comando
+        assert str(tmp_path / arquivo) not in ArchiveFilesRepository.ARCHIVES
+    assert len(leituras) == 1
+    for variavel in ["CMO_SBM", "GTER_UTE"]:
+        df = __obtem_dados_sintese_mock(variavel, m)
+        assert df is not None
+        assert not df.empty
+
+
+def test_memoria_maxima_sem_medida_da_memoria(test_settings):
+    from app.model.settings import Settings
+    from app.services.synthesis.operation.memory import check_memory_budget
+
+    cls = MagicMock()
+    with patch(
+        "app.services.synthesis.operation.memory.current_rss_mb",
+        return_value=float("nan"),
+    ):
+        check_memory_budget(cls)
+        cls._log.assert_not_called()
+        with patch.object(Settings(), "memory_budget", 1000.0):
+            check_memory_budget(cls)
+    cls._log.assert_called_once()
+    assert "nao sera aplicada" in cls._log.call_args[0][0]
+
+
+def test_filtros_estagios_cenarios_entidades(test_settings):
+    from app.model.operation.filters import parse_int_ranges
+    from app.model.settings import Settings
+
+    assert parse_int_ranges("1-3,5") == [1, 2, 3, 5]
+    assert parse_int_ranges("") is None
+
+    def sintetiza(variaveis: list[str]) -> MagicMock:
+        m = MagicMock(lambda df, filename: df)
+        with (
+            patch(
+                "app.adapters.repository.export.TestExportRepository.synthetize_df",
+                new=m,
+            ),
+            patch.object(Deck, "DECK_DATA_CACHING", {}),
+        ):
+            synthetize_operation(SynthetizeOperation(variaveis), uow)
+            OperationSynthetizer.clear_cache()
+        return m
+
+    variaveis = ["GHID_UHE", "GHID_SIN", "CMO_SBM"]
+    m_completa = sintetiza(variaveis)
+    with (
+        patch.object(Settings(), "stage_filter", "1"),
+        patch.object(Settings(), "scenario_filter", "1-2"),
+        patch.object(Settings(), "plant_filter", "6"),
+        patch.object(Settings(), "submarket_filter", "1"),
+    ):
+        m_filtrada = sintetiza(variaveis)
+
+    for chave, filtros in [
+        ("GHID_UHE", {"codigo_usina": [6]}),
+        ("GHID_SIN", {}),
+        ("CMO_SBM", {"codigo_submercado": [1]}),
+    ]:
+        df = __obtem_dados_sintese_mock(chave, m_completa)
+        filtros = {"estagio": [1], "cenario": [1, 2], **filtros}
+        for coluna, valores in filtros.items():
+            df = df.loc[df[coluna].isin(valores)]
+        df_filtrada = __obtem_dados_sintese_mock(chave, m_filtrada)
+        assert not df_filtrada.empty
+        pd.testing.assert_frame_equal(
+            df.reset_index(drop=True), df_filtrada.reset_index(drop=True)
+        )
+    df_meta = __obtem_dados_sintese_mock(
+        "METADADOS_FILTROS_OPERACAO", m_filtrada
+    )
+    assert df_meta["filtro"].tolist() == [
+        "estagios",
+        "cenarios",
+        "usinas",
+        "submercados",
+    ]
+    assert (
+        __obtem_dados_sintese_mock("METADADOS_FILTROS_OPERACAO", m_completa)
+        is None
+    )
+
+
+def test_filtros_estagios_cenarios_no_deck(test_settings):
+    from app.model.settings import Settings
+
+    variaveis = ["GHID_UHE", "CMO_SBM", "EARMF_SIN"]
+    m_completa = MagicMock(lambda df, filename: df)
+    with (
+        patch(
+            "app.adapters.repository.export.TestExportRepository.synthetize_df",
+            new=m_completa,
+        ),
+        patch.object(Deck, "DECK_DATA_CACHING", {}),
+    ):
+        synthetize_operation(SynthetizeOperation(variaveis), uow)
+        OperationSynthetizer.clear_cache()
+    num_estagios = __obtem_dados_sintese_mock("CMO_SBM", m_completa)[
+        "estagio"
+    ].max()
+
+    m_filtrada = MagicMock(lambda df, filename: df)
+    cache: dict = {}
+    with (
+        patch(
+            "app.adapters.repository.export.TestExportRepository.synthetize_df",
+            new=m_filtrada,
+        ),
+        patch.object(Deck, "DECK_DATA_CACHING", cache),
+        patch.object(Settings(), "stage_filter", f"1,{num_estagios}"),
+        patch.object(Settings(), "scenario_filter", "2"),
+    ):
+        synthetize_operation(SynthetizeOperation(variaveis), uow)
+        OperationSynthetizer.clear_cache()
+
+    # Os dados do Deck são filtrados antes da expansão dos cenários
+    filtros = {"estagio": [1, int(num_estagios)], "cenario": [2]}
+    df_usih = cache[f"dec_oper_usih_cenario_2_estagio_1-{num_estagios}"]
+    assert set(df_usih["estagio"]) == {1, num_estagios}
+    assert set(df_usih["cenario"]) == {2}
+    # Os limites são obtidos do primeiro cenário de todos os estágios
+    df_limites = cache["dec_oper_ree_cenario_1"]
+    assert set(df_limites["estagio"]) == set(range(1, num_estagios + 1))
+    assert set(df_limites["cenario"]) == {1}
+    assert "dec_oper_usih" not in cache
+    assert Deck.DECK_DATA_FILTERS == {}
+    for chave in variaveis:
+        df = __obtem_dados_sintese_mock(chave, m_completa)
+        for coluna, valores in filtros.items():
+            df = df.loc[df[coluna].isin(valores)]
+        df_filtrada = __obtem_dados_sintese_mock(chave, m_filtrada)
+        assert not df_filtrada.empty
+        pd.testing.assert_frame_equal(
+            df.reset_index(drop=True), df_filtrada.reset_index(drop=True)
+        )
+
+
+def test_apenas_estatisticas(test_settings):
+    from app.model.settings import Settings
+
+    def sintetiza(variaveis: list[str]) -> MagicMock:
+        m = MagicMock(lambda df, filename: df)
+        with (
+            patch(
+                "app.adapters.repository.export.TestExportRepository.synthetize_df",
+                new=m,
+            ),
+            patch.object(Deck, "DECK_DATA_CACHING", {}),
+        ):
+            synthetize_operation(SynthetizeOperation(variaveis), uow)
+            OperationSynthetizer.clear_cache()
+        return m
+
+    variaveis = ["GHID_UHE", "GHID_SIN", "CMO_SBM"]
+    m_completa = sintetiza(variaveis)
+    with patch.object(Settings(), "statistics_only", True):
+        m_estatisticas = sintetiza(variaveis)
+
+    for chave in variaveis:
+        assert __obtem_dados_sintese_mock(chave, m_completa) is not None
+        assert __obtem_dados_sintese_mock(chave, m_estatisticas) is None
+    for res in ["UHE", "SIN", "SBM"]:
+        chave = f"ESTATISTICAS_OPERACAO_{res}"
+        df = __obtem_dados_sintese_mock(chave, m_completa)
+        df_estatisticas = __obtem_dados_sintese_mock(chave, m_estatisticas)
+        colunas = [c for c in df.columns if c != "valor"]
+        df = df.sort_values(colunas).reset_index(drop=True)
+        df_estatisticas = df_estatisticas.sort_values(colunas).reset_index(
+            drop=True
+        )
+        pd.testing.assert_frame_equal(df, df_estatisticas)
+    assert (
+        __obtem_dados_sintese_mock("METADADOS_OPERACAO", m_estatisticas)
+        is not None
+    )
+
+
+def test_escrita_em_segundo_plano(test_settings):
+    from app.model.settings import Settings
+
+    def escreve(df: pd.DataFrame, filename: str) -> pd.DataFrame:
+        if filename == "GHID_SIN":
+            raise OSError("disco cheio")
+        return df
+
+    variaveis = ["GHID_UHE", "GHID_SIN", "CMO_SBM"]
+    m = MagicMock(side_effect=escreve)
+    with (
+        patch(
+            "app.adapters.repository.export.TestExportRepository.synthetize_df",
+            new=m,
+        ),
+        patch.object(Deck, "DECK_DATA_CACHING", {}),
+        patch.object(Settings(), "export_writers", 2),
+        patch.object(Settings(), "export_queue", 1),
+    ):
+        synthetize_operation(SynthetizeOperation(variaveis), uow)
+        OperationSynthetizer.clear_cache()
+
+    assert OperationSynthetizer.WRITER is None
+    for chave in ["GHID_UHE", "CMO_SBM"]:
+        assert __obtem_dados_sintese_mock(chave, m) is not None
+    df_meta = __obtem_dados_sintese_mock(OPERATION_SYNTHESIS_METADATA_OUTPUT, m)
+    assert "GHID_SIN" not in df_meta["chave"].tolist()
+    assert {"GHID_UHE", "CMO_SBM"} <= set(df_meta["chave"].tolist())
+
+
+def test_estatisticas_em_fragmentos(test_settings):
+    variaveis = ["GHID_UHE", "QTUR_UHE", "EVER_UHE"]
+    m = MagicMock(lambda df, filename: df)
+    fragmentos = []
+
+    def exporta_estatisticas(cls, uow):
+        fragmentos.extend(
+            cls.SYNTHESIS_STATS[SpatialResolution.USINA_HIDROELETRICA].values()
+        )
+        export_stats(cls, uow)
+
+    with (
+        patch(
+            "app.adapters.repository.export.TestExportRepository.synthetize_df",
+            new=m,
+        ),
+        patch.object(Deck, "DECK_DATA_CACHING", {}),
+        patch.object(
+            OperationSynthetizer,
+            "_export_stats",
+            classmethod(exporta_estatisticas),
+        ),
+    ):
+        synthetize_operation(SynthetizeOperation(variaveis), uow)
+        OperationSynthetizer.clear_cache()
+
+    assert not any(p.exists() for p in fragmentos)
+    assert OperationSynthetizer.STATS_DIR is None
+    df = __obtem_dados_sintese_mock("ESTATISTICAS_OPERACAO_UHE", m)
+    assert df["variavel"].tolist() == sorted(df["variavel"].tolist())
+    assert {"GHID", "QTUR", "EVER"} <= set(df["variavel"])
+    assert len(fragmentos) == df["variavel"].nunique()
+    # Os fragmentos são mantidos no diretório da síntese até a exportação
+    assert all(
+        p.parent.name == OPERATION_SYNTHESIS_STATS_FRAGMENTS_DIR
+        for p in fragmentos
+    )
+    assert not fragmentos[0].parent.exists()
+
+
+def test_estatisticas_com_sintese_interrompida(test_settings):
+    import pytest
+
+    variaveis = ["GHID_UHE", "QTUR_UHE", "EVER_UHE"]
+    m = MagicMock(lambda df, filename: df)
+    sintetiza = OperationSynthetizer._synthetize_single_variable
+
+    def sintetiza_ate_falha(cls, s, uow):
+        if str(s) == "EVER_UHE":
+            raise MemoryError("memória esgotada")
+        return sintetiza(s, uow)
+
+    with (
+        patch(
+            "app.adapters.repository.export.TestExportRepository.synthetize_df",
+            new=m,
+        ),
+        patch.object(Deck, "DECK_DATA_CACHING", {}),
+        patch.object(
+            OperationSynthetizer,
+            "_synthetize_single_variable",
+            classmethod(sintetiza_ate_falha),
+        ),
+        pytest.raises(MemoryError),
+    ):
+        OperationSynthetizer.synthetize(variaveis, uow)
+    OperationSynthetizer.clear_cache()
+
+    assert OperationSynthetizer.STATS_DIR is None
+    df = __obtem_dados_sintese_mock("ESTATISTICAS_OPERACAO_UHE", m)
+    assert {"GHID", "QTUR"} <= set(df["variavel"])
+    assert "EVER" not in set(df["variavel"])
+
+
+def test_esquema_compacto_das_sinteses(test_settings):
+    from pandas.api.types import is_integer_dtype, is_numeric_dtype
+
+    from app.utils.schema import CATEGORY_COLUMNS, INTEGER_COLUMNS
+
+    uow_memoria = factory("MEMORIA", DECK_TEST_DIR, q)
+    with patch.object(Deck, "DECK_DATA_CACHING", {}):
+        synthetize_operation(
+            SynthetizeOperation(["GHID_UHE", "CMO_SBM", "INT_SBP"]),
+            uow_memoria,
+        )
+        OperationSynthetizer.clear_cache()
+
+    tabelas = uow_memoria.tables
+    df = tabelas["GHID_UHE"]
+    assert df["estagio"].dtype == np.int16
+    assert df["codigo_usina"].dtype == np.int16
+    assert df["cenario"].dtype == np.int32
+    assert df["patamar"].dtype == np.int8
+    assert df["valor"].dtype == np.float64
+    df = tabelas["ESTATISTICAS_OPERACAO_SBP"]
+    assert df["codigo_submercado_de"].dtype == np.int16
+    assert df["variavel"].dtype == "category"
+    assert df["cenario"].dtype == "category"
+    for nome, df in tabelas.items():
+        for col in df.columns:
+            dtype = df[col].dtype
+            if col in INTEGER_COLUMNS and is_integer_dtype(dtype):
+                largura = np.dtype(INTEGER_COLUMNS[col]).itemsize
+                assert dtype.itemsize == largura, (nome, col)
+            elif col in CATEGORY_COLUMNS and not is_numeric_dtype(dtype):
+                assert dtype == "category", (nome, col)
+
+
+def test_manifesto_das_sinteses(test_settings):
+    from app.internal.constants import SYNTHESIS_MANIFEST_OUTPUT
+
+    uow_memoria = factory("MEMORIA", DECK_TEST_DIR, q)
+    with patch.object(Deck, "DECK_DATA_CACHING", {}):
+        synthetize_operation(SynthetizeOperation(["CMO_SBM"]), uow_memoria)
+        OperationSynthetizer.clear_cache()
+        manifesto = uow_memoria.tables[SYNTHESIS_MANIFEST_OUTPUT].copy()
+        synthetize_operation(SynthetizeOperation(["GHID_UHE"]), uow_memoria)
+        OperationSynthetizer.clear_cache()
+
+    tabelas = uow_memoria.tables
+    df = tabelas[SYNTHESIS_MANIFEST_OUTPUT].set_index("arquivo")
+    assert SYNTHESIS_MANIFEST_OUTPUT not in df.index
+    assert set(df.index) == set(tabelas) - {SYNTHESIS_MANIFEST_OUTPUT}
+    for arquivo, linha in df.iterrows():
+        assert linha["linhas"] == tabelas[arquivo].shape[0]
+        assert linha["bytes"] > 0
+    assert df.loc["GHID_UHE", "estagio_min"] == 1
+    assert (
+        df.loc["GHID_UHE", "estagio_max"]
+        == tabelas["GHID_UHE"]["estagio"].max()
+    )
+    assert pd.isna(df.loc["METADADOS_OPERACAO", "estagio_min"])
+    # Tabelas escritas somente no primeiro comando são mantidas, e
+    # as tabelas reescritas com os mesmos dados mantêm o mesmo hash
+    anterior = manifesto.set_index("arquivo")
+    assert df.loc["CMO_SBM", "hash"] == anterior.loc["CMO_SBM", "hash"]
+    assert (
+        df.loc["METADADOS_OPERACAO", "hash"]
+        != anterior.loc["METADADOS_OPERACAO", "hash"]
+    )
@@ -1,3 +1,4 @@
+import tempfile
 from unittest.mock import MagicMock, patch
 
 import numpy as np
@@ -9,12 +10,17 @@ from app.internal.constants import (
     CUT_INDEX_COL,
     ENTITY_INDEX_COL,
     ITERATION_COL,
+    POLICY_SYNTHESIS_CUT_STORE_OUTPUT,
     POLICY_SYNTHESIS_METADATA_OUTPUT,
+    RHS_COEF_CODE,
     SCENARIO_COL,
     STAGE_COL,
     STATE_VALUE_COL,
 )
+from app.model.policy.cutstore import STATE_VARIABLE_COLUMNS, CutStore
 from app.model.policy.policysynthesis import PolicySynthesis
+from app.model.settings import Settings
+from app.services.deck.deck import Deck
 from app.services.synthesis.policy import PolicySynthetizer
 from app.services.unitofwork import factory
 from tests.conftest import DECK_TEST_DIR, q
@@ -25,9 +31,14 @@ synthetizer = PolicySynthetizer()
 
 def __synthetize_with_mock(synthesis_str) -> tuple[pd.DataFrame, pd.DataFrame]:
     m = MagicMock(lambda df, filename: df)
-    with patch(
-        "app.adapters.repository.export.TestExportRepository.synthetize_df",
-        new=m,
+    # Os cortes armazenados são escritos fora do diretório do deck de teste
+    with (
+        tempfile.TemporaryDirectory() as diretorio,
+        patch.object(Settings(), "synthesis_dir", diretorio),
+        patch(
+            "app.adapters.repository.export.TestExportRepository.synthetize_df",
+            new=m,
+        ),
     ):
         PolicySynthetizer.synthetize([synthesis_str], uow)
 
@@ -83,3 +94,80 @@ def test_synthesis_cortes_variaveis(test_settings: None):
     assert df.at[0, "unidade_estado"] == "10^3 R$"
 
     __validate_metadata(synthesis_str, df_meta)
+
+
+def test_cut_store_representacao_densa(test_settings: None):
+    store = PolicySynthetizer.cut_store(uow)
+    df = Deck.cortes(uow)
+    df_stage = df.loc[df[STAGE_COL] == 1]
+    stage_cuts = store.stages[1]
+    num_cuts = df_stage[CUT_INDEX_COL].nunique()
+    num_variables = df_stage.groupby(CUT_INDEX_COL).size().iloc[0] - 1
+    assert stage_cuts.coefficients.shape == (num_cuts, num_variables)
+    assert stage_cuts.rhs.shape == (num_cuts,)
+
+
+def test_avaliacao_fcf_pontos_consultados(test_settings: None):
+    df = Deck.cortes(uow)
+    df_stage = df.loc[df[STAGE_COL] == 1].copy()
+    # Os estados consultados são os pontos em que cada corte foi gerado
+    df_stage["estado"] = df_stage[CUT_INDEX_COL]
+    rhs = df_stage[COEF_TYPE_COL] == RHS_COEF_CODE
+    estados = df_stage.loc[~rhs]
+    custos = PolicySynthetizer.evaluate_future_cost(1, estados, uow)
+    # Valor de cada corte em cada estado, rhs + coeficientes @ x, e o
+    # custo futuro como o máximo entre os cortes
+    termos = df_stage.loc[
+        ~rhs, [CUT_INDEX_COL, *STATE_VARIABLE_COLUMNS, COEF_VALUE_COL]
+    ].merge(
+        estados[["estado", *STATE_VARIABLE_COLUMNS, STATE_VALUE_COL]],
+        on=STATE_VARIABLE_COLUMNS,
+    )
+    termos["produto"] = termos[COEF_VALUE_COL] * termos[STATE_VALUE_COL]
+    rhs_cortes = df_stage.loc[rhs].set_index(CUT_INDEX_COL)[COEF_VALUE_COL]
+    valores_cortes = (
+        termos.groupby(["estado", CUT_INDEX_COL])["produto"]
+        .sum()
+        .unstack(fill_value=0.0)
+        .reindex(columns=rhs_cortes.index, fill_value=0.0)
+        + rhs_cortes
+    )
+    esperado = valores_cortes.max(axis=1).sort_index().to_numpy()
+    assert custos.shape == esperado.shape
+    np.testing.assert_allclose(custos, esperado, rtol=1e-9)
+
+
+def test_cut_store_arrow(test_settings: None, tmp_path):
+    store = PolicySynthetizer.cut_store(uow)
+    arquivo = str(tmp_path / "cortes.arrow")
+    store.save(arquivo)
+    recuperado = CutStore.load(arquivo)
+    assert recuperado.stages.keys() == store.stages.keys()
+    estados = np.random.default_rng(0).uniform(
+        0, 1e4, (100, store.stages[2].coefficients.shape[1])
+    )
+    assert np.allclose(
+        recuperado.evaluate(2, estados), store.evaluate(2, estados)
+    )
+    assert np.array_equal(
+        recuperado.stages[2].variables, store.stages[2].variables
+    )
+
+
+def test_cut_store_armazenado_na_sintese(test_settings: None, tmp_path):
+    with patch.object(Settings(), "synthesis_dir", str(tmp_path)):
+        PolicySynthetizer.synthetize(["CORTES_COEFICIENTES"], uow)
+        assert (tmp_path / POLICY_SYNTHESIS_CUT_STORE_OUTPUT).is_file()
+        with patch.object(Deck, "cut_store") as cut_store_deck:
+            recuperado = PolicySynthetizer.cut_store(uow)
+        cut_store_deck.assert_not_called()
+    store = Deck.cut_store(uow)
+    assert recuperado.stages.keys() == store.stages.keys()
+    for estagio, cortes in store.stages.items():
+        cortes_recuperados = recuperado.stages[estagio]
+        assert np.array_equal(cortes_recuperados.cut_index, cortes.cut_index)
+        assert np.array_equal(cortes_recuperados.rhs, cortes.rhs)
+        assert np.array_equal(
+            cortes_recuperados.coefficients, cortes.coefficients
+        )
+        assert np.array_equal(cortes_recuperados.variables, cortes.variables)
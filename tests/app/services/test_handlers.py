@@ -0,0 +1,40 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.domain.commands import SynthetizeSystem
+from app.services.handlers import synthetize_system
+from app.utils.timing import PerformanceTelemetry, time_and_log
+
+
+def test_comando_exporta_e_libera_a_unidade_de_trabalho(test_settings):
+    uow = MagicMock()
+    with time_and_log("comando_anterior"):
+        pass
+    with (
+        patch("app.services.handlers.SystemSynthetizer.synthetize"),
+        patch("app.services.handlers.export_performance") as desempenho,
+        patch("app.services.handlers.export_manifest") as manifesto,
+        patch("app.services.handlers.export_profiles") as perfis,
+    ):
+        synthetize_system(SynthetizeSystem(["EST"]), uow)
+    # Os tempos de comandos anteriores são descartados no início
+    assert PerformanceTelemetry().to_df().empty
+    for exportacao in [desempenho, manifesto, perfis]:
+        exportacao.assert_called_once_with(uow)
+    uow.close.assert_called_once()
+
+
+def test_comando_com_erro_libera_a_unidade_de_trabalho(test_settings):
+    uow = MagicMock()
+    with (
+        patch(
+            "app.services.handlers.SystemSynthetizer.synthetize",
+            side_effect=RuntimeError(),
+        ),
+        patch("app.services.handlers.export_performance") as desempenho,
+    ):
+        with pytest.raises(RuntimeError):
+            synthetize_system(SynthetizeSystem(["EST"]), uow)
+    desempenho.assert_not_called()
+    uow.close.assert_called_once()
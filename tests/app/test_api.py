@@ -0,0 +1,41 @@
+"""Tests for app/api.py — in-process synthesis API."""
+
+from unittest.mock import MagicMock, patch
+
+import pyarrow as pa
+
+from app import api
+from app.domain.commands import SynthetizeOperation
+from app.services.handlers import synthetize_operation
+from app.services.synthesis.operation import OperationSynthetizer
+from app.services.unitofwork import factory
+from tests.conftest import DECK_TEST_DIR, q
+
+
+def test_sintetizar_operacao():
+    m = MagicMock(lambda df, filename: df)
+    with patch(
+        "app.adapters.repository.export.TestExportRepository.synthetize_df",
+        new=m,
+    ):
+        synthetize_operation(
+            SynthetizeOperation(["GHID_UHE"]), factory("FS", DECK_TEST_DIR, q)
+        )
+        OperationSynthetizer.clear_cache()
+    esperado = {c.args[1]: c.args[0] for c in m.mock_calls}["GHID_UHE"]
+
+    tabelas = api.sintetizar_operacao(DECK_TEST_DIR, ["GHID_UHE"])
+    assert "METADADOS_OPERACAO" in tabelas
+    assert tabelas["GHID_UHE"].equals(esperado)
+
+    tabelas = api.sintetizar_operacao(DECK_TEST_DIR, ["GHID_UHE"], arrow=True)
+    assert isinstance(tabelas["GHID_UHE"], pa.Table)
+    assert tabelas["GHID_UHE"].num_rows == esperado.shape[0]
+    api.limpar_cache()
+
+
+def test_sintetizar_sistema():
+    tabelas = api.sintetizar_sistema(DECK_TEST_DIR, ["EST", "UHE"])
+    assert not tabelas["EST"].empty
+    assert not tabelas["UHE"].empty
+    api.limpar_cache()
@@ -0,0 +1,92 @@
+"""Tests for app/server.py and app/client.py — warm-cache synthesis server."""
+
+import os
+import shutil
+import threading
+
+import pytest
+
+from app.client import SynthesisClient
+from app.server import create_server
+from tests.conftest import DECK_TEST_DIR, q
+
+
+@pytest.fixture
+def servidor():
+    server = create_server(port=0, q=q)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def cliente(servidor):
+    return SynthesisClient(port=servidor.server_address[1])
+
+
+def test_sintese_sob_demanda(servidor, cliente):
+    df = cliente.synthetize(DECK_TEST_DIR, "operacao", "EARMF_SIN")
+    assert not df.empty
+    assert "valor" in df.columns
+    status = cliente.status()
+    assert len(status["casos"]) == 1
+    assert status["casos"][0]["tabelas_deck"] > 0
+    # A segunda requisição reutiliza os dados do caso em memória
+    caso = servidor.synthesis.cases[os.path.abspath(DECK_TEST_DIR)]
+    cache = caso.deck_cache
+    df2 = cliente.synthetize(DECK_TEST_DIR, "operacao", "EARMF_SBM")
+    assert not df2.empty
+    assert servidor.synthesis.cases[caso.directory].deck_cache is cache
+    assert cliente.status()["casos"][0]["requisicoes"] == 2
+
+
+def test_invalidacao_e_escrita(tmp_path, servidor, cliente):
+    caso = tmp_path / "caso"
+    shutil.copytree(DECK_TEST_DIR, caso)
+    cliente.synthetize(str(caso), "sistema", "EST")
+    estado = servidor.synthesis.cases[str(caso)]
+    os.utime(caso / "dadger.rv0", ns=(0, 0))
+    arquivos = cliente.write(str(caso), "sistema", ["EST"])
+    assert "EST" in arquivos
+    assert servidor.synthesis.cases[str(caso)] is not estado
+
+
+def test_erros_de_requisicao(cliente):
+    with pytest.raises(RuntimeError, match="400"):
+        cliente.synthetize(DECK_TEST_DIR, "inexistente", "EST")
+    with pytest.raises(RuntimeError, match="404"):
+        cliente.synthetize(DECK_TEST_DIR, "operacao", "XYZ_SIN")
+
+
+def test_caches_em_disco_por_caso(tmp_path):
+    from pathlib import Path
+    from unittest.mock import patch
+
+    from app.model.settings import Settings
+    from app.services.session import SynthesisSession
+    from app.services.synthesis.operation import OperationSynthetizer
+
+    caso = tmp_path / "caso"
+    shutil.copytree(DECK_TEST_DIR, caso)
+    sessao = SynthesisSession(q)
+    anterior = OperationSynthetizer.SPILL_DIR
+    # Com a memória máxima excedida, as sínteses em cache de cada caso
+    # são movidas para o disco em diretórios separados
+    with patch.object(Settings(), "memory_budget", 1.0):
+        for diretorio in [DECK_TEST_DIR, str(caso), DECK_TEST_DIR]:
+            df = sessao.synthetize(diretorio, "operacao", ["EARMF_SIN"])
+            assert not df["EARMF_SIN"].empty
+    assert OperationSynthetizer.SPILL_DIR is anterior
+    estados = list(sessao.cases.values())
+    diretorios = [e.spill_dir.name for e in estados if e.spill_dir]
+    assert len(set(diretorios)) == 2
+    for e in estados:
+        arquivos = [
+            v for v in e.synthesis_cache.values() if isinstance(v, Path)
+        ]
+        assert len(arquivos) > 0
+        assert all(a.parent == Path(e.spill_dir.name) for a in arquivos)
+    sessao.clear()
+    assert not any(os.path.exists(d) for d in diretorios)
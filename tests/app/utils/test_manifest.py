@@ -0,0 +1,39 @@
+"""Unit tests for app/utils/manifest.py — output fingerprints."""
+
+import pandas as pd
+
+from app.utils.manifest import OutputManifest, TableFingerprint
+
+
+def test_impressao_digital_independe_das_partes():
+    df = pd.DataFrame({"estagio": [2, 1, 3, 1], "valor": [1.0, 2.0, 3.0, 4.0]})
+    inteira = TableFingerprint.of([df])
+    partes = TableFingerprint.of([df.iloc[:1], df.iloc[1:3], df.iloc[3:]])
+    assert inteira.digest == partes.digest
+    assert (partes.rows, partes.stage_min, partes.stage_max) == (4, 1, 3)
+
+    alterada = df.copy()
+    alterada.loc[3, "valor"] = 5.0
+    assert TableFingerprint.of([alterada]).digest != inteira.digest
+    renomeada = df.rename(columns={"valor": "limite_inferior"})
+    assert TableFingerprint.of([renomeada]).digest != inteira.digest
+    sem_estagio = TableFingerprint.of([df[["valor"]]])
+    assert sem_estagio.stage_min is None
+
+
+def test_manifesto_das_tabelas():
+    manifesto = OutputManifest()
+    manifesto.clear()
+    df = pd.DataFrame({"estagio": [1, 2], "valor": [1.0, 2.0]})
+    manifesto.register("B", TableFingerprint.of([df]))
+    manifesto.register("A", TableFingerprint.of([df[["valor"]]]))
+    df_manifesto = manifesto.to_df(
+        lambda arquivo: 10 if arquivo == "B" else None
+    )
+    manifesto.clear()
+    assert df_manifesto["arquivo"].tolist() == ["A", "B"]
+    assert df_manifesto["linhas"].tolist() == [2, 2]
+    assert df_manifesto["bytes"].isna().tolist() == [True, False]
+    assert df_manifesto.loc[1, "bytes"] == 10
+    assert df_manifesto.loc[1, "estagio_max"] == 2
+    assert pd.isna(df_manifesto.loc[0, "estagio_min"])
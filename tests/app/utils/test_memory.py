@@ -0,0 +1,45 @@
+"""Unit tests for app/utils/memory.py — memory accounting helpers."""
+
+import numpy as np
+import pandas as pd
+import polars as pl
+
+from app.utils.memory import (
+    MemoryMonitor,
+    cache_sizes,
+    current_rss_mb,
+    largest_entries,
+    object_size_mb,
+)
+
+
+def test_memoria_residente():
+    assert current_rss_mb() > 0
+
+
+def test_tamanho_objetos():
+    df = pd.DataFrame({"a": np.zeros(1024**2 // 8)})
+    assert abs(object_size_mb(df) - 1.0) < 0.01
+    assert abs(object_size_mb(pl.from_pandas(df)) - 1.0) < 0.01
+    assert abs(object_size_mb({"x": [df, df.to_numpy()]}) - 2.0) < 0.01
+
+
+def test_maiores_objetos_em_cache():
+    pequeno = pd.DataFrame({"a": np.zeros(10)})
+    grande = pd.DataFrame({"a": np.zeros(100_000)})
+    entradas = largest_entries(
+        {"Deck": {"p": pequeno}, "Sintese": {"g": grande}}, entries=1
+    )
+    assert [e[0] for e in entradas] == ["Sintese[g]"]
+    assert [e[0] for e in cache_sizes({"p": pequeno, "g": grande})] == [
+        "g",
+        "p",
+    ]
+
+
+def test_monitor_de_memoria():
+    with MemoryMonitor(interval=0.001) as monitor:
+        inicio = current_rss_mb()
+        dados = np.ones(50 * 1024**2 // 8)
+        del dados
+    assert monitor.peak_mb >= inicio + 40
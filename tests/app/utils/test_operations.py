@@ -17,6 +17,7 @@ from app.utils.operations import (
     _calc_mean_std_pl,
     _calc_quantiles_pl,
     calc_statistics,
+    calc_statistics_collapsed,
 )
 
 # ---------------------------------------------------------------------------
@@ -359,3 +360,48 @@ class TestCalcStatistics:
         result = calc_statistics(df, probs)
         assert VALUE_COL in result.columns
         assert SCENARIO_COL in result.columns
+
+
+# ---------------------------------------------------------------------------
+# Tests for calc_statistics_collapsed (constant groups derived directly)
+# ---------------------------------------------------------------------------
+
+
+class TestCalcStatisticsCollapsed:
+    def test_matches_calc_statistics(self) -> None:
+        df = _make_simple_df(
+            stages=[1, 1, 1, 2, 2, 2, 3],
+            scenarios=[1, 2, 3, 1, 2, 3, 1],
+            blocks=[1, 1, 1, 1, 1, 1, 1],
+            values=[5.0, 5.0, 5.0, 1.0, 2.0, 4.0, 7.0],
+        )
+        probs = _make_probs_df(
+            stages=[1, 1, 1, 2, 2, 2, 3],
+            scenarios=[1, 2, 3, 1, 2, 3, 1],
+            probs=[1 / 3, 1 / 3, 1 / 3, 0.2, 0.3, 0.5, 1.0],
+        )
+        keys = [STAGE_COL, BLOCK_COL, SCENARIO_COL]
+        expected = calc_statistics(df, probs).sort(keys)
+        result = calc_statistics_collapsed(df, probs).sort(keys)
+        assert result.schema == expected.schema
+        assert result.select(keys).equals(expected.select(keys))
+        np.testing.assert_allclose(
+            result[VALUE_COL].to_numpy(),
+            expected[VALUE_COL].to_numpy(),
+            atol=1e-9,
+        )
+
+    def test_constant_group_with_nan_is_not_collapsed(self) -> None:
+        df = _make_simple_df(
+            stages=[1, 1],
+            scenarios=[1, 2],
+            blocks=[1, 1],
+            values=[float("nan"), float("nan")],
+        )
+        probs = _make_probs_df(
+            stages=[1, 1], scenarios=[1, 2], probs=[0.5, 0.5]
+        )
+        result = calc_statistics_collapsed(df, probs)
+        expected = calc_statistics(df, probs)
+        assert result.shape == expected.shape
+        assert all(math.isnan(v) for v in result[VALUE_COL].to_list())
@@ -0,0 +1,127 @@
+"""Unit tests for app/utils/profiling.py — opt-in CPU and memory profiles."""
+
+import pstats
+import threading
+
+import pytest
+
+from app.utils.profiling import PROFILE_SUBDIR, Profiler
+from app.utils.timing import time_and_log
+
+
+def _soma_quadrados(n: int) -> int:
+    return sum(i * i for i in range(n))
+
+
+def _aloca_lista(n: int) -> list:
+    return [str(i) for i in range(n)]
+
+
+def _funcoes(caminho) -> set:
+    return {f[2] for f in pstats.Stats(str(caminho)).stats.keys()}
+
+
+@pytest.fixture
+def profiler():
+    p = Profiler()
+    yield p
+    p.configure(None)
+
+
+def test_perfil_desabilitado(profiler, tmp_path):
+    profiler.configure(None)
+    with time_and_log("sintese", synthesizer="operacao"):
+        _soma_quadrados(1000)
+    assert profiler.write(tmp_path) == []
+    assert not (tmp_path / PROFILE_SUBDIR).exists()
+
+
+def test_perfil_cpu_por_variavel(profiler, tmp_path):
+    profiler.configure("cpu")
+    with time_and_log("sintese", synthesizer="operacao"):
+        with time_and_log("variavel", variable="CMO_SBM"):
+            _soma_quadrados(10000)
+        with time_and_log("fase", phase="export"):
+            pass
+        with time_and_log("variavel", variable="EARMF_SIN"):
+            pass
+    arquivos = {p.name for p in profiler.write(tmp_path)}
+    assert arquivos == {
+        "operacao.pstats",
+        "operacao.txt",
+        "operacao_CMO_SBM.pstats",
+        "operacao_CMO_SBM.txt",
+        "operacao_EARMF_SIN.pstats",
+        "operacao_EARMF_SIN.txt",
+    }
+    diretorio = tmp_path / PROFILE_SUBDIR
+    assert "_soma_quadrados" in _funcoes(diretorio / "operacao_CMO_SBM.pstats")
+    assert "_soma_quadrados" not in _funcoes(
+        diretorio / "operacao_EARMF_SIN.pstats"
+    )
+    assert "_soma_quadrados" in _funcoes(diretorio / "operacao.pstats")
+
+
+def test_perfil_memoria_por_variavel(profiler, tmp_path):
+    profiler.configure("MEMORIA")
+    with time_and_log("sintese", synthesizer="politica"):
+        with time_and_log("variavel", variable="CORTES_COEFICIENTES"):
+            dados = _aloca_lista(100000)
+    del dados
+    profiler.write(tmp_path)
+    relatorio = (
+        tmp_path / PROFILE_SUBDIR / "politica_CORTES_COEFICIENTES.txt"
+    ).read_text()
+    assert "Pico de memória alocada" in relatorio
+    assert "test_profiling.py" in relatorio
+
+
+def test_perfil_tipo_invalido(profiler):
+    with pytest.raises(ValueError):
+        profiler.configure("disco")
+
+
+def test_perfil_cpu_em_duas_threads(profiler, tmp_path):
+    profiler.configure("cpu")
+    # A thread "a" encerra o seu escopo enquanto o da thread "b" continua
+    # aberto, o que desempilharia o escopo errado com uma pilha única
+    barreiras = [threading.Barrier(2, timeout=10) for _ in range(3)]
+    erros: list = []
+
+    def _thread_a():
+        try:
+            with time_and_log("sintese", synthesizer="a"):
+                _soma_quadrados(10000)
+                barreiras[0].wait()
+                barreiras[1].wait()
+            barreiras[2].wait()
+        except Exception as e:
+            erros.append(e)
+
+    def _thread_b():
+        try:
+            barreiras[0].wait()
+            with time_and_log("sintese", synthesizer="b"):
+                barreiras[1].wait()
+                barreiras[2].wait()
+                _aloca_lista(10000)
+        except Exception as e:
+            erros.append(e)
+
+    threads = [threading.Thread(target=f) for f in [_thread_a, _thread_b]]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert erros == []
+    assert profiler._stack == []
+    profiler.write(tmp_path)
+    diretorio = tmp_path / PROFILE_SUBDIR
+    funcoes_a = _funcoes(diretorio / "a.pstats")
+    assert "_soma_quadrados" in funcoes_a
+    assert "_aloca_lista" not in funcoes_a
+    # A partir do Python 3.12, só o primeiro perfil ativo é medido
+    if "b" in profiler.reports:
+        funcoes_b = _funcoes(diretorio / "b.pstats")
+        assert "_aloca_lista" in funcoes_b
+        assert "_soma_quadrados" not in funcoes_b
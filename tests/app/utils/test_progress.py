@@ -0,0 +1,45 @@
+"""Unit tests for app/utils/progress.py — progress and ETA reporting."""
+
+import logging
+
+from app.utils.progress import ProgressReporter, TimingHistory
+
+
+def test_progresso_sem_historico(caplog):
+    logger = logging.getLogger("test_progress")
+    reporter = ProgressReporter(["A", "B", "C", "D"], logger)
+    assert reporter.eta() is None
+    with caplog.at_level(logging.INFO, logger="test_progress"):
+        reporter.finish("A", 2.0)
+        reporter.finish("B", 4.0, success=False)
+    assert reporter.done == 2
+    assert reporter.total == 4
+    assert reporter.eta() == 6.0
+    assert reporter.successful_timings == {"A": 2.0}
+    assert "Progresso: 2/4 (50%)" in caplog.text
+    assert "restante estimado 00:00:06" in caplog.text
+
+
+def test_progresso_com_historico():
+    history = {"A": 1.0, "B": 2.0, "C": 10.0}
+    reporter = ProgressReporter(["A", "B", "C"], history=history)
+    assert reporter.eta() == 13.0
+    # Itens concluídos fora de ordem, como em execuções paralelas
+    reporter.finish("B", 4.0)
+    assert reporter.eta() == 22.0
+    reporter.finish("C", 20.0)
+    reporter.finish("A", 2.0)
+    assert reporter.eta() == 0.0
+
+
+def test_historico_de_tempos(tmp_path):
+    path = tmp_path / "historico" / "tempos.json"
+    history = TimingHistory(str(path))
+    assert history.get("estagios2_cenarios3") == {}
+    history.update("estagios2_cenarios3", {"A": 2.0})
+    assert history.save()
+
+    history = TimingHistory(str(path))
+    history.update("estagios2_cenarios3", {"A": 4.0})
+    assert history.get("estagios2_cenarios3") == {"A": 3.0}
+    assert not TimingHistory("").save()
@@ -0,0 +1,50 @@
+"""Unit tests for app/utils/schema.py — compact dtype registry."""
+
+import numpy as np
+import pandas as pd
+
+from app.utils.schema import apply_schema
+
+
+def test_esquema_inteiros_compactos():
+    df = pd.DataFrame(
+        {
+            "estagio": [1, 2],
+            "patamar": [0, 3],
+            "codigo_usina": [1, 40000],
+            "cenario": [1, 2],
+            "outra": [1, 2],
+        }
+    )
+    compacto = apply_schema(df, float32=False)
+    assert compacto["estagio"].dtype == np.int16
+    assert compacto["patamar"].dtype == np.int8
+    # Valores que não cabem no tipo do registro usam o próximo tipo
+    assert compacto["codigo_usina"].dtype == np.int32
+    assert compacto["cenario"].dtype == np.int32
+    assert compacto["outra"].dtype == np.int64
+    # O DataFrame original não é alterado
+    assert (df.dtypes == np.int64).all()
+
+
+def test_esquema_categorias_e_float32():
+    df = pd.DataFrame(
+        {
+            "variavel": ["GHID", "GHID"],
+            "cenario": ["mean", "std"],
+            "usina": ["A", "B"],
+            "valor": [1.5, 2.5],
+            "duracao_patamar": [1.0, 2.0],
+        }
+    )
+    compacto = apply_schema(df, float32=False)
+    for col in ["variavel", "cenario", "usina"]:
+        assert compacto[col].dtype == "category"
+    assert compacto["valor"].dtype == np.float64
+    assert (
+        apply_schema(df, categories=False, float32=True)["variavel"].dtype
+        == df["variavel"].dtype
+    )
+    compacto = apply_schema(df, float32=True)
+    assert compacto["valor"].dtype == np.float32
+    assert compacto["duracao_patamar"].dtype == np.float64
@@ -0,0 +1,99 @@
+"""Unit tests for app/utils/timing.py — hierarchical timing telemetry."""
+
+import pytest
+
+from app.utils.timing import PerformanceTelemetry, time_and_log
+
+
+@pytest.fixture
+def telemetry():
+    t = PerformanceTelemetry()
+    t.clear()
+    yield t
+    t.clear()
+
+
+def test_telemetria_hierarquica(telemetry):
+    with time_and_log("sintese", synthesizer="operacao"):
+        with time_and_log("variavel", variable="CMO_SBM"):
+            with time_and_log("fase", phase="export") as timer:
+                timer.rows(rows_in=10, rows_out=5)
+        with time_and_log("variavel", variable="EARMF_SIN"):
+            pass
+
+    df = telemetry.to_df()
+    assert df["id"].tolist() == [0, 1, 2, 3]
+    assert df["id_pai"].tolist() == [-1, 0, 1, 0]
+    assert df["nivel"].tolist() == [0, 1, 2, 1]
+    assert (df["sintetizador"] == "operacao").all()
+    assert df["variavel"].tolist() == ["", "CMO_SBM", "CMO_SBM", "EARMF_SIN"]
+    fase = df.loc[df["fase"] == "export"].iloc[0]
+    assert fase["linhas_entrada"] == 10
+    assert fase["linhas_saida"] == 5
+    tempos = df["tempo_real_s"].tolist()
+    assert tempos[0] >= tempos[1] >= tempos[2]
+
+
+def test_telemetria_excecao(telemetry):
+    with pytest.raises(RuntimeError):
+        with time_and_log("sintese", synthesizer="sistema"):
+            with time_and_log("variavel", variable="EST"):
+                raise RuntimeError()
+    with time_and_log("sintese", synthesizer="sistema"):
+        pass
+
+    df = telemetry.to_df()
+    assert df["nivel"].tolist() == [0, 1, 0]
+    assert df["id_pai"].tolist() == [-1, 0, -1]
+
+
+def test_telemetria_vazia(telemetry):
+    df = telemetry.to_df()
+    assert df.empty
+    assert "tempo_cpu_s" in df.columns
+
+
+def test_telemetria_threads(telemetry):
+    import threading
+
+    def escreve(pai):
+        with time_and_log("escrita", phase="escrita", parent=pai):
+            pass
+
+    with time_and_log("sintese", synthesizer="operacao"):
+        with time_and_log("variavel", variable="CMO_SBM"):
+            t = threading.Thread(
+                target=escreve, args=(PerformanceTelemetry().current(),)
+            )
+            t.start()
+            t.join()
+        with time_and_log("variavel", variable="EARMF_SIN"):
+            pass
+
+    df = telemetry.to_df().set_index("descricao")
+    assert len(set(df["id"])) == 4
+    assert df.loc["escrita", "id_pai"] == df.loc["variavel", "id"].iloc[0]
+    assert df.loc["escrita", "nivel"] == 2
+    assert df.loc["escrita", "sintetizador"] == "operacao"
+    assert df.loc["escrita", "variavel"] == "CMO_SBM"
+    assert (df.loc["variavel", "id_pai"] == df.loc["sintese", "id"]).all()
+
+
+def test_telemetria_tempo_cpu_da_thread(telemetry):
+    import threading
+    import time
+
+    def processa():
+        inicio = time.thread_time()
+        while time.thread_time() - inicio < 0.2:
+            pass
+
+    with time_and_log("fase", phase="espera"):
+        t = threading.Thread(target=processa)
+        t.start()
+        t.join()
+
+    # O processamento da thread auxiliar não é atribuído à etapa
+    df = telemetry.to_df()
+    assert df["tempo_real_s"].iloc[0] >= 0.2
+    assert df["tempo_cpu_s"].iloc[0] < 0.1
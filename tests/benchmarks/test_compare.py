@@ -0,0 +1,100 @@
+from benchmarks.compare import (
+    benchmark_cases,
+    compare,
+    format_regressions,
+    index_results,
+    machine_scale,
+)
+
+
+def _resultados(*medidas):
+    return {
+        "resultados": [
+            {
+                "caso": "cenarios2_iteracoes1",
+                "cenarios": 2,
+                "iteracoes": 1,
+                "alvo": alvo,
+                "tempo_s": tempo,
+                "pico_rss_mb": memoria,
+                "fases": fases,
+            }
+            for alvo, tempo, memoria, fases in medidas
+        ]
+    }
+
+
+def test_indice_menor_repeticao():
+    indice = index_results(
+        _resultados(
+            ("OperationSynthetizer", 2.0, 500.0, {"resolve": 1.5}),
+            ("OperationSynthetizer", 1.0, 510.0, {"resolve": 0.8}),
+        )
+    )
+    metricas = indice[("cenarios2_iteracoes1", "OperationSynthetizer")]
+    assert metricas == {
+        "tempo_s": 1.0,
+        "pico_rss_mb": 500.0,
+        "fase:resolve": 0.8,
+    }
+
+
+def test_casos_e_alvos_da_linha_base():
+    casos, alvos = benchmark_cases(
+        _resultados(
+            ("OperationSynthetizer", 1.0, 500.0, {}),
+            ("PolicySynthetizer", 1.0, 500.0, {}),
+            ("OperationSynthetizer", 1.0, 500.0, {}),
+        )
+    )
+    assert casos == [{"cenarios": 2, "iteracoes": 1}]
+    assert alvos == ["OperationSynthetizer", "PolicySynthetizer"]
+
+
+def test_casos_com_usinas_e_estagios():
+    resultados = _resultados(("OperationSynthetizer", 1.0, 500.0, {}))
+    resultados["resultados"][0].update({"usinas": 250, "estagios": 12})
+    casos, _ = benchmark_cases(resultados)
+    assert casos == [
+        {"usinas": 250, "estagios": 12, "cenarios": 2, "iteracoes": 1}
+    ]
+
+
+def test_regressao_por_fase():
+    base = _resultados(
+        ("OperationSynthetizer", 10.0, 500.0, {"resolve": 6.0, "stats": 0.01})
+    )
+    atual = _resultados(
+        ("OperationSynthetizer", 11.0, 510.0, {"resolve": 9.0, "stats": 0.03})
+    )
+    regressoes = compare(atual, base, tolerance=0.25, min_time=0.05)
+    assert [r.metric for r in regressoes] == ["fase:resolve"]
+    assert regressoes[0].variation == 0.5
+    texto = format_regressions(regressoes)
+    assert "fase:resolve" in texto
+    assert "+50.0%" in texto
+
+
+def test_sem_regressao():
+    base = _resultados(("PolicySynthetizer", 1.0, 200.0, {}))
+    atual = _resultados(
+        ("PolicySynthetizer", 1.1, 210.0, {}),
+        ("ExecutionSynthetizer", 5.0, 200.0, {}),
+    )
+    assert compare(atual, base) == []
+
+
+def test_normalizacao_pela_maquina():
+    base = _resultados(("OperationSynthetizer", 10.0, 500.0, {"resolve": 6.0}))
+    atual = _resultados(
+        ("OperationSynthetizer", 18.0, 500.0, {"resolve": 11.0})
+    )
+    assert len(compare(atual, base)) == 2
+    # Na máquina atual, duas vezes mais lenta, os tempos não pioraram
+    base["calibracao_s"] = 0.5
+    atual["calibracao_s"] = 1.0
+    assert machine_scale(atual, base) == 2.0
+    assert compare(atual, base) == []
+    atual["resultados"][0]["pico_rss_mb"] = 700.0
+    regressoes = compare(atual, base)
+    assert [r.metric for r in regressoes] == ["pico_rss_mb"]
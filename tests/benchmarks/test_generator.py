@@ -0,0 +1,99 @@
+from unittest.mock import patch
+
+import numpy as np
+from idecomp.decomp import (
+    DecEcoDiscr,
+    DecFcfCortes,
+    DecOperUsih,
+    Hidr,
+    InviabUnic,
+    Relato,
+    Vazoes,
+)
+
+from app.services.deck.deck import Deck
+from benchmarks.generator import TEMPLATE_DECK_DIR, generate_deck
+from benchmarks.runner import run_benchmark
+
+
+def test_gera_deck_cenarios(tmp_path):
+    tamanhos = generate_deck(str(tmp_path), scenarios=5)
+    probs = Vazoes.read(str(tmp_path / "vazoes.rv0")).probabilidades
+    estagio_final = probs["estagio"].max()
+    probs_final = probs.loc[probs["estagio"] == estagio_final]
+    assert probs_final["cenario"].tolist() == [1, 2, 3, 4, 5]
+    assert np.isclose(probs_final["probabilidade"].sum(), 1.0)
+    df = DecOperUsih.read(str(tmp_path / "dec_oper_usih.csv")).tabela
+    assert df.shape[0] == tamanhos["dec_oper_usih.csv"]
+    df_final = df.loc[df["estagio"] == estagio_final]
+    assert sorted(df_final["cenario"].unique()) == [1, 2, 3, 4, 5]
+    assert sorted(df_final["no"].unique()) == probs_final["no"].tolist()
+
+
+def test_gera_deck_iteracoes(tmp_path):
+    generate_deck(str(tmp_path), iterations=3)
+    base = DecFcfCortes.read(
+        str(TEMPLATE_DECK_DIR / "dec_fcf_cortes_001.rv0")
+    ).tabela
+    df = DecFcfCortes.read(str(tmp_path / "dec_fcf_cortes_001.rv0")).tabela
+    assert df.shape[0] == 3 * base.shape[0]
+    assert df["indice_iteracao"].max() == 3 * base["indice_iteracao"].max()
+    inviab_base = InviabUnic.read(
+        str(TEMPLATE_DECK_DIR / "inviab_unic.rv0")
+    ).inviabilidades_iteracoes
+    inviab = InviabUnic.read(
+        str(tmp_path / "inviab_unic.rv0")
+    ).inviabilidades_iteracoes
+    assert inviab.shape[0] == 3 * inviab_base.shape[0]
+
+
+def test_gera_deck_usinas(tmp_path):
+    tamanhos = generate_deck(str(tmp_path), plants=200)
+    df = DecOperUsih.read(str(tmp_path / "dec_oper_usih.csv")).tabela
+    assert df.shape[0] == tamanhos["dec_oper_usih.csv"]
+    assert df["codigo_usina"].nunique() == 200
+    novas = sorted(df.loc[df["codigo_usina"] > 320, "codigo_usina"].unique())
+    assert novas == list(range(321, 356))
+    nome = df.loc[df["codigo_usina"] == 321, "nome_usina"].iloc[0]
+    cadastro = Hidr.read(str(tmp_path / "hidr.dat")).cadastro
+    assert cadastro.at[321, "nome_usina"] == nome
+    relato = Relato.read(str(tmp_path / "relato.rv0"))
+    mapa = relato.uhes_rees_submercados.set_index("codigo_usina")
+    assert mapa.at[321, "nome_usina"] == nome
+    assert mapa.at[321, "codigo_ree"] == mapa.at[1, "codigo_ree"]
+    operacao = relato.relatorio_operacao_uhe
+    assert 321 in operacao["codigo_usina"].tolist()
+    cortes = DecFcfCortes.read(str(tmp_path / "dec_fcf_cortes_001.rv0")).tabela
+    assert 321 in cortes["indice_entidade"].tolist()
+
+
+def test_gera_deck_estagios(tmp_path):
+    tamanhos = generate_deck(str(tmp_path), stages=9, scenarios=3)
+    df = DecOperUsih.read(str(tmp_path / "dec_oper_usih.csv")).tabela
+    assert df.shape[0] == tamanhos["dec_oper_usih.csv"]
+    assert sorted(df["estagio"].unique()) == list(range(1, 10))
+    assert sorted(df.loc[df["estagio"] == 9, "no"].unique()) == [9, 10, 11]
+    discr = DecEcoDiscr.read(str(tmp_path / "dec_eco_discr.csv")).tabela
+    assert discr["estagio"].max() == 9
+    probs = Vazoes.read(str(tmp_path / "vazoes.rv0")).probabilidades
+    assert probs["estagio"].max() == 9
+    assert probs["no"].tolist() == list(range(1, 12))
+    assert sorted(f.name for f in tmp_path.glob("dec_fcf_cortes_*")) == [
+        f"dec_fcf_cortes_{str(s).zfill(3)}.rv0" for s in range(1, 9)
+    ]
+    relato = Relato.read(str(tmp_path / "relato.rv0"))
+    estagios = relato.relatorio_operacao_custos["estagio"].unique()
+    assert sorted(estagios) == list(range(1, 9))
+    relato2 = Relato.read(str(tmp_path / "relato2.rv0"))
+    custos2 = relato2.relatorio_operacao_custos
+    assert custos2["estagio"].unique().tolist() == [9]
+    assert custos2["cenario"].tolist() == [1, 2, 3]
+
+
+def test_benchmark_carregador(tmp_path):
+    generate_deck(str(tmp_path), scenarios=4)
+    with patch.object(Deck, "DECK_DATA_CACHING", {}):
+        resultado = run_benchmark("Deck.dec_oper_usih", str(tmp_path))
+    assert resultado["alvo"] == "Deck.dec_oper_usih"
+    assert resultado["tempo_s"] > 0
+    assert resultado["linhas"] > 0
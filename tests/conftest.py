@@ -23,6 +23,7 @@ _BASEDIR = str(pathlib.Path().resolve())
 os.environ.setdefault("APP_INSTALLDIR", _BASEDIR)
 os.environ.setdefault("APP_BASEDIR", _BASEDIR)
 os.environ.setdefault("FORMATO_SINTESE", "TEST")
+os.environ.setdefault("HISTORICO_TEMPOS", "")
 
 m = Manager()
 q = m.Queue(-1)